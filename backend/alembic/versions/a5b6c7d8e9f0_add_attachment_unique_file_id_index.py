@@ -0,0 +1,34 @@
+"""Index attachments by Telegram unique file ID.
+
+Revision ID: a5b6c7d8e9f0
+Revises: z4a5b6c7d8e9
+Create Date: 2026-01-13 00:00:00.000000
+
+Downloads look up already-fetched attachments by unique file ID before
+transferring anything, so the same file reposted in another channel is
+linked from disk instead of downloaded again.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5b6c7d8e9f0"
+down_revision: str | None = "z4a5b6c7d8e9"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add index on attachments.telegram_unique_file_id."""
+    op.create_index(
+        "ix_attachments_unique_file_id",
+        "attachments",
+        ["telegram_unique_file_id"],
+    )
+
+
+def downgrade() -> None:
+    """Remove index on attachments.telegram_unique_file_id."""
+    op.drop_index("ix_attachments_unique_file_id", "attachments")
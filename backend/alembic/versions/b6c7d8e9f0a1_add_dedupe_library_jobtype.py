@@ -0,0 +1,31 @@
+"""Add DEDUPE_LIBRARY job type.
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-01-14 00:00:00.000000
+
+This migration adds DEDUPE_LIBRARY to the JobType enum, for the job that
+converts an existing library to content-addressed storage.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c7d8e9f0a1"
+down_revision: str | None = "a5b6c7d8e9f0"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add DEDUPE_LIBRARY to the jobtype enum (PostgreSQL only)."""
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'DEDUPE_LIBRARY'")
+
+
+def downgrade() -> None:
+    """No-op: PostgreSQL doesn't support removing enum values directly."""
+    pass
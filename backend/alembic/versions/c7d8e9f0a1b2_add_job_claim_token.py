@@ -0,0 +1,41 @@
+"""Add claim token to jobs.
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-01-15 00:00:00.000000
+
+Jobs claimed in a batch wait in the worker until their turn. If the stale
+job sweep requeues one meanwhile and another worker claims it, the token
+tells the first worker the claim is no longer its own.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: str | None = "b6c7d8e9f0a1"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add jobs.claim_token."""
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("jobs", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("claim_token", sa.String(36), nullable=True))
+    else:
+        op.add_column("jobs", sa.Column("claim_token", sa.String(36), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove jobs.claim_token."""
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("jobs", schema=None) as batch_op:
+            batch_op.drop_column("claim_token")
+    else:
+        op.drop_column("jobs", "claim_token")
@@ -0,0 +1,54 @@
+"""Add resized preview variants.
+
+Revision ID: z4a5b6c7d8e9
+Revises: y3z4a5b6c7d8
+Create Date: 2026-01-12 00:00:00.000000
+
+This migration:
+1. Adds the variants column to preview_assets (NULL = not generated yet)
+2. Adds GENERATE_PREVIEW_VARIANTS to JobType enum for the backfill job
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "z4a5b6c7d8e9"
+down_revision: str | None = "y3z4a5b6c7d8"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add preview variants column and backfill job type."""
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    # 1. Add variants column
+    if dialect == "sqlite":
+        with op.batch_alter_table("preview_assets", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("variants", sa.JSON(), nullable=True))
+    else:
+        op.add_column("preview_assets", sa.Column("variants", sa.JSON(), nullable=True))
+
+    # 2. Add GENERATE_PREVIEW_VARIANTS to jobtype enum (PostgreSQL only)
+    if dialect == "postgresql":
+        op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'GENERATE_PREVIEW_VARIANTS'")
+
+
+def downgrade() -> None:
+    """Remove preview variants column.
+
+    Note: PostgreSQL doesn't support removing enum values directly, so
+    GENERATE_PREVIEW_VARIANTS stays in the jobtype enum.
+    """
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    if dialect == "sqlite":
+        with op.batch_alter_table("preview_assets", schema=None) as batch_op:
+            batch_op.drop_column("variants")
+    else:
+        op.drop_column("preview_assets", "variants")
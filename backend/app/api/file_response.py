@@ -0,0 +1,359 @@
+"""Conditional and ranged file responses for library downloads.
+
+LibraryFileResponse serves a file from disk with RFC 7232 conditional
+request handling and RFC 7233 byte ranges:
+
+- Strong ETags: the file's SHA-256 when known, otherwise derived from
+  mtime and size
+- If-None-Match / If-Modified-Since return 304 Not Modified
+- If-Match / If-Unmodified-Since return 412 Precondition Failed
+- Range with one or more byte ranges returns 206 (multipart/byteranges
+  for several ranges), honouring If-Range; unsatisfiable ranges return 416
+
+This lets download managers resume interrupted transfers and fetch
+segments in parallel, and lets browsers revalidate instead of re-fetching.
+It doesn't depend on the installed Starlette's FileResponse range support.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Read size when streaming file bodies
+FILE_CHUNK_SIZE = 256 * 1024  # 256KB
+
+# More ranges than this in one request are ignored (full response instead)
+MAX_RANGES = 64
+
+
+class RangeNotSatisfiable(Exception):
+    """No requested range overlaps the file."""
+
+
+def build_etag(
+    sha256: str | None,
+    stat_result: os.stat_result,
+    expected_size: int | None = None,
+) -> str:
+    """Build a strong ETag for a file.
+
+    Args:
+        sha256: Content hash, if known.
+        stat_result: Current stat of the file.
+        expected_size: Size recorded alongside sha256. If the file no longer
+            has this size the hash is stale and isn't used.
+
+    Returns:
+        Quoted ETag value.
+    """
+    if sha256 and expected_size in (None, stat_result.st_size):
+        return f'"{sha256}"'
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(header: str, etag: str, weak: bool) -> bool:
+    """Check an If-Match/If-None-Match list against an ETag."""
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _parse_http_date(value: str) -> float | None:
+    """Parse an HTTP date to a timestamp, or None if invalid."""
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_range_header(header: str, file_size: int) -> list[tuple[int, int]] | None:
+    """Parse a Range header into sorted, merged byte ranges.
+
+    Args:
+        header: Range header value.
+        file_size: Size of the file in bytes.
+
+    Returns:
+        List of (start, end) with end exclusive, or None if the header is
+        malformed, isn't for bytes, or has too many ranges (the Range
+        header is then ignored).
+
+    Raises:
+        RangeNotSatisfiable: If no range overlaps the file.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+
+    parts = specs.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for part in parts:
+        first, sep, last = part.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) + 1 if last else max(file_size, start + 1)
+                if start < 0 or end <= start:
+                    return None
+            else:
+                # Suffix range: the last N bytes
+                suffix = int(last)
+                if suffix <= 0:
+                    continue
+                start = max(file_size - suffix, 0)
+                end = file_size
+        except ValueError:
+            return None
+
+        if start >= file_size:
+            continue
+        ranges.append((start, min(end, file_size)))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class LibraryFileResponse(Response):
+    """File response with conditional request and byte range support."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        sha256: str | None = None,
+        size_bytes: int | None = None,
+        filename: str | None = None,
+        media_type: str = "application/octet-stream",
+        headers: dict[str, str] | None = None,
+        content_disposition_type: str = "attachment",
+    ):
+        """Initialize the response.
+
+        Args:
+            path: File to serve.
+            sha256: Known content hash, used as the ETag.
+            size_bytes: File size recorded with sha256.
+            filename: Download filename for Content-Disposition.
+            media_type: Content-Type of the file.
+            headers: Extra headers (e.g. Cache-Control).
+            content_disposition_type: "attachment" or "inline".
+        """
+        self.path = Path(path)
+        self.sha256 = sha256
+        self.size_bytes = size_bytes
+        self.status_code = 200
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+        self.headers["accept-ranges"] = "bytes"
+        if filename is not None:
+            quoted = quote(filename)
+            if quoted != filename:
+                disposition = f"{content_disposition_type}; filename*=utf-8''{quoted}"
+            else:
+                disposition = f'{content_disposition_type}; filename="{filename}"'
+            self.headers["content-disposition"] = disposition
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the response, evaluating request preconditions first."""
+        try:
+            stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+        except FileNotFoundError:
+            await Response(status_code=404)(scope, receive, send)
+            return
+
+        file_size = stat_result.st_size
+        etag = build_etag(self.sha256, stat_result, self.size_bytes)
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        self.headers["etag"] = etag
+        self.headers["last-modified"] = last_modified
+
+        request_headers = Headers(scope=scope)
+        method = scope["method"].upper()
+        head_only = method == "HEAD"
+
+        status = self._evaluate_preconditions(
+            request_headers, etag, int(stat_result.st_mtime), method
+        )
+        if status is not None:
+            await self._send_status(send, status)
+            return
+
+        ranges = None
+        http_range = request_headers.get("range")
+        if http_range is not None and self._if_range_allows(
+            request_headers.get("if-range"), etag, last_modified
+        ):
+            try:
+                ranges = parse_range_header(http_range, file_size)
+            except RangeNotSatisfiable:
+                self.headers["content-range"] = f"bytes */{file_size}"
+                await self._send_status(send, 416)
+                return
+
+        if not ranges:
+            await self._send_range(send, 0, file_size, head_only, 200)
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+            await self._send_range(send, start, end, head_only, 206)
+        else:
+            await self._send_multipart(send, ranges, file_size, head_only)
+
+    def _evaluate_preconditions(
+        self, headers: Headers, etag: str, mtime: int, method: str
+    ) -> int | None:
+        """Apply RFC 7232 preconditions in their specified order.
+
+        Returns:
+            304 or 412 if the request short-circuits, otherwise None.
+        """
+        if_match = headers.get("if-match")
+        if if_match is not None:
+            if not _etag_matches(if_match, etag, weak=False):
+                return 412
+        else:
+            if_unmodified_since = headers.get("if-unmodified-since")
+            if if_unmodified_since is not None:
+                since = _parse_http_date(if_unmodified_since)
+                if since is not None and mtime > since:
+                    return 412
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            if _etag_matches(if_none_match, etag, weak=True):
+                return 304 if method in ("GET", "HEAD") else 412
+        elif method in ("GET", "HEAD"):
+            if_modified_since = headers.get("if-modified-since")
+            if if_modified_since is not None:
+                since = _parse_http_date(if_modified_since)
+                if since is not None and mtime <= since:
+                    return 304
+
+        return None
+
+    @staticmethod
+    def _if_range_allows(if_range: str | None, etag: str, last_modified: str) -> bool:
+        """Check whether If-Range permits a partial response."""
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"'):
+            return if_range == etag
+        # Weak ETags never match; dates must match Last-Modified exactly
+        return if_range == last_modified
+
+    async def _send_status(self, send: Send, status: int) -> None:
+        """Send a body-less response (304, 412 or 416)."""
+        headers = MutableHeaders(raw=list(self.raw_headers))
+        if status == 304:
+            # A 304 carries validators and caching headers, not entity headers
+            for name in ("content-type", "content-disposition", "content-length"):
+                if name in headers:
+                    del headers[name]
+        else:
+            headers["content-length"] = "0"
+        await send({"type": "http.response.start", "status": status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_range(
+        self,
+        send: Send,
+        start: int,
+        end: int,
+        head_only: bool,
+        status: int,
+    ) -> None:
+        """Send the whole file (200) or a single range (206)."""
+        self.headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": status, "headers": self.raw_headers})
+        if head_only or start == end:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            await self._send_file_range(send, file, start, end)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_multipart(
+        self,
+        send: Send,
+        ranges: list[tuple[int, int]],
+        file_size: int,
+        head_only: bool,
+    ) -> None:
+        """Send several ranges as multipart/byteranges."""
+        boundary = secrets.token_hex(13)
+        part_headers = [
+            (
+                f"--{boundary}\r\n"
+                f"Content-Type: {self.media_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        content_length = (
+            sum(len(header) for header in part_headers)
+            + sum(end - start for start, end in ranges)
+            + 2 * (len(ranges) - 1)  # CRLF between parts
+            + len(closing)
+        )
+
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(content_length)
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        if head_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            for i, (start, end) in enumerate(ranges):
+                prefix = part_headers[i] if i == 0 else b"\r\n" + part_headers[i]
+                await send({"type": "http.response.body", "body": prefix, "more_body": True})
+                await self._send_file_range(send, file, start, end)
+        await send({"type": "http.response.body", "body": closing, "more_body": False})
+
+    async def _send_file_range(
+        self, send: Send, file: anyio.AsyncFile[bytes], start: int, end: int
+    ) -> None:
+        """Stream bytes [start, end) of an open file as body chunks."""
+        await file.seek(start)
+        while start < end:
+            chunk = await file.read(min(FILE_CHUNK_SIZE, end - start))
+            if not chunk:
+                raise RuntimeError(f"File at path {self.path} is shorter than expected.")
+            start += len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
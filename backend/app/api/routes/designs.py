@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import String, and_, cast, func, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -47,6 +47,7 @@ from app.schemas.design import (
     PreviewSummary,
     TagSummary,
 )
+from app.services.blob_store import BlobStore
 from app.services.job_queue import JobQueueService
 from app.services.preview import PreviewService
 from app.services.tag import TagService
@@ -1898,7 +1899,7 @@ async def delete_files(
     from pathlib import Path
 
     from app.core.config import settings
-    from app.db.models import DesignFile, DesignStatus
+    from app.db.models import DesignStatus
 
     # Get design
     design = await db.get(Design, design_id)
@@ -1918,11 +1919,8 @@ async def delete_files(
         shutil.rmtree(staging_dir)
         logger.info("staging_deleted", design_id=design_id, path=str(staging_dir))
 
-    # Delete DesignFile records
-    from sqlalchemy import delete
-    await db.execute(
-        delete(DesignFile).where(DesignFile.design_id == design_id)
-    )
+    # Delete DesignFile records (and blobs no other design uses)
+    await BlobStore().delete_design_files(db, design_id)
 
     # Reset design status
     design.status = DesignStatus.DISCOVERED
@@ -2015,7 +2013,7 @@ async def bulk_delete_designs(
                             file_path.unlink()
 
             # Delete related records
-            await db.execute(sql_delete(DesignFile).where(DesignFile.design_id == design_id))
+            await BlobStore().delete_design_files(db, design_id)
             await db.execute(sql_delete(DesignSource).where(DesignSource.design_id == design_id))
             await db.execute(sql_delete(ExternalMetadataSource).where(ExternalMetadataSource.design_id == design_id))
             await db.execute(sql_delete(DesignTag).where(DesignTag.design_id == design_id))
@@ -2123,7 +2121,7 @@ async def delete_design(
             logger.info("library_folder_deleted", design_id=design_id)
 
     # Delete related records (cascade)
-    await db.execute(sql_delete(DesignFile).where(DesignFile.design_id == design_id))
+    await BlobStore().delete_design_files(db, design_id)
     await db.execute(sql_delete(DesignSource).where(DesignSource.design_id == design_id))
     await db.execute(sql_delete(ExternalMetadataSource).where(ExternalMetadataSource.design_id == design_id))
     await db.execute(sql_delete(DesignTag).where(DesignTag.design_id == design_id))
@@ -2205,18 +2203,22 @@ async def list_design_files(
 @router.get("/{design_id}/download")
 async def download_design_files(
     design_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Download all design files as a ZIP archive.
 
-    Creates a ZIP file on-the-fly and streams it to the client.
+    The archive is streamed as the files are read, so nothing is buffered
+    in memory. Already-compressed formats are stored rather than deflated;
+    if every file is stored the response carries a Content-Length and an
+    ETag, and single byte ranges are served so downloads can resume.
     Only includes files that exist in the library.
     """
-    import io
-    import zipfile
-    from fastapi.responses import StreamingResponse
+    from fastapi.responses import Response, StreamingResponse
 
+    from app.api.file_response import RangeNotSatisfiable, parse_range_header
     from app.db.models import DesignFile
+    from app.utils.zip_stream import ZipStream
 
     # Get design
     design = await db.get(Design, design_id)
@@ -2232,34 +2234,64 @@ async def download_design_files(
     if not design_files:
         raise HTTPException(status_code=404, detail="Design has no files")
 
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for df in design_files:
-            file_path = settings.library_path / df.relative_path
-            if file_path.exists():
-                # Use relative_path as the path in the ZIP
-                zip_file.write(file_path, df.relative_path)
-
-    zip_buffer.seek(0)
+    zip_stream = ZipStream()
+    for df in design_files:
+        file_path = settings.library_path / df.relative_path
+        if file_path.is_file():
+            # Use relative_path as the path in the ZIP
+            zip_stream.add_file(file_path, df.relative_path)
 
     # Generate safe filename
     safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in design.canonical_title)
     filename = f"{safe_title}.zip"
 
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    content_length = zip_stream.content_length
+    if content_length is not None:
+        etag = zip_stream.etag
+        headers["Content-Length"] = str(content_length)
+        headers["Accept-Ranges"] = "bytes"
+        headers["ETag"] = etag
+
+        # Resume: serve a single range if the archive is unchanged (If-Range)
+        http_range = request.headers.get("range")
+        if http_range is not None and request.headers.get("if-range", etag) == etag:
+            try:
+                ranges = parse_range_header(http_range, content_length)
+            except RangeNotSatisfiable:
+                return Response(
+                    status_code=416,
+                    headers={"Content-Range": f"bytes */{content_length}"},
+                )
+            # Several ranges aren't worth a multipart archive; send it whole
+            if ranges is not None and len(ranges) == 1:
+                start, end = ranges[0]
+                headers["Content-Length"] = str(end - start)
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/{content_length}"
+                logger.info(
+                    "design_download_resumed",
+                    design_id=design_id,
+                    start=start,
+                    end=end,
+                )
+                return StreamingResponse(
+                    zip_stream.iter_range(start, end),
+                    status_code=206,
+                    media_type="application/zip",
+                    headers=headers,
+                )
+
     logger.info(
         "design_download_started",
         design_id=design_id,
-        file_count=len(design_files),
+        file_count=len(zip_stream.entries),
+        content_length=content_length,
     )
 
     return StreamingResponse(
-        zip_buffer,
+        zip_stream,
         media_type="application/zip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+        headers=headers,
     )
 
 
@@ -2272,10 +2304,10 @@ async def download_single_file(
     """Download a single file from a design.
 
     Returns the file with proper Content-Disposition header for browser download.
-    Uses streaming for large files.
+    Supports Range requests (resume and segmented downloads) and conditional
+    requests, using the file's SHA-256 as a strong ETag.
     """
-    from fastapi.responses import FileResponse
-
+    from app.api.file_response import LibraryFileResponse
     from app.db.models import DesignFile
 
     # Get design (for ownership validation)
@@ -2322,8 +2354,10 @@ async def download_single_file(
         filename=design_file.filename,
     )
 
-    return FileResponse(
-        path=str(file_path),
+    return LibraryFileResponse(
+        file_path,
+        sha256=design_file.sha256,
+        size_bytes=design_file.size_bytes,
         filename=design_file.filename,
         media_type="application/octet-stream",
     )
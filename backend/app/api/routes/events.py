@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse
 
 from app.core.logging import get_logger
@@ -20,12 +20,21 @@ router = APIRouter(prefix="/events", tags=["events"])
 
 
 @router.get("/")
-async def sse_events():
+async def sse_events(
+    last_event_id_header: str | None = Header(None, alias="Last-Event-ID"),
+    last_event_id: str | None = Query(None),
+):
     """Subscribe to Server-Sent Events stream.
 
     Returns a streaming response that sends events as they occur.
     The connection stays open until the client disconnects.
 
+    Every event carries an SSE id. A reconnecting client sends the last id
+    it saw (Last-Event-ID header, or the last_event_id query parameter for
+    clients that reconnect with a new EventSource) and first receives the
+    events it missed. If those are no longer available it receives a
+    resync event and should refetch its state.
+
     Events are JSON-formatted with the following structure:
     ```json
     {
@@ -51,12 +60,14 @@ async def sse_events():
     - queue_updated: Queue was reordered
     - heartbeat: Keep-alive ping (every 30s)
     - sync_status: Channel sync status update
+    - resync: Events were missed; refetch queue and activity
     """
     broadcaster = get_event_broadcaster()
+    resume_from = last_event_id_header or last_event_id
 
     async def event_generator():
         """Generate SSE events from the broadcaster queue."""
-        async with broadcaster.subscribe() as queue:
+        async with broadcaster.subscribe(resume_from) as queue:
             # Send initial connection event
             yield Event(
                 type=EventType.HEARTBEAT,
@@ -106,10 +117,11 @@ async def sse_events():
 async def get_events_status():
     """Get status of the event broadcaster.
 
-    Returns the number of connected clients and broadcaster status.
+    Returns the number of connected clients, delivery metrics
+    (dropped, coalesced and replayed events) and broadcaster status.
     """
     broadcaster = get_event_broadcaster()
     return {
-        "connected_clients": broadcaster.client_count,
+        **broadcaster.get_stats(),
         "status": "active",
     }
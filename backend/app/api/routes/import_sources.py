@@ -48,6 +48,7 @@ from app.schemas.import_source import (
     SyncTriggerRequest,
     SyncTriggerResponse,
 )
+from app.services.blob_store import BlobStore
 from app.services.google_drive import GoogleDriveService
 from app.services.job_queue import JobQueueService
 from app.services.phpbb import PhpbbAuthError, PhpbbService
@@ -693,7 +694,7 @@ async def delete_import_source(
                         file_path.unlink()
 
             # Delete related records
-            await db.execute(sql_delete(DesignFile).where(DesignFile.design_id == design.id))
+            await BlobStore().delete_design_files(db, design.id)
             await db.execute(sql_delete(DesignSource).where(DesignSource.design_id == design.id))
             await db.execute(sql_delete(ExternalMetadataSource).where(ExternalMetadataSource.design_id == design.id))
             await db.execute(sql_delete(DesignTag).where(DesignTag.design_id == design.id))
@@ -760,7 +761,8 @@ async def trigger_sync(
 
     Queues a SYNC_IMPORT_SOURCE job that will:
     - For BULK_FOLDER sources: scan the folder and create import records
-    - For GOOGLE_DRIVE sources: list files and create import records
+    - For GOOGLE_DRIVE sources: apply Drive changes since the last sync and
+      create import records (request.rebuild rescans the whole tree)
 
     Returns immediately with the job_id for tracking progress.
     """
@@ -808,6 +810,7 @@ async def trigger_sync(
             "source_id": source_id,
             "auto_import": request.auto_import,
             "conflict_resolution": request.conflict_resolution.value,
+            "rebuild": request.rebuild,
         },
     )
     await db.commit()
@@ -817,6 +820,7 @@ async def trigger_sync(
         source_id=source_id,
         job_id=job.id,
         auto_import=request.auto_import,
+        rebuild=request.rebuild,
     )
 
     return SyncTriggerResponse(
@@ -1129,6 +1133,7 @@ async def trigger_folder_sync(
             "folder_id": folder_id,
             "auto_import": request.auto_import,
             "conflict_resolution": request.conflict_resolution.value,
+            "rebuild": request.rebuild,
         },
     )
     await db.commit()
@@ -1139,6 +1144,7 @@ async def trigger_folder_sync(
         folder_id=folder_id,
         job_id=job.id,
         auto_import=request.auto_import,
+        rebuild=request.rebuild,
     )
 
     return FolderSyncTriggerResponse(
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.file_response import LibraryFileResponse
 from app.core.logging import get_logger
 from app.db import get_db
 from app.db.models import PreviewAsset
 from app.db.models.enums import PreviewKind, PreviewSource
 from app.services.preview import PreviewService
+from app.services.preview_variants import select_variant
 
 logger = get_logger(__name__)
 
@@ -84,17 +85,33 @@ class AutoSelectPrimaryResponse(BaseModel):
     message: str
 
 
+class BackfillVariantsResponse(BaseModel):
+    """Response for queueing the preview variant backfill."""
+
+    job_id: str | None
+    queued: bool
+
+
 # =============================================================================
 # Static File Serving
 # =============================================================================
 
 
 @router.get("/files/{path:path}")
-async def serve_preview_file(path: str) -> FileResponse:
+async def serve_preview_file(
+    path: str,
+    w: int | None = Query(None, ge=1, le=4096, description="Display width in pixels"),
+    accept: str | None = Header(None),
+) -> LibraryFileResponse:
     """Serve a preview image file.
 
+    With w, serves the smallest resized variant at least that wide in a
+    format the client accepts (AVIF, then WebP), falling back to the
+    original when there is no suitable variant.
+
     Security: Validates path to prevent directory traversal.
     Returns appropriate Content-Type header based on file extension.
+    Supports conditional requests (ETag/304) and Range requests.
     """
     service = PreviewService()
     file_path = service.get_static_path(path)
@@ -102,6 +119,17 @@ async def serve_preview_file(path: str) -> FileResponse:
     if not file_path:
         raise HTTPException(status_code=404, detail="Preview file not found")
 
+    headers = {
+        "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+    }
+
+    if w is not None:
+        # The response depends on Accept, so caches must key on it
+        headers["Vary"] = "Accept"
+        file_path, content_type = select_variant(file_path, w, accept)
+        if content_type:
+            return LibraryFileResponse(file_path, media_type=content_type, headers=headers)
+
     # Determine content type
     ext = file_path.suffix.lower()
     content_types = {
@@ -113,15 +141,29 @@ async def serve_preview_file(path: str) -> FileResponse:
     }
     content_type = content_types.get(ext, "application/octet-stream")
 
-    return FileResponse(
-        path=file_path,
+    return LibraryFileResponse(
+        file_path,
         media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-        },
+        headers=headers,
     )
 
 
+@router.post("/variants/backfill", response_model=BackfillVariantsResponse)
+async def backfill_preview_variants(
+    db: AsyncSession = Depends(get_db),
+) -> BackfillVariantsResponse:
+    """Queue generation of resized variants for previews that lack them.
+
+    Variants are created when a preview is saved; this covers previews
+    saved before that. A backfill is also queued on startup.
+    """
+    service = PreviewService(db)
+    job_id = await service.queue_variant_backfill()
+    await db.commit()
+
+    return BackfillVariantsResponse(job_id=job_id, queued=job_id is not None)
+
+
 # =============================================================================
 # Preview CRUD Operations
 # =============================================================================
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.db import get_db
 from app.db.models import Job, JobStatus, JobType
+from app.services.blob_store import BlobStore
 
 logger = get_logger(__name__)
 
@@ -69,6 +70,13 @@ class SystemActivityResponse(BaseModel):
     summary: ActivitySummary
 
 
+class LibraryDedupeResponse(BaseModel):
+    """Response for queueing library deduplication."""
+
+    job_id: str | None
+    queued: bool
+
+
 # =============================================================================
 # Job Type to Category Mapping
 # =============================================================================
@@ -86,9 +94,11 @@ JOB_CATEGORY_MAP: dict[JobType, tuple[str, str]] = {
     # Images
     JobType.DOWNLOAD_TELEGRAM_IMAGES: ("images", "telegram_downloading"),
     JobType.GENERATE_RENDER: ("images", "previews_generating"),
+    JobType.GENERATE_PREVIEW_VARIANTS: ("images", "previews_generating"),
     # Analysis
     JobType.EXTRACT_ARCHIVE: ("analysis", "archives_extracting"),
     JobType.IMPORT_TO_LIBRARY: ("analysis", "importing_to_library"),
+    JobType.DEDUPE_LIBRARY: ("analysis", "importing_to_library"),
     JobType.ANALYZE_3MF: ("analysis", "analyzing_3mf"),
 }
 
@@ -176,3 +186,20 @@ async def get_system_activity(
         analysis=analysis,
         summary=summary,
     )
+
+
+@router.post("/library/dedupe", response_model=LibraryDedupeResponse)
+async def dedupe_library(
+    db: AsyncSession = Depends(get_db),
+) -> LibraryDedupeResponse:
+    """Queue conversion of the library to content-addressed storage.
+
+    Identical files across designs are replaced by hardlinks to one blob
+    under library/.blobs. Queued on startup when
+    PRINTARR_LIBRARY_CONTENT_ADDRESSED is enabled and the library hasn't
+    been converted yet.
+    """
+    job_id = await BlobStore().queue_dedupe(db)
+    await db.commit()
+
+    return LibraryDedupeResponse(job_id=job_id, queued=job_id is not None)
@@ -2,6 +2,7 @@
 
 Provides endpoints for:
 - Single and batch file uploads via multipart/form-data
+- Resumable chunked uploads (tus-style offsets) for large files
 - Upload status checking
 - Upload processing (trigger import)
 - Upload deletion/cleanup
@@ -11,22 +12,26 @@ See DEC-033 for Import Source design decisions.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Request, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
 
 from app.core.logging import get_logger
 from app.db import get_db
 from app.schemas.upload import (
     BatchUploadResponse,
+    CreateUploadSessionRequest,
     ProcessUploadRequest,
     ProcessUploadResponse,
     UploadInfo,
     UploadResponse,
+    UploadSessionResponse,
     UploadStatusResponse,
 )
 from app.services.upload import (
     UploadError,
     UploadNotFoundError,
+    UploadOffsetError,
     UploadProcessingError,
     UploadService,
     UploadValidationError,
@@ -54,13 +59,11 @@ async def upload_file(
     await service.ensure_staging_dir()
 
     try:
-        # Read file content
-        content = await file.read()
-
         response = await service.create_upload(
             filename=file.filename or "unnamed_file",
-            file_content=content,
+            file_content=file,
             content_type=file.content_type,
+            size=file.size,
         )
 
         await db.commit()
@@ -107,11 +110,11 @@ async def upload_files_batch(
 
     for file in files:
         try:
-            content = await file.read()
             response = await service.create_upload(
                 filename=file.filename or "unnamed_file",
-                file_content=content,
+                file_content=file,
                 content_type=file.content_type,
+                size=file.size,
             )
             uploads.append(response)
             total_size += response.size
@@ -148,6 +151,99 @@ async def upload_files_batch(
     )
 
 
+# ========== Resumable Uploads ==========
+
+
+def _offset_headers(session: UploadSessionResponse) -> dict[str, str]:
+    return {
+        "Upload-Offset": str(session.offset),
+        "Upload-Length": str(session.size),
+        "Cache-Control": "no-store",
+    }
+
+
+@router.post("/sessions", response_model=UploadSessionResponse, status_code=201)
+async def create_upload_session(
+    request: CreateUploadSessionRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> UploadSessionResponse:
+    """Start a resumable upload.
+
+    Send the data with PATCH /upload/sessions/{upload_id}. After a dropped
+    connection, HEAD the session for the current offset and continue from
+    there. Once all bytes have arrived the upload becomes PENDING and is
+    processed like any other.
+    """
+    service = UploadService(db)
+    await service.ensure_staging_dir()
+
+    try:
+        session = await service.create_upload_session(
+            filename=request.filename,
+            size=request.size,
+            content_type=request.content_type,
+        )
+    except UploadValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response.headers.update(_offset_headers(session))
+    return session
+
+
+@router.head("/sessions/{upload_id}")
+async def get_upload_session_offset(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get the current offset of a resumable upload (Upload-Offset header)."""
+    service = UploadService(db)
+
+    try:
+        session = await service.get_upload_session(upload_id)
+    except UploadNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    return Response(status_code=200, headers=_offset_headers(session))
+
+
+@router.patch("/sessions/{upload_id}", response_model=UploadSessionResponse)
+async def append_upload_chunk(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> UploadSessionResponse:
+    """Append the request body to a resumable upload.
+
+    The body is raw file data (application/offset+octet-stream) starting
+    at Upload-Offset, which must equal the current offset. It is streamed
+    straight to staging.
+    """
+    service = UploadService(db)
+
+    try:
+        session = await service.append_upload_chunk(upload_id, upload_offset, request.stream())
+    except UploadNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    except UploadOffsetError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.offset)},
+        )
+    except UploadValidationError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ClientDisconnect:
+        # What arrived is kept; the client resumes from the new offset
+        logger.info("upload_chunk_interrupted", upload_id=upload_id)
+        raise HTTPException(status_code=400, detail="Client disconnected")
+
+    response.headers.update(_offset_headers(session))
+    return session
+
+
 @router.get("/", response_model=list[UploadInfo])
 async def list_uploads(
     include_expired: bool = False,
@@ -56,12 +56,54 @@ class Settings(BaseSettings):
         default=2,
         description="Maximum concurrent download workers",
     )
+    max_concurrent_import_downloads: int = Field(
+        default=2,
+        ge=1,
+        le=10,
+        description="Maximum concurrent import source (Google Drive, phpBB, bulk folder) download workers (1-10)",
+    )
+    max_telegram_transfers: int = Field(
+        default=3,
+        ge=1,
+        le=10,
+        description="Maximum concurrent Telegram media transfers across all workers (1-10)",
+    )
+    max_disk_io_jobs: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum concurrent disk-heavy jobs (downloads, extraction, library import) (1-16)",
+    )
+    max_cpu_jobs: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum concurrent CPU-bound jobs (archive extraction, rendering) (1-16)",
+    )
+    threemf_analysis_memory_mb: int = Field(
+        default=1024,
+        ge=128,
+        le=16384,
+        description="Address-space cap per 3MF analysis worker process in MB (128-16384)",
+    )
     download_timeout_seconds: int = Field(
         default=600,
         ge=60,
         le=3600,
         description="Timeout for individual file downloads in seconds (60-3600, default 10 minutes)",
     )
+    worker_safety_poll_interval: float = Field(
+        default=30.0,
+        ge=5.0,
+        le=600.0,
+        description="Seconds between safety-net job queue polls while LISTEN/NOTIFY dispatch is active (5-600)",
+    )
+    job_claim_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=50,
+        description="Jobs claimed per poll by download/image workers (1-50, 1 disables batching; raise only for long backlogs)",
+    )
 
     # Sync settings (v0.6)
     sync_poll_interval: int = Field(
@@ -86,6 +128,10 @@ class Settings(BaseSettings):
         default="{designer}/{channel}/{title}",
         description="Global template for library folder structure",
     )
+    library_content_addressed: bool = Field(
+        default=False,
+        description="Store each unique file once under library/.blobs and hardlink it into design folders",
+    )
 
     # Database (PostgreSQL embedded in container per DEC-039)
     database_url: str = Field(
@@ -147,6 +193,24 @@ class Settings(BaseSettings):
         le=10.0,
         description="Minimum seconds between requests to the same channel (0.5-10)",
     )
+    telegram_download_connections: int = Field(
+        default=4,
+        ge=1,
+        le=8,
+        description="Parallel connections per large Telegram document download (1-8, 1 disables parallel parts)",
+    )
+    telegram_download_bandwidth_mbps: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=10000.0,
+        description="Total bandwidth budget for parallel Telegram downloads in Mbit/s (0 = unlimited)",
+    )
+    telegram_attachment_concurrency: int = Field(
+        default=2,
+        ge=1,
+        le=8,
+        description="Attachments of one design downloaded at the same time (1-8)",
+    )
 
     # FlareSolverr (optional, for bypassing Cloudflare on Thangs)
     flaresolverr_url: str | None = Field(
@@ -228,6 +292,18 @@ class Settings(BaseSettings):
         description="Priority for auto-queued render jobs (-10 to 10, negative = background)",
     )
 
+    # Preview derivative settings
+    preview_variant_quality: int = Field(
+        default=80,
+        ge=30,
+        le=95,
+        description="Encoder quality of resized WebP/AVIF preview variants (30-95)",
+    )
+    preview_avif_enabled: bool = Field(
+        default=False,
+        description="Also generate AVIF preview variants (needs Pillow with AVIF support)",
+    )
+
     # phpBB Forum settings (v1.0 - issue #239)
     phpbb_request_delay: float = Field(
         default=1.0,
@@ -281,6 +357,30 @@ class Settings(BaseSettings):
         le=30,
         description="Maximum AI-generated tags per design (1-30)",
     )
+    ai_image_max_edge: int = Field(
+        default=1024,
+        ge=256,
+        le=4096,
+        description="Longest edge in pixels of preview images sent to AI (256-4096)",
+    )
+    ai_image_quality: int = Field(
+        default=80,
+        ge=30,
+        le=95,
+        description="JPEG quality of preview images sent to AI (30-95)",
+    )
+    ai_batch_max_designs: int = Field(
+        default=8,
+        ge=1,
+        le=20,
+        description="Designs analyzed per AI request in batch mode; 1 disables batching (1-20)",
+    )
+    ai_batch_token_budget: int = Field(
+        default=32000,
+        ge=4000,
+        le=500000,
+        description="Approximate input token budget of a batched AI request (4000-500000)",
+    )
 
     @property
     def upload_staging_path(self) -> Path:
@@ -75,4 +75,5 @@ class Attachment(Base):
         Index("ix_attachments_message_id", "message_id"),
         Index("ix_attachments_candidate", "is_candidate_design_file"),
         Index("ix_attachments_sha256", "sha256"),
+        Index("ix_attachments_unique_file_id", "telegram_unique_file_id"),
     )
@@ -149,6 +149,8 @@ class JobType(str, enum.Enum):
     DOWNLOAD_IMPORT_RECORD = "DOWNLOAD_IMPORT_RECORD"  # v0.8: Per-design import download (DEC-040)
     AI_ANALYZE_DESIGN = "AI_ANALYZE_DESIGN"  # v1.0: AI-powered design analysis (DEC-043)
     DETECT_FAMILY_OVERLAP = "DETECT_FAMILY_OVERLAP"  # v1.0: Post-download family detection (DEC-044)
+    GENERATE_PREVIEW_VARIANTS = "GENERATE_PREVIEW_VARIANTS"  # Backfill of resized preview variants
+    DEDUPE_LIBRARY = "DEDUPE_LIBRARY"  # Convert the library to content-addressed blobs
 
 
 class JobStatus(str, enum.Enum):
@@ -62,6 +62,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if tags_created > 0:
             logger.info("predefined_tags_seeded", count=tags_created)
 
+    # Generate resized variants for previews saved before they existed
+    await PreviewService().queue_variant_backfill()
+
+    # Move files imported before content-addressed storage into the blob store
+    if settings.library_content_addressed:
+        from app.services.blob_store import BlobStore
+
+        blob_store = BlobStore()
+        if not blob_store.is_deduped():
+            async with async_session_maker() as db:
+                await blob_store.queue_dedupe(db)
+                await db.commit()
+
     # Initialize Telegram service if configured
     telegram_service = TelegramService.get_instance()
     telegram_authenticated = False
@@ -136,6 +149,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("stopping_cleanup_service")
     await cleanup_service.stop()
 
+    # Close pooled Google Drive connections
+    from app.services.google_drive_client import close_drive_http_clients
+    await close_drive_http_clients()
+
+    # Close pooled phpBB connections
+    from app.services.phpbb_http import close_phpbb_http_clients
+    await close_phpbb_http_clients()
+
+    # Stop the AI image preparation pool
+    from app.services.ai_images import shutdown_ai_image_executor
+    shutdown_ai_image_executor()
+
+    # Stop the 3MF analysis pool
+    from app.services.threemf import shutdown_threemf_executor
+    shutdown_threemf_executor()
+
+    # Stop the preview variant pool
+    from app.services.preview_variants import shutdown_preview_variant_executor
+    shutdown_preview_variant_executor()
+
     # Disconnect Telegram on shutdown
     if telegram_service.is_connected():
         await telegram_service.disconnect()
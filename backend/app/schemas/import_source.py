@@ -278,6 +278,10 @@ class SyncTriggerRequest(BaseModel):
     auto_import: bool = Field(
         False, description="Automatically import detected designs"
     )
+    rebuild: bool = Field(
+        False,
+        description="Google Drive: rescan the whole folder tree instead of applying changes since the last sync",
+    )
 
 
 class SyncTriggerResponse(BaseModel):
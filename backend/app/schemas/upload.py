@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 class UploadStatus(str, Enum):
     """Status of an upload."""
 
+    UPLOADING = "UPLOADING"  # Resumable upload still receiving data
     PENDING = "PENDING"  # File received, awaiting processing
     PROCESSING = "PROCESSING"  # Currently being processed
     COMPLETED = "COMPLETED"  # Successfully processed
@@ -24,6 +25,7 @@ class UploadInfo(BaseModel):
     id: str
     filename: str
     size: int
+    sha256: str | None = Field(None, description="SHA-256 of the file once fully received")
     mime_type: str | None = None
     status: UploadStatus
     error_message: str | None = None
@@ -39,6 +41,26 @@ class UploadResponse(BaseModel):
     filename: str
     size: int
     status: UploadStatus
+    sha256: str | None = None
+
+
+class CreateUploadSessionRequest(BaseModel):
+    """Request to start a resumable upload."""
+
+    filename: str = Field(..., min_length=1, max_length=255)
+    size: int = Field(..., ge=0, description="Total file size in bytes")
+    content_type: str | None = None
+
+
+class UploadSessionResponse(BaseModel):
+    """State of a resumable upload."""
+
+    upload_id: str
+    filename: str
+    offset: int = Field(..., description="Bytes received so far; the next chunk starts here")
+    size: int
+    status: UploadStatus
+    sha256: str | None = None
 
 
 class BatchUploadResponse(BaseModel):
@@ -12,22 +12,57 @@ from __future__ import annotations
 import asyncio
 import base64
 import json
+import math
 import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.db.models import Design, DesignSource, DesignTag, PreviewAsset, Tag
 from app.db.models.enums import PreviewSource, TagSource
 from app.db.session import async_session_maker
-from app.services.tag import TagService
+from app.services.ai_cache import AiResultCache
+from app.services.ai_images import prepare_ai_images
+from app.services.tag import TagService, tag_vocabulary_generation
+from app.utils.file_hash import compute_file_hashes_batch
 
 logger = get_logger(__name__)
 
+# Bump whenever _build_prompt changes what is asked, so cached results
+# from the old prompt aren't reused
+AI_PROMPT_VERSION = 1
+
+# Reload the tag vocabulary at least this often even without tag changes,
+# so the usage ordering stays roughly current
+TAG_VOCABULARY_TTL = 300  # seconds
+
+# Shared by the single-design and batch prompts
+TAG_GUIDELINES = """\
+- **Prefer existing tags** when meaning matches (use "helmet" not "helmets")
+- Lowercase, no special characters
+- Include: what it is, theme/franchise, style, use case
+- Be specific when warranted ("nightmare before christmas" not just "christmas")
+- Skip: "3d print", "stl", "model", "file"
+- **Do NOT include print-type tags** like "multicolor", "resin", "fdm", "presupported", "single color" - these require technical knowledge that cannot be determined from images"""
+
+PREVIEW_GUIDELINES = """\
+- Shows the complete model clearly
+- Good lighting/angle
+- Prefer creator photos over gray STL renders"""
+
+# Rough Gemini input cost of an image: 258 tokens per 768px tile, or a
+# single tile for images up to 384px on both sides
+GEMINI_IMAGE_TILE_TOKENS = 258
+GEMINI_IMAGE_TILE_SIZE = 768
+
 # Preview source priority for AI analysis (lower = better)
 # Creator-provided images are more useful than auto-generated ones
 PREVIEW_PRIORITY = {
@@ -214,6 +249,17 @@ class AiAnalysisResult:
         }
 
 
+@dataclass
+class AiBatchEntry:
+    """A design packed into a batch analysis request."""
+
+    design: Design
+    previews: list[PreviewAsset]
+    paths: list[Path]
+    hashes: list[str]
+    cache_key: str
+
+
 class AiService:
     """Service for AI-powered design analysis.
 
@@ -227,6 +273,9 @@ class AiService:
     # Class-level httpx client for connection pooling
     _http_client: httpx.AsyncClient | None = None
 
+    # Class-level tag vocabulary cache: (generation, limit, loaded_at, tags)
+    _tag_vocabulary: tuple[int, int, float, list[str]] | None = None
+
     def __init__(self, db: AsyncSession | None = None):
         """Initialize the AI service.
 
@@ -270,8 +319,6 @@ class AiService:
 
         try:
             # Get design with eager-loaded relationships (needed for sync _build_prompt)
-            from sqlalchemy.orm import selectinload
-
             result = await db.execute(
                 select(Design)
                 .where(Design.id == design_id)
@@ -298,24 +345,65 @@ class AiService:
 
             # Get previews for analysis
             previews = await self._get_previews_for_analysis(db, design_id)
-            if not previews:
+            preview_paths = self._existing_preview_paths(previews)
+            if not preview_paths:
                 logger.debug("no_previews_for_analysis", design_id=design_id)
                 return None
+            previews = list(preview_paths)
+
+            # Identical inputs give the same answer: reuse a stored result
+            hashes = await compute_file_hashes_batch(list(preview_paths.values()))
+            cache_key = None
+            if len(hashes) == len(previews):
+                cache_key = AiResultCache.key_for(
+                    AI_PROMPT_VERSION,
+                    self._design_context(design),
+                    [hashes[preview_paths[p]] for p in previews],
+                    [p.source.value for p in previews],
+                )
 
-            # Get existing tags for context (to prefer existing tag names)
-            existing_tags = await self._get_existing_tags(db)
+            cached = AiResultCache.get(cache_key) if cache_key else None
+            if cached is not None:
+                result = AiAnalysisResult(
+                    tags=cached["tags"],
+                    best_preview_index=cached.get("best_preview_index"),
+                )
+                logger.info("ai_result_cache_hit", design_id=design_id)
+            else:
+                # Get existing tags for context (to prefer existing tag names)
+                existing_tags = await self._get_existing_tags(db)
+
+                # Build prompt
+                # Read preview images
+                image_data_list, sent = await self._read_preview_images(
+                    previews,
+                    [hashes.get(preview_paths[p]) for p in previews],
+                )
+                if not image_data_list:
+                    logger.warning("no_preview_images_prepared", design_id=design_id)
+                    return None
 
-            # Build prompt
-            prompt = self._build_prompt(design, previews, existing_tags)
+                # Build prompt (numbering the images actually attached)
+                prompt = self._build_prompt(
+                    design, [previews[i] for i in sent], existing_tags
+                )
 
-            # Read preview images
-            image_data_list = await self._read_preview_images(previews)
+                # Call AI API with rate limiting
+                rate_limiter = await AiRateLimiter.get_instance()
+                await rate_limiter.acquire()
 
-            # Call AI API with rate limiting
-            rate_limiter = await AiRateLimiter.get_instance()
-            await rate_limiter.acquire()
+                result = await self._call_gemini(prompt, image_data_list)
 
-            result = await self._call_gemini(prompt, image_data_list)
+                # The model picks among the images it was sent; map that
+                # back to the preview list
+                if result and result.best_preview_index is not None:
+                    if 0 <= result.best_preview_index < len(sent):
+                        result.best_preview_index = sent[result.best_preview_index]
+                    else:
+                        result.best_preview_index = None
+
+                if result and cache_key and len(sent) == len(previews):
+                    AiResultCache.put(cache_key, result.to_dict())
 
             if result:
                 # Apply tags to design
@@ -356,6 +444,183 @@ class AiService:
             if not self.db:
                 await db.close()
 
+    async def prefetch_batch(
+        self,
+        design_ids: list[str],
+        force: bool = False,
+    ) -> list[str]:
+        """Analyze several designs with a single API request (batch mode).
+
+        Packs designs, in order, into one request with a shared prompt until
+        ai_batch_token_budget is reached, and stores each design's result in
+        AiResultCache under the same key analyze_design() uses. The
+        following analyze_design() calls then apply the results without
+        another API call.
+
+        Designs that are already analyzed or cached, have no previews,
+        don't fit in the budget or are missing from the response are left
+        for analyze_design() to handle on its own.
+
+        Args:
+            design_ids: Designs to analyze.
+            force: Include designs that already have AI tags.
+
+        Returns:
+            IDs of the designs whose results were stored.
+
+        Raises:
+            AiRateLimitError: If Gemini rate limits the request.
+        """
+        if not settings.ai_configured or len(design_ids) < 2:
+            return []
+
+        if self.db:
+            db = self.db
+        else:
+            db = async_session_maker()
+
+        try:
+            entries = await self._collect_batch(db, design_ids, force)
+            if len(entries) < 2:
+                return []
+
+            # Prepare every design's images together
+            prepared = await prepare_ai_images(
+                [path for e in entries for path in e.paths],
+                [h for e in entries for h in e.hashes],
+            )
+            images: list[tuple[bytes, str]] = []
+            complete: list[AiBatchEntry] = []
+            offset = 0
+            for entry in entries:
+                own = prepared[offset:offset + len(entry.paths)]
+                offset += len(entry.paths)
+                if all(p is not None for p in own):
+                    complete.append(entry)
+                    images.extend((p.data, p.mime_type) for p in own)
+            if len(complete) < 2:
+                return []
+
+            existing_tags = await self._get_existing_tags(db)
+            prompt = self._build_batch_prompt(complete, existing_tags)
+
+            rate_limiter = await AiRateLimiter.get_instance()
+            await rate_limiter.acquire()
+
+            try:
+                results = await self._call_gemini(
+                    prompt,
+                    images,
+                    parser=lambda text: self._parse_batch_response(text, len(complete)),
+                )
+            except AiRateLimitError:
+                raise
+            except Exception as e:
+                # Each design falls back to its own request
+                logger.warning("ai_batch_failed", designs=len(complete), error=str(e))
+                return []
+
+            stored = []
+            for index, entry in enumerate(complete):
+                result = (results or {}).get(index)
+                if result is None:
+                    continue
+                if (
+                    result.best_preview_index is not None
+                    and not 0 <= result.best_preview_index < len(entry.previews)
+                ):
+                    result.best_preview_index = None
+                AiResultCache.put(entry.cache_key, result.to_dict())
+                stored.append(entry.design.id)
+
+            logger.info(
+                "ai_batch_analyzed",
+                designs=len(complete),
+                results=len(stored),
+                images=len(images),
+            )
+            return stored
+
+        finally:
+            if not self.db:
+                await db.close()
+
+    async def _collect_batch(
+        self,
+        db: AsyncSession,
+        design_ids: list[str],
+        force: bool,
+    ) -> list[AiBatchEntry]:
+        """Select the designs for a batch request within the token budget.
+
+        Args:
+            db: Database session.
+            design_ids: Candidate designs, in priority order.
+            force: Include designs that already have AI tags.
+
+        Returns:
+            Designs to pack into the request.
+        """
+        result = await db.execute(
+            select(Design)
+            .where(Design.id.in_(design_ids))
+            .options(
+                selectinload(Design.sources).selectinload(DesignSource.channel)
+            )
+        )
+        designs = {d.id: d for d in result.scalars().all()}
+
+        analyzed: set[str] = set()
+        if not force:
+            result = await db.execute(
+                select(DesignTag.design_id).where(
+                    DesignTag.design_id.in_(design_ids),
+                    DesignTag.source == TagSource.AUTO_AI,
+                )
+            )
+            analyzed = {row[0] for row in result.all()}
+
+        entries: list[AiBatchEntry] = []
+        # The shared part of the prompt (instructions, existing tags)
+        tokens = 1500
+        for design_id in design_ids:
+            design = designs.get(design_id)
+            if design is None or design_id in analyzed:
+                continue
+
+            previews = await self._get_previews_for_analysis(db, design_id)
+            preview_paths = self._existing_preview_paths(previews)
+            if not preview_paths:
+                continue
+            previews = list(preview_paths)
+            paths = list(preview_paths.values())
+
+            hashes = await compute_file_hashes_batch(paths)
+            if len(hashes) != len(paths):
+                continue
+            cache_key = AiResultCache.key_for(
+                AI_PROMPT_VERSION,
+                self._design_context(design),
+                [hashes[path] for path in paths],
+                [p.source.value for p in previews],
+            )
+            if AiResultCache.get(cache_key) is not None:
+                continue
+
+            cost = self._estimate_tokens(design, previews)
+            if entries and tokens + cost > settings.ai_batch_token_budget:
+                break
+            tokens += cost
+            entries.append(AiBatchEntry(
+                design=design,
+                previews=previews,
+                paths=paths,
+                hashes=[hashes[path] for path in paths],
+                cache_key=cache_key,
+            ))
+
+        return entries
+
     async def _get_previews_for_analysis(
         self,
         db: AsyncSession,
@@ -399,6 +664,31 @@ class AiService:
 
         return selected
 
+    def _existing_preview_paths(self, previews: list[PreviewAsset]) -> dict[PreviewAsset, Path]:
+        """Map previews to their files, skipping any that are missing.
+
+        Args:
+            previews: Previews selected for analysis.
+
+        Returns:
+            Dict of preview to file path, in the original order.
+        """
+        cache_path = settings.cache_path / "previews"
+        paths: dict[PreviewAsset, Path] = {}
+
+        for preview in previews:
+            file_path = cache_path / preview.file_path
+            if not file_path.exists():
+                logger.warning(
+                    "preview_file_missing",
+                    preview_id=preview.id,
+                    path=str(file_path),
+                )
+                continue
+            paths[preview] = file_path
+
+        return paths
+
     async def _get_existing_tags(
         self,
         db: AsyncSession,
@@ -406,6 +696,10 @@ class AiService:
     ) -> list[str]:
         """Get top existing tags by usage for context.
 
+        The list is cached across designs until a tag is created or removed
+        (see app.services.tag.invalidate_tag_vocabulary) or
+        TAG_VOCABULARY_TTL passes.
+
         Args:
             db: Database session.
             limit: Maximum tags to return.
@@ -413,29 +707,33 @@ class AiService:
         Returns:
             List of tag names sorted by usage.
         """
+        generation = tag_vocabulary_generation()
+        cached = AiService._tag_vocabulary
+        if (
+            cached is not None
+            and cached[:2] == (generation, limit)
+            and time.monotonic() - cached[2] < TAG_VOCABULARY_TTL
+        ):
+            return cached[3]
+
         result = await db.execute(
             select(Tag.name)
             .where(Tag.usage_count > 0)
             .order_by(Tag.usage_count.desc())
             .limit(limit)
         )
-        return [row[0] for row in result.all()]
+        tags = [row[0] for row in result.all()]
+        AiService._tag_vocabulary = (generation, limit, time.monotonic(), tags)
+        return tags
 
-    def _build_prompt(
-        self,
-        design: Design,
-        previews: list[PreviewAsset],
-        existing_tags: list[str],
-    ) -> str:
-        """Build the AI analysis prompt.
+    def _design_context(self, design: Design) -> dict[str, str]:
+        """Get the design metadata that goes into the prompt.
 
         Args:
-            design: The design to analyze.
-            previews: Selected preview images.
-            existing_tags: Existing tags for context.
+            design: The design, with sources and channels loaded.
 
         Returns:
-            Formatted prompt string.
+            Dict with title, designer, channel and caption.
         """
         # Get design info
         title = design.canonical_title or "Unknown"
@@ -455,6 +753,35 @@ class AiService:
             if first_source.caption_snapshot:
                 caption_text = first_source.caption_snapshot[:1000]  # Limit length
 
+        return {
+            "title": title,
+            "designer": designer,
+            "channel": channel_name,
+            "caption": caption_text,
+        }
+
+    def _build_prompt(
+        self,
+        design: Design,
+        previews: list[PreviewAsset],
+        existing_tags: list[str],
+    ) -> str:
+        """Build the AI analysis prompt.
+
+        Args:
+            design: The design to analyze.
+            previews: Selected preview images.
+            existing_tags: Existing tags for context.
+
+        Returns:
+            Formatted prompt string.
+        """
+        context = self._design_context(design)
+        title = context["title"]
+        designer = context["designer"]
+        channel_name = context["channel"]
+        caption_text = context["caption"]
+
         # Format image sources
         image_sources = ", ".join(
             p.source.value for p in previews
@@ -486,18 +813,11 @@ Prefer these existing tags when the meaning matches:
 
 ### 1. Tags
 Generate up to {max_tags} tags for this design.
-- **Prefer existing tags** when meaning matches (use "helmet" not "helmets")
-- Lowercase, no special characters
-- Include: what it is, theme/franchise, style, use case
-- Be specific when warranted ("nightmare before christmas" not just "christmas")
-- Skip: "3d print", "stl", "model", "file"
-- **Do NOT include print-type tags** like "multicolor", "resin", "fdm", "presupported", "single color" - these require technical knowledge that cannot be determined from images
+{TAG_GUIDELINES}
 
 ### 2. Best Preview (if multiple images)
 Select which image (0-indexed) best represents this design.
-- Shows the complete model clearly
-- Good lighting/angle
-- Prefer creator photos over gray STL renders
+{PREVIEW_GUIDELINES}
 
 ## Response
 JSON only:
@@ -505,74 +825,130 @@ JSON only:
 
         return prompt
 
-    async def _read_preview_images(
+    def _estimate_tokens(self, design: Design, previews: list[PreviewAsset]) -> int:
+        """Estimate the tokens a design adds to a batch request.
+
+        Counts its images (after downscaling to ai_image_max_edge), its
+        metadata text and the tags it will get back.
+        """
+        edge = settings.ai_image_max_edge
+        tokens = 0
+        for preview in previews:
+            width = preview.width or edge
+            height = preview.height or edge
+            scale = min(1.0, edge / max(width, height, 1))
+            width, height = width * scale, height * scale
+            if width <= GEMINI_IMAGE_TILE_SIZE / 2 and height <= GEMINI_IMAGE_TILE_SIZE / 2:
+                tokens += GEMINI_IMAGE_TILE_TOKENS
+            else:
+                tokens += GEMINI_IMAGE_TILE_TOKENS * (
+                    math.ceil(width / GEMINI_IMAGE_TILE_SIZE)
+                    * math.ceil(height / GEMINI_IMAGE_TILE_SIZE)
+                )
+
+        context = self._design_context(design)
+        tokens += sum(len(v) for v in context.values()) // 4 + 50
+        tokens += settings.ai_max_tags_per_design * 5 + 20
+        return tokens
+
+    def _build_batch_prompt(
         self,
-        previews: list[PreviewAsset],
-    ) -> list[tuple[bytes, str]]:
-        """Read preview image files.
+        entries: list[AiBatchEntry],
+        existing_tags: list[str],
+    ) -> str:
+        """Build the prompt for analyzing several designs in one request.
 
         Args:
-            previews: List of preview assets.
+            entries: Designs in the batch; their images are attached in order.
+            existing_tags: Existing tags for context.
 
         Returns:
-            List of (image_bytes, mime_type) tuples.
+            Formatted prompt string.
         """
-        cache_path = settings.cache_path / "previews"
-        result = []
+        sections = []
+        first_image = 0
+        for index, entry in enumerate(entries):
+            context = self._design_context(entry.design)
+            count = len(entry.previews)
+            image_sources = ", ".join(p.source.value for p in entry.previews)
+            sections.append(f"""### Design {index}
+- **Title**: {context["title"]}
+- **Designer**: {context["designer"]}
+- **Source**: {context["channel"]}
+- **Images**: attached images {first_image}-{first_image + count - 1} \
+(this design's images 0-{count - 1}; sources: {image_sources})
+- **Caption**:
+{context["caption"]}""")
+            first_image += count
 
-        for preview in previews:
-            try:
-                file_path = cache_path / preview.file_path
-                if not file_path.exists():
-                    logger.warning(
-                        "preview_file_missing",
-                        preview_id=preview.id,
-                        path=str(file_path),
-                    )
-                    continue
+        existing_tags_list = ", ".join(existing_tags[:200])
+        max_tags = settings.ai_max_tags_per_design
+        designs_text = "\n\n".join(sections)
 
-                # Read file
-                def _read_file():
-                    return file_path.read_bytes()
-
-                loop = asyncio.get_event_loop()
-                image_data = await loop.run_in_executor(None, _read_file)
-
-                # Determine mime type - only include formats supported by Gemini
-                # Gemini does NOT support GIF images
-                ext = file_path.suffix.lower()
-                if ext == ".gif":
-                    logger.debug(
-                        "skipping_gif_for_ai",
-                        preview_id=preview.id,
-                        path=str(file_path),
-                    )
-                    continue
+        return f"""Analyze these {len(entries)} 3D printable designs independently.
+The attached images are numbered 0-{first_image - 1} across all designs, in the order listed.
 
-                mime_types = {
-                    ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg",
-                    ".png": "image/png",
-                    ".webp": "image/webp",
-                }
-                mime_type = mime_types.get(ext, "image/jpeg")
+## Designs
 
-                result.append((image_data, mime_type))
+{designs_text}
 
-            except Exception as e:
-                logger.warning(
-                    "preview_read_error",
-                    preview_id=preview.id,
-                    error=str(e),
-                )
+## Existing Tags
+Prefer these existing tags when the meaning matches:
+{existing_tags_list}
+
+## Tasks (for each design)
+
+### 1. Tags
+Generate up to {max_tags} tags for the design, based only on its own images and information.
+{TAG_GUIDELINES}
 
-        return result
+### 2. Best Preview (if multiple images)
+Select which of the design's own images (0-indexed within the design) best represents it.
+{PREVIEW_GUIDELINES}
+
+## Response
+JSON only, one entry per design:
+{{"designs": [{{"design": 0, "tags": ["tag1", "tag2"], "best_preview_index": 0}}]}}"""
+
+    async def _read_preview_images(
+        self,
+        previews: list[PreviewAsset],
+        digests: list[str | None] | None = None,
+    ) -> tuple[list[tuple[bytes, str]], list[int]]:
+        """Read preview images, downscaled for the AI request.
+
+        Previews whose file is missing or can't be prepared are left out.
+
+        Args:
+            previews: List of preview assets.
+            digests: SHA-256 of each preview file, where already computed.
+
+        Returns:
+            Tuple of (list of (image_bytes, mime_type) tuples, index in
+            previews of each image).
+        """
+        preview_paths = self._existing_preview_paths(previews)
+        found = [i for i, p in enumerate(previews) if p in preview_paths]
+        if digests is not None:
+            digests = [digests[i] for i in found]
+
+        # Re-encoded as JPEG, so formats Gemini rejects (GIF) work too
+        prepared = await prepare_ai_images([preview_paths[previews[i]] for i in found], digests)
+
+        images: list[tuple[bytes, str]] = []
+        indices: list[int] = []
+        for index, image in zip(found, prepared, strict=True):
+            if image is not None:
+                images.append((image.data, image.mime_type))
+                indices.append(index)
+        return images, indices
 
     async def _call_gemini(
         self,
         prompt: str,
         images: list[tuple[bytes, str]],
-    ) -> AiAnalysisResult | None:
+        parser: Callable[[str], Any] | None = None,
+    ) -> Any:
         """Call the Gemini API with the prompt and images.
 
         Uses the REST API directly with httpx to avoid SDK dependency conflicts.
@@ -580,9 +956,11 @@ JSON only:
         Args:
             prompt: The analysis prompt.
             images: List of (image_bytes, mime_type) tuples.
+            parser: Turns the response text into the result. Defaults to
+                _parse_response (single design).
 
         Returns:
-            AiAnalysisResult or None if failed.
+            Parsed result (AiAnalysisResult by default) or None if failed.
 
         Raises:
             AiRateLimitError: If Gemini returns a rate limit error.
@@ -658,7 +1036,7 @@ JSON only:
                 return None
 
             # Parse the JSON response
-            return self._parse_response(response_text)
+            return (parser or self._parse_response)(response_text)
 
         except AiRateLimitError:
             # Re-raise rate limit errors (already logged inline)
@@ -723,6 +1101,23 @@ JSON only:
 
         return None
 
+    @staticmethod
+    def _strip_code_fence(response_text: str) -> str:
+        """Extract the JSON text from a response.
+
+        Sometimes the model wraps it in markdown code blocks.
+        """
+        text = response_text.strip()
+
+        # Remove markdown code block if present
+        if text.startswith("```json"):
+            text = text[7:]
+        elif text.startswith("```"):
+            text = text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        return text.strip()
+
     def _parse_response(self, response_text: str) -> AiAnalysisResult | None:
         """Parse the AI response JSON.
 
@@ -733,21 +1128,8 @@ JSON only:
             AiAnalysisResult or None if parsing failed.
         """
         try:
-            # Try to extract JSON from response
-            # Sometimes the model wraps it in markdown code blocks
-            text = response_text.strip()
-
-            # Remove markdown code block if present
-            if text.startswith("```json"):
-                text = text[7:]
-            elif text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
             # Parse JSON
-            data = json.loads(text)
+            data = json.loads(self._strip_code_fence(response_text))
 
             tags = data.get("tags", [])
             # Normalize tags: lowercase, strip whitespace
@@ -779,6 +1161,47 @@ JSON only:
             )
             return None
 
+    def _parse_batch_response(
+        self,
+        response_text: str,
+        design_count: int,
+    ) -> dict[int, AiAnalysisResult]:
+        """Parse a batch response into per-design results.
+
+        Args:
+            response_text: Raw response from Gemini.
+            design_count: Number of designs in the request.
+
+        Returns:
+            Results keyed by design index. Designs the model skipped or
+            answered malformed are left out.
+        """
+        try:
+            data = json.loads(self._strip_code_fence(response_text))
+            items = data.get("designs", []) if isinstance(data, dict) else data
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning(
+                "ai_batch_response_parse_error",
+                error=str(e),
+                response=response_text[:500],
+            )
+            return {}
+
+        results: dict[int, AiAnalysisResult] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("design"))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < design_count or index in results:
+                continue
+            result = self._parse_response(json.dumps(item))
+            if result is not None:
+                results[index] = result
+        return results
+
     async def _apply_tags(
         self,
         db: AsyncSession,
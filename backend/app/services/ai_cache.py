@@ -0,0 +1,130 @@
+"""Persisted cache of AI analysis results (DEC-043).
+
+An analysis is fully determined by what is sent to the model: the prompt
+template, the design's metadata and the preview images. AiResultCache keys
+each result by a hash of exactly that, so re-analyzing an unchanged design,
+or analyzing a duplicate that shares its previews and metadata, reuses the
+stored result instead of calling the API.
+
+Results are stored as small JSON files under cache/ai_results. Changing the
+model, tag limit, image preparation or prompt version (AI_PROMPT_VERSION in
+app.services.ai) changes every key, so old results are simply never read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the stored layout changes
+AI_RESULT_CACHE_VERSION = 1
+
+# Results older than this are re-analyzed
+AI_RESULT_CACHE_MAX_AGE = 180 * 24 * 60 * 60  # seconds
+
+
+def _normalize(value: str | None) -> str:
+    """Collapse case and whitespace so cosmetic edits don't miss the cache."""
+    return " ".join((value or "").split()).lower()
+
+
+class AiResultCache:
+    """Content-addressed store of analysis results."""
+
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def key_for(
+        prompt_version: int,
+        context: dict[str, str],
+        image_hashes: list[str],
+        image_sources: list[str],
+    ) -> str:
+        """Compute the cache key for an analysis request.
+
+        Args:
+            prompt_version: Version of the prompt template.
+            context: Design metadata that goes into the prompt.
+            image_hashes: SHA-256 of each preview, in prompt order.
+            image_sources: Preview source of each image, in prompt order.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        from app.services.ai_images import AI_IMAGE_PIPELINE_VERSION
+
+        material = {
+            "prompt": prompt_version,
+            "model": settings.ai_model,
+            "max_tags": settings.ai_max_tags_per_design,
+            "images": [
+                AI_IMAGE_PIPELINE_VERSION,
+                settings.ai_image_max_edge,
+                settings.ai_image_quality,
+            ],
+            "context": {k: _normalize(v) for k, v in sorted(context.items())},
+            "previews": list(zip(image_hashes, image_sources, strict=True)),
+        }
+        return hashlib.sha256(
+            json.dumps(material, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def path_for(key: str) -> Path:
+        """Get the cache file location for a key."""
+        return settings.cache_path / "ai_results" / key[:2] / f"{key}.json"
+
+    @classmethod
+    def get(cls, key: str) -> dict[str, Any] | None:
+        """Load a stored result.
+
+        Returns:
+            Dict with "tags" and "best_preview_index", or None on a miss.
+        """
+        try:
+            data = json.loads(cls.path_for(key).read_text())
+        except (OSError, ValueError):
+            cls.misses += 1
+            return None
+
+        if (
+            data.get("version") != AI_RESULT_CACHE_VERSION
+            or time.time() - data.get("created_at", 0) > AI_RESULT_CACHE_MAX_AGE
+        ):
+            cls.misses += 1
+            return None
+
+        cls.hits += 1
+        return data["result"]
+
+    @classmethod
+    def put(cls, key: str, result: dict[str, Any]) -> None:
+        """Store a result (best-effort)."""
+        path = cls.path_for(key)
+        data = {
+            "version": AI_RESULT_CACHE_VERSION,
+            "created_at": time.time(),
+            "result": result,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("ai_result_cache_save_failed", key=key, error=str(e))
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """Get cache hit/miss counts since startup."""
+        return {"hits": cls.hits, "misses": cls.misses}
@@ -0,0 +1,210 @@
+"""Preview image preparation for AI analysis (DEC-043).
+
+Previews are stored at their original resolution (archive previews can be
+up to MAX_PREVIEW_SIZE_BYTES), which is far more than Gemini needs to tag
+a design. Before a request is built, each preview is downscaled so its
+longest edge is at most ai_image_max_edge and re-encoded as JPEG at
+ai_image_quality.
+
+Decoding and resizing are CPU-bound, so they run in a process pool sized
+by max_cpu_jobs, and all previews of a design are prepared in parallel.
+Results are cached under cache/ai_images keyed by the SHA-256 of the
+original file plus the resize parameters, so re-analyzing a design (or
+another design sharing a preview) skips the resize.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the output of prepare_image changes for the same input
+AI_IMAGE_PIPELINE_VERSION = 1
+
+AI_IMAGE_MIME_TYPE = "image/jpeg"
+
+_executor: ProcessPoolExecutor | None = None
+
+
+@dataclass
+class PreparedImage:
+    """A preview ready to send to the AI model."""
+
+    data: bytes
+    mime_type: str
+    original_size: int
+    cache_hit: bool
+
+
+def ai_image_cache_dir() -> Path:
+    """Directory holding downscaled AI images."""
+    return settings.cache_path / "ai_images"
+
+
+def prepare_image(
+    source_path: str,
+    cache_dir: str,
+    max_edge: int,
+    quality: int,
+    digest: str | None = None,
+) -> PreparedImage:
+    """Downscale and re-encode one image, using the cache if possible.
+
+    Runs in a worker process, so it only takes picklable arguments.
+
+    Args:
+        source_path: Original preview file.
+        cache_dir: Directory for cached results.
+        max_edge: Maximum width/height of the result in pixels.
+        quality: JPEG quality of the result.
+        digest: SHA-256 of the original, if already known. A cache hit
+            then doesn't read the original at all.
+
+    Returns:
+        PreparedImage with the JPEG bytes.
+
+    Raises:
+        OSError: If the original can't be read or decoded.
+    """
+    original = None
+    if digest is None:
+        original = Path(source_path).read_bytes()
+        digest = hashlib.sha256(original).hexdigest()
+    cached_path = (
+        Path(cache_dir)
+        / digest[:2]
+        / f"{digest}_v{AI_IMAGE_PIPELINE_VERSION}_{max_edge}_q{quality}.jpg"
+    )
+
+    try:
+        return PreparedImage(
+            data=cached_path.read_bytes(),
+            mime_type=AI_IMAGE_MIME_TYPE,
+            original_size=len(original) if original is not None else os.path.getsize(source_path),
+            cache_hit=True,
+        )
+    except OSError:
+        pass
+
+    if original is None:
+        original = Path(source_path).read_bytes()
+
+    with Image.open(BytesIO(original)) as img:
+        # Let JPEG decode at reduced scale straight away
+        img.draft("RGB", (max_edge, max_edge))
+        img = ImageOps.exif_transpose(img)
+
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            # JPEG has no alpha; flatten onto white like a product shot
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (255, 255, 255))
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+        out = BytesIO()
+        img.save(out, "JPEG", quality=quality, optimize=True)
+        data = out.getvalue()
+
+    try:
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cached_path)
+    except OSError:
+        pass  # Cache is best-effort
+
+    return PreparedImage(
+        data=data,
+        mime_type=AI_IMAGE_MIME_TYPE,
+        original_size=len(original),
+        cache_hit=False,
+    )
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=max(1, min(settings.max_cpu_jobs, os.cpu_count() or 1)),
+            # Don't fork the running event loop and its threads
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_ai_image_executor() -> None:
+    """Stop the process pool (application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def prepare_ai_images(
+    paths: list[Path],
+    digests: list[str | None] | None = None,
+) -> list[PreparedImage | None]:
+    """Prepare previews for an AI request in parallel.
+
+    Args:
+        paths: Original preview files.
+        digests: SHA-256 of each file where already computed.
+
+    Returns:
+        One entry per path, None where the image couldn't be prepared.
+    """
+    loop = asyncio.get_running_loop()
+    cache_dir = str(ai_image_cache_dir())
+    max_edge = settings.ai_image_max_edge
+    quality = settings.ai_image_quality
+    start = time.monotonic()
+
+    async def _prepare(path: Path, digest: str | None) -> PreparedImage | None:
+        args = (str(path), cache_dir, max_edge, quality, digest)
+        try:
+            try:
+                return await loop.run_in_executor(_get_executor(), prepare_image, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM on a huge image); start a fresh
+                # pool for later calls and do this one in a thread
+                shutdown_ai_image_executor()
+                return await loop.run_in_executor(None, prepare_image, *args)
+        except Exception as e:
+            logger.warning("ai_image_prepare_failed", path=str(path), error=str(e))
+            return None
+
+    if digests is None:
+        digests = [None] * len(paths)
+    prepared = await asyncio.gather(
+        *(_prepare(path, digest) for path, digest in zip(paths, digests, strict=True))
+    )
+
+    done = [p for p in prepared if p is not None]
+    logger.debug(
+        "ai_images_prepared",
+        count=len(done),
+        cache_hits=sum(1 for p in done if p.cache_hit),
+        original_bytes=sum(p.original_size for p in done),
+        prepared_bytes=sum(len(p.data) for p in done),
+        duration_ms=round((time.monotonic() - start) * 1000),
+    )
+    return prepared
@@ -14,7 +14,7 @@ import zipfile
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -31,7 +31,7 @@ from app.db.models import (
 from app.db.models.enums import PreviewKind, PreviewSource
 from app.db.session import async_session_maker
 from app.services.job_queue import JobQueueService
-from app.utils import compute_file_hash
+from app.utils import HashingWriter, compute_file_hash
 
 logger = get_logger(__name__)
 
@@ -78,6 +78,32 @@ MAX_PREVIEW_IMAGES = 10
 MIN_PREVIEW_SIZE_BYTES = 10 * 1024  # 10KB - skip tiny icons
 MAX_PREVIEW_SIZE_BYTES = 10 * 1024 * 1024  # 10MB - skip huge renders
 
+# Extracted files stat'd/hashed at once while the next archive extracts.
+# ZIP/RAR/TAR members are hashed as they are decompressed, so this mostly
+# matters for 7z, which extracts in one call.
+FILE_INFO_CONCURRENCY = 8
+
+# Preview images read ahead of the one being saved
+PREVIEW_READ_AHEAD = 2
+
+# Buffer for copying archive members to disk
+EXTRACT_COPY_BUFFER = 1024 * 1024
+
+
+def _write_member(src: BinaryIO, target: Path) -> None:
+    """Write an archive member to disk, hashing it from the decompressed stream.
+
+    The digest is remembered for the written file, so _prepare_file_info
+    doesn't have to read it back.
+    """
+    writer = HashingWriter(target)
+    try:
+        shutil.copyfileobj(src, writer, EXTRACT_COPY_BUFFER)
+    except BaseException:
+        writer.close()
+        raise
+    writer.finish()
+
 
 class ArchiveError(Exception):
     """Error during archive extraction."""
@@ -190,55 +216,70 @@ class ArchiveExtractor:
             await db.commit()
 
         # PHASE 2: Extract archives (NO database session held)
+        # File info (stat + hash) for each archive's files is computed by a
+        # bounded background stage while the next archive extracts.
         total_archives = len(archives)
-        all_extracted_files: list[ExtractedFileInfo] = []
+        info_semaphore = asyncio.Semaphore(FILE_INFO_CONCURRENCY)
+        info_tasks: list[asyncio.Task[ExtractedFileInfo]] = []
         nested_count = 0
 
-        for i, archive_path in enumerate(archives):
-            logger.info(
-                "extracting_archive",
-                design_id=design_id,
-                archive=archive_path.name,
-                index=i + 1,
-                total=total_archives,
-            )
-
-            # Extract the archive (no DB)
-            extracted_paths = await self._extract_archive(archive_path, staging_dir)
-
-            # Process extracted files and compute hashes (no DB)
-            for file_path in extracted_paths:
-                file_info = await self._prepare_file_info(file_path, staging_dir)
-                all_extracted_files.append(file_info)
-
-            # Check for nested archives
-            nested_archives = [
-                f for f in extracted_paths
-                if f.suffix.lower() in ARCHIVE_EXTENSIONS
-                or str(f).lower().endswith((".tar.gz", ".tgz"))
-            ]
+        def schedule_file_info(paths: list[Path]) -> dict[Path, asyncio.Task[ExtractedFileInfo]]:
+            scheduled = {}
+            for file_path in paths:
+                task = asyncio.create_task(
+                    self._prepare_file_info_bounded(file_path, staging_dir, info_semaphore)
+                )
+                info_tasks.append(task)
+                scheduled[file_path] = task
+            return scheduled
 
-            for nested in nested_archives:
+        try:
+            for i, archive_path in enumerate(archives):
                 logger.info(
-                    "extracting_nested_archive",
+                    "extracting_archive",
                     design_id=design_id,
-                    archive=nested.name,
+                    archive=archive_path.name,
+                    index=i + 1,
+                    total=total_archives,
                 )
-                nested_paths = await self._extract_archive(nested, staging_dir)
-                nested_count += 1
 
-                for file_path in nested_paths:
-                    file_info = await self._prepare_file_info(file_path, staging_dir)
-                    all_extracted_files.append(file_info)
+                # Extract the archive (no DB)
+                extracted_paths = await self._extract_archive(archive_path, staging_dir)
+                scheduled = schedule_file_info(extracted_paths)
 
-                # Delete nested archive after extraction
-                await self._delete_file(nested)
+                # Check for nested archives
+                nested_archives = [
+                    f for f in extracted_paths
+                    if f.suffix.lower() in ARCHIVE_EXTENSIONS
+                    or str(f).lower().endswith((".tar.gz", ".tgz"))
+                ]
+
+                for nested in nested_archives:
+                    logger.info(
+                        "extracting_nested_archive",
+                        design_id=design_id,
+                        archive=nested.name,
+                    )
+                    nested_paths = await self._extract_archive(nested, staging_dir)
+                    nested_count += 1
+                    schedule_file_info(nested_paths)
+
+                    # Its own file info must be done before it's deleted
+                    await scheduled[nested]
+                    await self._delete_file(nested)
+
+                # Delete original archive after successful extraction
+                await self._delete_archive_and_parts(archive_path)
 
-            # Delete original archive after successful extraction
-            await self._delete_archive_and_parts(archive_path)
+                if progress_callback:
+                    progress_callback(i + 1, total_archives)
 
-            if progress_callback:
-                progress_callback(i + 1, total_archives)
+            all_extracted_files = list(await asyncio.gather(*info_tasks))
+        except BaseException:
+            for task in info_tasks:
+                task.cancel()
+            await asyncio.gather(*info_tasks, return_exceptions=True)
+            raise
 
         # PHASE 3: Create DesignFile records (brief session)
         async with async_session_maker() as db:
@@ -397,6 +438,13 @@ class ArchiveExtractor:
             model_kind=model_kind,
         )
 
+    async def _prepare_file_info_bounded(
+        self, file_path: Path, staging_dir: Path, semaphore: asyncio.Semaphore
+    ) -> ExtractedFileInfo:
+        """Run _prepare_file_info, limited by the shared semaphore."""
+        async with semaphore:
+            return await self._prepare_file_info(file_path, staging_dir)
+
     def _get_staging_dir(self, design_id: str) -> Path:
         """Get the staging directory for a design."""
         return settings.staging_path / design_id
@@ -460,8 +508,8 @@ class ArchiveExtractor:
                     target = output_dir / member
                     target.parent.mkdir(parents=True, exist_ok=True)
 
-                    with zf.open(member) as src, open(target, "wb") as dst:
-                        shutil.copyfileobj(src, dst)
+                    with zf.open(member) as src:
+                        _write_member(src, target)
 
                     extracted.append(target)
 
@@ -491,8 +539,8 @@ class ArchiveExtractor:
                         target = output_dir / member
                         target.parent.mkdir(parents=True, exist_ok=True)
 
-                        with rf.open(member) as src, open(target, "wb") as dst:
-                            shutil.copyfileobj(src, dst)
+                        with rf.open(member) as src:
+                            _write_member(src, target)
 
                         extracted.append(target)
 
@@ -555,9 +603,8 @@ class ArchiveExtractor:
                         target = output_dir / member.name
                         target.parent.mkdir(parents=True, exist_ok=True)
 
-                        with tf.extractfile(member) as src, open(target, "wb") as dst:
-                            if src:
-                                shutil.copyfileobj(src, dst)
+                        with tf.extractfile(member) as src:
+                            _write_member(src, target)
 
                         extracted.append(target)
 
@@ -651,46 +698,62 @@ class ArchiveExtractor:
         # Save previews using PreviewService
         from app.services.preview import PreviewService
 
-        saved_count = 0
-        async with async_session_maker() as db:
-            preview_service = PreviewService(db)
+        # Read the next candidates while the current one is saved. Saves stay
+        # sequential and in priority order, so the best candidate is added first.
+        reads: list[asyncio.Task[bytes]] = []
 
-            for candidate in selected:
-                try:
-                    # Read image data
-                    image_data = await self._read_file(candidate.file_path)
+        def start_read(index: int) -> None:
+            if index < len(selected):
+                reads.append(asyncio.create_task(self._read_file(selected[index].file_path)))
 
-                    # Save as preview
-                    await preview_service.save_preview(
-                        design_id=design_id,
-                        source=PreviewSource.ARCHIVE,
-                        image_data=image_data,
-                        filename=candidate.filename,
-                        kind=PreviewKind.THUMBNAIL,
-                    )
-                    saved_count += 1
-
-                    logger.debug(
-                        "preview_extracted",
-                        design_id=design_id,
-                        filename=candidate.filename,
-                        priority=candidate.priority,
-                    )
+        for index in range(PREVIEW_READ_AHEAD):
+            start_read(index)
 
-                except Exception as e:
-                    logger.warning(
-                        "preview_extraction_failed",
-                        design_id=design_id,
-                        filename=candidate.filename,
-                        error=str(e),
-                    )
-                    continue
+        saved_count = 0
+        try:
+            async with async_session_maker() as db:
+                preview_service = PreviewService(db)
+
+                for index, candidate in enumerate(selected):
+                    read = reads[index]
+                    start_read(index + PREVIEW_READ_AHEAD)
+                    try:
+                        image_data = await read
+
+                        # Save as preview
+                        await preview_service.save_preview(
+                            design_id=design_id,
+                            source=PreviewSource.ARCHIVE,
+                            image_data=image_data,
+                            filename=candidate.filename,
+                            kind=PreviewKind.THUMBNAIL,
+                        )
+                        saved_count += 1
+
+                        logger.debug(
+                            "preview_extracted",
+                            design_id=design_id,
+                            filename=candidate.filename,
+                            priority=candidate.priority,
+                        )
+
+                    except Exception as e:
+                        logger.warning(
+                            "preview_extraction_failed",
+                            design_id=design_id,
+                            filename=candidate.filename,
+                            error=str(e),
+                        )
+                        continue
 
-            # Auto-select primary if we saved any
-            if saved_count > 0:
-                await preview_service.auto_select_primary(design_id)
+                # Auto-select primary if we saved any
+                if saved_count > 0:
+                    await preview_service.auto_select_primary(design_id)
 
-            await db.commit()
+                await db.commit()
+        finally:
+            for read in reads:
+                read.cancel()
 
         logger.info(
             "previews_extracted",
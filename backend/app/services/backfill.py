@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
@@ -19,6 +21,16 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Parsed messages buffered between the Telegram fetch and ingestion.
+# Bounds backfill memory regardless of channel history length.
+BACKFILL_QUEUE_SIZE = 200
+
+# Messages ingested per IngestService.ingest_batch call and transaction
+BACKFILL_BATCH_SIZE = 100
+
+# Marks the end of the message stream in the backfill queue
+_END_OF_STREAM = object()
+
 
 class BackfillService:
     """Service for backfilling historical messages from Telegram channels."""
@@ -88,55 +100,68 @@ class BackfillService:
         messages_processed = 0
         designs_created = 0
         last_message_id = min_id
-        batch_size = 100  # Process in batches
-
-        try:
-            client = self.telegram.client
 
-            # Phase 1: Collect all messages from Telegram (no database operations)
-            # This avoids greenlet conflicts between Telethon and aiosqlite
-            collected_messages = []
-            async for message in client.iter_messages(
+        # Telegram fetching runs in its own task and hands parsed messages
+        # over a bounded queue, so memory stays flat for any history length
+        # and ingestion starts as soon as the first message arrives. The
+        # producer never touches the database, which keeps Telethon and the
+        # DB driver from interleaving inside one task (greenlet conflicts).
+        queue: asyncio.Queue = asyncio.Queue(maxsize=BACKFILL_QUEUE_SIZE)
+        producer = asyncio.create_task(
+            self._produce_messages(
+                queue,
                 peer_id,
                 limit=limit,
                 offset_date=offset_date,
                 min_id=min_id,
-                reverse=True,  # Process oldest first for consistent checkpointing
-            ):
-                # Parse message using TelegramService's parser
-                message_data = await self.telegram._parse_message(message)
-                collected_messages.append((message.id, message_data))
-
-            logger.info(
-                "backfill_messages_collected",
-                channel_id=channel.id,
-                count=len(collected_messages),
             )
+        )
 
-            # Phase 2: Process collected messages through ingestion (database only)
-            for msg_id, message_data in collected_messages:
-                message, design_created = await self.ingest.ingest_message(
-                    channel, message_data
-                )
-
-                if message:
-                    messages_processed += 1
-                    last_message_id = max(last_message_id, msg_id)
-
-                    if design_created:
-                        designs_created += 1
-
-                # Checkpoint periodically
-                if messages_processed % batch_size == 0:
-                    await self._update_checkpoint(channel.id, msg_id)
+        try:
+            batch: list[dict] = []
+            fetch_error: BaseException | None = None
+            finished = False
+            while not finished:
+                item = await queue.get()
+                if item is _END_OF_STREAM:
+                    finished = True
+                elif isinstance(item, BaseException):
+                    # Ingest what was fetched before the failure, then raise
+                    fetch_error = item
+                    finished = True
+                else:
+                    batch.append(item)
+
+                # Ingest each full batch, and whenever we've caught up with
+                # Telegram, so new designs become visible without waiting
+                # for the whole backfill.
+                if batch and (
+                    finished or len(batch) >= BACKFILL_BATCH_SIZE or queue.empty()
+                ):
+                    results = await self.ingest.ingest_batch(channel, batch)
+                    batch = []
+
+                    for message, design_created in results:
+                        if message:
+                            messages_processed += 1
+                            last_message_id = max(
+                                last_message_id, message.telegram_message_id
+                            )
+                            if design_created:
+                                designs_created += 1
+
+                    await self._update_checkpoint(channel.id, last_message_id)
                     await self.db.commit()
                     logger.debug(
                         "backfill_checkpoint",
                         channel_id=channel.id,
                         messages_processed=messages_processed,
-                        checkpoint=msg_id,
+                        checkpoint=last_message_id,
                     )
 
+            if fetch_error is not None:
+                raise fetch_error
+
             # Final checkpoint
             await self._update_checkpoint(channel.id, last_message_id)
             await self._update_last_ingested(channel.id, last_message_id)
@@ -175,6 +200,51 @@ class BackfillService:
                 await self.db.commit()
             raise
 
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+    async def _produce_messages(
+        self,
+        queue: asyncio.Queue,
+        peer_id: int | str,
+        *,
+        limit: int | None,
+        offset_date: datetime | None,
+        min_id: int,
+    ) -> None:
+        """Fetch messages from Telegram and feed them into the backfill queue.
+
+        Blocks while the queue is full, so at most BACKFILL_QUEUE_SIZE parsed
+        messages are held in memory. Ends the stream with _END_OF_STREAM,
+        or with the exception if fetching fails.
+
+        Args:
+            queue: Bounded queue consumed by backfill_channel.
+            peer_id: Telegram peer ID or username.
+            limit: Maximum number of messages to fetch (None = all).
+            offset_date: Only fetch messages newer than this date.
+            min_id: Only fetch messages with a higher ID than this.
+        """
+        try:
+            client = self.telegram.client
+            async for message in client.iter_messages(
+                peer_id,
+                limit=limit,
+                offset_date=offset_date,
+                min_id=min_id,
+                reverse=True,  # Process oldest first for consistent checkpointing
+            ):
+                # Parse message using TelegramService's parser
+                message_data = await self.telegram._parse_message(message)
+                await queue.put(message_data)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_END_OF_STREAM)
+
     async def _update_checkpoint(self, channel_id: str, message_id: int) -> None:
         """Update the backfill checkpoint for a channel."""
         await self.db.execute(
@@ -0,0 +1,320 @@
+"""Content-addressed storage for library files.
+
+Design variants commonly share most of their files (see
+FamilyService.detect_family_by_file_overlap), yet every design keeps its own
+copy under the library. With PRINTARR_LIBRARY_CONTENT_ADDRESSED enabled,
+each unique file is stored once as a blob:
+
+    {library}/.blobs/ab/cd/abcd...  (SHA-256, sharded by its first 4 hex digits)
+
+and the readable {designer}/{channel}/{title} tree is built from hardlinks
+to the blobs (reflinks, or copies as a last resort, where hardlinks fail).
+Paths, DesignFile.relative_path and file serving are unchanged.
+
+A blob's references are the DesignFile rows carrying its SHA-256 whose
+design is in the library (or being imported into it). Deleting a design
+removes its rows and then calls release(), which deletes blobs nothing
+refers to any more. Library names are hardlinks of their blob, so
+removing a blob never takes content away from a file still in the tree.
+
+Existing libraries are converted in place by the DEDUPE_LIBRARY job, which
+walks every DesignFile and swaps duplicate copies for links to one blob.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.models import Design, DesignFile, DesignStatus, Job, JobStatus, JobType
+from app.db.session import async_session_maker
+from app.services.job_queue import JobQueueService
+from app.utils import compute_file_hash, link_or_copy
+
+logger = get_logger(__name__)
+
+# Directory under library_path holding the blobs
+BLOB_DIR_NAME = ".blobs"
+
+# Written once an existing library has been fully deduplicated
+DEDUPED_MARKER = ".deduped"
+
+# Designs whose files live in the library (and so may link to blobs)
+LIBRARY_STATUSES = (DesignStatus.IMPORTING, DesignStatus.ORGANIZED)
+
+
+@dataclass
+class DedupeBatch:
+    """Outcome of deduplicating one batch of DesignFiles."""
+
+    last_id: str | None
+    files: int = 0
+    linked: int = 0
+    bytes_saved: int = 0
+
+
+class BlobStore:
+    """Content-addressed blob storage under the library."""
+
+    def __init__(self, root: Path | None = None):
+        """Initialize the blob store.
+
+        Args:
+            root: Blob directory (default: library_path/.blobs).
+        """
+        self.root = root or settings.library_path / BLOB_DIR_NAME
+
+    def blob_path(self, sha256: str) -> Path:
+        """Get the path of the blob with the given SHA-256."""
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def add(self, source: Path, sha256: str) -> Path:
+        """Move a file into the store, or drop it if the blob already exists.
+
+        Args:
+            source: File to store (removed afterwards).
+            sha256: SHA-256 of its content, computed from the file itself.
+
+        Returns:
+            Path of the blob.
+
+        Raises:
+            ValueError: If an existing blob with that hash has another size
+                (the source is kept).
+        """
+        blob = self.blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            os.link(source, blob)
+        except FileExistsError:
+            # Cheap guard against a wrong hash before dropping the source
+            if blob.stat().st_size != source.stat().st_size:
+                raise ValueError(f"Blob {sha256} does not match {source}")
+        except OSError:
+            # Source on another filesystem (staging volume): copy it in and
+            # publish it atomically
+            tmp = blob.with_name(f".{blob.name}.tmp")
+            shutil.copy2(source, tmp)
+            os.replace(tmp, blob)
+
+        source.unlink()
+        return blob
+
+    def place(self, source: Path, target: Path, sha256: str) -> str:
+        """Store a file and link it into the library at target.
+
+        Args:
+            source: File to import (removed afterwards).
+            target: Library path to create.
+            sha256: SHA-256 of the file content.
+
+        Returns:
+            How target was created: "hardlink", "reflink" or "copy".
+        """
+        blob = self.add(source, sha256)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return link_or_copy(blob, target)
+
+    def adopt(self, path: Path, sha256: str) -> int:
+        """Turn an existing library file into a link of its blob.
+
+        The first copy of some content becomes the blob itself; later copies
+        are replaced by links to it.
+
+        Args:
+            path: Library file.
+            sha256: SHA-256 of its content.
+
+        Returns:
+            Bytes freed (0 if nothing was shared or only a copy was possible).
+        """
+        blob = self.blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            os.link(path, blob)
+            return 0
+        except FileExistsError:
+            pass
+
+        if os.path.samefile(path, blob):
+            return 0
+
+        size = path.stat().st_size
+        tmp = path.with_name(f".{path.name}.blobtmp")
+        tmp.unlink(missing_ok=True)
+        method = link_or_copy(blob, tmp)
+        os.replace(tmp, path)
+        return size if method != "copy" else 0
+
+    async def delete_design_files(self, db: AsyncSession, design_id: str) -> None:
+        """Delete a design's DesignFile rows and release their blobs.
+
+        Args:
+            db: Session deleting the design (caller commits).
+            design_id: The design ID.
+        """
+        result = await db.execute(
+            select(DesignFile.sha256).where(DesignFile.design_id == design_id)
+        )
+        sha256s = set(result.scalars().all())
+
+        await db.execute(delete(DesignFile).where(DesignFile.design_id == design_id))
+        await self.release(db, sha256s)
+
+    async def release(self, db: AsyncSession, sha256s: set[str | None]) -> int:
+        """Delete blobs no library design's DesignFile refers to any more.
+
+        Call after the DesignFile rows of a deleted design were removed
+        (flushed) in the same session.
+
+        Args:
+            db: Session that removed the DesignFiles.
+            sha256s: Hashes of the removed files.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        removed = 0
+        for sha256 in sha256s:
+            if not sha256:
+                continue
+            blob = self.blob_path(sha256)
+            if not blob.exists():
+                continue
+
+            result = await db.execute(
+                select(func.count(DesignFile.id))
+                .join(Design, DesignFile.design_id == Design.id)
+                .where(DesignFile.sha256 == sha256, Design.status.in_(LIBRARY_STATUSES))
+            )
+            if (result.scalar() or 0) > 0:
+                continue
+
+            blob.unlink(missing_ok=True)
+            for shard in (blob.parent, blob.parent.parent):
+                try:
+                    shard.rmdir()
+                except OSError:
+                    break
+            removed += 1
+
+        if removed:
+            logger.info("library_blobs_released", count=removed)
+        return removed
+
+    def is_deduped(self) -> bool:
+        """Check whether the existing library was already deduplicated."""
+        return (self.root / DEDUPED_MARKER).exists()
+
+    def mark_deduped(self) -> None:
+        """Record that the existing library has been deduplicated."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / DEDUPED_MARKER).touch()
+
+    async def count_library_files(self) -> int:
+        """Count DesignFiles of designs imported into the library."""
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(func.count(DesignFile.id))
+                .join(Design, DesignFile.design_id == Design.id)
+                .where(Design.status == DesignStatus.ORGANIZED)
+            )
+            return result.scalar() or 0
+
+    async def dedupe_batch(self, after_id: str | None, limit: int) -> DedupeBatch:
+        """Deduplicate the next batch of library files, ordered by DesignFile ID.
+
+        Each file is hashed from disk (its recorded SHA-256 may be missing or
+        stale) and linked to its blob. Corrected hashes are saved.
+
+        Args:
+            after_id: Last DesignFile ID of the previous batch.
+            limit: Maximum DesignFiles to process.
+
+        Returns:
+            The batch outcome; last_id is None once all files were processed.
+        """
+        # Read the batch (brief session)
+        async with async_session_maker() as db:
+            query = (
+                select(DesignFile.id, DesignFile.relative_path, DesignFile.sha256)
+                .join(Design, DesignFile.design_id == Design.id)
+                .where(Design.status == DesignStatus.ORGANIZED)
+                .order_by(DesignFile.id)
+                .limit(limit)
+            )
+            if after_id is not None:
+                query = query.where(DesignFile.id > after_id)
+            rows = (await db.execute(query)).all()
+
+        if not rows:
+            return DedupeBatch(last_id=None)
+
+        batch = DedupeBatch(last_id=rows[-1].id, files=len(rows))
+        corrected: dict[str, str] = {}
+
+        # Link files (NO database session held)
+        for row in rows:
+            path = settings.library_path / row.relative_path
+            if not path.is_file():
+                continue
+
+            try:
+                sha256 = await compute_file_hash(path)
+                saved = await asyncio.to_thread(self.adopt, path, sha256)
+            except OSError as e:
+                logger.warning("library_dedupe_file_failed", path=str(path), error=str(e))
+                continue
+
+            if saved:
+                batch.linked += 1
+                batch.bytes_saved += saved
+            if sha256 != row.sha256:
+                corrected[row.id] = sha256
+
+        # Save corrected hashes (brief session)
+        if corrected:
+            async with async_session_maker() as db:
+                for design_file_id, sha256 in corrected.items():
+                    design_file = await db.get(DesignFile, design_file_id)
+                    if design_file:
+                        design_file.sha256 = sha256
+                await db.commit()
+
+        return batch
+
+    async def queue_dedupe(self, db: AsyncSession) -> str | None:
+        """Queue a DEDUPE_LIBRARY job unless one is queued or running.
+
+        Args:
+            db: Session to enqueue with (caller commits).
+
+        Returns:
+            The job ID, or None if a dedupe job is already pending.
+        """
+        pending = await db.execute(
+            select(func.count(Job.id)).where(
+                Job.type == JobType.DEDUPE_LIBRARY,
+                Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+            )
+        )
+        if (pending.scalar() or 0) > 0:
+            return None
+
+        job = await JobQueueService(db).enqueue(
+            JobType.DEDUPE_LIBRARY,
+            priority=-5,  # Background work
+            display_name="Library deduplication",
+        )
+        logger.info("library_dedupe_queued", job_id=job.id)
+        return job.id
@@ -13,7 +13,6 @@ See DEC-037 for conflict handling.
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -39,6 +38,7 @@ from app.db.models import (
 )
 from app.schemas.import_profile import DesignDetectionResult, ImportProfileConfig
 from app.services.auto_render import auto_queue_render_for_design
+from app.services.folder_scan import DirectoryLister, FolderScanCache, scan_folder_stats
 from app.services.import_profile import ImportProfileService
 
 if TYPE_CHECKING:
@@ -183,21 +183,8 @@ class BulkImportService:
                 source.import_profile_id
             )
 
-        # Traverse and detect designs
-        detected = self._profile_service.traverse_for_designs(folder_path, config)
-
-        # Convert to DetectedDesign objects
-        designs = []
-        for path, detection in detected:
-            relative_path = str(path.relative_to(folder_path))
-            detected_design = DetectedDesign(path, detection, relative_path)
-
-            # Calculate additional metadata
-            detected_design.total_size = self._calculate_folder_size(path)
-            detected_design.mtime = self._get_folder_mtime(path)
-            detected_design.file_hash = self._calculate_folder_hash(path)
-
-            designs.append(detected_design)
+        # Traverse and detect designs off the event loop
+        designs = await asyncio.to_thread(self._scan_designs, folder_path, config)
 
         logger.info(
             "folder_scanned",
@@ -234,71 +221,73 @@ class BulkImportService:
         # Get import profile config
         config = await self._profile_service.get_profile_config(profile_id)
 
-        # Traverse and detect designs
-        detected = self._profile_service.traverse_for_designs(folder_path, config)
+        # Traverse and detect designs off the event loop
+        designs = await asyncio.to_thread(self._scan_designs, folder_path, config)
+
+        logger.info(
+            "folder_path_scanned",
+            folder_path=str(folder_path),
+            designs_found=len(designs),
+        )
+
+        return designs
+
+    def _scan_designs(
+        self,
+        folder_path: Path,
+        config: ImportProfileConfig,
+    ) -> list[DetectedDesign]:
+        """Detect designs under a folder and collect their metadata.
+
+        Runs in a worker thread. Uses the persisted FolderScanCache so
+        subtrees that haven't changed since the last scan are neither
+        listed nor walked again; changed design folders get a single
+        scandir pass for size, mtime and hash.
+
+        Args:
+            folder_path: Root folder to scan.
+            config: Import profile configuration.
+
+        Returns:
+            List of DetectedDesign objects.
+        """
+        cache = FolderScanCache.load(folder_path, config)
+        # Detection and stats share one listing of each directory
+        lister = DirectoryLister()
+        detected = self._profile_service.traverse_for_designs(
+            folder_path, config, cache=cache, lister=lister
+        )
 
-        # Convert to DetectedDesign objects
         designs = []
         for path, detection in detected:
             relative_path = str(path.relative_to(folder_path))
             detected_design = DetectedDesign(path, detection, relative_path)
 
-            # Calculate additional metadata
-            detected_design.total_size = self._calculate_folder_size(path)
-            detected_design.mtime = self._get_folder_mtime(path)
-            detected_design.file_hash = self._calculate_folder_hash(path)
+            cached = cache.get_design(relative_path)
+            if cached is not None:
+                detected_design.total_size = cached.total_size
+                detected_design.mtime = cached.mtime
+                detected_design.file_hash = cached.file_hash
+            else:
+                stats = scan_folder_stats(path, lister)
+                detected_design.total_size = stats.total_size
+                detected_design.mtime = stats.mtime
+                detected_design.file_hash = stats.file_hash
+                cache.record_design(relative_path, detection, stats)
 
             designs.append(detected_design)
 
-        logger.info(
-            "folder_path_scanned",
+        cache.save()
+
+        logger.debug(
+            "folder_scan_cache",
             folder_path=str(folder_path),
-            designs_found=len(designs),
+            reused=cache.hits,
+            rescanned=cache.misses,
         )
 
         return designs
 
-    def _calculate_folder_size(self, folder_path: Path) -> int:
-        """Calculate total size of files in a folder."""
-        total = 0
-        try:
-            for f in folder_path.rglob("*"):
-                if f.is_file():
-                    total += f.stat().st_size
-        except (PermissionError, OSError):
-            pass
-        return total
-
-    def _get_folder_mtime(self, folder_path: Path) -> datetime | None:
-        """Get the most recent modification time in a folder."""
-        latest = None
-        try:
-            for f in folder_path.rglob("*"):
-                if f.is_file():
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    if latest is None or mtime > latest:
-                        latest = mtime
-        except (PermissionError, OSError):
-            pass
-        return latest
-
-    def _calculate_folder_hash(self, folder_path: Path) -> str:
-        """Calculate a hash representing the folder contents.
-
-        Uses a combination of file paths and sizes for quick comparison.
-        """
-        hasher = hashlib.sha256()
-        try:
-            files = sorted(folder_path.rglob("*"))
-            for f in files:
-                if f.is_file():
-                    rel_path = str(f.relative_to(folder_path))
-                    size = f.stat().st_size
-                    hasher.update(f"{rel_path}:{size}".encode())
-        except (PermissionError, OSError):
-            pass
-        return hasher.hexdigest()[:32]
-
     # ========== Import Record Management ==========
 
     async def create_import_records(
@@ -653,15 +642,27 @@ class BulkImportService:
             )
             for folder in affected_folders:
                 if folder.exists():
-                    detection = self._profile_service.is_design_folder(folder, config)
+                    lister = DirectoryLister()
+                    detection = self._profile_service.is_design_folder(
+                        folder, config, lister
+                    )
                     if detection.is_design:
                         relative_path = str(folder.relative_to(folder_path))
                         detected = DetectedDesign(folder, detection, relative_path)
-                        detected.total_size = self._calculate_folder_size(folder)
-                        detected.mtime = self._get_folder_mtime(folder)
-                        detected.file_hash = self._calculate_folder_hash(folder)
+                        stats = await asyncio.to_thread(scan_folder_stats, folder, lister)
+                        detected.total_size = stats.total_size
+                        detected.mtime = stats.mtime
+                        detected.file_hash = stats.file_hash
                         await self.create_import_records(source, [detected])
 
+            # Files may have been rewritten in place, which directory mtimes
+            # don't reveal; make the next scan recompute these folders
+            await asyncio.to_thread(
+                FolderScanCache.invalidate,
+                folder_path,
+                [str(folder.relative_to(folder_path)) for folder in affected_folders],
+            )
+
         logger.info(
             "events_processed",
             source_id=source.id,
@@ -41,6 +41,7 @@ from app.schemas.stats import (
     QueueResponse,
     StorageResponse,
 )
+from app.services.blob_store import BLOB_DIR_NAME
 
 logger = get_logger(__name__)
 
@@ -372,17 +373,31 @@ class DashboardService:
         return {"file_count": file_count, "size_bytes": size_bytes}
 
     def _count_files_and_size(self, path: Path) -> tuple[int, int]:
-        """Count files and total size in a directory (sync operation)."""
+        """Count files and total size in a directory (sync operation).
+
+        Hardlinked files (content-addressed library) take space once, so
+        each inode is only counted towards the size once; the blob store
+        itself is skipped.
+        """
         file_count = 0
         size_bytes = 0
+        seen_inodes: set[tuple[int, int]] = set()
 
         try:
             for root, dirs, files in os.walk(path):
+                if root == str(path) and BLOB_DIR_NAME in dirs:
+                    dirs.remove(BLOB_DIR_NAME)
                 for f in files:
                     file_path = Path(root) / f
                     try:
                         file_count += 1
-                        size_bytes += file_path.stat().st_size
+                        st = file_path.stat()
+                        if st.st_nlink > 1:
+                            inode = (st.st_dev, st.st_ino)
+                            if inode in seen_inodes:
+                                continue
+                            seen_inodes.add(inode)
+                        size_bytes += st.st_size
                     except (OSError, PermissionError):
                         pass
         except (OSError, PermissionError) as e:
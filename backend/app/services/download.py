@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Callable
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from telethon.errors import FileReferenceExpiredError
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -30,9 +31,15 @@ from app.db.models import (
 )
 from app.db.session import async_session_maker
 from app.services.job_queue import JobQueueService
+from app.telegram.cache import TelegramCache
 from app.telegram.exceptions import TelegramRateLimitError
-from app.utils import compute_file_hash
-from app.telegram.service import TelegramService
+from app.telegram.parallel_download import (
+    PARALLEL_DOWNLOAD_MIN_SIZE,
+    ParallelDownloader,
+    ParallelDownloadError,
+)
+from app.utils import HashingWriter, compute_file_hash, link_or_copy, remember_file_hash
+from app.telegram.service import TelegramService, media_unique_id
 
 if TYPE_CHECKING:
     from telethon.types import Message
@@ -62,6 +69,8 @@ class AttachmentDownloadInfo:
     message_id: str
     channel_peer_id: str
     telegram_message_id: int
+    telegram_unique_file_id: str | None = None
+    size_bytes: int | None = None
 
 
 class DownloadService:
@@ -82,6 +91,7 @@ class DownloadService:
         """
         self.db = db
         self._telegram: TelegramService | None = None
+        self._claimed_paths: set[Path] = set()
 
     @property
     def telegram(self) -> TelegramService:
@@ -124,6 +134,8 @@ class DownloadService:
         )
 
         # PHASE 2: Download files (NO database session held)
+        await self._prefetch_telegram_messages(attachments_info)
+
         downloaded_count = 0
         total_bytes = 0
         has_archives = False
@@ -131,12 +143,46 @@ class DownloadService:
         downloaded_files: list[dict[str, Any]] = []  # Track file info for DesignFile creation
         total_attachments = len(attachments_info)
 
-        for i, att_info in enumerate(attachments_info):
-            # Each attachment download manages its own session
-            result = await self._download_attachment(
-                att_info, staging_dir, progress_callback
-            )
+        # Several attachments download at once (their combined rate is capped
+        # by the shared bandwidth budget); byte progress is summed across them.
+        semaphore = asyncio.Semaphore(settings.telegram_attachment_concurrency)
+        byte_progress: dict[str, tuple[int, int]] = {}
+
+        def attachment_progress(att_id: str) -> Callable[[int, int], None] | None:
+            if not progress_callback:
+                return None
+
+            def report(current: int, total: int) -> None:
+                byte_progress[att_id] = (current, total)
+                progress_callback(
+                    sum(c for c, _ in byte_progress.values()),
+                    sum(t for _, t in byte_progress.values()),
+                )
+
+            return report
+
+        async def download_one(att_info: AttachmentDownloadInfo) -> dict[str, Any]:
+            nonlocal downloaded_count
+            async with semaphore:
+                # Each attachment download manages its own session
+                result = await self._download_attachment(
+                    att_info, staging_dir, attachment_progress(att_info.id)
+                )
             downloaded_count += 1
+            if progress_callback:
+                progress_callback(downloaded_count, total_attachments)
+            return result
+
+        # Let every attachment finish (each records its own status) before
+        # reporting the first failure
+        results = await asyncio.gather(
+            *(download_one(a) for a in attachments_info), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        for att_info, result in zip(attachments_info, results, strict=True):
             total_bytes += result["size"]
             download_paths.append(result["path"])
 
@@ -153,9 +199,6 @@ class DownloadService:
             if att_info.ext and att_info.ext.lower() in ARCHIVE_EXTENSIONS:
                 has_archives = True
 
-            if progress_callback:
-                progress_callback(i + 1, total_attachments)
-
         # PHASE 3: Update design status and create DesignFile records (brief session)
         async with async_session_maker() as db:
             design = await db.get(Design, design_id)
@@ -278,6 +321,8 @@ class DownloadService:
                             message_id=msg.id,
                             channel_peer_id=msg.channel.telegram_peer_id,
                             telegram_message_id=msg.telegram_message_id,
+                            telegram_unique_file_id=attachment.telegram_unique_file_id,
+                            size_bytes=attachment.size_bytes,
                         )
                     )
 
@@ -311,66 +356,35 @@ class DownloadService:
                 attachment.download_status = AttachmentDownloadStatus.DOWNLOADING
                 await db.commit()
 
-        # Determine file path
+        # Determine file path (also avoiding names claimed by attachments
+        # still downloading alongside this one)
         file_path = staging_dir / att_info.filename
-        if file_path.exists():
+        if file_path.exists() or file_path in self._claimed_paths:
             base = file_path.stem
             ext = file_path.suffix
             counter = 1
-            while file_path.exists():
+            while file_path.exists() or file_path in self._claimed_paths:
                 file_path = staging_dir / f"{base}_{counter}{ext}"
                 counter += 1
+        self._claimed_paths.add(file_path)
 
-        # PHASE 2: Download from Telegram (NO database session held)
+        # PHASE 2: Download from Telegram (NO database session held), unless
+        # the same file is already on disk from another channel
         try:
-            tg_message = await self._fetch_telegram_message(
-                att_info.channel_peer_id,
-                att_info.telegram_message_id,
-            )
-
-            if not tg_message or not tg_message.media:
-                raise DownloadError("Message has no media to download")
-
-            downloaded_path = await self._download_media(
-                tg_message, file_path, progress_callback
-            )
-
-            if not downloaded_path:
-                raise DownloadError("Download returned no path")
-
-            downloaded_path_obj = Path(downloaded_path)
-
-            # Verify file exists
-            if not downloaded_path_obj.exists():
-                raise DownloadError(f"Downloaded file not found: {downloaded_path}")
-
-            # If Telethon saved to a different location, move to staging
-            if downloaded_path_obj.parent.resolve() != staging_dir.resolve():
-                logger.warning(
-                    "download_path_mismatch",
-                    expected_dir=str(staging_dir),
-                    actual_path=str(downloaded_path),
+            if not att_info.telegram_unique_file_id:
+                # Ingested before file IDs were recorded
+                att_info.telegram_unique_file_id = await self._lookup_unique_file_id(
+                    att_info
                 )
-                import shutil
-                correct_path = staging_dir / downloaded_path_obj.name
-                # Handle collision
-                if correct_path.exists():
-                    base = correct_path.stem
-                    ext = correct_path.suffix
-                    counter = 1
-                    while correct_path.exists():
-                        correct_path = staging_dir / f"{base}_{counter}{ext}"
-                        counter += 1
-                shutil.move(str(downloaded_path_obj), str(correct_path))
-                downloaded_path = str(correct_path)
-                downloaded_path_obj = correct_path
-                logger.info(
-                    "download_moved_to_staging",
-                    new_path=str(correct_path),
+            sha256 = await self._reuse_existing_copy(att_info, file_path, progress_callback)
+            if sha256 is not None:
+                downloaded_path = str(file_path)
+            else:
+                downloaded_path = await self._fetch_attachment(
+                    att_info, file_path, progress_callback
                 )
-
-            sha256 = await self._compute_file_hash(downloaded_path_obj)
-            file_size = downloaded_path_obj.stat().st_size
+                sha256 = await self._compute_file_hash(Path(downloaded_path))
+            file_size = Path(downloaded_path).stat().st_size
 
         except TelegramRateLimitError as e:
             # Update status to FAILED
@@ -390,6 +404,10 @@ class DownloadService:
                     await db.commit()
             raise
 
+        finally:
+            # The file (if any) now exists and blocks the name itself
+            self._claimed_paths.discard(file_path)
+
         # PHASE 3b: Record success (brief session)
         async with async_session_maker() as db:
             attachment = await db.get(Attachment, att_info.id)
@@ -397,66 +415,293 @@ class DownloadService:
                 attachment.download_status = AttachmentDownloadStatus.DOWNLOADED
                 attachment.download_path = str(downloaded_path)
                 attachment.sha256 = sha256
+                if not attachment.telegram_unique_file_id:
+                    attachment.telegram_unique_file_id = att_info.telegram_unique_file_id
                 await db.commit()
 
         return {"path": str(downloaded_path), "size": file_size, "sha256": sha256}
 
-    async def _fetch_telegram_message(
-        self, channel_peer_id: str, telegram_message_id: int
-    ) -> Message | None:
-        """Fetch message from Telegram. No database access here."""
+    async def _fetch_attachment(
+        self,
+        att_info: AttachmentDownloadInfo,
+        file_path: Path,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> str:
+        """Download an attachment's file from Telegram. No database access here."""
+        tg_message = await self._fetch_telegram_message(
+            att_info.channel_peer_id,
+            att_info.telegram_message_id,
+        )
+
+        if not tg_message or not tg_message.media:
+            raise DownloadError("Message has no media to download")
+
+        try:
+            downloaded_path = await self._download_media(
+                tg_message, file_path, progress_callback
+            )
+        except FileReferenceExpiredError:
+            # The (cached) message outlived its file reference; refetch
+            # it and try once more
+            tg_message = await self._refresh_telegram_message(
+                att_info.channel_peer_id,
+                att_info.telegram_message_id,
+            )
+            if not tg_message or not tg_message.media:
+                raise DownloadError("Message has no media to download")
+
+            downloaded_path = await self._download_media(
+                tg_message, file_path, progress_callback
+            )
+
+        if not downloaded_path:
+            raise DownloadError("Download returned no path")
+
+        # Verify file exists
+        if not Path(downloaded_path).exists():
+            raise DownloadError(f"Downloaded file not found: {downloaded_path}")
+
+        return str(downloaded_path)
+
+    async def _reuse_existing_copy(
+        self,
+        att_info: AttachmentDownloadInfo,
+        file_path: Path,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> str | None:
+        """Link an already-downloaded copy of this attachment into staging.
+
+        The same file is often posted in several channels. Telegram gives it
+        the same unique file ID everywhere, so an earlier attachment with that
+        ID has these bytes on disk already - still in staging, or imported
+        into the library. Attachments are never matched on size or filename,
+        which don't identify the content. The copy is checked against the
+        digest recorded when it was downloaded, then hardlinked (or
+        reflinked/copied) to file_path.
+
+        Returns:
+            SHA-256 of the linked file, or None if no usable copy was found.
+        """
+        for candidate_id, sha256, size, paths in await self._find_downloaded_copies(att_info):
+            size = size or att_info.size_bytes
+            for source in paths:
+                try:
+                    if not source.is_file() or (size and source.stat().st_size != size):
+                        continue
+                    if await compute_file_hash(source) != sha256:
+                        continue
+                    method = await asyncio.to_thread(link_or_copy, source, file_path)
+                except OSError as e:
+                    logger.warning(
+                        "attachment_reuse_failed",
+                        attachment_id=att_info.id,
+                        source=str(source),
+                        error=str(e),
+                    )
+                    file_path.unlink(missing_ok=True)
+                    continue
+
+                remember_file_hash(file_path, sha256)
+                if progress_callback:
+                    file_size = file_path.stat().st_size
+                    progress_callback(file_size, file_size)
+                logger.info(
+                    "attachment_reused",
+                    attachment_id=att_info.id,
+                    source_attachment_id=candidate_id,
+                    source=str(source),
+                    method=method,
+                )
+                return sha256
+
+        return None
+
+    async def _find_downloaded_copies(
+        self, att_info: AttachmentDownloadInfo
+    ) -> list[tuple[str, str, int | None, list[Path]]]:
+        """Find downloaded attachments with the same unique file ID (brief session).
+
+        Returns:
+            (attachment_id, sha256, size_bytes, candidate paths) per match.
+        """
+        if not att_info.telegram_unique_file_id:
+            return []
+
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Attachment)
+                .options(selectinload(Attachment.design_files))
+                .where(
+                    Attachment.id != att_info.id,
+                    Attachment.telegram_unique_file_id == att_info.telegram_unique_file_id,
+                    Attachment.download_status == AttachmentDownloadStatus.DOWNLOADED,
+                    Attachment.sha256.isnot(None),
+                )
+            )
+            attachments = list(result.scalars().all())
+
+        copies = []
+        for attachment in attachments:
+            # download_path while in staging; DesignFile paths once the
+            # design has been imported into the library
+            paths = [Path(attachment.download_path)] if attachment.download_path else []
+            for design_file in attachment.design_files:
+                if design_file.is_from_archive:
+                    continue
+                paths.append(settings.library_path / design_file.relative_path)
+                paths.append(
+                    self._get_staging_dir(design_file.design_id) / design_file.relative_path
+                )
+            copies.append((attachment.id, attachment.sha256, attachment.size_bytes, paths))
+        return copies
+
+    async def _lookup_unique_file_id(self, att_info: AttachmentDownloadInfo) -> str | None:
+        """Get the unique file ID of an attachment from its message.
+
+        The message is usually in TelegramCache already from the design's
+        prefetch. Failures are left to the download itself.
+        """
+        try:
+            tg_message = await self._fetch_telegram_message(
+                att_info.channel_peer_id,
+                att_info.telegram_message_id,
+            )
+        except Exception as e:
+            logger.debug("unique_file_id_lookup_failed", attachment_id=att_info.id, error=str(e))
+            return None
+        return media_unique_id(tg_message) if tg_message else None
+
+    async def _ensure_telegram(self) -> None:
+        """Connect to Telegram if needed and check the session is authorized."""
         if not self.telegram.is_connected():
             await self.telegram.connect()
 
         if not await self.telegram.is_authenticated():
             raise DownloadError("Telegram not authenticated")
 
-        client = self.telegram.client
-        entity = await client.get_entity(int(channel_peer_id))
-        message = await client.get_messages(entity, ids=telegram_message_id)
-        return message
+    async def _prefetch_telegram_messages(
+        self, attachments_info: list[AttachmentDownloadInfo]
+    ) -> None:
+        """Fetch every message the design needs, one batched request per channel.
+
+        The messages land in TelegramCache, so the per-attachment fetches
+        below don't each cost a round trip. Failures are left to those
+        fetches, which record them against the attachment.
+        """
+        message_ids: dict[str, list[int]] = {}
+        for att_info in attachments_info:
+            message_ids.setdefault(att_info.channel_peer_id, []).append(
+                att_info.telegram_message_id
+            )
+
+        try:
+            await self._ensure_telegram()
+            for channel_peer_id, ids in message_ids.items():
+                await TelegramCache.get_instance().get_messages(
+                    self.telegram.client, int(channel_peer_id), ids
+                )
+        except Exception as e:
+            logger.warning("telegram_message_prefetch_failed", error=str(e))
+
+    async def _fetch_telegram_message(
+        self, channel_peer_id: str, telegram_message_id: int
+    ) -> Message | None:
+        """Fetch message from Telegram (or TelegramCache). No database access here."""
+        await self._ensure_telegram()
+        return await TelegramCache.get_instance().get_message(
+            self.telegram.client, int(channel_peer_id), telegram_message_id
+        )
+
+    async def _refresh_telegram_message(
+        self, channel_peer_id: str, telegram_message_id: int
+    ) -> Message | None:
+        """Refetch a message whose file reference expired. No database access here."""
+        await self._ensure_telegram()
+        return await TelegramCache.get_instance().refresh_message(
+            self.telegram.client, int(channel_peer_id), telegram_message_id
+        )
 
     async def _download_media(
         self,
         message: Message,
         file_path: Path,
         progress_callback: Callable[[int, int], None] | None = None,
-    ) -> str:
+    ) -> str | None:
         """Download media from Telegram message. No database access here.
 
         Uses asyncio.wait_for to enforce a timeout and prevent indefinite hangs
         when Telegram needs to transfer files across datacenters.
+
+        Telethon writes into a HashingWriter, so the SHA-256 is computed as the
+        chunks arrive and _compute_file_hash doesn't have to re-read the file.
+        Large documents go through the parallel downloader instead.
         """
+        document = getattr(message, "document", None)
+        if (
+            document is not None
+            and settings.telegram_download_connections > 1
+            and document.size >= PARALLEL_DOWNLOAD_MIN_SIZE
+        ):
+            return await self._download_media_parallel(document, file_path, progress_callback)
+
         client = self.telegram.client
 
         def telethon_progress(current: int, total: int) -> None:
             if progress_callback:
                 progress_callback(current, total)
 
+        writer = HashingWriter(file_path)
         try:
             result = await asyncio.wait_for(
                 client.download_media(
                     message,
-                    file=str(file_path),
+                    file=writer,
                     progress_callback=telethon_progress if progress_callback else None,
                 ),
                 timeout=settings.download_timeout_seconds,
             )
-            return result
         except asyncio.TimeoutError:
-            # Clean up partial file if it exists
-            if file_path.exists():
-                try:
-                    file_path.unlink()
-                except OSError:
-                    pass
+            # Clean up partial file
+            writer.discard()
             raise DownloadError(
                 f"Download timed out after {settings.download_timeout_seconds} seconds. "
                 "This may happen when Telegram transfers files between datacenters."
             )
+        except BaseException:
+            writer.discard()
+            raise
+
+        if result is None:
+            # Nothing downloadable in the message
+            writer.discard()
+            return None
+
+        writer.finish()
+        return str(file_path)
+
+    async def _download_media_parallel(
+        self,
+        document: Any,
+        file_path: Path,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> str:
+        """Download a large document over several connections.
+
+        There's no overall timeout here: each part request has its own, and
+        a failed download resumes from its persisted part bitmap on retry.
+        """
+        downloader = ParallelDownloader(self.telegram.client)
+        try:
+            await downloader.download(document, file_path, progress_callback)
+        except ParallelDownloadError as e:
+            raise DownloadError(str(e)) from e
+        return str(file_path)
 
     async def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of file. No database access here."""
+        """Compute SHA256 hash of file. No database access here.
+
+        Free for files written by _download_media (digest already known).
+        """
         return await compute_file_hash(file_path)
 
     def _get_staging_dir(self, design_id: str) -> Path:
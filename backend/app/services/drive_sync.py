@@ -0,0 +1,375 @@
+"""Persisted Google Drive tree snapshots for incremental import sync.
+
+A full Drive sync lists every folder under the import root. DriveTreeSnapshot
+stores what that listing found (one compact entry per file and folder), the
+designs detected in it, and the Changes API page token taken just before
+the listing started.
+
+The next sync asks the Changes API for everything since that token and
+applies it to the snapshot. The Changes API reports changes across the
+whole Drive, so anything that isn't under the root is dropped. The snapshot
+records which folders were touched:
+
+- Every changed entry marks its parent folder and that folder's ancestors
+  as dirty. Detection for a folder only looks at its own subtree, so the
+  other folders keep their previous result.
+- A folder that was renamed or moved changes the path of everything below
+  it, so its whole subtree is marked dirty.
+- A folder moved in from outside the tree arrives without its children.
+  Its contents are listed separately (see folders_to_list).
+
+Changes are replayed idempotently, so a change that lands while a full
+listing is running is simply applied again on the next sync.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from app.schemas.import_profile import ImportProfileConfig
+    from app.services.google_drive import ChangeInfo, DetectedGoogleDriveDesign, FileInfo
+
+logger = get_logger(__name__)
+
+# Bump when the snapshot layout changes
+DRIVE_SNAPSHOT_VERSION = 1
+
+# Rebuild from a full listing after this long, as a safety net for any
+# change the Changes API didn't report to us
+DRIVE_SNAPSHOT_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+
+@dataclass
+class ChangeSet:
+    """Folders affected by changes applied to a snapshot."""
+
+    # Folders whose detection result must be recomputed
+    dirty: set[str] = field(default_factory=set)
+    # Folders that entered the tree from outside; their contents are unknown
+    folders_to_list: set[str] = field(default_factory=set)
+    applied: int = 0
+    ignored: int = 0
+
+
+class DriveTreeSnapshot:
+    """Listing of a Drive folder tree as of a Changes API page token."""
+
+    def __init__(self, key: str, root_id: str, config: ImportProfileConfig):
+        """Initialize an empty snapshot.
+
+        Args:
+            key: Identifies the import folder (or legacy source) it belongs to.
+            root_id: Google Drive ID of the tree's root folder.
+            config: Profile config; detection results depend on it.
+        """
+        self.key = key
+        self.root_id = root_id
+        self.config_fingerprint = hashlib.sha256(
+            config.model_dump_json().encode()
+        ).hexdigest()[:16]
+        self.created_at = time.time()
+        self.page_token: str | None = None
+        # file ID -> {"n": name, "m": mime type, "s": size, "p": parent, "t": modified}
+        self.entries: dict[str, dict[str, Any]] = {}
+        # folder ID -> DetectedGoogleDriveDesign dump
+        self.designs: dict[str, dict[str, Any]] = {}
+        self._children: dict[str, set[str]] = {}
+
+    @staticmethod
+    def path_for(key: str) -> Path:
+        """Get the snapshot file location for a key."""
+        name = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return settings.cache_path / "gdrive_sync" / f"{name}.json"
+
+    @classmethod
+    def load(
+        cls, key: str, root_id: str, config: ImportProfileConfig
+    ) -> DriveTreeSnapshot | None:
+        """Load a snapshot, or None if there isn't a usable one.
+
+        A snapshot is discarded if it was written by another snapshot
+        version, for another root folder or profile config, or is older than
+        DRIVE_SNAPSHOT_MAX_AGE.
+
+        Args:
+            key: Snapshot key.
+            root_id: Root folder the snapshot must describe.
+            config: Profile config used for this sync.
+
+        Returns:
+            The stored snapshot, or None.
+        """
+        snapshot = cls(key, root_id, config)
+        try:
+            data = json.loads(cls.path_for(key).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if (
+            data.get("version") != DRIVE_SNAPSHOT_VERSION
+            or data.get("root") != root_id
+            or data.get("config") != snapshot.config_fingerprint
+            or not data.get("page_token")
+            or time.time() - data.get("created_at", 0) > DRIVE_SNAPSHOT_MAX_AGE
+        ):
+            return None
+
+        snapshot.created_at = data["created_at"]
+        snapshot.page_token = data["page_token"]
+        snapshot.entries = data.get("entries", {})
+        snapshot.designs = data.get("designs", {})
+        snapshot._index_children()
+        return snapshot
+
+    @classmethod
+    def from_listing(
+        cls,
+        key: str,
+        root_id: str,
+        config: ImportProfileConfig,
+        files: list[FileInfo],
+        page_token: str | None,
+    ) -> DriveTreeSnapshot:
+        """Build a snapshot from a full recursive listing.
+
+        Args:
+            key: Snapshot key.
+            root_id: Root folder that was listed.
+            config: Profile config used for detection.
+            files: Every file and folder under the root.
+            page_token: Changes API token taken before the listing started.
+        """
+        snapshot = cls(key, root_id, config)
+        snapshot.page_token = page_token
+        for f in files:
+            snapshot._set_entry(f)
+        return snapshot
+
+    def save(self) -> None:
+        """Persist the snapshot (best-effort)."""
+        path = self.path_for(self.key)
+        data = {
+            "version": DRIVE_SNAPSHOT_VERSION,
+            "root": self.root_id,
+            "config": self.config_fingerprint,
+            "created_at": self.created_at,
+            "page_token": self.page_token,
+            "entries": self.entries,
+            "designs": self.designs,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("drive_snapshot_save_failed", key=self.key, error=str(e))
+
+    @classmethod
+    def delete(cls, key: str) -> None:
+        """Remove a stored snapshot so the next sync does a full listing."""
+        try:
+            cls.path_for(key).unlink()
+        except OSError:
+            pass
+
+    # ========== Tree Access ==========
+
+    def file_infos(self) -> list[FileInfo]:
+        """Get every entry as FileInfo, for building the virtual folder tree."""
+        from app.services.google_drive import FileInfo
+
+        return [
+            FileInfo(
+                id=file_id,
+                name=entry["n"],
+                mime_type=entry["m"],
+                size=entry["s"],
+                modified_time=datetime.fromisoformat(entry["t"]) if entry["t"] else None,
+                parent_id=entry["p"],
+                is_folder=entry["m"] == FOLDER_MIME_TYPE,
+            )
+            for file_id, entry in self.entries.items()
+        ]
+
+    def previous_designs(self) -> dict[str, DetectedGoogleDriveDesign]:
+        """Get the designs detected by the last sync, keyed by folder ID."""
+        from app.services.google_drive import DetectedGoogleDriveDesign
+
+        return {
+            folder_id: DetectedGoogleDriveDesign.model_validate(data)
+            for folder_id, data in self.designs.items()
+        }
+
+    def set_designs(self, designs: list[DetectedGoogleDriveDesign]) -> None:
+        """Record the designs detected for the current tree."""
+        self.designs = {d.folder_id: d.model_dump(mode="json") for d in designs}
+
+    def is_folder(self, file_id: str) -> bool:
+        """Check if an ID is the root or a folder in the tree."""
+        if file_id == self.root_id:
+            return True
+        entry = self.entries.get(file_id)
+        return entry is not None and entry["m"] == FOLDER_MIME_TYPE
+
+    # ========== Applying Changes ==========
+
+    def add_listing(self, folder_id: str, files: list[FileInfo], changes: ChangeSet) -> None:
+        """Add the contents of a folder that was listed after entering the tree."""
+        for f in files:
+            self._set_entry(f)
+        self._mark_subtree(folder_id, changes)
+
+    def apply_changes(self, change_list: list[ChangeInfo]) -> ChangeSet:
+        """Apply Changes API results to the snapshot.
+
+        The Changes API only reports the latest change per file, in time
+        order, so a folder's change can come after changes to files inside
+        it. Folders are applied first, repeating until no more of them can
+        be placed under the root; files are applied after that.
+
+        Args:
+            change_list: Changes since page_token, across the whole Drive.
+
+        Returns:
+            ChangeSet with the affected folders.
+        """
+        changes = ChangeSet()
+
+        folder_changes: list[ChangeInfo] = []
+        file_changes: list[ChangeInfo] = []
+        for change in change_list:
+            info = change.file_info
+            if info is not None and info.is_folder:
+                folder_changes.append(change)
+            elif info is None and self.is_folder(change.file_id):
+                folder_changes.append(change)
+            else:
+                file_changes.append(change)
+
+        # Folders: place those whose parent is in the tree until none are left
+        pending = folder_changes
+        while pending:
+            deferred: list[ChangeInfo] = []
+            for change in pending:
+                info = change.file_info
+                if change.removed or info is None:
+                    self._remove(change.file_id, changes)
+                elif info.parent_id and self.is_folder(info.parent_id):
+                    self._upsert(info, changes)
+                else:
+                    deferred.append(change)
+            if len(deferred) == len(pending):
+                # The rest live outside the tree (or just left it)
+                for change in deferred:
+                    self._remove(change.file_id, changes)
+                break
+            pending = deferred
+
+        for change in file_changes:
+            info = change.file_info
+            if change.removed or info is None:
+                self._remove(change.file_id, changes)
+            elif info.parent_id and self.is_folder(info.parent_id):
+                self._upsert(info, changes)
+            else:
+                self._remove(change.file_id, changes)
+
+        return changes
+
+    def _upsert(self, info: FileInfo, changes: ChangeSet) -> None:
+        old = self.entries.get(info.id)
+        self._set_entry(info)
+        changes.applied += 1
+
+        if old is None:
+            if info.is_folder:
+                # New here: either just created (its children come as their
+                # own changes) or moved in (they don't). List it to be sure.
+                changes.folders_to_list.add(info.id)
+                self._mark_subtree(info.id, changes)
+            self._mark_dirty(info.parent_id, changes)
+            return
+
+        self._mark_dirty(old["p"], changes)
+        self._mark_dirty(info.parent_id, changes)
+        if info.is_folder and (old["p"] != info.parent_id or old["n"] != info.name):
+            self._mark_subtree(info.id, changes)
+
+    def _remove(self, file_id: str, changes: ChangeSet) -> None:
+        old = self.entries.get(file_id)
+        if old is None:
+            changes.ignored += 1
+            return
+
+        changes.applied += 1
+        # Mark before unlinking, while the ancestor chain is still intact
+        self._mark_dirty(old["p"], changes)
+        stack = [file_id]
+        while stack:
+            current = stack.pop()
+            stack.extend(self._children.pop(current, ()))
+            entry = self.entries.pop(current, None)
+            changes.dirty.discard(current)
+            changes.folders_to_list.discard(current)
+            if entry is not None and current == file_id:
+                siblings = self._children.get(entry["p"])
+                if siblings is not None:
+                    siblings.discard(current)
+
+    def _set_entry(self, info: FileInfo) -> None:
+        old = self.entries.get(info.id)
+        if old is not None and old["p"] != info.parent_id:
+            siblings = self._children.get(old["p"])
+            if siblings is not None:
+                siblings.discard(info.id)
+        self.entries[info.id] = {
+            "n": info.name,
+            "m": info.mime_type,
+            "s": info.size,
+            "p": info.parent_id,
+            "t": info.modified_time.isoformat() if info.modified_time else None,
+        }
+        self._children.setdefault(info.parent_id, set()).add(info.id)
+
+    def _index_children(self) -> None:
+        self._children = {}
+        for file_id, entry in self.entries.items():
+            self._children.setdefault(entry["p"], set()).add(file_id)
+
+    def _mark_dirty(self, folder_id: str | None, changes: ChangeSet) -> None:
+        """Mark a folder and its ancestors up to the root as dirty."""
+        seen: set[str] = set()
+        while folder_id and folder_id not in seen:
+            seen.add(folder_id)
+            changes.dirty.add(folder_id)
+            if folder_id == self.root_id:
+                return
+            entry = self.entries.get(folder_id)
+            if entry is None:
+                return
+            folder_id = entry["p"]
+
+    def _mark_subtree(self, folder_id: str, changes: ChangeSet) -> None:
+        """Mark a folder, its ancestors and everything below it as dirty."""
+        self._mark_dirty(folder_id, changes)
+        stack = [folder_id]
+        while stack:
+            current = stack.pop()
+            for child in self._children.get(current, ()):
+                if self.entries[child]["m"] == FOLDER_MIME_TYPE:
+                    changes.dirty.add(child)
+                    stack.append(child)
@@ -25,6 +25,7 @@ from app.db.models import (
     DuplicateMatchType,
     ExternalMetadataSource,
 )
+from app.services.duplicate_index import get_design_match_index
 
 if TYPE_CHECKING:
     pass
@@ -586,13 +587,26 @@ class DuplicateService:
         if not design.canonical_title or not design.canonical_designer:
             return []
 
-        # Get all designs to compare (excluding self)
+        # Narrow to designs that can reach the threshold on both fields,
+        # then re-check them against the database below
+        index = get_design_match_index()
+        await index.ensure_loaded(self.db)
+        candidate_ids = index.find_title_designer_candidates(
+            design.canonical_title,
+            design.canonical_designer,
+            TITLE_SIMILARITY_THRESHOLD,
+        )
+        if not candidate_ids:
+            return []
+
         result = await self.db.execute(
             select(Design)
             .where(
+                Design.id.in_(candidate_ids),
                 Design.id != design.id,
                 Design.status != DesignStatus.DELETED,
             )
+            .order_by(Design.created_at)
         )
         all_designs = result.scalars().all()
 
@@ -715,10 +729,20 @@ class DuplicateService:
                 return title_only_match, True
             return title_only_match, False
 
-        # Try fuzzy title match
+        # Try fuzzy title match against indexed candidates only
+        index = get_design_match_index()
+        await index.ensure_loaded(self.db)
+        candidate_ids = index.find_title_candidates(title, TITLE_SIMILARITY_THRESHOLD)
+        if not candidate_ids:
+            return None, False
+
         result = await self.db.execute(
             select(Design)
-            .where(Design.status != DesignStatus.DELETED)
+            .where(
+                Design.id.in_(candidate_ids),
+                Design.status != DesignStatus.DELETED,
+            )
+            .order_by(Design.created_at)
         )
         all_designs = result.scalars().all()
 
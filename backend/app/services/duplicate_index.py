@@ -0,0 +1,350 @@
+"""Candidate index for fuzzy title/designer duplicate matching (DEC-041).
+
+DuplicateService used to hydrate every Design and run fuzz.ratio against
+each one per lookup. This index keeps the lowercased title and designer of
+every non-deleted design in memory, blocked two ways:
+
+- By designer: a title+designer lookup fuzzy-matches the query designer
+  against the distinct designers only, then scores titles inside the
+  matching buckets.
+- By title length: fuzz.ratio(a, b) <= 200 * min(len) / (len(a) + len(b)),
+  so titles whose length is too far off can never reach the threshold and
+  are skipped without scoring.
+
+Both filters are lossless, so the index returns a superset of the real
+matches. DuplicateService re-loads the candidates from the database and
+applies its usual checks, which keeps match decisions unchanged even if
+the index is briefly stale.
+
+The index is kept current from ORM session events: flushed Design inserts,
+updates and deletes are applied immediately; bulk UPDATE/DELETE statements
+and rollbacks of flushed design changes mark it stale so it is rebuilt on
+the next lookup. A periodic rebuild covers anything else (e.g. raw SQL).
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from typing import Any
+
+from rapidfuzz import fuzz, process
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.logging import get_logger
+from app.db.models import Design, DesignStatus
+
+logger = get_logger(__name__)
+
+# Full rebuild interval as a safety net for out-of-band writes
+INDEX_REBUILD_INTERVAL = 15 * 60  # seconds
+
+# Session.info flag: session flushed Design changes since its last commit
+_SESSION_DIRTY_KEY = "design_match_index_dirty"
+
+
+def _length_bounds(length: int, threshold: float) -> tuple[int, int]:
+    """Get the range of string lengths that can reach a fuzz.ratio threshold.
+
+    Args:
+        length: Length of the query string.
+        threshold: Minimum fuzz.ratio score (0-100).
+
+    Returns:
+        Inclusive (min_length, max_length).
+    """
+    if threshold <= 0:
+        return 0, 2**31
+    low = int(length * threshold // (200 - threshold))
+    high = int(length * (200 - threshold) // threshold) + 1
+    return low, high
+
+
+class DesignMatchIndex:
+    """In-memory blocking index over design titles and designers."""
+
+    def __init__(self):
+        """Initialize an empty (unloaded) index."""
+        # design_id -> (title, designer), both lowercased
+        self._designs: dict[str, tuple[str, str]] = {}
+        # designer -> title length -> {design_id: title}
+        self._by_designer: dict[str, dict[int, dict[str, str]]] = {}
+        # title length -> {design_id: title}
+        self._by_length: dict[int, dict[str, str]] = {}
+        self._bind: weakref.ref | None = None
+        self._loaded_at: float | None = None
+        self._stale = True
+        self._rebuilds = 0
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def is_current_for(self, bind: Any) -> bool:
+        """Check if the index was loaded from this engine."""
+        return self._bind is not None and self._bind() is bind
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Rebuild the index if it is stale, expired or from another engine.
+
+        Args:
+            db: Session used to load designs (sees its own flushed rows).
+        """
+        bind = db.get_bind()
+        expired = (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > INDEX_REBUILD_INTERVAL
+        )
+        if not self._stale and not expired and self.is_current_for(bind):
+            return
+
+        started = time.monotonic()
+        result = await db.execute(
+            select(Design.id, Design.canonical_title, Design.canonical_designer).where(
+                Design.status != DesignStatus.DELETED
+            )
+        )
+
+        self._designs.clear()
+        self._by_designer.clear()
+        self._by_length.clear()
+        for design_id, title, designer in result.all():
+            self._add(design_id, title, designer)
+
+        self._bind = weakref.ref(bind)
+        self._loaded_at = time.monotonic()
+        self._stale = False
+        self._rebuilds += 1
+
+        logger.info(
+            "design_match_index_built",
+            designs=len(self._designs),
+            designers=len(self._by_designer),
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+        )
+
+    def mark_stale(self) -> None:
+        """Force a full rebuild on the next lookup."""
+        self._stale = True
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def upsert(
+        self,
+        design_id: str,
+        title: str | None,
+        designer: str | None,
+        status: DesignStatus | None = None,
+    ) -> None:
+        """Add or update a design (deleted designs are removed)."""
+        self.remove(design_id)
+        if status != DesignStatus.DELETED:
+            self._add(design_id, title, designer)
+
+    def remove(self, design_id: str) -> None:
+        """Remove a design from the index."""
+        entry = self._designs.pop(design_id, None)
+        if entry is None:
+            return
+        title, designer = entry
+        length_bucket = self._by_length.get(len(title))
+        if length_bucket is not None:
+            length_bucket.pop(design_id, None)
+            if not length_bucket:
+                del self._by_length[len(title)]
+        designer_bucket = self._by_designer.get(designer)
+        if designer_bucket is not None:
+            titles = designer_bucket.get(len(title))
+            if titles is not None:
+                titles.pop(design_id, None)
+                if not titles:
+                    del designer_bucket[len(title)]
+            if not designer_bucket:
+                del self._by_designer[designer]
+
+    def _add(self, design_id: str, title: str | None, designer: str | None) -> None:
+        """Insert a design into all buckets."""
+        title = (title or "").lower()
+        designer = (designer or "").lower()
+        self._designs[design_id] = (title, designer)
+        self._by_length.setdefault(len(title), {})[design_id] = title
+        self._by_designer.setdefault(designer, {}).setdefault(len(title), {})[
+            design_id
+        ] = title
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def find_title_candidates(self, title: str, threshold: float) -> list[str]:
+        """Find designs whose title may fuzzy-match.
+
+        Args:
+            title: Query title.
+            threshold: Minimum fuzz.ratio score for the title.
+
+        Returns:
+            IDs of designs whose lowercased title scores >= threshold.
+        """
+        return self._match_titles(title.lower(), self._by_length, threshold)
+
+    def find_title_designer_candidates(
+        self, title: str, designer: str, threshold: float
+    ) -> list[str]:
+        """Find designs whose title and designer may both fuzzy-match.
+
+        Args:
+            title: Query title.
+            designer: Query designer.
+            threshold: Minimum fuzz.ratio score for title and designer.
+
+        Returns:
+            IDs of designs scoring >= threshold on both fields.
+        """
+        designer = designer.lower()
+        low, high = _length_bounds(len(designer), threshold)
+        designers = [d for d in self._by_designer if low <= len(d) <= high]
+        matched = process.extract(
+            designer,
+            designers,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            limit=None,
+        )
+
+        title = title.lower()
+        ids: list[str] = []
+        for other_designer, _, _ in matched:
+            ids.extend(
+                self._match_titles(title, self._by_designer[other_designer], threshold)
+            )
+        return ids
+
+    def _match_titles(
+        self,
+        title: str,
+        by_length: dict[int, dict[str, str]],
+        threshold: float,
+    ) -> list[str]:
+        """Score titles in the length range that can reach the threshold."""
+        low, high = _length_bounds(len(title), threshold)
+        choices: dict[str, str] = {}
+        for length, titles in by_length.items():
+            if low <= length <= high:
+                choices.update(titles)
+        if not choices:
+            return []
+
+        matched = process.extract(
+            title,
+            choices,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            limit=None,
+        )
+        return [design_id for _, _, design_id in matched]
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "designs": len(self._designs),
+            "designers": len(self._by_designer),
+            "stale": self._stale,
+            "rebuilds": self._rebuilds,
+        }
+
+
+# Global index instance
+_index: DesignMatchIndex | None = None
+
+
+def get_design_match_index() -> DesignMatchIndex:
+    """Get the design match index singleton."""
+    global _index
+    if _index is None:
+        _index = DesignMatchIndex()
+    return _index
+
+
+# =============================================================================
+# Session event hooks
+# =============================================================================
+
+
+_INDEXED_ATTRS = ("canonical_title", "canonical_designer", "status")
+
+
+def _sync_design(index: DesignMatchIndex, design: Design) -> None:
+    """Apply one flushed Design to the index without triggering loads."""
+    state = inspect(design)
+    design_id = state.identity[0] if state.identity else state.dict.get("id")
+    if design_id is None:
+        return
+
+    if state.persistent and not any(
+        state.attrs[key].history.has_changes() for key in _INDEXED_ATTRS
+    ):
+        return
+
+    if any(key not in state.dict for key in _INDEXED_ATTRS):
+        # Expired attributes can't be read inside a flush; rebuild instead
+        index.mark_stale()
+        return
+
+    index.upsert(
+        design_id,
+        state.dict["canonical_title"],
+        state.dict["canonical_designer"],
+        state.dict["status"],
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    """Apply flushed Design changes to the index."""
+    index = _index
+    if index is None or not index.is_current_for(session.get_bind()):
+        return
+
+    changed = False
+    for obj in [*session.new, *session.dirty]:
+        if isinstance(obj, Design):
+            _sync_design(index, obj)
+            changed = True
+    for obj in session.deleted:
+        if isinstance(obj, Design):
+            index.remove(inspect(obj).identity[0])
+            changed = True
+
+    if changed:
+        session.info[_SESSION_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Flushed design changes are now durable."""
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    """Rebuild after rolling back design changes the index already applied."""
+    if session.info.pop(_SESSION_DIRTY_KEY, None) and _index is not None:
+        _index.mark_stale()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Bulk UPDATE/DELETE on designs bypasses flush events; rebuild instead."""
+    if _index is None:
+        return
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Design:
+        _index.mark_stale()
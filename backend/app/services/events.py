@@ -6,12 +6,27 @@ Events are broadcast for:
 - Job progress updates
 - Design status changes
 - Queue changes
+
+Every broadcast event gets an SSE id ("<epoch>:<sequence>"). The last
+SSE_REPLAY_BUFFER_SIZE state events are kept in a ring buffer, along with
+the latest progress event of each running job, so a client reconnecting
+with Last-Event-ID gets what it missed instead of refetching everything.
+If the gap is no longer covered (buffer overrun, server restart) the client
+is sent a resync event instead.
+
+Each client has a bounded queue. Progress events for a job that is still
+waiting in a client's queue are replaced by the newer one in place, so a
+slow client sees the latest progress rather than every step. If a client
+still falls SSE_CLIENT_QUEUE_SIZE events behind, the oldest are dropped and
+a resync event is delivered before the next one.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from enum import Enum
@@ -23,6 +38,12 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Events a client may have pending before the oldest are dropped
+SSE_CLIENT_QUEUE_SIZE = 256
+
+# State events kept for Last-Event-ID replay (progress is kept per job)
+SSE_REPLAY_BUFFER_SIZE = 1000
+
 
 class EventType(str, Enum):
     """Types of events that can be broadcast."""
@@ -47,6 +68,15 @@ class EventType(str, Enum):
     # System events
     HEARTBEAT = "heartbeat"
     SYNC_STATUS = "sync_status"
+    RESYNC = "resync"  # Events were missed; refetch state
+
+
+# Events that end a job, so its latest progress no longer needs replaying
+JOB_FINISHED_EVENTS = frozenset({
+    EventType.JOB_COMPLETED,
+    EventType.JOB_FAILED,
+    EventType.JOB_CANCELED,
+})
 
 
 class Event(BaseModel):
@@ -55,6 +85,7 @@ class Event(BaseModel):
     type: EventType
     payload: dict[str, Any]
     timestamp: datetime = None
+    id: str | None = None  # Assigned on broadcast
 
     def __init__(self, **data):
         if "timestamp" not in data or data["timestamp"] is None:
@@ -68,14 +99,85 @@ class Event(BaseModel):
             "payload": self.payload,
             "timestamp": self.timestamp.isoformat(),
         }
-        return f"data: {json.dumps(data)}\n\n"
+        id_line = f"id: {self.id}\n" if self.id else ""
+        return f"{id_line}data: {json.dumps(data)}\n\n"
+
+
+class EventSubscription:
+    """A connected client's bounded, progress-coalescing event queue."""
+
+    def __init__(self, broadcaster: EventBroadcaster, maxsize: int = SSE_CLIENT_QUEUE_SIZE):
+        self._broadcaster = broadcaster
+        self._maxsize = maxsize
+        # Events, or a job_id whose latest progress is in _progress
+        self._pending: deque[Event | str] = deque()
+        self._progress: dict[str, Event] = {}
+        self._wakeup = asyncio.Event()
+        self._resync_needed = False
+
+    def put(self, event: Event) -> None:
+        """Queue an event for this client (never blocks)."""
+        if event.type == EventType.JOB_PROGRESS:
+            job_id = event.payload.get("job_id")
+            if job_id is not None:
+                if job_id in self._progress:
+                    # Still waiting to be sent: keep its place, send the newer value
+                    self._progress[job_id] = event
+                    self._broadcaster._coalesced += 1
+                    return
+                self._progress[job_id] = event
+                self._append(job_id)
+                return
+
+        self._append(event)
+
+    def _append(self, item: Event | str) -> None:
+        if len(self._pending) >= self._maxsize:
+            dropped = self._pending.popleft()
+            if isinstance(dropped, str):
+                self._progress.pop(dropped, None)
+            self._resync_needed = True
+            self._broadcaster._dropped += 1
+        self._pending.append(item)
+        self._wakeup.set()
+
+    def qsize(self) -> int:
+        """Number of events waiting to be sent."""
+        return len(self._pending) + (1 if self._resync_needed else 0)
+
+    def get_nowait(self) -> Event:
+        """Take the next event.
+
+        Raises:
+            asyncio.QueueEmpty: If nothing is pending.
+        """
+        if self._resync_needed:
+            self._resync_needed = False
+            return Event(type=EventType.RESYNC, payload={"reason": "client_lagging"})
+        if not self._pending:
+            raise asyncio.QueueEmpty
+        item = self._pending.popleft()
+        if isinstance(item, str):
+            return self._progress.pop(item)
+        return item
+
+    async def get(self) -> Event:
+        """Wait for the next event."""
+        while True:
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                self._wakeup.clear()
+                await self._wakeup.wait()
 
 
 class EventBroadcaster:
     """Manages SSE connections and broadcasts events.
 
     This is a singleton that maintains a list of connected clients
-    and broadcasts events to all of them.
+    and broadcasts events to all of them. Everything runs on the event
+    loop without awaiting, so subscribing with a replay position and
+    broadcasting can't interleave.
     """
 
     _instance: "EventBroadcaster | None" = None
@@ -90,62 +192,121 @@ class EventBroadcaster:
         if self._initialized:
             return
         self._initialized = True
-        self._clients: list[asyncio.Queue[Event]] = []
-        self._lock = asyncio.Lock()
+        self._clients: list[EventSubscription] = []
+
+        # Event IDs restart with the process; the epoch tells them apart
+        self._epoch = int(time.time() * 1000)
+        self._sequence = 0
+        self._history: deque[Event] = deque(maxlen=SSE_REPLAY_BUFFER_SIZE)
+        self._evicted_sequence = 0  # Highest sequence pushed out of _history
+        self._latest_progress: dict[str, Event] = {}
+
+        # Metrics
+        self._published = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._replayed = 0
+        self._resyncs = 0
+
         logger.info("event_broadcaster_initialized")
 
     @asynccontextmanager
-    async def subscribe(self) -> AsyncGenerator[asyncio.Queue[Event], None]:
+    async def subscribe(
+        self, last_event_id: str | None = None
+    ) -> AsyncGenerator[EventSubscription, None]:
         """Subscribe to events.
 
-        Returns an async queue that will receive events.
+        Returns a subscription that will receive events.
         The subscription is automatically cleaned up when the context exits.
 
         Usage:
-            async with broadcaster.subscribe() as queue:
+            async with broadcaster.subscribe(last_event_id) as queue:
                 while True:
                     event = await queue.get()
                     yield event.to_sse()
-        """
-        queue: asyncio.Queue[Event] = asyncio.Queue()
-        async with self._lock:
-            self._clients.append(queue)
-            client_count = len(self._clients)
 
-        logger.info("sse_client_connected", client_count=client_count)
+        Args:
+            last_event_id: Last-Event-ID from a reconnecting client. Events
+                after it are queued first, or a resync event if they're gone.
+        """
+        queue = EventSubscription(self)
+        if last_event_id:
+            self._replay_into(queue, last_event_id)
+        self._clients.append(queue)
+        client_count = len(self._clients)
+
+        logger.info(
+            "sse_client_connected",
+            client_count=client_count,
+            resumed_from=last_event_id,
+        )
 
         try:
             yield queue
         finally:
-            async with self._lock:
-                self._clients.remove(queue)
-                client_count = len(self._clients)
+            self._clients.remove(queue)
+            client_count = len(self._clients)
             logger.info("sse_client_disconnected", client_count=client_count)
 
+    def _replay_into(self, queue: EventSubscription, last_event_id: str) -> None:
+        """Queue everything broadcast after last_event_id, or a resync."""
+        try:
+            epoch_str, sequence_str = last_event_id.split(":", 1)
+            epoch, after = int(epoch_str), int(sequence_str)
+        except ValueError:
+            epoch, after = -1, -1
+
+        if epoch != self._epoch or after > self._sequence or after < self._evicted_sequence:
+            self._resyncs += 1
+            queue.put(Event(type=EventType.RESYNC, payload={"reason": "history_unavailable"}))
+            return
+
+        missed = [e for e in self._history if self._sequence_of(e) > after]
+        missed.extend(
+            e for e in self._latest_progress.values() if self._sequence_of(e) > after
+        )
+        missed.sort(key=self._sequence_of)
+        for event in missed:
+            queue.put(event)
+        self._replayed += len(missed)
+
+    @staticmethod
+    def _sequence_of(event: Event) -> int:
+        return int(event.id.rsplit(":", 1)[1])
+
     async def broadcast(self, event: Event) -> None:
         """Broadcast an event to all connected clients.
 
         Args:
             event: The event to broadcast.
         """
-        async with self._lock:
-            clients = list(self._clients)
-
-        if not clients:
+        self._sequence += 1
+        event.id = f"{self._epoch}:{self._sequence}"
+        self._published += 1
+
+        # Remember it for clients that reconnect
+        if event.type == EventType.JOB_PROGRESS:
+            job_id = event.payload.get("job_id")
+            if job_id is not None:
+                self._latest_progress[job_id] = event
+        else:
+            if event.type in JOB_FINISHED_EVENTS:
+                self._latest_progress.pop(event.payload.get("job_id"), None)
+            if len(self._history) == self._history.maxlen:
+                self._evicted_sequence = self._sequence_of(self._history[0])
+            self._history.append(event)
+
+        if not self._clients:
             return
 
         # Put event in all client queues
-        for queue in clients:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Client queue is full, skip
-                logger.warning("sse_client_queue_full")
+        for queue in self._clients:
+            queue.put(event)
 
         logger.debug(
             "event_broadcast",
             event_type=event.type.value,
-            client_count=len(clients),
+            client_count=len(self._clients),
         )
 
     async def broadcast_job_created(
@@ -324,6 +485,25 @@ class EventBroadcaster:
         """Get the number of connected clients."""
         return len(self._clients)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get event bus statistics.
+
+        Returns:
+            Dictionary with event bus stats.
+        """
+        return {
+            "connected_clients": len(self._clients),
+            "last_event_id": f"{self._epoch}:{self._sequence}",
+            "events_published": self._published,
+            "events_dropped": self._dropped,
+            "events_coalesced": self._coalesced,
+            "events_replayed": self._replayed,
+            "resyncs": self._resyncs,
+            "replay_buffer_size": len(self._history),
+            "tracked_job_progress": len(self._latest_progress),
+            "max_client_backlog": max((q.qsize() for q in self._clients), default=0),
+        }
+
 
 # Global singleton instance
 event_broadcaster = EventBroadcaster()
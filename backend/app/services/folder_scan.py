@@ -0,0 +1,436 @@
+"""Single-pass folder walker and incremental scan cache for bulk imports.
+
+DirectoryLister lists each directory at most once per scan with os.scandir.
+Design detection, traversal and scan_folder_stats() all read the same
+listings, so a design folder is walked once no matter how many of them look
+at it.
+
+scan_folder_stats() collects everything BulkImportService needs from a
+design folder: total size, latest file mtime, the content fingerprint and
+the directory layout.
+
+FolderScanCache remembers each directory's (mtime, inode) from the last
+scan of an import root, along with the detection result and stats of every
+design folder. A directory's mtime changes whenever entries are added,
+removed or renamed inside it, so a subtree whose directories all match the
+cache has the same files as last time and can be reused without listing it.
+
+File rewrites that keep the same name don't touch directory mtimes. Those
+are picked up by watchdog events (which invalidate the affected designs)
+and by a full rescan once the cache is older than SCAN_CACHE_MAX_AGE.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.schemas.import_profile import DesignDetectionResult, ImportProfileConfig
+
+logger = get_logger(__name__)
+
+# Bump when the cache layout changes
+SCAN_CACHE_VERSION = 1
+
+# Force a full rescan after this long to catch in-place file rewrites
+SCAN_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+
+@dataclass
+class DirectoryRecord:
+    """A directory's identity and child directories at scan time."""
+
+    mtime_ns: int
+    inode: int
+    subdirs: list[str]
+
+
+@dataclass
+class FolderStats:
+    """Size, mtime and fingerprint of a design folder."""
+
+    total_size: int = 0
+    mtime: datetime | None = None
+    file_hash: str = ""
+    files: list[str] = field(default_factory=list)
+    # Relative directory path -> record, for every directory walked
+    directories: dict[str, DirectoryRecord] = field(default_factory=dict)
+
+
+def join_relative(rel: str, name: str) -> str:
+    """Append a name to a root-relative path ("." is the root itself).
+
+    Matches how str(Path.relative_to()) renders paths on POSIX.
+    """
+    return name if rel == "." else f"{rel}/{name}"
+
+
+@dataclass
+class DirectoryListing:
+    """One directory as seen by a single os.scandir pass."""
+
+    mtime_ns: int
+    inode: int
+    # (name, size, mtime) of each file, in scandir order
+    files: list[tuple[str, int, float]]
+    subdirs: list[str]
+    # Symlinks to directories (traversed for detection, never walked for stats)
+    linked_dirs: list[str]
+
+
+class DirectoryLister:
+    """Lists each directory at most once during a scan."""
+
+    def __init__(self) -> None:
+        """Initialize an empty listing memo."""
+        self._listings: dict[str, DirectoryListing | None] = {}
+
+    def list(self, path: Path) -> DirectoryListing | None:
+        """List a directory, or None if it can't be listed.
+
+        The directory's (mtime, inode) is taken before listing it.
+        """
+        key = str(path)
+        if key in self._listings:
+            return self._listings[key]
+
+        listing = None
+        try:
+            dir_stat = os.stat(key)
+            files: list[tuple[str, int, float]] = []
+            subdirs: list[str] = []
+            linked_dirs: list[str] = []
+            with os.scandir(key) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_dir():
+                            linked_dirs.append(entry.name)
+                        elif entry.is_file():
+                            entry_stat = entry.stat()
+                            files.append((entry.name, entry_stat.st_size, entry_stat.st_mtime))
+                    except OSError:
+                        continue
+            listing = DirectoryListing(
+                mtime_ns=dir_stat.st_mtime_ns,
+                inode=dir_stat.st_ino,
+                files=files,
+                subdirs=subdirs,
+                linked_dirs=linked_dirs,
+            )
+        except OSError:
+            pass
+
+        self._listings[key] = listing
+        return listing
+
+    def walk_files(self, path: Path, rel: str = ".") -> list[tuple[str, int, float]]:
+        """Get every file below a directory as (relative path, size, mtime).
+
+        Directories are visited in pre-order like Path.rglob(); symlinked
+        directories are not followed.
+        """
+        listing = self.list(path)
+        if listing is None:
+            return []
+
+        files = [(join_relative(rel, name), size, mtime) for name, size, mtime in listing.files]
+        for name in listing.subdirs:
+            files.extend(self.walk_files(path / name, join_relative(rel, name)))
+        return files
+
+
+def scan_folder_stats(folder_path: Path, lister: DirectoryLister | None = None) -> FolderStats:
+    """Walk a folder once and collect size, mtime and content fingerprint.
+
+    The fingerprint hashes "relative_path:size" for every file in path
+    order, so it only changes when files are added, removed, renamed or
+    resized. Symlinked directories are not followed.
+
+    Args:
+        folder_path: The design folder to walk.
+        lister: Listings shared with the rest of the scan, if any.
+
+    Returns:
+        FolderStats for the folder.
+    """
+    lister = lister or DirectoryLister()
+    stats = FolderStats()
+    # (path parts, relative path, size) for the fingerprint
+    files: list[tuple[list[str], str, int]] = []
+    latest_mtime: float | None = None
+
+    pending = [(folder_path, ".")]
+    while pending:
+        dir_path, rel = pending.pop()
+        listing = lister.list(dir_path)
+        if listing is None:
+            continue
+
+        for name, size, mtime in listing.files:
+            file_rel = join_relative(rel, name)
+            files.append((file_rel.split("/"), file_rel, size))
+            stats.total_size += size
+            if latest_mtime is None or mtime > latest_mtime:
+                latest_mtime = mtime
+        for name in listing.subdirs:
+            pending.append((dir_path / name, join_relative(rel, name)))
+
+        stats.directories[rel] = DirectoryRecord(
+            mtime_ns=listing.mtime_ns,
+            inode=listing.inode,
+            subdirs=sorted(listing.subdirs),
+        )
+
+    hasher = hashlib.sha256()
+    files.sort(key=lambda f: f[0])
+    for _, file_rel, size in files:
+        hasher.update(f"{file_rel}:{size}".encode())
+
+    stats.file_hash = hasher.hexdigest()[:32]
+    stats.files = [file_rel for _, file_rel, _ in files]
+    if latest_mtime is not None:
+        stats.mtime = datetime.fromtimestamp(latest_mtime)
+    return stats
+
+
+@dataclass
+class CachedDesign:
+    """Detection result and stats of a design folder from a previous scan."""
+
+    detection: DesignDetectionResult
+    total_size: int
+    mtime: datetime | None
+    file_hash: str
+
+
+class FolderScanCache:
+    """Persisted per-directory (mtime, inode) cache for one import root.
+
+    A scan starts from the previous state and builds a fresh one: entries
+    for subtrees that are confirmed unchanged are carried over, changed
+    directories are recorded as they are rescanned, and anything that no
+    longer exists simply isn't carried over.
+    """
+
+    def __init__(self, root: Path, config: ImportProfileConfig):
+        """Initialize an empty cache for an import root.
+
+        Args:
+            root: The import root folder.
+            config: Profile config; detection results depend on it.
+        """
+        self.root = root
+        self.config_fingerprint = hashlib.sha256(
+            config.model_dump_json().encode()
+        ).hexdigest()[:16]
+        self.created_at = time.time()
+        self._old_dirs: dict[str, dict[str, Any]] = {}
+        self._old_designs: dict[str, dict[str, Any]] = {}
+        self._dirs: dict[str, dict[str, Any]] = {}
+        self._designs: dict[str, dict[str, Any]] = {}
+        self._unchanged: dict[str, bool] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def path_for(root: Path) -> Path:
+        """Get the cache file location for an import root."""
+        key = hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+        return settings.cache_path / "import_scan" / f"{key}.json"
+
+    @classmethod
+    def load(cls, root: Path, config: ImportProfileConfig) -> FolderScanCache:
+        """Load the cache for an import root, or start empty.
+
+        The previous state is discarded if it was written by another cache
+        version, for another profile config, or is older than
+        SCAN_CACHE_MAX_AGE.
+
+        Args:
+            root: The import root folder.
+            config: Profile config used for this scan.
+
+        Returns:
+            FolderScanCache ready for a scan.
+        """
+        cache = cls(root, config)
+        path = cls.path_for(root)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cache
+
+        if (
+            data.get("version") != SCAN_CACHE_VERSION
+            or data.get("config") != cache.config_fingerprint
+            or time.time() - data.get("created_at", 0) > SCAN_CACHE_MAX_AGE
+        ):
+            return cache
+
+        cache.created_at = data["created_at"]
+        cache._old_dirs = data.get("dirs", {})
+        cache._old_designs = data.get("designs", {})
+        return cache
+
+    def save(self) -> None:
+        """Persist the state built by the current scan (best-effort)."""
+        path = self.path_for(self.root)
+        data = {
+            "version": SCAN_CACHE_VERSION,
+            "config": self.config_fingerprint,
+            "created_at": self.created_at,
+            "dirs": self._dirs,
+            "designs": self._designs,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("scan_cache_save_failed", path=str(path), error=str(e))
+
+    @classmethod
+    def invalidate(cls, root: Path, rel_paths: list[str]) -> None:
+        """Drop cached designs so the next scan recomputes them.
+
+        Args:
+            root: The import root folder.
+            rel_paths: Design folder paths relative to the root.
+        """
+        path = cls.path_for(root)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+
+        designs = data.get("designs", {})
+        dirs = data.get("dirs", {})
+        changed = False
+        for rel in rel_paths:
+            if designs.pop(rel, None) is not None:
+                changed = True
+            if dirs.pop(rel, None) is not None:
+                changed = True
+        if not changed:
+            return
+
+        try:
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("scan_cache_save_failed", path=str(path), error=str(e))
+
+    # ========== Lookups ==========
+
+    def is_unchanged(self, folder_path: Path, rel: str) -> bool:
+        """Check if a directory and everything below it match the cache.
+
+        Only directories are stat'ed; nothing is listed. Unchanged
+        subtrees are carried over into the new state.
+
+        Args:
+            folder_path: Absolute path of the directory.
+            rel: Path relative to the root ("." for the root itself).
+
+        Returns:
+            True if the subtree can be reused from the previous scan.
+        """
+        if rel in self._unchanged:
+            return self._unchanged[rel]
+
+        entry = self._old_dirs.get(rel)
+        unchanged = False
+        if entry is not None:
+            try:
+                dir_stat = os.stat(folder_path)
+            except OSError:
+                dir_stat = None
+            if (
+                dir_stat is not None
+                and dir_stat.st_mtime_ns == entry["m"]
+                and dir_stat.st_ino == entry["i"]
+            ):
+                unchanged = all(
+                    self.is_unchanged(folder_path / name, join_relative(rel, name))
+                    for name in entry["d"]
+                )
+
+        self._unchanged[rel] = unchanged
+        if unchanged:
+            self._dirs[rel] = entry
+            if rel in self._old_designs:
+                self._designs[rel] = self._old_designs[rel]
+        return unchanged
+
+    def subdirs(self, rel: str) -> list[str]:
+        """Get the cached child directory names of an unchanged directory."""
+        return self._dirs[rel]["d"]
+
+    def is_cached_design(self, rel: str) -> bool:
+        """Check if an unchanged folder was a design last time."""
+        return rel in self._designs
+
+    def get_design(self, rel: str) -> CachedDesign | None:
+        """Get the cached design for an unchanged folder, if it was one."""
+        data = self._designs.get(rel)
+        if data is None:
+            return None
+        self.hits += 1
+        return CachedDesign(
+            detection=DesignDetectionResult.model_validate(data["detection"]),
+            total_size=data["size"],
+            mtime=datetime.fromisoformat(data["mtime"]) if data["mtime"] else None,
+            file_hash=data["hash"],
+        )
+
+    # ========== Recording ==========
+
+    def record_directory(
+        self, rel: str, listing: DirectoryListing, subdirs: list[str]
+    ) -> None:
+        """Record a directory that was listed during this scan.
+
+        Args:
+            rel: Path relative to the root.
+            listing: The directory's listing.
+            subdirs: Child directory names the traversal descends into.
+        """
+        self._dirs[rel] = {"m": listing.mtime_ns, "i": listing.inode, "d": sorted(subdirs)}
+
+    def record_subtree(self, rel: str, stats: FolderStats) -> None:
+        """Record a folder and every directory below it from a fresh walk."""
+        for dir_rel, record in stats.directories.items():
+            full_rel = rel if dir_rel == "." else join_relative(rel, dir_rel)
+            self._dirs[full_rel] = {
+                "m": record.mtime_ns,
+                "i": record.inode,
+                "d": record.subdirs,
+            }
+
+    def record_design(
+        self,
+        rel: str,
+        detection: DesignDetectionResult,
+        stats: FolderStats,
+    ) -> None:
+        """Record a design folder, its subtree and its stats."""
+        self.misses += 1
+        self.record_subtree(rel, stats)
+        self._designs[rel] = {
+            "detection": detection.model_dump(),
+            "size": stats.total_size,
+            "mtime": stats.mtime.isoformat() if stats.mtime else None,
+            "hash": stats.file_hash,
+        }
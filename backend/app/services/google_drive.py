@@ -4,7 +4,7 @@ Provides:
 - Public folder access via API key
 - OAuth2 authentication for private folders
 - File listing with pagination
-- File downloading
+- Streamed, resumable file downloads over an async HTTP/2 client
 - Credential encryption and storage
 - Rate limiting with exponential backoff
 
@@ -22,6 +22,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, TypeVar
 
+import httpx
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -29,9 +30,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.db.models import GoogleCredentials
+from app.services.drive_sync import DriveTreeSnapshot
+from app.services.google_drive_client import (
+    DriveClient,
+    DriveClientError,
+    DriveHttpError,
+    close_drive_http_client,
+    get_drive_http_client,
+)
 
 if TYPE_CHECKING:
-    pass
+    from app.schemas.import_profile import (
+        ImportProfileConfig,
+        ProfileIgnoreConfig,
+        ProfileTitleConfig,
+    )
 
 T = TypeVar("T")
 
@@ -350,6 +363,15 @@ class DetectedGoogleDriveDesign(BaseModel):
         arbitrary_types_allowed = True
 
 
+class DriveSyncResult(BaseModel):
+    """Result of GoogleDriveService.sync_designs."""
+
+    designs: list[DetectedGoogleDriveDesign] = Field(default_factory=list)
+    page_token: str | None = None
+    incremental: bool = False
+    changes_applied: int = 0
+
+
 class GoogleDriveService:
     """Service for interacting with Google Drive API.
 
@@ -435,16 +457,7 @@ class GoogleDriveService:
             GoogleAccessDeniedError: If access is denied.
             GoogleRateLimitError: If rate limited after max retries.
         """
-        # Lazy import to avoid startup errors if google libs not installed
-        try:
-            from googleapiclient.discovery import build
-            from googleapiclient.errors import HttpError
-        except ImportError as e:
-            raise GoogleDriveError(
-                "Google API libraries not installed. Run: pip install google-api-python-client"
-            ) from e
-
-        service = await self._get_drive_service(credentials)
+        client = await self._get_drive_client(credentials)
 
         async def _execute_with_retry() -> FolderInfo:
             for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
@@ -452,11 +465,7 @@ class GoogleDriveService:
                     # Pace requests to avoid rate limiting
                     await get_request_pacer().acquire()
 
-                    file = service.files().get(
-                        fileId=folder_id,
-                        fields="id, name, mimeType, owners",
-                        supportsAllDrives=True,
-                    ).execute()
+                    file = await client.get_file(folder_id, "id, name, mimeType, owners")
 
                     if file.get("mimeType") != "application/vnd.google-apps.folder":
                         raise GoogleDriveError(f"ID {folder_id} is not a folder")
@@ -466,13 +475,7 @@ class GoogleDriveService:
 
                     # Count files in folder
                     query = f"'{folder_id}' in parents and trashed = false"
-                    result = service.files().list(
-                        q=query,
-                        fields="files(id)",
-                        pageSize=1000,
-                        supportsAllDrives=True,
-                        includeItemsFromAllDrives=True,
-                    ).execute()
+                    result = await client.list_files(query, "files(id)", page_size=1000)
                     file_count = len(result.get("files", []))
 
                     owners = file.get("owners", [])
@@ -486,14 +489,14 @@ class GoogleDriveService:
                         owner_email=owner_email,
                     )
 
-                except HttpError as e:
-                    if e.resp.status == 404:
+                except DriveHttpError as e:
+                    if e.status == 404:
                         raise GoogleNotFoundError(f"Folder {folder_id} not found") from e
-                    if e.resp.status in (401, 403):
+                    if e.status in (401, 403) and not e.is_rate_limit:
                         raise GoogleAccessDeniedError(
                             f"Access denied to folder {folder_id}. May require authentication."
                         ) from e
-                    if e.resp.status == 429:
+                    if e.is_rate_limit:
                         if attempt >= RATE_LIMIT_MAX_RETRIES:
                             raise GoogleRateLimitError(
                                 f"Rate limit exceeded after {attempt + 1} attempts"
@@ -513,6 +516,8 @@ class GoogleDriveService:
                         await asyncio.sleep(delay)
                         continue
                     raise GoogleDriveError(f"Google API error: {e}") from e
+                except httpx.HTTPError as e:
+                    raise GoogleDriveError(f"Google API error: {e}") from e
 
             raise GoogleRateLimitError("Rate limit handling exhausted")
 
@@ -540,12 +545,7 @@ class GoogleDriveService:
             GoogleDriveError: If listing fails.
             GoogleRateLimitError: If rate limited after max retries.
         """
-        try:
-            from googleapiclient.errors import HttpError
-        except ImportError as e:
-            raise GoogleDriveError("Google API libraries not installed") from e
-
-        service = await self._get_drive_service(credentials)
+        client = await self._get_drive_client(credentials)
 
         for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
             try:
@@ -553,15 +553,13 @@ class GoogleDriveService:
                 await get_request_pacer().acquire()
 
                 query = f"'{folder_id}' in parents and trashed = false"
-                result = service.files().list(
-                    q=query,
-                    fields="nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, parents, webViewLink)",
-                    pageToken=page_token,
-                    pageSize=page_size,
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
-                    orderBy="name",
-                ).execute()
+                result = await client.list_files(
+                    query,
+                    "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, parents, webViewLink)",
+                    page_token=page_token,
+                    page_size=page_size,
+                    order_by="name",
+                )
 
                 files = []
                 for f in result.get("files", []):
@@ -579,12 +577,12 @@ class GoogleDriveService:
 
                 return files, result.get("nextPageToken")
 
-            except HttpError as e:
-                if e.resp.status == 404:
+            except DriveHttpError as e:
+                if e.status == 404:
                     raise GoogleNotFoundError(f"Folder {folder_id} not found") from e
-                if e.resp.status in (401, 403):
+                if e.status in (401, 403) and not e.is_rate_limit:
                     raise GoogleAccessDeniedError(f"Access denied to folder {folder_id}") from e
-                if e.resp.status == 429:
+                if e.is_rate_limit:
                     if attempt >= RATE_LIMIT_MAX_RETRIES:
                         raise GoogleRateLimitError(
                             f"Rate limit exceeded after {attempt + 1} attempts"
@@ -604,6 +602,8 @@ class GoogleDriveService:
                     await asyncio.sleep(delay)
                     continue
                 raise GoogleDriveError(f"Google API error: {e}") from e
+            except httpx.HTTPError as e:
+                raise GoogleDriveError(f"Google API error: {e}") from e
 
         raise GoogleRateLimitError("Rate limit handling exhausted")
 
@@ -773,15 +773,7 @@ class GoogleDriveService:
             GoogleDriveError: If download fails.
             GoogleRateLimitError: If rate limited after max retries.
         """
-        try:
-            from googleapiclient.errors import HttpError
-            from googleapiclient.http import MediaIoBaseDownload
-        except ImportError as e:
-            raise GoogleDriveError("Google API libraries not installed") from e
-
-        import io
-
-        service = await self._get_drive_service(credentials)
+        client = await self._get_drive_client(credentials)
 
         for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
             try:
@@ -789,11 +781,7 @@ class GoogleDriveService:
                 await get_request_pacer().acquire()
 
                 # Get file metadata first
-                file_meta = service.files().get(
-                    fileId=file_id,
-                    fields="name, size, mimeType",
-                    supportsAllDrives=True,
-                ).execute()
+                file_meta = await client.get_file(file_id, "name, size, mimeType, modifiedTime")
 
                 # Create parent directories
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -801,33 +789,30 @@ class GoogleDriveService:
                 # Pace before download
                 await get_request_pacer().acquire()
 
-                # Download file
-                request = service.files().get_media(
-                    fileId=file_id,
-                    supportsAllDrives=True,
+                # Stream to disk, resuming any partial file of this version
+                expected_size = int(file_meta["size"]) if file_meta.get("size") else None
+                size = await client.download_media(
+                    file_id,
+                    dest_path,
+                    expected_size=expected_size,
+                    version=f"{file_id}:{file_meta.get('modifiedTime')}:{expected_size}",
                 )
 
-                with open(dest_path, "wb") as f:
-                    downloader = MediaIoBaseDownload(f, request)
-                    done = False
-                    while not done:
-                        status, done = downloader.next_chunk()
-
                 logger.info(
                     "file_downloaded",
                     file_id=file_id,
                     name=file_meta["name"],
-                    size=file_meta.get("size", 0),
+                    size=size,
                     dest=str(dest_path),
                 )
                 return dest_path
 
-            except HttpError as e:
-                if e.resp.status == 404:
+            except DriveHttpError as e:
+                if e.status == 404:
                     raise GoogleNotFoundError(f"File {file_id} not found") from e
-                if e.resp.status in (401, 403):
+                if e.status in (401, 403) and not e.is_rate_limit:
                     raise GoogleAccessDeniedError(f"Access denied to file {file_id}") from e
-                if e.resp.status == 429:
+                if e.is_rate_limit:
                     if attempt >= RATE_LIMIT_MAX_RETRIES:
                         raise GoogleRateLimitError(
                             f"Rate limit exceeded after {attempt + 1} attempts"
@@ -847,6 +832,8 @@ class GoogleDriveService:
                     await asyncio.sleep(delay)
                     continue
                 raise GoogleDriveError(f"Download failed: {e}") from e
+            except (DriveClientError, httpx.HTTPError) as e:
+                raise GoogleDriveError(f"Download failed: {e}") from e
 
         raise GoogleRateLimitError("Rate limit handling exhausted")
 
@@ -986,7 +973,6 @@ class GoogleDriveService:
         # Try to revoke with Google
         if credentials.access_token_encrypted:
             try:
-                import httpx
                 token = self._decrypt(credentials.access_token_encrypted)
                 async with httpx.AsyncClient() as client:
                     await client.post(
@@ -997,6 +983,7 @@ class GoogleDriveService:
                 logger.warning("credential_revoke_failed", error=str(e))
 
         await self.db.delete(credentials)
+        await close_drive_http_client(credentials_id)
         logger.info("credentials_deleted", credentials_id=credentials_id)
 
     # ========== Credential Management ==========
@@ -1033,13 +1020,16 @@ class GoogleDriveService:
         )
         return result.scalar_one_or_none()
 
-    async def _refresh_if_needed(self, credentials: GoogleCredentials) -> None:
+    async def _refresh_if_needed(
+        self, credentials: GoogleCredentials, force: bool = False
+    ) -> None:
         """Refresh OAuth token if expired.
 
         Args:
             credentials: Credentials to potentially refresh.
+            force: Refresh even if the expiry is unknown or far away.
         """
-        if not credentials.expires_at:
+        if not force and not credentials.expires_at:
             return
 
         # Refresh if expiring in next 30 minutes (#237)
@@ -1049,10 +1039,11 @@ class GoogleDriveService:
         # Printarr doesn't persist the new token.
         # Handle both timezone-naive (from DB) and timezone-aware datetimes
         expires_at = credentials.expires_at
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        if expires_at > datetime.now(timezone.utc) + timedelta(minutes=30):
-            return
+        if not force:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at > datetime.now(timezone.utc) + timedelta(minutes=30):
+                return
 
         if not credentials.refresh_token_encrypted:
             logger.warning("cannot_refresh_no_refresh_token", email=credentials.email)
@@ -1074,7 +1065,8 @@ class GoogleDriveService:
             client_secret=settings.google_client_secret,
         )
 
-        creds.refresh(Request())
+        # google-auth refreshes synchronously; keep it off the event loop
+        await asyncio.to_thread(creds.refresh, Request())
 
         credentials.access_token_encrypted = self._encrypt(creds.token)
         credentials.expires_at = creds.expiry
@@ -1125,6 +1117,39 @@ class GoogleDriveService:
                 "No credentials available. Either provide OAuth credentials or set PRINTARR_GOOGLE_API_KEY"
             )
 
+    async def _get_drive_client(self, credentials: GoogleCredentials | None = None) -> DriveClient:
+        """Get an async Drive client on the pooled connection for a credential.
+
+        Args:
+            credentials: Optional stored credentials for authenticated access.
+
+        Returns:
+            DriveClient for the files, changes and media endpoints.
+        """
+        if credentials:
+            # googleapiclient used to refresh lazily on a 401. Plain HTTP
+            # calls can't, so refresh up front when the expiry is unknown.
+            await self._refresh_if_needed(
+                credentials,
+                force=not credentials.expires_at or not credentials.access_token_encrypted,
+            )
+            if not credentials.access_token_encrypted:
+                raise GoogleAuthError(f"No access token for {credentials.email}")
+
+            return DriveClient(
+                get_drive_http_client(credentials.id),
+                access_token=self._decrypt(credentials.access_token_encrypted),
+            )
+
+        elif settings.google_api_key:
+            # Use API key for public folders
+            return DriveClient(get_drive_http_client(None), api_key=settings.google_api_key)
+
+        else:
+            raise GoogleAuthError(
+                "No credentials available. Either provide OAuth credentials or set PRINTARR_GOOGLE_API_KEY"
+            )
+
     def _get_encryption_key(self) -> bytes:
         """Get or generate the encryption key."""
         if self._encryption_key:
@@ -1166,7 +1191,7 @@ class GoogleDriveService:
         self,
         folder_id: str,
         credentials: GoogleCredentials | None = None,
-        config: "ImportProfileConfig | None" = None,
+        config: ImportProfileConfig | None = None,
         use_cache: bool = True,
         use_batch: bool = True,
     ) -> list[DetectedGoogleDriveDesign]:
@@ -1215,6 +1240,174 @@ class GoogleDriveService:
 
         return designs
 
+    async def sync_designs(
+        self,
+        folder_id: str,
+        snapshot_key: str,
+        credentials: GoogleCredentials | None = None,
+        config: ImportProfileConfig | None = None,
+        page_token: str | None = None,
+        rebuild: bool = False,
+    ) -> DriveSyncResult:
+        """Detect designs in a folder, incrementally when possible.
+
+        Uses the Changes API to update the tree stored by the previous sync,
+        then re-evaluates detection only for the folders the changes
+        touched. Falls back to a full scan when there is no usable snapshot,
+        when rebuild is set, or when the Changes API can't be used (API key
+        access has no Changes API).
+
+        Args:
+            folder_id: Root folder ID to sync.
+            snapshot_key: Identifies the stored tree (e.g. the import folder ID).
+            credentials: Optional credentials for private folders.
+            config: Import profile config. Uses default detection if not provided.
+            page_token: Changes token persisted by the caller. If given, the
+                stored tree is only used when it was saved at this token.
+            rebuild: Discard the stored tree and list everything again.
+
+        Returns:
+            DriveSyncResult with all current designs and the new page token.
+
+        Raises:
+            GoogleRateLimitError: If rate limited after max retries.
+            GoogleDriveError: If the full listing fails.
+        """
+        from app.schemas.import_profile import ImportProfileConfig
+
+        if config is None:
+            config = ImportProfileConfig()
+
+        snapshot = None
+        if not rebuild and credentials is not None:
+            snapshot = DriveTreeSnapshot.load(snapshot_key, folder_id, config)
+            if snapshot is not None and page_token and snapshot.page_token != page_token:
+                snapshot = None
+
+        if snapshot is not None:
+            try:
+                return await self._sync_designs_incremental(snapshot, credentials, config)
+            except GoogleRateLimitError:
+                raise
+            except GoogleDriveError as e:
+                # Expired or invalid token, etc. - start over from a full listing
+                logger.warning(
+                    "gdrive_incremental_sync_failed",
+                    folder_id=folder_id,
+                    error=str(e),
+                )
+
+        # Take the token before listing so changes made during the listing
+        # are replayed next time rather than missed
+        new_token = None
+        if credentials is not None:
+            try:
+                new_token = await self.get_start_page_token(credentials)
+            except GoogleRateLimitError:
+                raise
+            except GoogleDriveError as e:
+                # Non-fatal - we can still sync without change tracking
+                logger.warning("failed_to_get_page_token", error=str(e))
+
+        # A cached listing may predate the token, so only use it when
+        # there's no change tracking to keep consistent with
+        all_files = await self.list_folder_recursive_cached(
+            folder_id, credentials, use_cache=not rebuild and new_token is None
+        )
+        snapshot = DriveTreeSnapshot.from_listing(
+            snapshot_key, folder_id, config, all_files, new_token
+        )
+        root_folder = self._build_folder_tree(folder_id, all_files)
+        designs = self._detect_designs_in_tree(root_folder, config, "")
+
+        if new_token:
+            snapshot.set_designs(designs)
+            snapshot.save()
+        else:
+            DriveTreeSnapshot.delete(snapshot_key)
+
+        logger.info(
+            "gdrive_full_sync_complete",
+            folder_id=folder_id,
+            total_files=len(all_files),
+            designs_found=len(designs),
+            rebuild=rebuild,
+        )
+
+        return DriveSyncResult(
+            designs=designs,
+            page_token=new_token,
+            incremental=False,
+        )
+
+    async def _sync_designs_incremental(
+        self,
+        snapshot: DriveTreeSnapshot,
+        credentials: GoogleCredentials | None,
+        config: ImportProfileConfig,
+    ) -> DriveSyncResult:
+        """Apply changes since the snapshot's token and re-detect dirty folders."""
+        change_list: list[ChangeInfo] = []
+        token = snapshot.page_token
+        while True:
+            page = await self.list_changes(token, credentials=credentials, page_size=1000)
+            change_list.extend(page.changes)
+            token = page.new_page_token
+            if not page.has_more:
+                break
+
+        changes = snapshot.apply_changes(change_list)
+
+        # Folders that entered the tree from elsewhere come without children
+        for moved_in_id in changes.folders_to_list:
+            files = await self.list_folder_recursive_cached(
+                moved_in_id, credentials, use_cache=False
+            )
+            snapshot.add_listing(moved_in_id, files, changes)
+
+        previous = snapshot.previous_designs()
+
+        def reuse(folder: VirtualFolder) -> list[DetectedGoogleDriveDesign] | None:
+            if folder.id in changes.dirty:
+                return None
+            # Designs never contain designs, so stop descending at one
+            found: list[DetectedGoogleDriveDesign] = []
+            stack = [folder]
+            while stack:
+                current = stack.pop()
+                if current.id in previous:
+                    found.append(previous[current.id])
+                else:
+                    stack.extend(current.subfolders.values())
+            return found
+
+        if changes.dirty:
+            root_folder = self._build_folder_tree(snapshot.root_id, snapshot.file_infos())
+            designs = self._detect_designs_in_tree(root_folder, config, "", reuse=reuse)
+        else:
+            designs = list(previous.values())
+
+        snapshot.page_token = token
+        snapshot.set_designs(designs)
+        snapshot.save()
+
+        logger.info(
+            "gdrive_incremental_sync_complete",
+            folder_id=snapshot.root_id,
+            changes_seen=len(change_list),
+            changes_applied=changes.applied,
+            folders_reevaluated=len(changes.dirty),
+            folders_listed=len(changes.folders_to_list),
+            designs_found=len(designs),
+        )
+
+        return DriveSyncResult(
+            designs=designs,
+            page_token=token,
+            incremental=True,
+            changes_applied=changes.applied,
+        )
+
     def _build_folder_tree(
         self, root_id: str, all_files: list[FileInfo]
     ) -> VirtualFolder:
@@ -1263,9 +1456,10 @@ class GoogleDriveService:
     def _detect_designs_in_tree(
         self,
         folder: VirtualFolder,
-        config: "ImportProfileConfig",
+        config: ImportProfileConfig,
         current_path: str,
         current_depth: int = 0,
+        reuse: Callable[[VirtualFolder], list[DetectedGoogleDriveDesign] | None] | None = None,
     ) -> list[DetectedGoogleDriveDesign]:
         """Recursively detect designs in a folder tree.
 
@@ -1279,6 +1473,8 @@ class GoogleDriveService:
             config: Import profile configuration.
             current_path: Current relative path from root.
             current_depth: Current depth in the tree (0 = root).
+            reuse: Optional callback returning the previous designs of an
+                unchanged subtree, or None to evaluate it.
 
         Returns:
             List of detected designs.
@@ -1291,6 +1487,12 @@ class GoogleDriveService:
         if folder.name and self._should_ignore_folder(folder.name, config.ignore):
             return results
 
+        # Unchanged subtree: keep the previous result
+        if reuse is not None:
+            reused = reuse(folder)
+            if reused is not None:
+                return reused
+
         # Check if we're using depth-based detection
         design_depth = config.detection.design_depth
         if design_depth is not None:
@@ -1305,7 +1507,7 @@ class GoogleDriveService:
                 for subfolder in folder.subfolders.values():
                     subfolder_path = f"{current_path}/{subfolder.name}" if current_path else subfolder.name
                     results.extend(self._detect_designs_in_tree(
-                        subfolder, config, subfolder_path, current_depth + 1
+                        subfolder, config, subfolder_path, current_depth + 1, reuse
                     ))
                 return results
             else:
@@ -1324,7 +1526,7 @@ class GoogleDriveService:
         for subfolder in folder.subfolders.values():
             subfolder_path = f"{current_path}/{subfolder.name}" if current_path else subfolder.name
             results.extend(self._detect_designs_in_tree(
-                subfolder, config, subfolder_path, current_depth + 1
+                subfolder, config, subfolder_path, current_depth + 1, reuse
             ))
 
         return results
@@ -1332,7 +1534,7 @@ class GoogleDriveService:
     def _create_design_from_folder(
         self,
         folder: VirtualFolder,
-        config: "ImportProfileConfig",
+        config: ImportProfileConfig,
     ) -> DetectedGoogleDriveDesign | None:
         """Create a design from a folder without complex detection logic.
 
@@ -1389,7 +1591,7 @@ class GoogleDriveService:
     def _is_design_folder_virtual(
         self,
         folder: VirtualFolder,
-        config: "ImportProfileConfig",
+        config: ImportProfileConfig,
     ) -> DetectedGoogleDriveDesign | None:
         """Check if a virtual folder represents a design.
 
@@ -1490,7 +1692,7 @@ class GoogleDriveService:
             total_size=total_size,
         )
 
-    def _should_ignore_folder(self, folder_name: str, ignore: "ProfileIgnoreConfig") -> bool:
+    def _should_ignore_folder(self, folder_name: str, ignore: ProfileIgnoreConfig) -> bool:
         """Check if a folder should be ignored."""
         import fnmatch
 
@@ -1509,7 +1711,7 @@ class GoogleDriveService:
             return "." + filename.rsplit(".", 1)[-1].lower()
         return ""
 
-    def _extract_title_from_name(self, folder_name: str, title_config: "ProfileTitleConfig") -> str:
+    def _extract_title_from_name(self, folder_name: str, title_config: ProfileTitleConfig) -> str:
         """Extract title from folder name using title config."""
         title = folder_name
 
@@ -1770,7 +1972,7 @@ class GoogleDriveService:
 
             # Execute batch
             try:
-                batch.execute()
+                await asyncio.to_thread(batch.execute)
             except HttpError as e:
                 if e.resp.status == 429:
                     raise GoogleRateLimitError(f"Batch request rate limited: {e}") from e
@@ -1805,24 +2007,19 @@ class GoogleDriveService:
         Raises:
             GoogleDriveError: If request fails.
         """
-        try:
-            from googleapiclient.errors import HttpError
-        except ImportError as e:
-            raise GoogleDriveError("Google API libraries not installed") from e
-
-        service = await self._get_drive_service(credentials)
+        client = await self._get_drive_client(credentials)
 
         await get_request_pacer().acquire()
 
         try:
-            response = service.changes().getStartPageToken(
-                supportsAllDrives=True,
-            ).execute()
+            response = await client.get_start_page_token()
             return response.get("startPageToken")
-        except HttpError as e:
-            if e.resp.status == 429:
+        except DriveHttpError as e:
+            if e.is_rate_limit:
                 raise GoogleRateLimitError(f"Rate limited getting start token: {e}") from e
             raise GoogleDriveError(f"Failed to get start page token: {e}") from e
+        except httpx.HTTPError as e:
+            raise GoogleDriveError(f"Failed to get start page token: {e}") from e
 
     async def list_changes(
         self,
@@ -1847,26 +2044,16 @@ class GoogleDriveService:
         Raises:
             GoogleDriveError: If request fails.
         """
-        try:
-            from googleapiclient.errors import HttpError
-        except ImportError as e:
-            raise GoogleDriveError("Google API libraries not installed") from e
-
-        service = await self._get_drive_service(credentials)
+        client = await self._get_drive_client(credentials)
 
         await get_request_pacer().acquire()
 
         try:
-            # Build change request
-            request_params = {
-                "pageToken": page_token,
-                "pageSize": page_size,
-                "fields": "nextPageToken, newStartPageToken, changes(fileId, removed, file(id, name, mimeType, size, parents, modifiedTime, trashed))",
-                "supportsAllDrives": True,
-                "includeItemsFromAllDrives": True,
-            }
-
-            response = service.changes().list(**request_params).execute()
+            response = await client.list_changes(
+                page_token,
+                "nextPageToken, newStartPageToken, changes(fileId, removed, file(id, name, mimeType, size, parents, modifiedTime, trashed))",
+                page_size=page_size,
+            )
 
             changes: list[ChangeInfo] = []
             files_added = 0
@@ -1939,10 +2126,12 @@ class GoogleDriveService:
                 files_removed=files_removed,
             )
 
-        except HttpError as e:
-            if e.resp.status == 429:
+        except DriveHttpError as e:
+            if e.is_rate_limit:
                 raise GoogleRateLimitError(f"Rate limited listing changes: {e}") from e
             raise GoogleDriveError(f"Failed to list changes: {e}") from e
+        except httpx.HTTPError as e:
+            raise GoogleDriveError(f"Failed to list changes: {e}") from e
 
 
 # ========== File Metadata Cache ==========
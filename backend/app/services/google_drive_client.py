@@ -0,0 +1,394 @@
+"""Async HTTP transport for the Google Drive v3 REST API.
+
+googleapiclient is synchronous: every .execute() and next_chunk() call
+blocks the event loop for the whole round trip. DriveClient talks to the
+files, changes and media endpoints with httpx instead, so Drive traffic
+runs concurrently with the API server, SSE and the other workers.
+
+One pooled httpx.AsyncClient is kept per credential (and one for API key
+access). With the h2 package installed it negotiates HTTP/2, so parallel
+requests for the same credential share a single multiplexed connection.
+Auth is sent per request, so refreshed access tokens reuse the pool.
+
+Media downloads stream straight to a ".part" file next to the destination.
+If the transfer drops, the next attempt asks for the remaining bytes with a
+Range request and appends to the partial file. The partial file name is
+tied to the file's version, so a stale partial from an older revision is
+never resumed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.utils.file_hash import HashingWriter
+
+logger = get_logger(__name__)
+
+DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
+
+# Bytes buffered per disk write while streaming media
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Range-resumes attempted after a dropped transfer before giving up
+DOWNLOAD_MAX_RESUMES = 5
+DOWNLOAD_RESUME_DELAY = 1.0  # seconds, doubled per resume
+
+# 403 reasons Google uses for quota/rate limiting instead of 429
+RATE_LIMIT_REASONS = frozenset({
+    "rateLimitExceeded",
+    "userRateLimitExceeded",
+    "dailyLimitExceeded",
+    "quotaExceeded",
+})
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class DriveClientError(Exception):
+    """Base exception for Drive transport errors."""
+
+    pass
+
+
+class DriveHttpError(DriveClientError):
+    """Raised when the Drive API answers with an error status."""
+
+    def __init__(
+        self,
+        status: int,
+        message: str,
+        reason: str | None = None,
+        retry_after: int | None = None,
+    ):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def is_rate_limit(self) -> bool:
+        """Whether Google rejected the request for rate or quota reasons."""
+        return self.status == 429 or (
+            self.status == 403 and self.reason in RATE_LIMIT_REASONS
+        )
+
+
+class DriveDownloadError(DriveClientError):
+    """Raised when a media download cannot be completed."""
+
+    pass
+
+
+# Pooled clients keyed by credential ID (None for API key access)
+_clients: dict[str | None, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def get_drive_http_client(credentials_id: str | None = None) -> httpx.AsyncClient:
+    """Get the pooled HTTP client for a credential.
+
+    Args:
+        credentials_id: GoogleCredentials ID, or None for API key access.
+
+    Returns:
+        Shared httpx.AsyncClient for that credential.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(credentials_id)
+    # Connections are bound to the loop that opened them
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+
+    client = httpx.AsyncClient(
+        base_url=DRIVE_API_BASE,
+        http2=HTTP2_AVAILABLE,
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, read=120.0),
+        limits=httpx.Limits(
+            max_connections=settings.google_max_concurrent_downloads + 2,
+            max_keepalive_connections=settings.google_max_concurrent_downloads + 2,
+        ),
+    )
+    _clients[credentials_id] = (loop, client)
+    return client
+
+
+async def close_drive_http_client(credentials_id: str | None) -> None:
+    """Close and forget the pooled client for a credential."""
+    entry = _clients.pop(credentials_id, None)
+    if entry is not None and not entry[1].is_closed:
+        await entry[1].aclose()
+
+
+async def close_drive_http_clients() -> None:
+    """Close every pooled Drive client (application shutdown)."""
+    for credentials_id in list(_clients):
+        await close_drive_http_client(credentials_id)
+
+
+def partial_download_path(dest_path: Path, version: str | None = None) -> Path:
+    """Path of the in-progress file for a download.
+
+    Args:
+        dest_path: Final destination of the file.
+        version: Opaque file version (e.g. modifiedTime and size).
+
+    Returns:
+        Hidden sibling path ending in ".part".
+    """
+    tag = hashlib.sha1((version or "").encode()).hexdigest()[:12]
+    return dest_path.with_name(f".{dest_path.name}.{tag}.part")
+
+
+def _discard_stale_partials(dest_path: Path, keep: Path) -> None:
+    """Remove partial files left by earlier versions of the same file."""
+    pattern = str(dest_path.with_name(f".{glob.escape(dest_path.name)}.*.part"))
+    for stale in glob.glob(pattern):
+        if stale != str(keep):
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+
+
+def _error_from_response(response: httpx.Response) -> DriveHttpError:
+    """Build a DriveHttpError from a Drive error response (body already read)."""
+    message = response.reason_phrase or "error"
+    reason = None
+    try:
+        error = response.json().get("error", {})
+        if isinstance(error, dict):
+            message = error.get("message") or message
+            errors = error.get("errors") or []
+            if errors:
+                reason = errors[0].get("reason")
+    except ValueError:
+        pass
+
+    retry_after = None
+    header = response.headers.get("Retry-After")
+    if header and header.isdigit():
+        retry_after = int(header)
+
+    return DriveHttpError(response.status_code, message, reason, retry_after)
+
+
+class DriveClient:
+    """Async Drive v3 API calls for one credential.
+
+    Cheap to construct: the connection pool lives in the shared
+    httpx.AsyncClient, this only carries the auth to send with it.
+    """
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        *,
+        access_token: str | None = None,
+        api_key: str | None = None,
+    ):
+        if not access_token and not api_key:
+            raise ValueError("DriveClient needs an access token or an API key")
+        self._http = http
+        self._access_token = access_token
+        self._api_key = api_key
+
+    def _auth(self, params: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
+        """Attach credentials to a request's params and headers."""
+        params = {k: v for k, v in params.items() if v is not None}
+        headers: dict[str, str] = {}
+        if self._access_token:
+            headers["Authorization"] = f"Bearer {self._access_token}"
+        else:
+            params["key"] = self._api_key
+        return params, headers
+
+    async def _get_json(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        params, headers = self._auth(params)
+        response = await self._http.get(path, params=params, headers=headers)
+        if response.status_code >= 400:
+            raise _error_from_response(response)
+        return response.json()
+
+    # ========== Metadata Endpoints ==========
+
+    async def get_file(self, file_id: str, fields: str) -> dict[str, Any]:
+        """files.get for metadata."""
+        return await self._get_json(
+            f"/files/{file_id}",
+            {"fields": fields, "supportsAllDrives": "true"},
+        )
+
+    async def list_files(
+        self,
+        q: str,
+        fields: str,
+        page_token: str | None = None,
+        page_size: int = 100,
+        order_by: str | None = None,
+    ) -> dict[str, Any]:
+        """files.list across My Drive and shared drives."""
+        return await self._get_json(
+            "/files",
+            {
+                "q": q,
+                "fields": fields,
+                "pageToken": page_token,
+                "pageSize": page_size,
+                "orderBy": order_by,
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true",
+            },
+        )
+
+    async def get_start_page_token(self) -> dict[str, Any]:
+        """changes.getStartPageToken."""
+        return await self._get_json(
+            "/changes/startPageToken",
+            {"supportsAllDrives": "true"},
+        )
+
+    async def list_changes(
+        self,
+        page_token: str,
+        fields: str,
+        page_size: int = 100,
+    ) -> dict[str, Any]:
+        """changes.list from a page token."""
+        return await self._get_json(
+            "/changes",
+            {
+                "pageToken": page_token,
+                "fields": fields,
+                "pageSize": page_size,
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true",
+            },
+        )
+
+    # ========== Media Download ==========
+
+    async def download_media(
+        self,
+        file_id: str,
+        dest_path: Path,
+        expected_size: int | None = None,
+        version: str | None = None,
+    ) -> int:
+        """Stream a file's content to disk, resuming partial transfers.
+
+        Args:
+            file_id: Google Drive file ID.
+            dest_path: Final destination. Its parent directory must exist.
+            expected_size: Size reported by files.get, if known.
+            version: File version used to match an existing partial file.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            DriveHttpError: If Drive rejects the request.
+            DriveDownloadError: If the transfer can't be completed.
+        """
+        part_path = partial_download_path(dest_path, version)
+        await asyncio.to_thread(_discard_stale_partials, dest_path, part_path)
+
+        # Hashes any partial file once, then each chunk as it's appended, so
+        # the finished file never needs to be read back for its SHA-256.
+        writer = await asyncio.to_thread(HashingWriter, part_path, append=True)
+        try:
+            resumes = 0
+            while True:
+                offset = writer.size
+                if expected_size is not None and offset > expected_size:
+                    await asyncio.to_thread(writer.truncate)
+                    offset = 0
+                if expected_size is not None and 0 < offset == expected_size:
+                    break
+
+                params, headers = self._auth({"alt": "media", "supportsAllDrives": "true"})
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+
+                try:
+                    async with self._http.stream(
+                        "GET", f"/files/{file_id}", params=params, headers=headers
+                    ) as response:
+                        if response.status_code == 416 and offset:
+                            # Nothing left past the partial file; it's complete
+                            # unless the size check below says otherwise.
+                            break
+                        if response.status_code >= 400:
+                            await response.aread()
+                            raise _error_from_response(response)
+
+                        if response.status_code == 206:
+                            content_range = response.headers.get("Content-Range", "")
+                            if not content_range.startswith(f"bytes {offset}-"):
+                                raise DriveDownloadError(
+                                    f"Unexpected Content-Range {content_range!r} resuming at {offset}"
+                                )
+                        elif offset:
+                            # Range ignored; the full body follows
+                            await asyncio.to_thread(writer.truncate)
+
+                        buffer = bytearray()
+                        try:
+                            async for chunk in response.aiter_bytes():
+                                buffer += chunk
+                                if len(buffer) >= DOWNLOAD_CHUNK_SIZE:
+                                    await asyncio.to_thread(writer.write, buffer)
+                                    buffer.clear()
+                        finally:
+                            # Keep what arrived before a drop so the resume skips it
+                            if buffer:
+                                await asyncio.to_thread(writer.write, buffer)
+                    break
+
+                except httpx.TransportError as e:
+                    resumes += 1
+                    if resumes > DOWNLOAD_MAX_RESUMES:
+                        raise DriveDownloadError(
+                            f"Download of {file_id} failed after {resumes} attempts: {e}"
+                        ) from e
+
+                    delay = DOWNLOAD_RESUME_DELAY * (2 ** (resumes - 1))
+                    logger.warning(
+                        "gdrive_download_interrupted",
+                        file_id=file_id,
+                        bytes_done=writer.size,
+                        resume=resumes,
+                        delay_seconds=delay,
+                        error=str(e),
+                    )
+                    await asyncio.sleep(delay)
+        except BaseException:
+            # Keep the partial file for the next attempt
+            await asyncio.to_thread(writer.close)
+            raise
+
+        size = writer.size
+        if expected_size is not None and size != expected_size:
+            await asyncio.to_thread(writer.discard)
+            raise DriveDownloadError(
+                f"Downloaded {size} bytes of {file_id}, expected {expected_size}"
+            )
+
+        # The remembered digest follows the file through the rename
+        await asyncio.to_thread(writer.finish)
+        os.replace(part_path, dest_path)
+        return size
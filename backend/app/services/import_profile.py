@@ -32,6 +32,12 @@ from app.schemas.import_profile import (
     ProfilePreviewConfig,
     ProfileTitleConfig,
 )
+from app.services.folder_scan import (
+    DirectoryLister,
+    FolderScanCache,
+    join_relative,
+    scan_folder_stats,
+)
 
 if TYPE_CHECKING:
     pass
@@ -423,7 +429,10 @@ class ImportProfileService:
     # ========== Design Detection (DEC-036) ==========
 
     def is_design_folder(
-        self, folder_path: Path, config: ImportProfileConfig
+        self,
+        folder_path: Path,
+        config: ImportProfileConfig,
+        lister: DirectoryLister | None = None,
     ) -> DesignDetectionResult:
         """Detect if a folder represents a single design.
 
@@ -432,6 +441,7 @@ class ImportProfileService:
         Args:
             folder_path: Path to the folder to check.
             config: Import profile configuration.
+            lister: Directory listings shared with the rest of the scan.
 
         Returns:
             DesignDetectionResult with detection details.
@@ -450,33 +460,33 @@ class ImportProfileService:
             return result
 
         # Get root files
-        try:
-            root_files = [f for f in folder_path.iterdir() if f.is_file()]
-        except PermissionError:
+        lister = lister or DirectoryLister()
+        listing = lister.list(folder_path)
+        if listing is None:
             logger.warning("permission_denied", path=str(folder_path))
             return result
 
         # Check for model files at root
-        for f in root_files:
-            ext = f.suffix.lower()
+        for name, _, _ in listing.files:
+            ext = Path(name).suffix.lower()
             if ext in model_extensions:
-                model_files.append(str(f.relative_to(folder_path)))
+                model_files.append(name)
             elif ext in archive_extensions:
-                archive_files.append(str(f.relative_to(folder_path)))
+                archive_files.append(name)
 
         # Check for model files in subfolders
         if detection.structure in ("nested", "auto"):
             for subfolder_name in detection.model_subfolders:
-                subfolder_path = folder_path / subfolder_name
-                if subfolder_path.exists() and subfolder_path.is_dir():
-                    for f in subfolder_path.rglob("*"):
-                        if f.is_file():
-                            ext = f.suffix.lower()
-                            if ext in model_extensions:
-                                model_files.append(str(f.relative_to(folder_path)))
+                for rel_path, _, _ in lister.walk_files(
+                    folder_path / subfolder_name, subfolder_name
+                ):
+                    if Path(rel_path).suffix.lower() in model_extensions:
+                        model_files.append(rel_path)
 
         # Find preview files and check for preview folder
-        preview_files, has_preview_folder = self._find_preview_files_with_folder_check(folder_path, config.preview)
+        preview_files, has_preview_folder = self._find_preview_files_with_folder_check(
+            folder_path, config.preview, lister
+        )
 
         # Check if require_preview_folder is set and we don't have one
         if detection.require_preview_folder and not has_preview_folder:
@@ -553,53 +563,52 @@ class ImportProfileService:
         return files
 
     def _find_preview_files_with_folder_check(
-        self, folder_path: Path, preview: ProfilePreviewConfig
+        self,
+        folder_path: Path,
+        preview: ProfilePreviewConfig,
+        lister: DirectoryLister | None = None,
     ) -> tuple[list[str], bool]:
         """Find preview image files in a folder and check for preview folders.
 
         Args:
             folder_path: Path to the design folder.
             preview: Preview configuration.
+            lister: Directory listings shared with the rest of the scan.
 
         Returns:
             Tuple of (list of relative paths to preview files, has_preview_folder).
         """
+        lister = lister or DirectoryLister()
         preview_files: list[str] = []
         preview_extensions = set(ext.lower() for ext in preview.extensions)
         has_preview_folder = False
 
+        def collect(folder_name: str) -> None:
+            for rel_path, _, _ in lister.walk_files(folder_path / folder_name, folder_name):
+                if Path(rel_path).suffix.lower() in preview_extensions:
+                    preview_files.append(rel_path)
+
+        listing = lister.list(folder_path)
+
         # Check root folder
-        if preview.include_root:
-            try:
-                for f in folder_path.iterdir():
-                    if f.is_file() and f.suffix.lower() in preview_extensions:
-                        preview_files.append(str(f.relative_to(folder_path)))
-            except PermissionError:
-                pass
+        if preview.include_root and listing is not None:
+            for name, _, _ in listing.files:
+                if Path(name).suffix.lower() in preview_extensions:
+                    preview_files.append(name)
 
         # Check specific folders
         for folder_name in preview.folders:
-            preview_path = folder_path / folder_name
-            if preview_path.exists() and preview_path.is_dir():
+            if lister.list(folder_path / folder_name) is not None:
                 has_preview_folder = True
-                try:
-                    for f in preview_path.rglob("*"):
-                        if f.is_file() and f.suffix.lower() in preview_extensions:
-                            preview_files.append(str(f.relative_to(folder_path)))
-                except PermissionError:
-                    pass
+                collect(folder_name)
 
         # Check wildcard folders (case-insensitive matching)
-        for pattern in preview.wildcard_folders:
-            try:
-                for subfolder in folder_path.iterdir():
-                    if subfolder.is_dir() and fnmatch.fnmatch(subfolder.name.lower(), pattern.lower()):
+        if listing is not None:
+            for pattern in preview.wildcard_folders:
+                for name in listing.subdirs + listing.linked_dirs:
+                    if fnmatch.fnmatch(name.lower(), pattern.lower()):
                         has_preview_folder = True
-                        for f in subfolder.rglob("*"):
-                            if f.is_file() and f.suffix.lower() in preview_extensions:
-                                preview_files.append(str(f.relative_to(folder_path)))
-            except PermissionError:
-                pass
+                        collect(name)
 
         return preview_files, has_preview_folder
 
@@ -676,7 +685,11 @@ class ImportProfileService:
     # ========== Folder Traversal ==========
 
     def traverse_for_designs(
-        self, root_path: Path, config: ImportProfileConfig
+        self,
+        root_path: Path,
+        config: ImportProfileConfig,
+        cache: FolderScanCache | None = None,
+        lister: DirectoryLister | None = None,
     ) -> list[tuple[Path, DesignDetectionResult]]:
         """Traverse a folder structure and detect all designs.
 
@@ -686,15 +699,32 @@ class ImportProfileService:
         - If no: recurse into children
         - Skip ignored folders
 
+        With a scan cache, subtrees whose directories are unchanged since
+        the last scan reuse their cached detection results instead of being
+        listed again. The caller records design folders in the cache.
+
+        Every directory is listed at most once; pass the same lister to
+        scan_folder_stats() to reuse the listings of detected designs.
+
         Args:
             root_path: Root path to start traversal.
             config: Import profile configuration.
+            cache: Optional FolderScanCache for incremental scans.
+            lister: Directory listings shared with the rest of the scan.
 
         Returns:
             List of (path, detection_result) tuples for all detected designs.
         """
         designs: list[tuple[Path, DesignDetectionResult]] = []
-        self._traverse_recursive(root_path, config, designs, current_depth=0)
+        self._traverse_recursive(
+            root_path,
+            config,
+            designs,
+            current_depth=0,
+            cache=cache,
+            rel=".",
+            lister=lister or DirectoryLister(),
+        )
         return designs
 
     def _traverse_recursive(
@@ -703,6 +733,9 @@ class ImportProfileService:
         config: ImportProfileConfig,
         results: list[tuple[Path, DesignDetectionResult]],
         current_depth: int = 0,
+        cache: FolderScanCache | None = None,
+        rel: str = ".",
+        lister: DirectoryLister | None = None,
     ) -> None:
         """Recursive helper for folder traversal.
 
@@ -711,35 +744,60 @@ class ImportProfileService:
             config: Import profile configuration.
             results: Accumulator for detected designs.
             current_depth: Current depth in the tree (0 = root).
+            cache: Optional FolderScanCache for incremental scans.
+            rel: Path of folder_path relative to the traversal root.
+            lister: Directory listings shared with the rest of the scan.
         """
+        lister = lister or DirectoryLister()
         # Skip ignored folders
         if self._should_ignore_folder(folder_path.name, config.ignore):
             return
 
-        # Check if we're using depth-based detection
         design_depth = config.detection.design_depth
+
+        # Unchanged since the last scan - reuse cached results
+        if cache is not None and cache.is_unchanged(folder_path, rel):
+            cached = cache.get_design(rel)
+            if cached is not None:
+                results.append((folder_path, cached.detection))
+                return
+            if design_depth is not None and current_depth >= design_depth:
+                return
+            for name in cache.subdirs(rel):
+                self._traverse_recursive(
+                    folder_path / name,
+                    config,
+                    results,
+                    current_depth + 1,
+                    cache,
+                    join_relative(rel, name),
+                    lister,
+                )
+            return
+
+        # Check if we're using depth-based detection
         if design_depth is not None:
             if current_depth == design_depth:
                 # At target depth - treat this folder as a design
-                detection = self._create_design_from_folder(folder_path, config)
+                detection = self._create_design_from_folder(folder_path, config, lister)
                 if detection.is_design:
                     results.append((folder_path, detection))
+                elif cache is not None:
+                    # Detection covered the whole subtree; remember it
+                    cache.record_subtree(rel, scan_folder_stats(folder_path, lister))
                 return
             elif current_depth < design_depth:
                 # Not deep enough yet, recurse into children
-                try:
-                    for child in folder_path.iterdir():
-                        if child.is_dir():
-                            self._traverse_recursive(child, config, results, current_depth + 1)
-                except PermissionError:
-                    logger.warning("permission_denied_traversal", path=str(folder_path))
+                self._traverse_children(
+                    folder_path, config, results, current_depth, cache, rel, lister
+                )
                 return
             else:
                 # Deeper than target, skip
                 return
 
         # Normal detection logic (design_depth not set)
-        detection = self.is_design_folder(folder_path, config)
+        detection = self.is_design_folder(folder_path, config, lister)
 
         if detection.is_design:
             # Add to results and don't recurse deeper
@@ -747,17 +805,54 @@ class ImportProfileService:
             return
 
         # Not a design, recurse into children
-        try:
-            for child in folder_path.iterdir():
-                if child.is_dir():
-                    self._traverse_recursive(child, config, results, current_depth + 1)
-        except PermissionError:
+        self._traverse_children(
+            folder_path, config, results, current_depth, cache, rel, lister
+        )
+
+    def _traverse_children(
+        self,
+        folder_path: Path,
+        config: ImportProfileConfig,
+        results: list[tuple[Path, DesignDetectionResult]],
+        current_depth: int,
+        cache: FolderScanCache | None,
+        rel: str,
+        lister: DirectoryLister,
+    ) -> None:
+        """Recurse into the child folders of a non-design folder."""
+        listing = lister.list(folder_path)
+        if listing is None:
             logger.warning("permission_denied_traversal", path=str(folder_path))
+            return
+
+        children = listing.subdirs + listing.linked_dirs
+        for name in children:
+            self._traverse_recursive(
+                folder_path / name,
+                config,
+                results,
+                current_depth + 1,
+                cache,
+                join_relative(rel, name),
+                lister,
+            )
+
+        if cache is not None:
+            cache.record_directory(
+                rel,
+                listing,
+                [
+                    name
+                    for name in children
+                    if not self._should_ignore_folder(name, config.ignore)
+                ],
+            )
 
     def _create_design_from_folder(
         self,
         folder_path: Path,
         config: ImportProfileConfig,
+        lister: DirectoryLister | None = None,
     ) -> DesignDetectionResult:
         """Create a design from a folder without complex detection logic.
 
@@ -767,6 +862,7 @@ class ImportProfileService:
         Args:
             folder_path: Folder to treat as a design.
             config: Import profile configuration.
+            lister: Directory listings shared with the rest of the scan.
 
         Returns:
             DesignDetectionResult with all files found.
@@ -781,20 +877,15 @@ class ImportProfileService:
         preview_files: list[str] = []
 
         # Scan all files recursively
-        try:
-            for f in folder_path.rglob("*"):
-                if f.is_file():
-                    ext = f.suffix.lower()
-                    rel_path = str(f.relative_to(folder_path))
-
-                    if ext in model_extensions:
-                        model_files.append(rel_path)
-                    elif ext in archive_extensions:
-                        archive_files.append(rel_path)
-                    elif ext in preview_extensions:
-                        preview_files.append(rel_path)
-        except PermissionError:
-            pass
+        lister = lister or DirectoryLister()
+        for rel_path, _, _ in lister.walk_files(folder_path):
+            ext = Path(rel_path).suffix.lower()
+            if ext in model_extensions:
+                model_files.append(rel_path)
+            elif ext in archive_extensions:
+                archive_files.append(rel_path)
+            elif ext in preview_extensions:
+                preview_files.append(rel_path)
 
         # Must have at least one model or archive file
         if not model_files and not archive_files:
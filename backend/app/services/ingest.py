@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
@@ -31,6 +32,7 @@ from app.services.thangs import ThangsAdapter
 
 if TYPE_CHECKING:
     from app.db.models import Channel
+    from app.services.discovery import DiscoveryService
 
 logger = get_logger(__name__)
 
@@ -68,6 +70,13 @@ SPLIT_ARCHIVE_MATCH_WINDOW = timedelta(hours=24)
 NEARBY_PHOTO_WINDOW_MINUTES = 30
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 @dataclass
 class SplitArchiveInfo:
     """Information about a split archive file."""
@@ -155,7 +164,7 @@ class IngestService:
         has_design_files = any(a.is_candidate_design_file for a in attachments)
 
         if has_design_files:
-            await self._create_design(channel, message, caption_text)
+            await self._create_design(channel, message, caption_text, attachments)
             logger.info(
                 "design_detected",
                 channel_id=channel.id,
@@ -171,6 +180,134 @@ class IngestService:
             )
             return message, False
 
+    async def ingest_batch(
+        self,
+        channel: Channel,
+        messages: list[dict[str, Any]],
+    ) -> list[tuple[TelegramMessage | None, bool]]:
+        """Ingest a batch of Telegram messages from one channel.
+
+        Equivalent to calling ingest_message for each message in order, but
+        set-based where possible:
+        1. Known telegram_message_ids are resolved with a single IN query
+        2. New messages and attachments are inserted in one flush
+        3. Design follow-ups (image jobs, family detection) run once the
+           whole batch is in place, so nearby photos and family candidates
+           posted in the same batch are found
+
+        The caller owns the transaction; nothing is committed here.
+
+        Args:
+            channel: The Channel model these messages belong to.
+            messages: Parsed message data from TelegramService.
+
+        Returns:
+            List of (TelegramMessage or None if skipped, design_created flag),
+            one per input message, in input order.
+        """
+        results: list[tuple[TelegramMessage | None, bool]] = [(None, False)] * len(
+            messages
+        )
+
+        telegram_ids = {m.get("id") for m in messages if m.get("id") is not None}
+        known: dict[int, TelegramMessage] = {}
+        if telegram_ids:
+            result = await self.db.execute(
+                select(TelegramMessage).where(
+                    TelegramMessage.channel_id == channel.id,
+                    TelegramMessage.telegram_message_id.in_(telegram_ids),
+                )
+            )
+            known = {m.telegram_message_id: m for m in result.scalars().all()}
+
+        # Build all new rows up front; explicit IDs let attachments reference
+        # their message before anything is flushed.
+        new_rows: list[tuple[int, TelegramMessage, list[Attachment], dict]] = []
+        for index, message_data in enumerate(messages):
+            telegram_message_id = message_data.get("id")
+            if telegram_message_id is None:
+                logger.warning("message_missing_id", message=message_data)
+                continue
+
+            existing = known.get(telegram_message_id)
+            if existing:
+                results[index] = (existing, False)
+                continue
+
+            date_posted = self._parse_date(message_data.get("date"))
+            if date_posted is None:
+                date_posted = datetime.now(timezone.utc)
+            caption_text = message_data.get("text", "") or ""
+
+            message = TelegramMessage(
+                id=str(uuid.uuid4()),
+                channel_id=channel.id,
+                telegram_message_id=telegram_message_id,
+                date_posted=date_posted,
+                author_name=self._extract_author_name(message_data),
+                caption_text=caption_text,
+                caption_text_normalized=self._normalize_text(caption_text),
+                has_media=message_data.get("has_media", False),
+            )
+            attachments = [
+                self._create_attachment(message.id, raw)
+                for raw in message_data.get("attachments", [])
+            ]
+            known[telegram_message_id] = message
+            new_rows.append((index, message, attachments, message_data))
+
+        if not new_rows:
+            return results
+
+        self.db.add_all([message for _, message, _, _ in new_rows])
+        self.db.add_all([att for _, _, atts, _ in new_rows for att in atts])
+        await self.db.flush()
+
+        # One DiscoveryService for the batch so monitored channels load once
+        from app.services.discovery import DiscoveryService
+
+        discovery = DiscoveryService(self.db)
+
+        created: list[tuple[Design, TelegramMessage, list[Attachment]]] = []
+        for index, message, attachments, message_data in new_rows:
+            await self._process_channel_discovery(message_data, discovery)
+
+            if not any(a.is_candidate_design_file for a in attachments):
+                results[index] = (message, False)
+                continue
+
+            caption_text = message.caption_text or ""
+            design, is_new = await self._create_design_record(
+                channel, message, caption_text, attachments
+            )
+            if is_new:
+                filenames = self._attachment_filenames(attachments)
+                await self._process_external_urls(design, caption_text)
+                await self._auto_tag_design(design, caption_text, filenames)
+                created.append((design, message, attachments))
+
+            results[index] = (message, True)
+            logger.info(
+                "design_detected",
+                channel_id=channel.id,
+                message_id=message.id,
+                telegram_message_id=message.telegram_message_id,
+            )
+
+        if created:
+            await self._queue_image_downloads_for_batch(channel, created)
+            for design, _, _ in created:
+                await self._process_family_detection(design)
+
+        logger.debug(
+            "message_batch_ingested",
+            channel_id=channel.id,
+            received=len(messages),
+            inserted=len(new_rows),
+            designs_created=len(created),
+        )
+        return results
+
     async def _get_existing_message(
         self, channel_id: str, telegram_message_id: int
     ) -> TelegramMessage | None:
@@ -262,6 +399,7 @@ class IngestService:
             filename=filename,
             mime_type=raw.get("mime_type"),
             size_bytes=raw.get("size"),
+            telegram_unique_file_id=raw.get("unique_file_id"),
             ext=ext,
             is_candidate_design_file=is_candidate,
         )
@@ -297,14 +435,58 @@ class IngestService:
         channel: Channel,
         message: TelegramMessage,
         caption_text: str,
+        attachments: list[Attachment],
     ) -> Design:
         """Create a Design record from a design post message.
 
         If this message contains a split archive, we try to find and merge
         with an existing design for the same archive.
         """
+        design, is_new = await self._create_design_record(
+            channel, message, caption_text, attachments
+        )
+        if not is_new:
+            return design
+
+        filenames = self._attachment_filenames(attachments)
+
+        # Process external URLs (Thangs, Printables, Thingiverse)
+        # This is non-blocking - errors are logged but don't fail ingestion
+        await self._process_external_urls(design, caption_text)
+
+        # Auto-tag from caption and filenames (v0.7)
+        await self._auto_tag_design(design, caption_text, filenames)
+
+        # Queue image download job if message has photos (v0.7)
+        await self._queue_image_download_if_needed(
+            design=design,
+            channel=channel,
+            message=message,
+        )
+
+        # Family detection (v1.0 - DEC-044)
+        await self._process_family_detection(design)
+
+        return design
+
+    async def _create_design_record(
+        self,
+        channel: Channel,
+        message: TelegramMessage,
+        caption_text: str,
+        attachments: list[Attachment],
+    ) -> tuple[Design, bool]:
+        """Create the Design and DesignSource rows for a design post.
+
+        Split archive parts are merged into a matching existing design.
+        Follow-up processing (tags, URLs, images, families) is left to the
+        caller.
+
+        Returns:
+            Tuple of (Design, True if a new design was created).
+        """
         # Check if this is a split archive
-        split_info = await self._check_split_archive_attachments(message.id)
+        split_info = self._find_split_archive_attachment(attachments)
 
         if split_info:
             # Try to find existing design for this split archive
@@ -317,22 +499,23 @@ class IngestService:
 
             if existing_design:
                 # Merge into existing design
-                return await self._merge_into_split_archive_design(
+                design = await self._merge_into_split_archive_design(
                     existing_design,
                     channel,
                     message,
                     caption_text,
                     split_info.part_number,
                 )
+                return design, False
 
         # Extract title from caption or filename
-        title = await self._extract_title(caption_text, message)
+        title = self._extract_title(caption_text, message, attachments)
 
         # Get file types from attachments
-        file_types = await self._get_file_types(message.id)
+        file_types = self._get_file_types(attachments)
 
         # Detect multicolor from caption and filenames (heuristic)
-        filenames = await self._get_attachment_filenames(message.id)
+        filenames = self._attachment_filenames(attachments)
         detector = get_multicolor_detector()
         is_multicolor = detector.detect_from_caption_and_files(caption_text, filenames)
         multicolor_status = MulticolorStatus.MULTI if is_multicolor else MulticolorStatus.UNKNOWN
@@ -390,24 +573,7 @@ class IngestService:
                 file_types=file_types,
             )
 
-        # Process external URLs (Thangs, Printables, Thingiverse)
-        # This is non-blocking - errors are logged but don't fail ingestion
-        await self._process_external_urls(design, caption_text)
-
-        # Auto-tag from caption and filenames (v0.7)
-        await self._auto_tag_design(design, caption_text, filenames)
-
-        # Queue image download job if message has photos (v0.7)
-        await self._queue_image_download_if_needed(
-            design=design,
-            channel=channel,
-            message=message,
-        )
-
-        # Family detection (v1.0 - DEC-044)
-        await self._process_family_detection(design)
-
-        return design
+        return design, True
 
     async def _process_external_urls(self, design: Design, caption: str) -> None:
         """Process caption for external platform URLs and create links.
@@ -444,7 +610,12 @@ class IngestService:
                 error=str(e),
             )
 
-    async def _extract_title(self, caption: str, message: TelegramMessage) -> str:
+    def _extract_title(
+        self,
+        caption: str,
+        message: TelegramMessage,
+        attachments: list[Attachment],
+    ) -> str:
         """Extract a title from caption or fallback to filename."""
         if caption:
             # Use first non-empty line as title
@@ -462,7 +633,7 @@ class IngestService:
                     return line
 
         # Fallback: get first candidate attachment filename without extension
-        filename = await self._get_first_attachment_filename(message.id)
+        filename = self._get_first_attachment_filename(attachments)
         if filename:
             # Strip extension and return
             title = self._strip_extension(filename)
@@ -472,18 +643,14 @@ class IngestService:
         # Last fallback: generic date-based title
         return f"Design from {message.date_posted.strftime('%Y-%m-%d')}"
 
-    async def _get_first_attachment_filename(self, message_id: str) -> str | None:
+    def _get_first_attachment_filename(
+        self, attachments: list[Attachment]
+    ) -> str | None:
         """Get the filename of the first candidate design attachment."""
-        result = await self.db.execute(
-            select(Attachment.filename)
-            .where(
-                Attachment.message_id == message_id,
-                Attachment.is_candidate_design_file == True,  # noqa: E712
-                Attachment.filename.isnot(None),
-            )
-            .limit(1)
-        )
-        return result.scalar_one_or_none()
+        for attachment in attachments:
+            if attachment.is_candidate_design_file and attachment.filename:
+                return attachment.filename
+        return None
 
     def _strip_extension(self, filename: str) -> str:
         """Strip file extension from filename for use as title.
@@ -521,30 +688,17 @@ class IngestService:
 
         return result
 
-    async def _get_file_types(self, message_id: str) -> list[str]:
+    def _get_file_types(self, attachments: list[Attachment]) -> list[str]:
         """Get distinct file extensions for a message's attachments."""
-        result = await self.db.execute(
-            select(Attachment.ext)
-            .where(
-                Attachment.message_id == message_id,
-                Attachment.is_candidate_design_file == True,  # noqa: E712
-                Attachment.ext.isnot(None),
-            )
-            .distinct()
+        extensions = dict.fromkeys(
+            a.ext for a in attachments if a.is_candidate_design_file and a.ext
         )
-        extensions = result.scalars().all()
         # Convert to uppercase without dots for display
-        return [ext.lstrip(".").upper() for ext in extensions if ext]
+        return [ext.lstrip(".").upper() for ext in extensions]
 
-    async def _get_attachment_filenames(self, message_id: str) -> list[str]:
+    def _attachment_filenames(self, attachments: list[Attachment]) -> list[str]:
         """Get all attachment filenames for a message."""
-        result = await self.db.execute(
-            select(Attachment.filename).where(
-                Attachment.message_id == message_id,
-                Attachment.filename.isnot(None),
-            )
-        )
-        return list(result.scalars().all())
+        return [a.filename for a in attachments if a.filename]
 
     async def _auto_tag_design(
         self,
@@ -682,25 +836,17 @@ class IngestService:
 
         return None
 
-    async def _check_split_archive_attachments(
-        self, message_id: str
+    def _find_split_archive_attachment(
+        self, attachments: list[Attachment]
     ) -> SplitArchiveInfo | None:
         """Check if a message contains split archive attachments.
 
         Returns the first detected split archive info, or None if not a split archive.
         """
-        result = await self.db.execute(
-            select(Attachment.filename)
-            .where(
-                Attachment.message_id == message_id,
-                Attachment.is_candidate_design_file == True,  # noqa: E712
-                Attachment.filename.isnot(None),
-            )
-        )
-        filenames = result.scalars().all()
-
-        for filename in filenames:
-            split_info = self.detect_split_archive(filename)
+        for attachment in attachments:
+            if not attachment.is_candidate_design_file or not attachment.filename:
+                continue
+            split_info = self.detect_split_archive(attachment.filename)
             if split_info:
                 return split_info
 
@@ -779,7 +925,11 @@ class IngestService:
 
         return existing_design
 
-    async def _process_channel_discovery(self, message_data: dict[str, Any]) -> None:
+    async def _process_channel_discovery(
+        self,
+        message_data: dict[str, Any],
+        discovery: DiscoveryService | None = None,
+    ) -> None:
         """Process a message for channel discovery (v0.6).
 
         Detects channel references from forwards, links, and mentions,
@@ -787,11 +937,13 @@ class IngestService:
 
         Args:
             message_data: Parsed message data from TelegramService.
+            discovery: Service to reuse across a batch (created if omitted).
         """
         try:
-            from app.services.discovery import DiscoveryService
+            if discovery is None:
+                from app.services.discovery import DiscoveryService
 
-            discovery = DiscoveryService(self.db)
+                discovery = DiscoveryService(self.db)
             discovered = await discovery.process_message(message_data)
 
             if discovered:
@@ -895,40 +1047,128 @@ class IngestService:
             if not same_message_has_photos and not nearby_photo_messages:
                 return
 
-            # Build list of message IDs with photos to download
-            photo_message_ids = []
-            if same_message_has_photos:
-                photo_message_ids.append(message.telegram_message_id)
-            for nearby_msg in nearby_photo_messages:
-                photo_message_ids.append(nearby_msg.telegram_message_id)
-
-            # Queue the image download job
-            queue = JobQueueService(self.db)
-            job = await queue.enqueue(
-                JobType.DOWNLOAD_TELEGRAM_IMAGES,
-                design_id=design.id,
-                priority=5,  # Lower priority than file downloads
-                payload={
-                    "design_id": design.id,
-                    "message_ids": photo_message_ids,  # List of all message IDs with photos
-                    "channel_peer_id": channel.telegram_peer_id,
-                    # Keep legacy field for backwards compatibility
-                    "message_id": message.telegram_message_id,
-                },
+            await self._queue_image_download(
+                design, channel, message, same_message_has_photos, nearby_photo_messages
             )
 
-            logger.info(
-                "image_download_job_queued",
+        except Exception as e:
+            # Log but don't fail - image download is non-critical
+            logger.warning(
+                "image_download_queue_failed",
                 design_id=design.id,
-                job_id=job.id,
-                message_ids=photo_message_ids,
-                nearby_count=len(nearby_photo_messages),
+                error=str(e),
             )
 
+    async def _queue_image_downloads_for_batch(
+        self,
+        channel: Channel,
+        created: list[tuple[Design, TelegramMessage, list[Attachment]]],
+    ) -> None:
+        """Queue image download jobs for designs created by ingest_batch.
+
+        Photo messages for the whole batch are loaded with one query over
+        the combined time window, then matched to each design in memory
+        using the same rules as _find_nearby_photo_messages.
+
+        Args:
+            channel: The source channel.
+            created: (design, message, attachments) for each new design.
+        """
+        try:
+            dates = [message.date_posted for _, message, _ in created]
+            window_start = min(dates) - timedelta(minutes=NEARBY_PHOTO_WINDOW_MINUTES)
+            result = await self.db.execute(
+                select(TelegramMessage)
+                .join(Attachment, Attachment.message_id == TelegramMessage.id)
+                .where(
+                    TelegramMessage.channel_id == channel.id,
+                    TelegramMessage.date_posted >= window_start,
+                    TelegramMessage.date_posted <= max(dates),
+                    Attachment.media_type == MediaType.PHOTO,
+                )
+                .distinct()
+                .order_by(TelegramMessage.date_posted.desc())
+            )
+            photo_messages = list(result.scalars().all())
         except Exception as e:
-            # Log but don't fail - image download is non-critical
             logger.warning(
                 "image_download_queue_failed",
-                design_id=design.id,
+                channel_id=channel.id,
                 error=str(e),
             )
+            return
+
+        for design, message, attachments in created:
+            try:
+                same_message_has_photos = any(
+                    a.media_type == MediaType.PHOTO for a in attachments
+                )
+                posted = _as_utc(message.date_posted)
+                window_start = posted - timedelta(minutes=NEARBY_PHOTO_WINDOW_MINUTES)
+                nearby_photo_messages = [
+                    m
+                    for m in photo_messages
+                    if m.id != message.id
+                    and window_start <= _as_utc(m.date_posted) <= posted
+                    and (
+                        not message.author_name
+                        or m.author_name == message.author_name
+                    )
+                ]
+
+                if not same_message_has_photos and not nearby_photo_messages:
+                    continue
+
+                await self._queue_image_download(
+                    design,
+                    channel,
+                    message,
+                    same_message_has_photos,
+                    nearby_photo_messages,
+                )
+            except Exception as e:
+                # Log but don't fail - image download is non-critical
+                logger.warning(
+                    "image_download_queue_failed",
+                    design_id=design.id,
+                    error=str(e),
+                )
+
+    async def _queue_image_download(
+        self,
+        design: Design,
+        channel: Channel,
+        message: TelegramMessage,
+        same_message_has_photos: bool,
+        nearby_photo_messages: list[TelegramMessage],
+    ) -> None:
+        """Enqueue a DOWNLOAD_TELEGRAM_IMAGES job for a design."""
+        # Build list of message IDs with photos to download
+        photo_message_ids = []
+        if same_message_has_photos:
+            photo_message_ids.append(message.telegram_message_id)
+        for nearby_msg in nearby_photo_messages:
+            photo_message_ids.append(nearby_msg.telegram_message_id)
+
+        # Queue the image download job
+        queue = JobQueueService(self.db)
+        job = await queue.enqueue(
+            JobType.DOWNLOAD_TELEGRAM_IMAGES,
+            design_id=design.id,
+            priority=5,  # Lower priority than file downloads
+            payload={
+                "design_id": design.id,
+                "message_ids": photo_message_ids,  # List of all message IDs with photos
+                "channel_peer_id": channel.telegram_peer_id,
+                # Keep legacy field for backwards compatibility
+                "message_id": message.telegram_message_id,
+            },
+        )
+
+        logger.info(
+            "image_download_job_queued",
+            design_id=design.id,
+            job_id=job.id,
+            message_ids=photo_message_ids,
+            nearby_count=len(nearby_photo_messages),
+        )
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -23,6 +24,40 @@ DESIGN_JOB_TYPES = {
     JobType.IMPORT_TO_LIBRARY,
 }
 
+# Postgres NOTIFY channel prefix for job dispatch. The WorkerManager's
+# dispatcher LISTENs on one channel per job type and wakes idle workers.
+JOB_NOTIFY_CHANNEL_PREFIX = "printarr_jobs_"
+
+
+def job_notify_channel(job_type: JobType) -> str:
+    """Get the NOTIFY channel name for a job type.
+
+    Args:
+        job_type: The job type.
+
+    Returns:
+        Channel name, e.g. "printarr_jobs_download_design".
+    """
+    return f"{JOB_NOTIFY_CHANNEL_PREFIX}{job_type.value.lower()}"
+
+
+async def notify_job_available(db: AsyncSession, job_type: JobType) -> None:
+    """Emit a NOTIFY that a job of this type is ready to be claimed.
+
+    Postgres delivers the notification when the surrounding transaction
+    commits, so listeners never wake before the job row is visible.
+    No-op on other databases (SQLite in tests), where workers poll.
+
+    Args:
+        db: Async database session holding the enqueue transaction.
+        job_type: Type of the job that became available.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    await db.execute(
+        select(func.pg_notify(job_notify_channel(job_type), job_type.value))
+    )
+
 
 class JobQueueService:
     """Service for managing the job queue.
@@ -77,6 +112,7 @@ class JobQueueService:
         )
         self.db.add(job)
         await self.db.flush()
+        await notify_job_available(self.db, job_type)
 
         logger.info(
             "job_enqueued",
@@ -182,6 +218,7 @@ class JobQueueService:
         job.status = JobStatus.RUNNING
         job.started_at = datetime.now(timezone.utc)
         job.attempts += 1
+        job.claim_token = str(uuid.uuid4())
 
         await self.db.flush()
 
@@ -202,6 +239,187 @@ class JobQueueService:
 
         return job
 
+    async def dequeue_many(
+        self,
+        job_types: list[JobType] | None = None,
+        n: int = 1,
+    ) -> list[Job]:
+        """Atomically claim up to n available jobs in one statement.
+
+        Runs a single UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP
+        LOCKED LIMIT n) RETURNING, so a batch costs one round trip and one
+        commit instead of one per job. Eligibility and ordering match
+        dequeue().
+
+        Claimed jobs are RUNNING but not yet started; callers should call
+        start_claimed() right before processing each one and release()
+        any they don't get to. The batch shares a claim token, so a job
+        requeued as stale and claimed by another worker meanwhile is
+        recognised as no longer ours.
+
+        Args:
+            job_types: Optional list of job types to consider.
+                      If None, considers all types.
+            n: Maximum number of jobs to claim.
+
+        Returns:
+            Claimed jobs ordered by priority (desc) then created_at (asc).
+        """
+        if n < 1:
+            return []
+
+        now = datetime.now(timezone.utc)
+        claim_token = str(uuid.uuid4())
+
+        conditions = [
+            Job.status == JobStatus.QUEUED,
+            or_(Job.next_retry_at.is_(None), Job.next_retry_at <= now),
+        ]
+        if job_types:
+            conditions.append(Job.type.in_(job_types))
+
+        candidates = (
+            select(Job.id)
+            .where(and_(*conditions))
+            .order_by(Job.priority.desc(), Job.created_at.asc())
+            .limit(n)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+
+        try:
+            result = await self.db.execute(
+                update(Job)
+                .where(Job.id.in_(candidates), Job.status == JobStatus.QUEUED)
+                .values(
+                    status=JobStatus.RUNNING,
+                    started_at=now,
+                    attempts=Job.attempts + 1,
+                    claim_token=claim_token,
+                )
+                .returning(Job)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            jobs = list(result.scalars().all())
+        except Exception as e:
+            logger.error(
+                "dequeue_many_query_error",
+                error=str(e),
+                job_types=[jt.value for jt in job_types] if job_types else None,
+                exc_info=True,
+            )
+            return []
+
+        # RETURNING order is not guaranteed
+        jobs.sort(key=lambda j: (-j.priority, j.created_at))
+
+        if jobs:
+            logger.info(
+                "jobs_claimed",
+                count=len(jobs),
+                job_ids=[j.id for j in jobs],
+                job_types=sorted({j.type.value for j in jobs}),
+            )
+
+        return jobs
+
+    async def start_claimed(self, job: Job) -> bool:
+        """Mark a job claimed by dequeue_many() as actually starting.
+
+        Resets started_at so time spent waiting in a worker's local batch
+        doesn't count towards stale-job detection. Fails if the job is no
+        longer RUNNING under this claim (cancelled, or requeued as stale and
+        possibly claimed by another worker while it waited).
+
+        Args:
+            job: A job returned by dequeue_many().
+
+        Returns:
+            True if the job may be processed, False if it should be skipped.
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job.id,
+                Job.status == JobStatus.RUNNING,
+                Job.claim_token == job.claim_token,
+            )
+            .values(started_at=now)
+            .returning(Job.id)
+        )
+        if result.scalar_one_or_none() is None:
+            logger.info(
+                "claimed_job_no_longer_running",
+                job_id=job.id,
+                job_type=job.type.value,
+            )
+            return False
+
+        job.started_at = now
+        await self.db.flush()
+
+        logger.info(
+            "job_claimed",
+            job_id=job.id,
+            job_type=job.type.value,
+            attempt=job.attempts,
+        )
+
+        # Broadcast job started event (#217)
+        broadcaster = get_event_broadcaster()
+        asyncio.create_task(broadcaster.broadcast_job_started(
+            job_id=job.id,
+            job_type=job.type.value,
+            design_id=job.design_id,
+        ))
+
+        return True
+
+    async def release(self, jobs: list[Job]) -> int:
+        """Return claimed-but-unstarted jobs to the queue.
+
+        Undoes dequeue_many() for jobs a worker did not get to (e.g. on
+        shutdown), including the attempt it counted. Jobs since claimed by
+        another worker are left alone.
+
+        Args:
+            jobs: Jobs claimed by dequeue_many().
+
+        Returns:
+            Number of jobs released.
+        """
+        if not jobs:
+            return 0
+
+        claims = or_(*(
+            and_(Job.id == job.id, Job.claim_token == job.claim_token)
+            for job in jobs
+        ))
+        result = await self.db.execute(
+            update(Job)
+            .where(claims, Job.status == JobStatus.RUNNING)
+            .values(
+                status=JobStatus.QUEUED,
+                started_at=None,
+                attempts=Job.attempts - 1,
+            )
+            .returning(Job.type)
+            .execution_options(synchronize_session=False)
+        )
+        released_types = list(result.scalars().all())
+        await self.db.flush()
+
+        for job_type in set(released_types):
+            await notify_job_available(self.db, job_type)
+
+        if released_types:
+            logger.info(
+                "claimed_jobs_released",
+                count=len(released_types),
+            )
+        return len(released_types)
+
     async def complete(
         self,
         job_id: str,
@@ -733,10 +951,15 @@ class JobQueueService:
                 status=JobStatus.QUEUED,
                 started_at=None,
             )
+            .returning(Job.type)
         )
+        requeued_types = list(result.scalars().all())
         await self.db.flush()
 
-        count = result.rowcount
+        for job_type in set(requeued_types):
+            await notify_job_available(self.db, job_type)
+
+        count = len(requeued_types)
         if count > 0:
             logger.warning(
                 "stale_jobs_requeued",
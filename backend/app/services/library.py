@@ -9,7 +9,6 @@ from __future__ import annotations
 import asyncio
 import re
 import shutil
-import zipfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import BytesIO
@@ -38,9 +37,11 @@ from app.db.models.enums import (
     PreviewSource,
 )
 from app.db.session import async_session_maker
+from app.services.blob_store import BlobStore
 from app.services.job_queue import JobQueueService
-from app.services.multicolor import get_multicolor_detector
 from app.services.preview import PreviewService
+from app.services.threemf import ThreeMfAnalysis, analyze_3mf_files
+from app.utils import compute_file_hash
 
 logger = get_logger(__name__)
 
@@ -50,15 +51,6 @@ INVALID_CHARS = re.compile(r'[/\\:*?"<>|]')
 # Default template if none configured
 DEFAULT_TEMPLATE = "{designer}/{channel}/{title}"
 
-# Common thumbnail paths inside 3MF files (in priority order)
-THREEMF_THUMBNAIL_PATHS = [
-    "Metadata/thumbnail.png",
-    "thumbnail.png",
-    "3D/Metadata/thumbnail.png",
-    "Metadata/thumbnail.jpg",
-    "thumbnail.jpg",
-]
-
 
 class LibraryError(Exception):
     """Error during library import."""
@@ -86,6 +78,7 @@ class FileToMove:
     filename: str
     size_bytes: int | None
     source_path: Path
+    sha256: str | None = None
 
 
 class LibraryImportService:
@@ -148,11 +141,15 @@ class LibraryImportService:
         library_path = self._build_library_path(design_info, template)
 
         # PHASE 2: Move files (NO database session held)
+        # In content-addressed mode files go into the blob store and the
+        # library gets links to them instead
         library_path.mkdir(parents=True, exist_ok=True)
+        blob_store = BlobStore() if settings.library_content_addressed else None
         total_files = len(files_to_move)
         files_imported = 0
         total_bytes = 0
-        moved_files: list[tuple[str, str, str]] = []  # (design_file_id, new_relative_path, new_filename)
+        # (design_file_id, new_relative_path, new_filename, sha256)
+        moved_files: list[tuple[str, str, str, str | None]] = []
 
         for i, file_info in enumerate(files_to_move):
             if not file_info.source_path.exists():
@@ -181,11 +178,20 @@ class LibraryImportService:
             target_path = target_dir / target_filename
 
             # Move file (no DB)
-            await self._move_file(file_info.source_path, target_path)
+            sha256 = file_info.sha256
+            if blob_store:
+                # The blob name must match the bytes: never trust the recorded
+                # hash (cheap when the file was hashed while it was written)
+                sha256 = await compute_file_hash(file_info.source_path)
+                await self._store_file(blob_store, file_info.source_path, target_path, sha256)
+            else:
+                await self._move_file(file_info.source_path, target_path)
 
             # Record the move for DB update - preserve internal structure in relative_path
             new_relative_path = str(target_path.relative_to(settings.library_path))
-            moved_files.append((file_info.design_file_id, new_relative_path, target_filename))
+            moved_files.append(
+                (file_info.design_file_id, new_relative_path, target_filename, sha256)
+            )
 
             files_imported += 1
             total_bytes += file_info.size_bytes or 0
@@ -198,11 +204,13 @@ class LibraryImportService:
 
         # PHASE 3: Update DesignFile records (brief session)
         async with async_session_maker() as db:
-            for design_file_id, new_relative_path, new_filename in moved_files:
+            for design_file_id, new_relative_path, new_filename, sha256 in moved_files:
                 design_file = await db.get(DesignFile, design_file_id)
                 if design_file:
                     design_file.relative_path = new_relative_path
                     design_file.filename = new_filename
+                    if sha256:
+                        design_file.sha256 = sha256
 
             await db.commit()
 
@@ -214,7 +222,12 @@ class LibraryImportService:
                 await db.commit()
 
         # PHASE 5: Extract 3MF thumbnails (NO database session held during I/O)
-        threemf_thumbnails = await self._extract_3mf_thumbnails(design_id, library_path)
+        # One streaming pass per 3MF also gives the multicolor answer (PHASE 8)
+        threemf_analyses = await analyze_3mf_files(
+            self._find_3mf_files(library_path),
+            read_thumbnail=True,
+        )
+        threemf_thumbnails = await self._extract_3mf_thumbnails(design_id, threemf_analyses)
 
         # PHASE 5.5: Create preview assets from imported image files
         image_previews = await self._create_image_previews(design_id, library_path)
@@ -239,7 +252,7 @@ class LibraryImportService:
             logger.debug("render_job_queued", design_id=design_id)
 
         # PHASE 8: Analyze 3MF files for multicolor detection
-        await self._analyze_3mf_multicolor(design_id, library_path)
+        await self._analyze_3mf_multicolor(design_id, threemf_analyses)
 
         logger.info(
             "import_complete",
@@ -312,6 +325,7 @@ class LibraryImportService:
                     filename=df.filename,
                     size_bytes=df.size_bytes,
                     source_path=source_path,
+                    sha256=df.sha256,
                 )
             )
 
@@ -383,6 +397,21 @@ class LibraryImportService:
             target=str(target),
         )
 
+    async def _store_file(
+        self, blob_store: BlobStore, source: Path, target: Path, sha256: str
+    ) -> None:
+        """Add a file to the blob store and link it into the library."""
+        loop = asyncio.get_event_loop()
+        method = await loop.run_in_executor(None, blob_store.place, source, target, sha256)
+
+        logger.debug(
+            "file_stored",
+            source=str(source),
+            target=str(target),
+            sha256=sha256,
+            method=method,
+        )
+
     async def _cleanup_staging(self, staging_dir: Path) -> None:
         """Remove the staging directory if empty."""
         def _do_cleanup() -> None:
@@ -419,35 +448,34 @@ class LibraryImportService:
         """Get the staging directory for a design."""
         return settings.staging_path / design_id
 
-    async def _extract_3mf_thumbnails(self, design_id: str, library_path: Path) -> int:
-        """Extract thumbnails from 3MF files in the library folder.
+    async def _extract_3mf_thumbnails(
+        self,
+        design_id: str,
+        analyses: dict[Path, ThreeMfAnalysis],
+    ) -> int:
+        """Save the thumbnails found in the design's 3MF files.
 
         Args:
             design_id: The design ID.
-            library_path: Path to the design's library folder.
+            analyses: Analysis (read with read_thumbnail) per 3MF file.
 
         Returns:
             Number of thumbnails extracted.
         """
-        threemf_files = self._find_3mf_files(library_path)
-        if not threemf_files:
-            return 0
-
         extracted_count = 0
 
-        for threemf_path in threemf_files:
-            thumbnail_data = await self._extract_thumbnail_from_3mf(threemf_path)
-            if not thumbnail_data:
+        for threemf_path, analysis in analyses.items():
+            if not analysis.thumbnail_data:
                 continue
 
-            image_data, original_filename = thumbnail_data
+            original_filename = analysis.thumbnail_name.split("/")[-1]
 
             # Save thumbnail using PreviewService
             async with async_session_maker() as db:
                 preview_service = PreviewService(db)
                 await preview_service.save_preview(
                     design_id=design_id,
-                    image_data=image_data,
+                    image_data=analysis.thumbnail_data,
                     source=PreviewSource.EMBEDDED_3MF,
                     kind=PreviewKind.THUMBNAIL,
                     filename=original_filename or f"{threemf_path.stem}_thumbnail.png",
@@ -459,6 +487,7 @@ class LibraryImportService:
                 "extracted_3mf_thumbnail",
                 design_id=design_id,
                 threemf_file=threemf_path.name,
+                plates=len(analysis.plates),
             )
 
         if extracted_count > 0:
@@ -485,55 +514,6 @@ class LibraryImportService:
         # Use rglob to search recursively for 3MF files in subdirectories
         return list(directory.rglob("*.3mf"))
 
-    async def _extract_thumbnail_from_3mf(
-        self, threemf_path: Path
-    ) -> tuple[bytes, str | None] | None:
-        """Extract embedded thumbnail from a 3MF file.
-
-        3MF files are ZIP archives that may contain thumbnail images
-        at standard locations.
-
-        Args:
-            threemf_path: Path to the 3MF file.
-
-        Returns:
-            Tuple of (image_data, original_filename) or None if no thumbnail.
-        """
-        def _do_extract() -> tuple[bytes, str | None] | None:
-            try:
-                with zipfile.ZipFile(threemf_path, "r") as zf:
-                    # Get list of files in archive
-                    namelist = zf.namelist()
-
-                    # Try each known thumbnail path
-                    for thumb_path in THREEMF_THUMBNAIL_PATHS:
-                        if thumb_path in namelist:
-                            data = zf.read(thumb_path)
-                            if len(data) > 0:
-                                return (data, thumb_path.split("/")[-1])
-
-                    # Also check for any image in Metadata folder
-                    for name in namelist:
-                        if name.startswith("Metadata/") and name.lower().endswith(
-                            (".png", ".jpg", ".jpeg")
-                        ):
-                            data = zf.read(name)
-                            if len(data) > 0:
-                                return (data, name.split("/")[-1])
-
-                return None
-
-            except (zipfile.BadZipFile, Exception) as e:
-                logger.warning(
-                    "3mf_thumbnail_extraction_failed",
-                    file=str(threemf_path),
-                    error=str(e),
-                )
-                return None
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _do_extract)
-
     async def _create_image_previews(self, design_id: str, library_path: Path) -> int:
         """Create preview assets from imported image files.
 
@@ -606,32 +586,30 @@ class LibraryImportService:
 
         return created_count
 
-    async def _analyze_3mf_multicolor(self, design_id: str, library_path: Path) -> bool:
-        """Analyze 3MF files for multicolor detection.
+    async def _analyze_3mf_multicolor(
+        self,
+        design_id: str,
+        analyses: dict[Path, ThreeMfAnalysis],
+    ) -> bool:
+        """Apply 3MF multicolor detection to the design.
 
         Args:
             design_id: The design ID.
-            library_path: Path to the design's library folder.
+            analyses: Analysis per 3MF file in the design's library folder.
 
         Returns:
             True if multicolor was detected.
         """
-        threemf_files = self._find_3mf_files(library_path)
-        if not threemf_files:
-            return False
-
-        detector = get_multicolor_detector()
         is_multicolor = False
 
-        for threemf_path in threemf_files:
-            detected, details = detector.detect_from_3mf(threemf_path)
-            if detected:
+        for threemf_path, analysis in analyses.items():
+            if analysis.is_multicolor:
                 is_multicolor = True
                 logger.info(
                     "multicolor_detected_3mf",
                     design_id=design_id,
                     file=threemf_path.name,
-                    color_count=details.get("color_count", 0),
+                    color_count=len(analysis.colors),
                 )
                 break  # One is enough
 
@@ -6,7 +6,8 @@ Provides:
 - Attachment extraction from topics
 - File downloading with session cookies
 - Credential encryption and storage
-- Rate limiting with configurable delays
+- Rate limiting with configurable delays, per forum host
+- Incremental re-scans using conditional requests and topic markers
 
 See issue #239 for design decisions.
 
@@ -16,12 +17,11 @@ Example phpBB sites:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import httpx
@@ -32,17 +32,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.db.models import PhpbbCredentials
+from app.services.phpbb_http import get_host_bucket, phpbb_http_client
+from app.services.phpbb_sync import PhpbbForumSnapshot
+from app.utils import HashingWriter
 
 if TYPE_CHECKING:
     pass
 
 logger = get_logger(__name__)
 
-# Rate limiting
-REQUEST_DELAY = settings.phpbb_request_delay
+# Rate limiting (request pacing is per host, see phpbb_http)
 MAX_CONCURRENT_DOWNLOADS = settings.phpbb_max_concurrent_downloads
 SESSION_TIMEOUT_HOURS = settings.phpbb_session_timeout_hours
 
+# Bytes per read while streaming attachment downloads
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Timeout for attachment downloads (10 minutes)
+DOWNLOAD_TIMEOUT_SECONDS = 600.0
+
 
 class PhpbbError(Exception):
     """Base exception for phpBB errors."""
@@ -89,6 +97,8 @@ class TopicInfo(BaseModel):
     author: str | None = None
     post_count: int = 0
     last_post_date: datetime | None = None
+    # Changes whenever someone posts in the topic (last post ID and replies)
+    last_post_marker: str | None = None
     url: str
 
 
@@ -152,17 +162,12 @@ class PhpbbService:
         """
         self.db = db
         self._encryption_key: bytes | None = None
-        self._last_request_time: datetime | None = None
 
     # ========== Rate Limiting ==========
 
-    async def _rate_limit(self) -> None:
-        """Wait to respect rate limiting between requests."""
-        if self._last_request_time:
-            elapsed = (datetime.now(timezone.utc) - self._last_request_time).total_seconds()
-            if elapsed < REQUEST_DELAY:
-                await asyncio.sleep(REQUEST_DELAY - elapsed)
-        self._last_request_time = datetime.now(timezone.utc)
+    async def _rate_limit(self, url: str) -> None:
+        """Wait for the host's shared request budget (see phpbb_http)."""
+        await get_host_bucket(url).acquire()
 
     # ========== Authentication ==========
 
@@ -196,7 +201,7 @@ class PhpbbService:
         base_url = base_url.rstrip("/")
 
         async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            await self._rate_limit()
+            await self._rate_limit(base_url)
 
             # Get login page to extract CSRF tokens
             login_url = f"{base_url}/ucp.php?mode=login"
@@ -245,7 +250,7 @@ class PhpbbService:
             if sid_input:
                 form_data["sid"] = sid_input.get("value", "")
 
-            await self._rate_limit()
+            await self._rate_limit(base_url)
 
             # Submit login form (don't follow redirects so we can check the response)
             post_url = f"{base_url}/ucp.php?mode=login"
@@ -343,10 +348,8 @@ class PhpbbService:
 
         base_url = base_url.rstrip("/")
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
-            await self._rate_limit()
+        async with phpbb_http_client(base_url, cookies) as client:
+            await self._rate_limit(base_url)
 
             # Check the user control panel - if logged in, it shows username
             response = await client.get(f"{base_url}/ucp.php")
@@ -407,10 +410,8 @@ class PhpbbService:
 
         full_url = urljoin(base_url + "/", forum_url)
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
-            await self._rate_limit()
+        async with phpbb_http_client(base_url, cookies) as client:
+            await self._rate_limit(base_url)
 
             response = await client.get(full_url)
 
@@ -462,6 +463,7 @@ class PhpbbService:
         forum_url: str,
         cookies: dict[str, str],
         start: int = 0,
+        snapshot: PhpbbForumSnapshot | None = None,
     ) -> tuple[list[TopicInfo], int | None]:
         """List topics in a forum with pagination.
 
@@ -470,6 +472,8 @@ class PhpbbService:
             forum_url: URL of the forum (viewforum.php?f=X)
             cookies: Session cookies.
             start: Offset for pagination (default 0).
+            snapshot: Previous sync state; the page is requested conditionally
+                and reused from it if the server reports it unchanged.
 
         Returns:
             Tuple of (list of TopicInfo, next_start or None if last page).
@@ -494,12 +498,20 @@ class PhpbbService:
         if start > 0:
             paginated_url += f"&start={start}"
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
-            await self._rate_limit()
+        async with phpbb_http_client(base_url, cookies) as client:
+            await self._rate_limit(base_url)
+
+            headers = snapshot.validators(paginated_url) if snapshot else {}
+            response = await client.get(paginated_url, headers=headers)
 
-            response = await client.get(paginated_url)
+            if response.status_code == 304 and snapshot:
+                cached = snapshot.cached_page(paginated_url)
+                if cached is not None:
+                    logger.debug("phpbb_topics_not_modified", forum_id=forum_id, start=start)
+                    return [TopicInfo(**t) for t in cached["topics"]], cached["next_start"]
+                # Validators without a stored page: ask again unconditionally
+                await self._rate_limit(base_url)
+                response = await client.get(paginated_url)
 
             if response.status_code != 200:
                 raise PhpbbError(f"Failed to load forum: {response.status_code}")
@@ -572,6 +584,7 @@ class PhpbbService:
                         title=title,
                         author=author,
                         post_count=post_count,
+                        last_post_marker=self._last_post_marker(row, post_count),
                         url=href,
                     ))
 
@@ -602,14 +615,42 @@ class PhpbbService:
                 has_next=next_start is not None,
             )
 
+            if snapshot:
+                snapshot.store_page(
+                    paginated_url,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    topics=[t.model_dump(mode="json") for t in topics],
+                    next_start=next_start,
+                )
+
             return topics, next_start
 
+    def _last_post_marker(self, row: Any, post_count: int) -> str | None:
+        """Build a marker of a topic row's last post.
+
+        Uses the last post link (p=ID) when present, else the last post
+        column text (author and date), combined with the reply count.
+        """
+        lastpost = row.find("dd", class_="lastpost")
+        if not lastpost:
+            return None
+
+        for link in lastpost.find_all("a", href=True):
+            post_match = re.search(r"p=(\d+)", link["href"])
+            if post_match:
+                return f"p{post_match.group(1)}:{post_count}"
+
+        text = " ".join(lastpost.get_text(" ", strip=True).split())
+        return f"{text}:{post_count}" if text else None
+
     async def list_all_topics(
         self,
         base_url: str,
         forum_url: str,
         cookies: dict[str, str],
         max_topics: int | None = None,
+        snapshot: PhpbbForumSnapshot | None = None,
     ) -> list[TopicInfo]:
         """List all topics in a forum (handling pagination).
 
@@ -618,6 +659,7 @@ class PhpbbService:
             forum_url: URL of the forum.
             cookies: Session cookies.
             max_topics: Optional limit on topics to fetch.
+            snapshot: Previous sync state for conditional page requests.
 
         Returns:
             List of all TopicInfo in the forum.
@@ -627,7 +669,7 @@ class PhpbbService:
 
         while True:
             topics, next_start = await self.list_topics(
-                base_url, forum_url, cookies, start
+                base_url, forum_url, cookies, start, snapshot=snapshot
             )
             all_topics.extend(topics)
 
@@ -675,16 +717,14 @@ class PhpbbService:
 
         attachments: list[AttachmentInfo] = []
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
+        async with phpbb_http_client(base_url, cookies) as client:
             # May need to paginate through topic pages
             current_url = full_url
             page_num = 0
             max_pages = 100  # Safety limit
 
             while current_url and page_num < max_pages:
-                await self._rate_limit()
+                await self._rate_limit(base_url)
 
                 response = await client.get(current_url)
 
@@ -841,11 +881,9 @@ class PhpbbService:
         # Image extensions to look for
         image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
+        async with phpbb_http_client(base_url, cookies) as client:
             # Only look at first page of topic (where preview images likely are)
-            await self._rate_limit()
+            await self._rate_limit(base_url)
 
             response = await client.get(full_url)
 
@@ -997,15 +1035,13 @@ class PhpbbService:
         seen_image_urls: set[str] = set()
         image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, cookies=cookies
-        ) as client:
+        async with phpbb_http_client(base_url, cookies) as client:
             current_url = full_url
             page_num = 0
             max_pages = 100
 
             while current_url and page_num < max_pages:
-                await self._rate_limit()
+                await self._rate_limit(base_url)
 
                 response = await client.get(current_url)
 
@@ -1250,15 +1286,15 @@ class PhpbbService:
         Raises:
             PhpbbError: If download fails.
         """
-        await self._rate_limit()
+        await self._rate_limit(download_url)
 
         # Create parent directories
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with httpx.AsyncClient(
-            follow_redirects=True, timeout=600.0, cookies=cookies  # 10 minute timeout
-        ) as client:
-            async with client.stream("GET", download_url) as response:
+        async with phpbb_http_client(download_url, cookies) as client:
+            async with client.stream(
+                "GET", download_url, timeout=DOWNLOAD_TIMEOUT_SECONDS
+            ) as response:
                 if response.status_code == 404:
                     raise PhpbbNotFoundError(f"File not found: {download_url}")
 
@@ -1281,13 +1317,19 @@ class PhpbbService:
                         if dest_path.is_dir():
                             dest_path = dest_path / filename_match.group(1)
 
+                # Hash while writing so the import doesn't re-read the file
                 downloaded = 0
-                with open(dest_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
+                writer = HashingWriter(dest_path)
+                try:
+                    async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        writer.write(chunk)
                         downloaded += len(chunk)
                         if progress_callback:
                             await progress_callback(downloaded, total_size)
+                except BaseException:
+                    writer.discard()
+                    raise
+                writer.finish()
 
         logger.info(
             "phpbb_file_downloaded",
@@ -1307,25 +1349,48 @@ class PhpbbService:
         cookies: dict[str, str],
         max_topics: int | None = None,
         include_images: bool = True,
+        snapshot_key: str | None = None,
     ) -> list[DetectedPhpbbDesign]:
         """Scan a forum for designs (topics with ZIP attachments).
 
+        With a snapshot_key, the state of the previous scan is loaded: index
+        pages are requested conditionally, and topics whose last post marker
+        is unchanged are not fetched again (the design found in them last
+        time is reused). The updated state is saved for the next scan.
+
         Args:
             base_url: Base URL of the phpBB forum.
             forum_url: URL of the forum to scan.
             cookies: Session cookies.
             max_topics: Optional limit on topics to scan.
             include_images: Whether to also extract preview images from topics.
+            snapshot_key: Identifies the stored scan state (e.g. the import
+                folder ID). None scans everything without storing state.
 
         Returns:
             List of detected designs.
         """
+        snapshot = None
+        if snapshot_key:
+            snapshot = PhpbbForumSnapshot.load(snapshot_key, forum_url)
+
         # Get all topics
-        topics = await self.list_all_topics(base_url, forum_url, cookies, max_topics)
+        topics = await self.list_all_topics(
+            base_url, forum_url, cookies, max_topics, snapshot=snapshot
+        )
 
         designs: list[DetectedPhpbbDesign] = []
+        topics_skipped = 0
 
         for topic in topics:
+            if snapshot:
+                unchanged = snapshot.unchanged_topic(topic.topic_id, topic.last_post_marker)
+                if unchanged is not None:
+                    topics_skipped += 1
+                    if unchanged["design"]:
+                        designs.append(DetectedPhpbbDesign(**unchanged["design"]))
+                    continue
+
             # Get attachments and images in a single fetch
             topic_url = f"viewtopic.php?f={topic.forum_id}&t={topic.topic_id}"
             try:
@@ -1348,6 +1413,8 @@ class PhpbbService:
             ]
 
             if not archive_attachments:
+                if snapshot:
+                    snapshot.store_topic(topic.topic_id, topic.last_post_marker, None)
                 continue
 
             # Create design from topic
@@ -1356,7 +1423,7 @@ class PhpbbService:
             # Clean up title (remove common prefixes/suffixes)
             title = self._clean_title(topic.title)
 
-            designs.append(DetectedPhpbbDesign(
+            design = DetectedPhpbbDesign(
                 topic_id=topic.topic_id,
                 forum_id=topic.forum_id,
                 topic_title=topic.title,
@@ -1367,12 +1434,24 @@ class PhpbbService:
                 total_size=total_size,
                 author=topic.author,
                 last_post_date=topic.last_post_date,
-            ))
+            )
+            designs.append(design)
+            if snapshot:
+                snapshot.store_topic(
+                    topic.topic_id, topic.last_post_marker, design.model_dump(mode="json")
+                )
+
+        # A partial scan doesn't tell which topics are gone
+        if snapshot and max_topics is None:
+            snapshot.retain_topics({t.topic_id for t in topics})
+        if snapshot:
+            snapshot.save()
 
         logger.info(
             "phpbb_forum_scanned",
             forum_url=forum_url,
             topics_scanned=len(topics),
+            topics_unchanged=topics_skipped,
             designs_found=len(designs),
         )
 
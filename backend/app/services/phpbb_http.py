@@ -0,0 +1,214 @@
+"""Pooled HTTP clients and per-host pacing for phpBB forums.
+
+Scraping a forum walks dozens of index pages and hundreds of topics. Opening
+an httpx.AsyncClient per page paid a TCP and TLS handshake every time, so
+one pooled client is kept per forum host (and session cookies) instead. With
+the h2 package installed it negotiates HTTP/2, so concurrent syncs and
+downloads from the same forum share one multiplexed connection.
+
+Clients are borrowed with ``async with phpbb_http_client(url, cookies)``.
+A client evicted from the pool while requests are still using it is
+closed when the last of them returns it.
+
+Pacing is a token bucket per host, shared by every PhpbbService instance:
+syncs of different forums on the same site draw from the same budget,
+while different sites don't slow each other down. The bucket refills at
+one request per PRINTARR_PHPBB_REQUEST_DELAY seconds (read on every
+request, so setting changes apply at once) and allows a short burst of
+REQUEST_BURST requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Requests a host may receive back to back before pacing kicks in
+REQUEST_BURST = 3
+
+# Pooled clients kept open (least recently used are closed)
+MAX_POOLED_CLIENTS = 16
+
+_ClientKey = tuple[str, str]
+
+# Pooled clients keyed by (origin, cookie fingerprint)
+_clients: OrderedDict[_ClientKey, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = (
+    OrderedDict()
+)
+
+# Borrow count of clients currently in use
+_in_use: dict[httpx.AsyncClient, int] = {}
+
+# Evicted clients still in use; closed when returned
+_retired: set[httpx.AsyncClient] = set()
+
+_buckets: dict[str, HostTokenBucket] = {}
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+class HostTokenBucket:
+    """Token bucket pacing requests to one host."""
+
+    def __init__(self, delay: float | None = None, burst: int = REQUEST_BURST):
+        """Initialize the bucket (full).
+
+        Args:
+            delay: Seconds per token (one request per delay on average).
+                None follows settings.phpbb_request_delay.
+            burst: Bucket capacity.
+        """
+        self._delay = delay
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def delay(self) -> float:
+        """Current seconds per token."""
+        if self._delay is not None:
+            return self._delay
+        return settings.phpbb_request_delay
+
+    async def acquire(self) -> None:
+        """Wait for a token, then take it."""
+        async with self._lock:
+            delay = self.delay
+            now = time.monotonic()
+            if delay > 0:
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last_refill) / delay
+                )
+            else:
+                self.tokens = self.capacity
+            self.last_refill = now
+
+            if self.tokens < 1:
+                # Holding the lock while sleeping keeps waiters in order
+                wait = (1 - self.tokens) * delay
+                await asyncio.sleep(wait)
+                self.tokens = 1.0
+                self.last_refill = time.monotonic()
+
+            self.tokens -= 1
+
+
+def get_host_bucket(url: str) -> HostTokenBucket:
+    """Get the shared token bucket for a URL's host."""
+    origin = _origin(url)
+    bucket = _buckets.get(origin)
+    if bucket is None:
+        bucket = _buckets[origin] = HostTokenBucket()
+    return bucket
+
+
+@asynccontextmanager
+async def phpbb_http_client(
+    url: str, cookies: dict[str, str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Borrow the pooled HTTP client for a forum host and session.
+
+    Cookies live in the client's jar (redirects re-derive the Cookie header
+    from it), so each session gets its own client. In practice that is one
+    client per forum.
+
+    Args:
+        url: Any URL on the forum.
+        cookies: Session cookies.
+
+    Yields:
+        Shared httpx.AsyncClient, valid until the block exits.
+    """
+    client, evicted = _pooled_client(url, cookies)
+    for old_client in evicted:
+        await _close_when_idle(old_client)
+
+    _in_use[client] = _in_use.get(client, 0) + 1
+    try:
+        yield client
+    finally:
+        _in_use[client] -= 1
+        if not _in_use[client]:
+            del _in_use[client]
+            if client in _retired:
+                _retired.discard(client)
+                await client.aclose()
+
+
+async def _close_when_idle(client: httpx.AsyncClient) -> None:
+    if client in _in_use:
+        _retired.add(client)
+    elif not client.is_closed:
+        await client.aclose()
+
+
+def _pooled_client(
+    url: str, cookies: dict[str, str]
+) -> tuple[httpx.AsyncClient, list[httpx.AsyncClient]]:
+    """Get or create the pooled client; also returns clients evicted for it."""
+    loop = asyncio.get_running_loop()
+    fingerprint = hashlib.sha256(
+        repr(sorted(cookies.items())).encode()
+    ).hexdigest()[:16]
+    key = (_origin(url), fingerprint)
+
+    entry = _clients.get(key)
+    # Connections are bound to the loop that opened them
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        _clients.move_to_end(key)
+        return entry[1], []
+
+    client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        follow_redirects=True,
+        timeout=30.0,
+        cookies=cookies,
+        limits=httpx.Limits(
+            max_connections=settings.phpbb_max_concurrent_downloads + 2,
+            max_keepalive_connections=settings.phpbb_max_concurrent_downloads + 2,
+        ),
+    )
+    _clients[key] = (loop, client)
+
+    # Clients of another event loop can't be closed from this one
+    evicted = []
+    while len(_clients) > MAX_POOLED_CLIENTS:
+        _, (old_loop, old_client) = _clients.popitem(last=False)
+        if old_loop is loop:
+            evicted.append(old_client)
+
+    logger.debug("phpbb_http_client_created", origin=key[0], http2=HTTP2_AVAILABLE)
+    return client, evicted
+
+
+async def close_phpbb_http_clients() -> None:
+    """Close every pooled phpBB client (application shutdown)."""
+    clients = [client for _, client in _clients.values()] + list(_retired)
+    _clients.clear()
+    _retired.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
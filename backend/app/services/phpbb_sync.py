@@ -0,0 +1,183 @@
+"""Persisted phpBB forum state for incremental import sync.
+
+A full forum scan loads every index page and then every topic in it. Most
+of that is unchanged between syncs. PhpbbForumSnapshot remembers, per
+import folder (or legacy source):
+
+- For each forum index page: the ETag/Last-Modified validators the server
+  sent and the topics parsed from it. The next sync sends them as
+  If-None-Match/If-Modified-Since; a 304 reuses the stored topics.
+- For each topic: its "last post" marker from the index row (last post ID
+  and reply count) and the design detected in it, if any. A topic whose
+  marker is unchanged is not fetched again.
+
+Editing the first post of a topic doesn't change its last post, so the
+snapshot is dropped after PHPBB_SNAPSHOT_MAX_AGE as a safety net and the
+next sync scans everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the snapshot layout changes
+PHPBB_SNAPSHOT_VERSION = 1
+
+# Rescan every topic after this long
+PHPBB_SNAPSHOT_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+class PhpbbForumSnapshot:
+    """Validators, topic markers and detected designs of one forum."""
+
+    def __init__(self, key: str, forum_url: str):
+        """Initialize an empty snapshot.
+
+        Args:
+            key: Identifies the import folder (or legacy source) it belongs to.
+            forum_url: Forum the snapshot describes.
+        """
+        self.key = key
+        self.forum_url = forum_url
+        self.created_at = time.time()
+        # page URL -> {"etag", "last_modified", "topics": [TopicInfo dump], "next_start"}
+        self.pages: dict[str, dict[str, Any]] = {}
+        # topic ID (str) -> {"marker": str, "design": DetectedPhpbbDesign dump | None}
+        self.topics: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def path_for(key: str) -> Path:
+        """Get the snapshot file location for a key."""
+        name = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return settings.cache_path / "phpbb_sync" / f"{name}.json"
+
+    @classmethod
+    def load(cls, key: str, forum_url: str) -> PhpbbForumSnapshot:
+        """Load the stored snapshot, or an empty one if there isn't a usable one.
+
+        Args:
+            key: Snapshot key.
+            forum_url: Forum the snapshot must describe.
+        """
+        snapshot = cls(key, forum_url)
+        try:
+            data = json.loads(cls.path_for(key).read_text())
+        except (OSError, ValueError):
+            return snapshot
+
+        if (
+            data.get("version") != PHPBB_SNAPSHOT_VERSION
+            or data.get("forum") != forum_url
+            or time.time() - data.get("created_at", 0) > PHPBB_SNAPSHOT_MAX_AGE
+        ):
+            return snapshot
+
+        snapshot.created_at = data["created_at"]
+        snapshot.pages = data.get("pages", {})
+        snapshot.topics = data.get("topics", {})
+        return snapshot
+
+    def save(self) -> None:
+        """Persist the snapshot (best-effort)."""
+        path = self.path_for(self.key)
+        data = {
+            "version": PHPBB_SNAPSHOT_VERSION,
+            "forum": self.forum_url,
+            "created_at": self.created_at,
+            "pages": self.pages,
+            "topics": self.topics,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":"), default=str))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("phpbb_snapshot_save_failed", key=self.key, error=str(e))
+
+    @classmethod
+    def delete(cls, key: str) -> None:
+        """Remove a stored snapshot so the next sync scans everything."""
+        try:
+            cls.path_for(key).unlink()
+        except OSError:
+            pass
+
+    # ========== Index Pages ==========
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional request headers for a cached index page."""
+        page = self.pages.get(url)
+        if not page:
+            return {}
+
+        headers = {}
+        if page.get("etag"):
+            headers["If-None-Match"] = page["etag"]
+        if page.get("last_modified"):
+            headers["If-Modified-Since"] = page["last_modified"]
+        return headers
+
+    def cached_page(self, url: str) -> dict[str, Any] | None:
+        """Get the stored parse result of an index page."""
+        return self.pages.get(url)
+
+    def store_page(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        topics: list[dict[str, Any]],
+        next_start: int | None,
+    ) -> None:
+        """Remember an index page; pages without validators aren't kept."""
+        if not etag and not last_modified:
+            self.pages.pop(url, None)
+            return
+
+        self.pages[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "topics": topics,
+            "next_start": next_start,
+        }
+
+    # ========== Topics ==========
+
+    def unchanged_topic(self, topic_id: int, marker: str | None) -> dict[str, Any] | None:
+        """Get the stored entry of a topic whose last post hasn't changed.
+
+        Returns:
+            {"marker", "design"} if the topic can be skipped, else None.
+        """
+        if not marker:
+            return None
+
+        entry = self.topics.get(str(topic_id))
+        if entry is None or entry.get("marker") != marker:
+            return None
+        return entry
+
+    def store_topic(
+        self, topic_id: int, marker: str | None, design: dict[str, Any] | None
+    ) -> None:
+        """Remember a scanned topic and the design found in it (None if none)."""
+        if not marker:
+            self.topics.pop(str(topic_id), None)
+            return
+        self.topics[str(topic_id)] = {"marker": marker, "design": design}
+
+    def retain_topics(self, topic_ids: set[int]) -> None:
+        """Forget topics that are no longer listed in the forum."""
+        keep = {str(topic_id) for topic_id in topic_ids}
+        self.topics = {k: v for k, v in self.topics.items() if k in keep}
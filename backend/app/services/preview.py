@@ -9,6 +9,8 @@ Handles storage, retrieval, and management of preview images from various source
 
 Per DEC-027, images are stored in /cache/previews/ with subdirectories by source.
 Per DEC-032, primary preview is auto-selected based on source priority.
+Resized WebP/AVIF variants are generated next to each original on save
+(see app.services.preview_variants).
 """
 
 from __future__ import annotations
@@ -21,7 +23,7 @@ from typing import Any
 
 import aiofiles
 from PIL import Image
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -29,6 +31,7 @@ from app.core.logging import get_logger
 from app.db.models import Design, PreviewAsset
 from app.db.models.enums import PreviewKind, PreviewSource
 from app.db.session import async_session_maker
+from app.services.preview_variants import create_preview_variants, variant_paths
 
 logger = get_logger(__name__)
 
@@ -140,8 +143,9 @@ class PreviewService:
         # Get image dimensions
         width, height = await self._get_image_dimensions(image_data)
 
-        # Save file
+        # Save file and its resized variants
         await self._save_file(file_path, image_data)
+        variants = await create_preview_variants(file_path, self._previews_root)
 
         # Create database record
         if self.db:
@@ -159,6 +163,7 @@ class PreviewService:
                 original_filename=filename,
                 width=width,
                 height=height,
+                variants=variants,
                 telegram_file_id=telegram_file_id,
                 source_attachment_id=source_attachment_id,
                 is_primary=False,
@@ -277,11 +282,13 @@ class PreviewService:
                 await db.close()
 
     async def _delete_file(self, path: Path) -> None:
-        """Delete a file."""
+        """Delete a preview file and its resized variants."""
 
         def _do_delete() -> None:
             try:
                 path.unlink()
+                for variant in variant_paths(path):
+                    variant.unlink(missing_ok=True)
                 # Try to remove empty parent directories
                 parent = path.parent
                 while parent != self._previews_root:
@@ -518,6 +525,115 @@ class PreviewService:
             if not self.db:
                 await db.close()
 
+    async def count_missing_variants(self) -> int:
+        """Count previews whose resized variants were never generated."""
+        if self.db:
+            db = self.db
+        else:
+            db = async_session_maker()
+
+        try:
+            result = await db.execute(
+                select(func.count(PreviewAsset.id)).where(PreviewAsset.variants.is_(None))
+            )
+            return result.scalar() or 0
+
+        finally:
+            if not self.db:
+                await db.close()
+
+    async def generate_missing_variants(self, limit: int = 50) -> int:
+        """Generate resized variants for previews saved before they existed.
+
+        Args:
+            limit: Maximum number of previews to process.
+
+        Returns:
+            Number of previews processed (0 when none are left).
+        """
+        if self.db:
+            db = self.db
+        else:
+            db = async_session_maker()
+
+        try:
+            result = await db.execute(
+                select(PreviewAsset)
+                .where(PreviewAsset.variants.is_(None))
+                .order_by(PreviewAsset.created_at.desc())
+                .limit(limit)
+            )
+            previews = list(result.scalars().all())
+
+            for preview in previews:
+                file_path = self._previews_root / preview.file_path
+                if file_path.exists():
+                    preview.variants = await create_preview_variants(
+                        file_path, self._previews_root
+                    )
+                else:
+                    # Nothing to resize; don't pick it up again
+                    preview.variants = []
+
+            if not self.db:
+                await db.commit()
+            else:
+                await db.flush()
+
+            return len(previews)
+
+        finally:
+            if not self.db:
+                await db.close()
+
+    async def queue_variant_backfill(self) -> str | None:
+        """Queue a GENERATE_PREVIEW_VARIANTS job if any previews need one.
+
+        Returns:
+            The job ID if a job was queued, None if there is nothing to do
+            or a backfill is already queued or running.
+        """
+        from app.db.models import Job, JobStatus, JobType
+        from app.services.job_queue import JobQueueService
+
+        if self.db:
+            db = self.db
+        else:
+            db = async_session_maker()
+
+        try:
+            pending = await db.execute(
+                select(func.count(Job.id)).where(
+                    Job.type == JobType.GENERATE_PREVIEW_VARIANTS,
+                    Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+                )
+            )
+            if (pending.scalar() or 0) > 0:
+                return None
+
+            missing = await db.execute(
+                select(func.count(PreviewAsset.id)).where(PreviewAsset.variants.is_(None))
+            )
+            count = missing.scalar() or 0
+            if count == 0:
+                return None
+
+            job = await JobQueueService(db).enqueue(
+                JobType.GENERATE_PREVIEW_VARIANTS,
+                priority=-5,  # Background work
+                display_name="Preview variants",
+            )
+
+            if not self.db:
+                await db.commit()
+
+            logger.info("preview_variant_backfill_queued", job_id=job.id, previews=count)
+            return job.id
+
+        finally:
+            if not self.db:
+                await db.close()
+
     def get_static_path(self, relative_path: str) -> Path | None:
         """Get absolute path for static file serving with security validation.
 
@@ -0,0 +1,241 @@
+"""Resized derivatives of preview images.
+
+Previews are stored as received, often several megapixels, while the design
+grid shows them as ~200px tiles. When a preview is saved, a fixed set of
+widths (PREVIEW_VARIANT_WIDTHS) is rendered next to the original as WebP,
+and additionally as AVIF when enabled and supported by the installed Pillow.
+Only widths smaller than the original are generated.
+
+Variants are named after the original ("<stem>.w400.webp"), so the file
+route can pick one from the requested width and the Accept header with a
+couple of stat calls and no database lookup. PreviewAsset.variants records
+what was generated; NULL means the preview predates variants (see the
+GENERATE_PREVIEW_VARIANTS backfill job).
+
+Decoding and resizing are CPU-bound and run in a process pool sized by
+max_cpu_jobs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Widths rendered for every preview (grid tiles, 2x tiles, detail view)
+PREVIEW_VARIANT_WIDTHS = (200, 400, 800)
+
+# Output formats in order of preference when the client accepts them
+VARIANT_MEDIA_TYPES = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+}
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def avif_supported() -> bool:
+    """Check if the installed Pillow can encode AVIF."""
+    try:
+        import pillow_avif  # noqa: F401  (registers the plugin on older Pillow)
+    except ImportError:
+        pass
+    Image.init()
+    return "AVIF" in Image.SAVE
+
+
+def variant_formats() -> list[str]:
+    """Formats to generate with the current settings."""
+    formats = ["webp"]
+    if settings.preview_avif_enabled and avif_supported():
+        formats.insert(0, "avif")
+    return formats
+
+
+def variant_path(original: Path, width: int, fmt: str) -> Path:
+    """Location of one derivative of a preview file."""
+    return original.with_name(f"{original.stem}.w{width}.{fmt}")
+
+
+def variant_paths(original: Path) -> list[Path]:
+    """Every derivative location a preview file can have (for cleanup)."""
+    return [
+        variant_path(original, width, fmt)
+        for width in PREVIEW_VARIANT_WIDTHS
+        for fmt in VARIANT_MEDIA_TYPES
+    ]
+
+
+def generate_variants(
+    source_path: str,
+    widths: tuple[int, ...],
+    formats: list[str],
+    quality: int,
+) -> list[dict[str, Any]]:
+    """Render the derivatives of one preview file.
+
+    Runs in a worker process, so it only takes picklable arguments.
+
+    Args:
+        source_path: Original preview file.
+        widths: Target widths in pixels.
+        formats: Output formats ("webp", "avif").
+        quality: Encoder quality.
+
+    Returns:
+        One dict per written file with width, height, format and path.
+        Empty for animated images and images no wider than the smallest
+        target width.
+
+    Raises:
+        OSError: If the original can't be read or decoded.
+    """
+    original = Path(source_path)
+    written: list[dict[str, Any]] = []
+
+    with Image.open(original) as img:
+        if getattr(img, "is_animated", False):
+            # A still derivative would lose the animation
+            return written
+
+        # Let JPEG decode at reduced scale straight away. draft never goes
+        # below the requested box, so every target width still fits.
+        img.draft("RGB", (max(widths), max(widths)))
+        img = ImageOps.exif_transpose(img)
+
+        targets = [w for w in widths if w < img.width]
+        if not targets:
+            return written
+
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            img = img.convert("RGBA")
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        for width in sorted(targets, reverse=True):
+            height = max(1, round(img.height * width / img.width))
+            resized = img.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            for fmt in formats:
+                path = variant_path(original, width, fmt)
+                tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                resized.save(tmp_path, fmt.upper(), quality=quality)
+                os.replace(tmp_path, path)
+                written.append({
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "path": str(path),
+                    "file_size": path.stat().st_size,
+                })
+
+    return written
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=max(1, min(settings.max_cpu_jobs, os.cpu_count() or 1)),
+            # Don't fork the running event loop and its threads
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_preview_variant_executor() -> None:
+    """Stop the process pool (application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def create_preview_variants(original: Path, previews_root: Path) -> list[dict[str, Any]]:
+    """Generate the derivatives of a stored preview.
+
+    Args:
+        original: Absolute path of the preview file.
+        previews_root: Root the recorded paths are made relative to.
+
+    Returns:
+        Variant records for PreviewAsset.variants. Empty if nothing was
+        generated, including when the image couldn't be decoded.
+    """
+    loop = asyncio.get_running_loop()
+    args = (
+        str(original),
+        PREVIEW_VARIANT_WIDTHS,
+        variant_formats(),
+        settings.preview_variant_quality,
+    )
+    try:
+        written = await loop.run_in_executor(_get_executor(), generate_variants, *args)
+    except BrokenProcessPool as e:
+        # A worker died (e.g. OOM on a huge image). Retrying in this process
+        # could take the server down the same way; skip the variants and
+        # start a fresh pool for later calls.
+        shutdown_preview_variant_executor()
+        logger.warning("preview_variants_pool_broken", path=str(original), error=str(e))
+        return []
+    except Exception as e:
+        logger.warning("preview_variants_failed", path=str(original), error=str(e))
+        return []
+
+    for variant in written:
+        variant["path"] = str(Path(variant["path"]).relative_to(previews_root))
+    return written
+
+
+def _accepts(accept: str, media_type: str) -> bool:
+    """Check if an Accept header explicitly lists a media type."""
+    for part in accept.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == media_type:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def select_variant(original: Path, width: int | None, accept: str | None) -> tuple[Path, str | None]:
+    """Choose the file to serve for a preview request.
+
+    Picks the smallest variant at least as wide as requested, in the most
+    preferred format the client accepts. Falls back to the original when no
+    width is requested, the original is narrower than the matching variant
+    width, or the variant hasn't been generated.
+
+    Args:
+        original: Absolute path of the preview file.
+        width: Width the client will display the image at, if given.
+        accept: The request's Accept header.
+
+    Returns:
+        Tuple of (path, media type), where the media type is None for the
+        original.
+    """
+    if width is None or not accept:
+        return original, None
+
+    target = next((w for w in PREVIEW_VARIANT_WIDTHS if w >= width), None)
+    if target is None:
+        return original, None
+
+    for fmt, media_type in VARIANT_MEDIA_TYPES.items():
+        if not _accepts(accept, media_type):
+            continue
+        path = variant_path(original, target, fmt)
+        if path.is_file():
+            return path, media_type
+
+    return original, None
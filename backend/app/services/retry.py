@@ -243,6 +243,10 @@ class RetryService:
 
         await self.db.flush()
 
+        from app.services.job_queue import notify_job_available
+
+        await notify_job_available(self.db, job.type)
+
         logger.info(
             "manual_retry_scheduled",
             job_id=job_id,
@@ -25,6 +25,12 @@ SETTINGS_DEFAULTS: dict[str, Any] = {
     "max_concurrent_downloads": 3,
     "delete_archives_after_extraction": True,
 
+    # Worker concurrency settings (applied to running workers)
+    "max_concurrent_import_downloads": 2,
+    "max_telegram_transfers": 3,
+    "max_disk_io_jobs": 4,
+    "max_cpu_jobs": 2,
+
     # Telegram settings (High Priority)
     "telegram_rate_limit_rpm": 30,
     "telegram_channel_spacing": 2.0,
@@ -75,6 +81,34 @@ SETTINGS_METADATA: dict[str, dict[str, Any]] = {
         "description": "Delete archive files after successful extraction",
         "requires_restart": False,
     },
+    "max_concurrent_import_downloads": {
+        "type": "int",
+        "min": 1,
+        "max": 10,
+        "description": "Maximum concurrent import source download workers",
+        "requires_restart": False,
+    },
+    "max_telegram_transfers": {
+        "type": "int",
+        "min": 1,
+        "max": 10,
+        "description": "Maximum concurrent Telegram media transfers across all workers",
+        "requires_restart": False,
+    },
+    "max_disk_io_jobs": {
+        "type": "int",
+        "min": 1,
+        "max": 16,
+        "description": "Maximum concurrent disk-heavy jobs (downloads, extraction, library import)",
+        "requires_restart": False,
+    },
+    "max_cpu_jobs": {
+        "type": "int",
+        "min": 1,
+        "max": 16,
+        "description": "Maximum concurrent CPU-bound jobs (archive extraction, rendering)",
+        "requires_restart": False,
+    },
     "telegram_rate_limit_rpm": {
         "type": "int",
         "min": 10,
@@ -185,6 +219,15 @@ SETTINGS_METADATA: dict[str, dict[str, Any]] = {
     },
 }
 
+# Settings applied to the running WorkerManager when changed
+WORKER_CONCURRENCY_SETTINGS = {
+    "max_concurrent_downloads",
+    "max_concurrent_import_downloads",
+    "max_telegram_transfers",
+    "max_disk_io_jobs",
+    "max_cpu_jobs",
+}
+
 # Required variables for library_template validation
 LIBRARY_TEMPLATE_REQUIRED_VARS = ["{title}"]
 
@@ -304,6 +347,8 @@ class SettingsService:
             value_type=type(value).__name__,
         )
 
+        await self._apply_runtime_setting(key, value)
+
     async def get_all(self) -> dict[str, Any]:
         """Get all settings with defaults merged in.
 
@@ -346,6 +391,9 @@ class SettingsService:
 
         logger.info("settings_reset_to_defaults")
 
+        for key in WORKER_CONCURRENCY_SETTINGS:
+            await self._apply_runtime_setting(key, self._get_fallback(key))
+
         return dict(SETTINGS_DEFAULTS)
 
     async def delete(self, key: str) -> bool:
@@ -371,6 +419,8 @@ class SettingsService:
         self._cache.pop(key, None)
 
         logger.info("setting_deleted", key=key)
+
+        await self._apply_runtime_setting(key, self._get_fallback(key))
         return True
 
     # Convenience methods
@@ -424,6 +474,10 @@ class SettingsService:
         """Get fallback value from environment variables (#221)."""
         env_mapping = {
             "max_concurrent_downloads": env_settings.max_concurrent_downloads,
+            "max_concurrent_import_downloads": env_settings.max_concurrent_import_downloads,
+            "max_telegram_transfers": env_settings.max_telegram_transfers,
+            "max_disk_io_jobs": env_settings.max_disk_io_jobs,
+            "max_cpu_jobs": env_settings.max_cpu_jobs,
             "library_template": env_settings.library_template_global,
             "telegram_rate_limit_rpm": env_settings.telegram_rate_limit_rpm,
             "telegram_channel_spacing": env_settings.telegram_channel_spacing,
@@ -446,6 +500,24 @@ class SettingsService:
         }
         return env_mapping.get(key)
 
+    def _get_fallback(self, key: str) -> Any | None:
+        """Get the value a setting reverts to when not stored in the database."""
+        env_value = self._get_env_fallback(key)
+        if env_value is not None:
+            return env_value
+        return SETTINGS_DEFAULTS.get(key)
+
+    async def _apply_runtime_setting(self, key: str, value: Any) -> None:
+        """Push a changed setting to running services that honour it live.
+
+        Worker pool sizes and shared-resource caps are applied to the
+        WorkerManager immediately rather than on the next restart.
+        """
+        if key in WORKER_CONCURRENCY_SETTINGS and value is not None:
+            from app.workers.manager import apply_concurrency_setting
+
+            await apply_concurrency_setting(key, value)
+
     def _validate_setting(self, key: str, value: Any) -> None:
         """Validate a setting value using metadata (#221).
 
@@ -440,6 +440,7 @@ class SyncService:
         designs_created = 0
 
         # Fetch messages newer than last_id (min_id parameter)
+        batch = []
         async for message in telegram.client.iter_messages(
             entity,
             min_id=last_id,
@@ -448,45 +449,49 @@ class SyncService:
             if not self._running:
                 break
 
-            message_data = await telegram._parse_message(message)
+            batch.append(await telegram._parse_message(message))
 
-            # Ingest in a fresh session (session-per-operation)
+        if batch:
+            # Ingest the whole batch in one fresh session (session-per-operation)
             async with async_session_maker() as db:
                 # Re-fetch channel in this session
                 result = await db.execute(
                     select(Channel).where(Channel.id == channel.id)
                 )
                 db_channel = result.scalar_one_or_none()
-                if not db_channel:
-                    break
 
-                ingest = IngestService(db)
-                telegram_msg, design_created = await ingest.ingest_message(
-                    channel=db_channel,
-                    message_data=message_data,
-                )
-
-                if telegram_msg:
-                    messages_fetched += 1
-                    self._messages_processed += 1
-
-                    # Update last_ingested_message_id
-                    if message.id > (db_channel.last_ingested_message_id or 0):
-                        db_channel.last_ingested_message_id = message.id
-                        db_channel.last_sync_at = datetime.now(timezone.utc)
-
-                if design_created:
-                    designs_created += 1
-                    self._designs_created += 1
-
-                    # Check if auto-download is enabled
-                    if db_channel.download_mode in (
-                        DownloadMode.DOWNLOAD_ALL,
-                        DownloadMode.DOWNLOAD_ALL_NEW,
-                    ):
-                        await self._queue_download(db, telegram_msg)
-
-                await db.commit()
+                if db_channel:
+                    ingest = IngestService(db)
+                    results = await ingest.ingest_batch(db_channel, batch)
+
+                    for telegram_msg, design_created in results:
+                        if not telegram_msg:
+                            continue
+
+                        messages_fetched += 1
+                        self._messages_processed += 1
+
+                        # Update last_ingested_message_id
+                        if telegram_msg.telegram_message_id > (
+                            db_channel.last_ingested_message_id or 0
+                        ):
+                            db_channel.last_ingested_message_id = (
+                                telegram_msg.telegram_message_id
+                            )
+                            db_channel.last_sync_at = datetime.now(timezone.utc)
+
+                        if design_created:
+                            designs_created += 1
+                            self._designs_created += 1
+
+                            # Check if auto-download is enabled
+                            if db_channel.download_mode in (
+                                DownloadMode.DOWNLOAD_ALL,
+                                DownloadMode.DOWNLOAD_ALL_NEW,
+                            ):
+                                await self._queue_download(db, telegram_msg)
+
+                    await db.commit()
 
         # Always update last_sync_at when channel is successfully checked
         async with async_session_maker() as db:
@@ -26,6 +26,22 @@ TAG_CATEGORIES = {
 }
 
 
+# Incremented when the set of tags in use may have changed, so cached
+# vocabularies (see AiService._get_existing_tags) know to reload
+_vocabulary_generation = 0
+
+
+def tag_vocabulary_generation() -> int:
+    """Get the current tag vocabulary generation."""
+    return _vocabulary_generation
+
+
+def invalidate_tag_vocabulary() -> None:
+    """Mark cached tag vocabularies as stale."""
+    global _vocabulary_generation
+    _vocabulary_generation += 1
+
+
 class TagError(Exception):
     """Error during tag operations."""
     pass
@@ -81,6 +97,7 @@ class TagService:
         )
         self.db.add(tag)
         await self.db.flush()
+        invalidate_tag_vocabulary()
 
         logger.info(
             "tag_created",
@@ -195,6 +212,8 @@ class TagService:
         )
 
         await self.db.flush()
+        # May have been the tag's last use
+        invalidate_tag_vocabulary()
 
         logger.debug(
             "tag_removed_from_design",
@@ -364,6 +383,7 @@ class TagService:
         await self.db.flush()
 
         if created_count > 0:
+            invalidate_tag_vocabulary()
             logger.info(
                 "predefined_tags_seeded",
                 count=created_count,
@@ -0,0 +1,346 @@
+"""Streaming 3MF analysis for library imports.
+
+A 3MF file is a ZIP archive whose 3D/3dmodel.model entry holds the scene
+as XML. Slicer exports routinely put hundreds of megabytes of mesh data
+(<vertex>/<triangle> elements) in it, while everything multicolor
+detection needs - basematerials, color groups and object material
+references - is a handful of small elements.
+
+analyze_3mf streams the model entry through an expat parser with a target
+object instead of building an ElementTree, so no element objects are
+created at all. Everything inside <mesh> is skipped by depth counting,
+and parsing stops as soon as the file is known to be multicolor. Plate
+numbers, thumbnails and the <metadata> header are read in the same pass.
+
+analyze_3mf_files runs the analysis in a small process pool whose workers
+have an address-space cap (threemf_analysis_memory_mb), so a pathological
+file fails on its own instead of growing the import worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Common thumbnail paths inside 3MF files (in priority order)
+THREEMF_THUMBNAIL_PATHS = [
+    "Metadata/thumbnail.png",
+    "thumbnail.png",
+    "3D/Metadata/thumbnail.png",
+    "Metadata/thumbnail.jpg",
+    "thumbnail.jpg",
+]
+
+# Common locations of the model XML (in priority order)
+THREEMF_MODEL_PATHS = [
+    "3D/3dmodel.model",
+    "3dmodel.model",
+    "Metadata/model.model",
+]
+
+# Bytes of model XML fed to the parser at a time
+PARSE_CHUNK_SIZE = 1024 * 1024
+
+# Bambu/Orca per-plate files: Metadata/plate_1.png, plate_1.json, ...
+PLATE_ENTRY_PATTERN = re.compile(r"^Metadata/plate_(\d+)(?:_small)?\.(?:png|jpg|json|gcode)$")
+
+_executor: ProcessPoolExecutor | None = None
+
+
+@dataclass
+class ThreeMfAnalysis:
+    """What a single pass over a 3MF file found."""
+
+    colors: list[str] = field(default_factory=list)
+    materials: list[str] = field(default_factory=list)
+    metadata: dict[str, str] = field(default_factory=dict)
+    plates: list[int] = field(default_factory=list)
+    thumbnails: list[str] = field(default_factory=list)
+    thumbnail_name: str | None = None
+    thumbnail_data: bytes | None = None
+    # False when parsing stopped early because the answer was known
+    fully_parsed: bool = False
+    error: str | None = None
+
+    @property
+    def is_multicolor(self) -> bool:
+        """More than one color or material is defined."""
+        return len(self.colors) > 1 or len(self.materials) > 1
+
+    def details(self) -> dict[str, Any]:
+        """Summary in the shape MulticolorDetector.detect_from_3mf returns."""
+        return {
+            "colors": self.colors,
+            "materials": self.materials,
+            "color_count": len(self.colors),
+            "plates": self.plates,
+            "thumbnails": self.thumbnails,
+            "metadata": self.metadata,
+        }
+
+
+class _AnswerKnown(Exception):
+    """Raised from the parser target to stop parsing early."""
+
+
+class _ModelScanner:
+    """expat target collecting materials while skipping mesh data."""
+
+    def __init__(self, stop_when_multicolor: bool):
+        self.stop_when_multicolor = stop_when_multicolor
+        self.colors: set[str] = set()
+        self.materials: set[str] = set()
+        self.metadata: dict[str, str] = {}
+        self._mesh_depth = 0
+        self._text_target: tuple[str, str] | None = None  # (kind, key)
+        self._text: list[str] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if self._mesh_depth:
+            self._mesh_depth += 1
+            return
+
+        local = tag.rsplit("}", 1)[-1].lower()
+        if local == "mesh":
+            self._mesh_depth = 1
+            return
+
+        if local == "base":
+            color = attrib.get("displaycolor") or attrib.get("color")
+            if color:
+                self.colors.add(color)
+        elif local == "color":
+            color = attrib.get("color") or attrib.get("value")
+            if color:
+                self.colors.add(color)
+            else:
+                self._text_target = ("color", "")
+        elif local in ("object", "component"):
+            material_id = attrib.get("materialid") or attrib.get("pid")
+            if material_id:
+                self.materials.add(material_id)
+        elif local == "basematerials":
+            mat_id = attrib.get("id")
+            if mat_id:
+                self.materials.add(f"basematerials_{mat_id}")
+        elif local == "metadata" and attrib.get("name"):
+            self._text_target = ("metadata", attrib["name"])
+
+        self._text = []
+
+    def data(self, text: str) -> None:
+        if self._text_target is not None:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        if self._mesh_depth:
+            self._mesh_depth -= 1
+            return
+
+        if self._text_target is not None:
+            kind, key = self._text_target
+            value = "".join(self._text).strip()
+            if value:
+                if kind == "color":
+                    self.colors.add(value)
+                else:
+                    self.metadata[key] = value[:500]
+            self._text_target = None
+            self._text = []
+
+        if self.stop_when_multicolor and (len(self.colors) > 1 or len(self.materials) > 1):
+            raise _AnswerKnown
+
+    def close(self) -> None:
+        return None
+
+
+def find_model_entry(namelist: list[str]) -> str | None:
+    """Find the 3D model XML entry in a 3MF archive listing."""
+    names = set(namelist)
+    for candidate in THREEMF_MODEL_PATHS:
+        if candidate in names:
+            return candidate
+
+    # Fall back to any .model file
+    for name in namelist:
+        if name.endswith(".model"):
+            return name
+
+    return None
+
+
+def _pick_thumbnail(namelist: list[str]) -> str | None:
+    names = set(namelist)
+    for candidate in THREEMF_THUMBNAIL_PATHS:
+        if candidate in names:
+            return candidate
+    return None
+
+
+def analyze_3mf(
+    path: Path | str,
+    *,
+    stop_when_multicolor: bool = True,
+    read_thumbnail: bool = False,
+) -> ThreeMfAnalysis:
+    """Analyze a 3MF file in one streaming pass.
+
+    Args:
+        path: The 3MF file.
+        stop_when_multicolor: Stop parsing as soon as more than one color
+            or material has been seen.
+        read_thumbnail: Also return the bytes of the preferred thumbnail.
+
+    Returns:
+        ThreeMfAnalysis. Read or parse failures are reported in error
+        rather than raised.
+    """
+    result = ThreeMfAnalysis()
+    try:
+        with zipfile.ZipFile(path, "r") as zf:
+            namelist = zf.namelist()
+
+            result.thumbnails = [
+                name for name in namelist
+                if name.lower().endswith((".png", ".jpg", ".jpeg"))
+                and (name.startswith("Metadata/") or name in THREEMF_THUMBNAIL_PATHS)
+            ]
+            result.plates = sorted({
+                int(m.group(1)) for m in map(PLATE_ENTRY_PATTERN.match, namelist) if m
+            })
+
+            if read_thumbnail:
+                name = _pick_thumbnail(namelist)
+                candidates = [name] if name else []
+                candidates += [n for n in result.thumbnails if n.startswith("Metadata/")]
+                for candidate in candidates:
+                    data = zf.read(candidate)
+                    if data:
+                        result.thumbnail_name = candidate
+                        result.thumbnail_data = data
+                        break
+
+            model_entry = find_model_entry(namelist)
+            if model_entry is None:
+                result.fully_parsed = True
+                return result
+
+            scanner = _ModelScanner(stop_when_multicolor)
+            parser = ET.XMLParser(target=scanner)
+            try:
+                with zf.open(model_entry) as stream:
+                    while chunk := stream.read(PARSE_CHUNK_SIZE):
+                        parser.feed(chunk)
+                parser.close()
+                result.fully_parsed = True
+            except _AnswerKnown:
+                pass
+
+            result.colors = sorted(scanner.colors)
+            result.materials = sorted(scanner.materials)
+            result.metadata = scanner.metadata
+
+    except (zipfile.BadZipFile, ET.ParseError, OSError, MemoryError) as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def _limit_worker_memory(limit_bytes: int) -> None:
+    """Process pool initializer: cap the worker's address space."""
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+    except (ImportError, ValueError, OSError):
+        pass  # Not supported on this platform
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the shared analysis pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=max(1, min(settings.max_cpu_jobs, os.cpu_count() or 1)),
+            # Don't fork the running event loop and its threads
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_worker_memory,
+            initargs=(settings.threemf_analysis_memory_mb * 1024 * 1024,),
+        )
+    return _executor
+
+
+def shutdown_threemf_executor() -> None:
+    """Stop the analysis pool (application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def analyze_3mf_files(
+    paths: list[Path],
+    *,
+    stop_when_multicolor: bool = True,
+    read_thumbnail: bool = False,
+) -> dict[Path, ThreeMfAnalysis]:
+    """Analyze several 3MF files in the memory-capped process pool.
+
+    Args:
+        paths: 3MF files to analyze.
+        stop_when_multicolor: See analyze_3mf.
+        read_thumbnail: See analyze_3mf.
+
+    Returns:
+        Analysis per path. A file whose worker died gets an analysis with
+        error set.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _analyze(path: Path) -> ThreeMfAnalysis:
+        try:
+            analysis = await loop.run_in_executor(
+                _get_executor(),
+                _analyze_in_worker,
+                str(path),
+                stop_when_multicolor,
+                read_thumbnail,
+            )
+        except BrokenProcessPool as e:
+            # Most likely killed for exceeding the memory cap
+            shutdown_threemf_executor()
+            analysis = ThreeMfAnalysis(error=f"analysis worker died: {e}")
+
+        if analysis.error:
+            logger.warning("3mf_analysis_failed", file=str(path), error=analysis.error)
+        return analysis
+
+    analyses = await asyncio.gather(*(_analyze(path) for path in paths))
+    return dict(zip(paths, analyses, strict=True))
+
+
+def _analyze_in_worker(
+    path: str,
+    stop_when_multicolor: bool,
+    read_thumbnail: bool,
+) -> ThreeMfAnalysis:
+    return analyze_3mf(
+        path,
+        stop_when_multicolor=stop_when_multicolor,
+        read_thumbnail=read_thumbnail,
+    )
@@ -2,18 +2,33 @@
 
 Provides:
 - File upload to staging directory
+- Resumable chunked uploads
 - Archive extraction
 - Design detection and creation
 - Upload cleanup
+
+Uploads are streamed to staging in chunks: the size limit is enforced as
+bytes arrive and the SHA-256 is computed in the same pass, so no upload is
+ever held in memory as a whole.
+
+Resumable uploads follow the tus protocol's offset model: a session is
+created with the final size, each PATCH appends at the current offset, and
+after a dropped connection the client asks for the offset and continues
+from there. The file on disk is the source of truth for the offset.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import os
 import shutil
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import aiofiles
 import aiofiles.os
@@ -38,6 +53,7 @@ from app.schemas.upload import (
     ProcessUploadResponse,
     UploadInfo,
     UploadResponse,
+    UploadSessionResponse,
     UploadStatus,
 )
 from app.services.archive import ArchiveExtractor
@@ -46,7 +62,7 @@ from app.services.import_profile import ImportProfileService
 from app.services.job_queue import JobQueueService
 from app.services.preview import PreviewService
 from app.services.settings import SettingsService
-from app.utils import compute_file_hash
+from app.utils import compute_file_hash, remember_file_hash
 
 # Model file extensions for classification
 MODEL_EXTENSIONS = {
@@ -68,6 +84,16 @@ logger = get_logger(__name__)
 # Metadata file for tracking upload state
 UPLOAD_META_FILE = ".upload_meta.json"
 
+# Bytes read from the request and written to staging at a time
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Running SHA-256 of resumable uploads: upload ID -> (offset, hasher).
+# Lost on restart, in which case the received part is re-hashed once.
+_session_hashes: dict[str, tuple[int, Any]] = {}
+
+# One append at a time per resumable upload
+_session_locks: dict[str, asyncio.Lock] = {}
+
 
 class UploadError(Exception):
     """Base exception for upload errors."""
@@ -93,6 +119,62 @@ class UploadProcessingError(UploadError):
     pass
 
 
+class UploadOffsetError(UploadError):
+    """Raised when a resumable upload chunk doesn't start at the current offset."""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(message)
+        self.offset = offset
+
+
+async def _iter_chunks(
+    content: bytes | BinaryIO | AsyncIterable[bytes] | Any,
+) -> AsyncIterator[bytes]:
+    """Yield upload content in chunks of at most UPLOAD_CHUNK_SIZE.
+
+    Args:
+        content: Bytes, a file-like object with a sync or async read()
+            (such as FastAPI's UploadFile), or an async iterable of bytes
+            (such as Request.stream()).
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), UPLOAD_CHUNK_SIZE):
+            yield bytes(view[start:start + UPLOAD_CHUNK_SIZE])
+        return
+
+    read = getattr(content, "read", None)
+    if read is not None and inspect.iscoroutinefunction(read):
+        while chunk := await read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    elif read is not None:
+        while chunk := read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    else:
+        async for chunk in content:
+            if chunk:
+                yield chunk
+
+
+def _write_chunk(f: BinaryIO, hasher: Any, chunk: bytes) -> None:
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _hash_prefix(path: Path, length: int) -> Any:
+    """SHA-256 state after the first length bytes of a file."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher
+
+
 class UploadService:
     """Service for managing file uploads.
 
@@ -117,15 +199,23 @@ class UploadService:
     async def create_upload(
         self,
         filename: str,
-        file_content: BinaryIO | bytes,
+        file_content: bytes | BinaryIO | AsyncIterable[bytes] | Any,
         content_type: str | None = None,
+        size: int | None = None,
     ) -> UploadResponse:
         """Create a new upload from file content.
 
+        The content is streamed to staging; the size limit is checked as it
+        arrives and the SHA-256 is computed on the way.
+
         Args:
             filename: Original filename.
-            file_content: File content (file-like object or bytes).
+            file_content: File content: bytes, a file-like object with a sync
+                or async read() (e.g. FastAPI UploadFile), or an async
+                iterable of chunks.
             content_type: Optional MIME type.
+            size: Size announced by the client, if known. Lets oversized
+                files be rejected before anything is written.
 
         Returns:
             UploadResponse with upload details.
@@ -133,11 +223,12 @@ class UploadService:
         Raises:
             UploadValidationError: If file is invalid.
         """
-        # Validate extension
-        ext = Path(filename).suffix.lower()
-        if ext not in settings.upload_allowed_extensions:
+        filename = Path(filename).name  # Never write outside the upload dir
+        self._validate_extension(filename)
+        max_size_mb, max_size_bytes = await self._get_max_size()
+        if size is not None and size > max_size_bytes:
             raise UploadValidationError(
-                f"File type '{ext}' not allowed. Allowed: {settings.upload_allowed_extensions}"
+                f"File size ({size / 1024 / 1024:.1f}MB) exceeds maximum ({max_size_mb}MB)"
             )
 
         # Generate upload ID and paths
@@ -146,37 +237,29 @@ class UploadService:
         await aiofiles.os.makedirs(upload_dir, exist_ok=True)
 
         file_path = upload_dir / filename
+        hasher = hashlib.sha256()
 
-        # Write file to staging
-        if isinstance(file_content, bytes):
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
-        else:
-            # File-like object (from FastAPI UploadFile)
-            async with aiofiles.open(file_path, "wb") as f:
-                while chunk := file_content.read(1024 * 1024):  # 1MB chunks
-                    await f.write(chunk)
-
-        # Get file size
-        stat = await aiofiles.os.stat(file_path)
-        size = stat.st_size
-
-        # Validate size - use runtime settings from database
-        settings_service = SettingsService(self.db)
-        all_settings = await settings_service.get_all()
-        max_size_mb = all_settings.get("upload_max_size_mb", settings.upload_max_size_mb)
-        max_size_bytes = max_size_mb * 1024 * 1024
-        if size > max_size_bytes:
-            # Cleanup and raise error
+        try:
+            size = await self._stream_to_file(
+                file_path, _iter_chunks(file_content), hasher, max_size_bytes
+            )
+        except UploadValidationError:
             await self._cleanup_upload(upload_id)
             raise UploadValidationError(
-                f"File size ({size / 1024 / 1024:.1f}MB) exceeds maximum ({max_size_mb}MB)"
-            )
+                f"File size exceeds maximum ({max_size_mb}MB)"
+            ) from None
+        except BaseException:
+            await self._cleanup_upload(upload_id)
+            raise
+
+        sha256 = hasher.hexdigest()
+        remember_file_hash(file_path, sha256)
 
         # Save metadata
         await self._save_meta(upload_id, {
             "filename": filename,
             "size": size,
+            "sha256": sha256,
             "mime_type": content_type,
             "status": UploadStatus.PENDING.value,
             "created_at": datetime.now(timezone.utc).isoformat(),
@@ -194,6 +277,191 @@ class UploadService:
             filename=filename,
             size=size,
             status=UploadStatus.PENDING,
+            sha256=sha256,
+        )
+
+    # ========== Resumable Uploads ==========
+
+    async def create_upload_session(
+        self,
+        filename: str,
+        size: int,
+        content_type: str | None = None,
+    ) -> UploadSessionResponse:
+        """Start a resumable upload.
+
+        Args:
+            filename: Original filename.
+            size: Total size of the file in bytes.
+            content_type: Optional MIME type.
+
+        Returns:
+            UploadSessionResponse at offset 0.
+
+        Raises:
+            UploadValidationError: If the file type or size is not allowed.
+        """
+        filename = Path(filename).name  # Never write outside the upload dir
+        self._validate_extension(filename)
+        max_size_mb, max_size_bytes = await self._get_max_size()
+        if size > max_size_bytes:
+            raise UploadValidationError(
+                f"File size ({size / 1024 / 1024:.1f}MB) exceeds maximum ({max_size_mb}MB)"
+            )
+
+        upload_id = str(uuid.uuid4())
+        upload_dir = self._staging_path / upload_id
+        await aiofiles.os.makedirs(upload_dir, exist_ok=True)
+        async with aiofiles.open(upload_dir / filename, "wb"):
+            pass
+
+        await self._save_meta(upload_id, {
+            "filename": filename,
+            "size": size,
+            "mime_type": content_type,
+            "status": UploadStatus.UPLOADING.value,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+        logger.info(
+            "upload_session_created",
+            upload_id=upload_id,
+            filename=filename,
+            size=size,
+        )
+
+        return UploadSessionResponse(
+            upload_id=upload_id,
+            filename=filename,
+            offset=0,
+            size=size,
+            status=UploadStatus.UPLOADING,
+        )
+
+    async def get_upload_session(self, upload_id: str) -> UploadSessionResponse:
+        """Get the current offset of a resumable upload.
+
+        Raises:
+            UploadNotFoundError: If upload not found.
+        """
+        meta = await self._load_meta(upload_id)
+        if not meta:
+            raise UploadNotFoundError(f"Upload {upload_id} not found")
+
+        file_path = self._staging_path / upload_id / meta["filename"]
+        offset = file_path.stat().st_size if file_path.exists() else 0
+        return UploadSessionResponse(
+            upload_id=upload_id,
+            filename=meta["filename"],
+            offset=offset,
+            size=meta["size"],
+            status=UploadStatus(meta["status"]),
+            sha256=meta.get("sha256"),
+        )
+
+    async def append_upload_chunk(
+        self,
+        upload_id: str,
+        offset: int,
+        content: bytes | BinaryIO | AsyncIterable[bytes] | Any,
+    ) -> UploadSessionResponse:
+        """Append data to a resumable upload.
+
+        Whatever arrives before the connection drops is kept, so the client
+        can ask for the offset and continue from there.
+
+        Args:
+            upload_id: Upload ID.
+            offset: Offset the client believes the data starts at.
+            content: The data (see create_upload).
+
+        Returns:
+            UploadSessionResponse with the new offset. The status becomes
+            PENDING once the declared size has been received.
+
+        Raises:
+            UploadNotFoundError: If upload not found.
+            UploadOffsetError: If offset isn't the current offset, or
+                another append to this upload is in progress.
+            UploadValidationError: If the data runs past the declared size.
+        """
+        meta = await self._load_meta(upload_id)
+        if not meta:
+            raise UploadNotFoundError(f"Upload {upload_id} not found")
+
+        file_path = self._staging_path / upload_id / meta["filename"]
+        lock = _session_locks.setdefault(upload_id, asyncio.Lock())
+        if lock.locked():
+            current = file_path.stat().st_size if file_path.exists() else 0
+            raise UploadOffsetError(f"Upload {upload_id} is already receiving data", current)
+
+        async with lock:
+            if meta["status"] != UploadStatus.UPLOADING.value:
+                raise UploadOffsetError(
+                    f"Upload {upload_id} is not accepting data (status: {meta['status']})",
+                    meta["size"],
+                )
+
+            current = file_path.stat().st_size if file_path.exists() else 0
+            if offset != current:
+                raise UploadOffsetError(
+                    f"Offset {offset} does not match upload offset {current}", current
+                )
+
+            cached = _session_hashes.get(upload_id)
+            if cached is not None and cached[0] == current:
+                hasher = cached[1]
+            else:
+                hasher = await asyncio.to_thread(_hash_prefix, file_path, current)
+
+            # The cached hash is only reused if it covers exactly the bytes
+            # on disk, which a failed write can't guarantee
+            hash_valid = True
+            try:
+                await self._stream_to_file(
+                    file_path,
+                    _iter_chunks(content),
+                    hasher,
+                    meta["size"] - current,
+                    append=True,
+                )
+            except UploadValidationError:
+                raise UploadValidationError(
+                    f"Data exceeds the declared upload size ({meta['size']} bytes)"
+                ) from None
+            except OSError:
+                hash_valid = False
+                raise
+            finally:
+                written = file_path.stat().st_size if file_path.exists() else 0
+                if hash_valid:
+                    _session_hashes[upload_id] = (written, hasher)
+                else:
+                    _session_hashes.pop(upload_id, None)
+
+            if written == meta["size"]:
+                meta["status"] = UploadStatus.PENDING.value
+                meta["sha256"] = hasher.hexdigest()
+                remember_file_hash(file_path, meta["sha256"])
+                await self._save_meta(upload_id, meta)
+                _session_hashes.pop(upload_id, None)
+                logger.info(
+                    "upload_session_completed",
+                    upload_id=upload_id,
+                    filename=meta["filename"],
+                    size=written,
+                )
+
+        if meta["status"] != UploadStatus.UPLOADING.value:
+            _session_locks.pop(upload_id, None)
+
+        return UploadSessionResponse(
+            upload_id=upload_id,
+            filename=meta["filename"],
+            offset=written,
+            size=meta["size"],
+            status=UploadStatus(meta["status"]),
+            sha256=meta.get("sha256"),
         )
 
     async def get_upload(self, upload_id: str) -> UploadInfo:
@@ -216,6 +484,7 @@ class UploadService:
             id=upload_id,
             filename=meta["filename"],
             size=meta["size"],
+            sha256=meta.get("sha256"),
             mime_type=meta.get("mime_type"),
             status=UploadStatus(meta["status"]),
             error_message=meta.get("error_message"),
@@ -297,6 +566,8 @@ class UploadService:
         if not meta:
             raise UploadNotFoundError(f"Upload {upload_id} not found")
 
+        if meta["status"] == UploadStatus.UPLOADING.value:
+            raise UploadProcessingError(f"Upload {upload_id} is still receiving data")
         if meta["status"] != UploadStatus.PENDING.value:
             raise UploadProcessingError(
                 f"Upload {upload_id} already processed (status: {meta['status']})"
@@ -340,7 +611,12 @@ class UploadService:
             else:
                 # Single model file
                 await aiofiles.os.makedirs(extracted_dir, exist_ok=True)
-                shutil.copy2(file_path, extracted_dir / filename)
+                # Hardlink where possible: same inode, so the hash computed
+                # while receiving the upload is reused below
+                try:
+                    os.link(file_path, extracted_dir / filename)
+                except OSError:
+                    shutil.copy2(file_path, extracted_dir / filename)
                 files_extracted = 1
                 model_files = 1
                 detected_title = Path(filename).stem
@@ -558,6 +834,7 @@ class UploadService:
 
                 created_at = datetime.fromisoformat(meta["created_at"])
                 if created_at < cutoff and meta["status"] in [
+                    UploadStatus.UPLOADING.value,
                     UploadStatus.PENDING.value,
                     UploadStatus.FAILED.value,
                 ]:
@@ -578,6 +855,60 @@ class UploadService:
 
     # ========== Private Helpers ==========
 
+    def _validate_extension(self, filename: str) -> None:
+        """Reject file types that can't be imported."""
+        ext = Path(filename).suffix.lower()
+        if ext not in settings.upload_allowed_extensions:
+            raise UploadValidationError(
+                f"File type '{ext}' not allowed. Allowed: {settings.upload_allowed_extensions}"
+            )
+
+    async def _get_max_size(self) -> tuple[int, int]:
+        """Get the upload size limit (runtime setting) as (MB, bytes)."""
+        settings_service = SettingsService(self.db)
+        all_settings = await settings_service.get_all()
+        max_size_mb = all_settings.get("upload_max_size_mb", settings.upload_max_size_mb)
+        return max_size_mb, max_size_mb * 1024 * 1024
+
+    async def _stream_to_file(
+        self,
+        path: Path,
+        chunks: AsyncIterator[bytes],
+        hasher: Any,
+        max_bytes: int,
+        append: bool = False,
+    ) -> int:
+        """Write chunks to a file, hashing them on the way.
+
+        Each chunk is written and hashed in one worker thread hop, so the
+        event loop never touches the data.
+
+        Args:
+            path: Destination file.
+            chunks: Data to write.
+            hasher: hashlib object updated with every written chunk.
+            max_bytes: Maximum number of bytes to accept.
+            append: Append to the file instead of replacing it.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            UploadValidationError: If more than max_bytes arrive. Data up to
+                the limit has been written.
+        """
+        written = 0
+        f = await asyncio.to_thread(open, path, "ab" if append else "wb")
+        try:
+            async for chunk in chunks:
+                if written + len(chunk) > max_bytes:
+                    raise UploadValidationError("Upload exceeds size limit")
+                await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+                written += len(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+        return written
+
     async def _save_meta(self, upload_id: str, meta: dict) -> None:
         """Save upload metadata to file."""
         import json
@@ -603,6 +934,8 @@ class UploadService:
 
     async def _cleanup_upload(self, upload_id: str) -> None:
         """Remove upload directory and all files."""
+        _session_hashes.pop(upload_id, None)
+        _session_locks.pop(upload_id, None)
         upload_dir = self._staging_path / upload_id
         if upload_dir.exists():
             shutil.rmtree(upload_dir)
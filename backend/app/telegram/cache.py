@@ -0,0 +1,222 @@
+"""Process-wide cache of Telegram channel entities and messages.
+
+Download and image jobs need the Message object for every attachment they
+fetch. Resolving the channel and fetching each message separately costs
+two round trips per attachment. A 40-part split archive would spend 80
+requests against the rate limiter before any bytes move.
+
+TelegramCache keeps:
+- Resolved input entities per channel. They don't expire for an account,
+  so they're kept until logout.
+- Recently fetched messages, for a short time. Their file references
+  expire; callers that hit FILE_REFERENCE_EXPIRED call refresh_message()
+  to get a fresh copy and retry.
+
+get_messages() fetches every missing ID of a channel in one batched
+request. Concurrent callers asking for the same message share one fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from app.core.logging import get_logger
+from app.telegram.rate_limiter import rate_limited
+
+if TYPE_CHECKING:
+    from telethon import TelegramClient
+    from telethon.types import Message
+
+logger = get_logger(__name__)
+
+# Seconds a fetched message (and its file references) is reused
+MESSAGE_TTL_SECONDS = 600
+
+# Bounds on cached entries (least recently used are dropped)
+MAX_CACHED_ENTITIES = 1024
+MAX_CACHED_MESSAGES = 2048
+
+# Message IDs per messages.getMessages / channels.getMessages request
+MESSAGES_PER_REQUEST = 100
+
+
+class TelegramCache:
+    """Cache of input entities and recent messages, shared across workers."""
+
+    _instance: TelegramCache | None = None
+
+    def __init__(self) -> None:
+        self._entities: OrderedDict[int, Any] = OrderedDict()
+        self._messages: OrderedDict[tuple[int, int], tuple[float, Message | None]] = OrderedDict()
+        self._inflight: dict[tuple[int, int], asyncio.Future[Message | None]] = {}
+        self._entity_lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls) -> TelegramCache:
+        """Get the singleton cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drop everything (on logout, or between tests)."""
+        cls._instance = None
+
+    async def get_input_entity(self, client: TelegramClient, peer_id: int) -> Any:
+        """Resolve a channel to its input entity, once per process.
+
+        Args:
+            client: Connected Telethon client.
+            peer_id: Channel peer ID.
+
+        Returns:
+            Input peer usable in requests.
+        """
+        entity = self._entities.get(peer_id)
+        if entity is not None:
+            self._entities.move_to_end(peer_id)
+            return entity
+
+        async with self._entity_lock:
+            entity = self._entities.get(peer_id)
+            if entity is None:
+                entity = await self._resolve_entity(client, peer_id)
+                self._entities[peer_id] = entity
+                while len(self._entities) > MAX_CACHED_ENTITIES:
+                    self._entities.popitem(last=False)
+            return entity
+
+    async def get_message(
+        self, client: TelegramClient, peer_id: int, message_id: int
+    ) -> Message | None:
+        """Get one message, from cache if still fresh.
+
+        Args:
+            client: Connected Telethon client.
+            peer_id: Channel peer ID.
+            message_id: Telegram message ID.
+
+        Returns:
+            The message, or None if it doesn't exist.
+        """
+        messages = await self.get_messages(client, peer_id, [message_id])
+        return messages[message_id]
+
+    async def get_messages(
+        self, client: TelegramClient, peer_id: int, message_ids: list[int]
+    ) -> dict[int, Message | None]:
+        """Get several messages of a channel with at most one request per 100 IDs.
+
+        Args:
+            client: Connected Telethon client.
+            peer_id: Channel peer ID.
+            message_ids: Telegram message IDs.
+
+        Returns:
+            Dict of message ID to message (None for deleted/missing ones).
+        """
+        now = time.monotonic()
+        found: dict[int, Message | None] = {}
+        waiting: dict[int, asyncio.Future[Message | None]] = {}
+        to_fetch: list[int] = []
+
+        for message_id in dict.fromkeys(message_ids):
+            key = (peer_id, message_id)
+            cached = self._messages.get(key)
+            if cached is not None and now - cached[0] < MESSAGE_TTL_SECONDS:
+                found[message_id] = cached[1]
+            elif key in self._inflight:
+                waiting[message_id] = self._inflight[key]
+            else:
+                to_fetch.append(message_id)
+
+        if to_fetch:
+            loop = asyncio.get_running_loop()
+            futures = {}
+            for message_id in to_fetch:
+                futures[message_id] = self._inflight[(peer_id, message_id)] = loop.create_future()
+            try:
+                fetched = await self._fetch_messages(client, peer_id, to_fetch)
+            except asyncio.CancelledError:
+                for future in futures.values():
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                    # Mark retrieved: waiters may not exist
+                    future.exception()
+                raise
+            finally:
+                for message_id in to_fetch:
+                    self._inflight.pop((peer_id, message_id), None)
+
+            for message_id in to_fetch:
+                message = fetched.get(message_id)
+                self._store(peer_id, message_id, message)
+                futures[message_id].set_result(message)
+                found[message_id] = message
+
+        for message_id, future in waiting.items():
+            found[message_id] = await asyncio.shield(future)
+
+        return found
+
+    async def refresh_message(
+        self, client: TelegramClient, peer_id: int, message_id: int
+    ) -> Message | None:
+        """Refetch a message whose file reference has expired.
+
+        Args:
+            client: Connected Telethon client.
+            peer_id: Channel peer ID.
+            message_id: Telegram message ID.
+
+        Returns:
+            The refreshed message, or None if it no longer exists.
+        """
+        self._messages.pop((peer_id, message_id), None)
+        logger.info("telegram_message_refreshed", peer_id=peer_id, message_id=message_id)
+        return await self.get_message(client, peer_id, message_id)
+
+    def _store(self, peer_id: int, message_id: int, message: Message | None) -> None:
+        key = (peer_id, message_id)
+        self._messages[key] = (time.monotonic(), message)
+        self._messages.move_to_end(key)
+        while len(self._messages) > MAX_CACHED_MESSAGES:
+            self._messages.popitem(last=False)
+
+    async def _fetch_messages(
+        self, client: TelegramClient, peer_id: int, message_ids: list[int]
+    ) -> dict[int, Message | None]:
+        entity = await self.get_input_entity(client, peer_id)
+        fetched: dict[int, Message | None] = {}
+        for start in range(0, len(message_ids), MESSAGES_PER_REQUEST):
+            batch = message_ids[start:start + MESSAGES_PER_REQUEST]
+            messages = await self._get_messages_request(client, entity, batch)
+            for message_id, message in zip(batch, messages, strict=True):
+                fetched[message_id] = message
+
+        logger.debug(
+            "telegram_messages_fetched",
+            peer_id=peer_id,
+            requested=len(message_ids),
+        )
+        return fetched
+
+    @staticmethod
+    @rate_limited()
+    async def _resolve_entity(client: TelegramClient, peer_id: int) -> Any:
+        return await client.get_input_entity(peer_id)
+
+    @staticmethod
+    @rate_limited()
+    async def _get_messages_request(
+        client: TelegramClient, entity: Any, message_ids: list[int]
+    ) -> list[Message | None]:
+        # With a list of IDs Telethon returns one entry per ID, None for missing
+        return list(await client.get_messages(entity, ids=message_ids))
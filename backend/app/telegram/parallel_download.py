@@ -0,0 +1,463 @@
+"""Parallel multi-connection downloads of large Telegram documents.
+
+Telethon's download_media requests one part at a time over a single
+connection, so a large archive downloads at single-connection MTProto
+speed. ParallelDownloader opens several senders to the document's DC and
+keeps one upload.getFile request in flight on each ("fast download"):
+
+- Parts are written at their offsets into a preallocated hidden ".part"
+  file next to the destination.
+- Completed parts are recorded in a bitmap persisted beside the partial
+  file, so a download interrupted by a restart only fetches what's missing.
+- The SHA-256 is computed in file order as the contiguous prefix
+  completes (parts that finish early wait in memory, parts from an earlier
+  run are read back), so the finished file is never read again.
+- A process-wide BandwidthBudget caps the combined rate of all parallel
+  downloads (settings.telegram_download_bandwidth_mbps).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.telegram.exceptions import TelegramError, TelegramRateLimitError
+from app.utils import remember_file_hash
+
+if TYPE_CHECKING:
+    from telethon import TelegramClient
+    from telethon.network import MTProtoSender
+
+logger = get_logger(__name__)
+
+# Bytes per upload.getFile request (the largest limit Telegram accepts)
+PART_SIZE = 512 * 1024
+
+# Documents smaller than this use Telethon's single-stream download
+PARALLEL_DOWNLOAD_MIN_SIZE = 20 * 1024 * 1024
+
+# Per-part request timeout and attempts before the download fails
+PART_TIMEOUT_SECONDS = 60
+PART_MAX_ATTEMPTS = 3
+
+# Seconds between persisting the part bitmap
+STATE_SAVE_INTERVAL = 2.0
+
+# Out-of-order parts kept in memory for hashing; later ones are read back
+HASH_WINDOW_PARTS = 64
+
+FetchPart = Callable[[int, int], Awaitable[bytes]]
+
+
+class ParallelDownloadError(TelegramError):
+    """Raised when a parallel download can't be completed."""
+
+    def __init__(self, message: str):
+        super().__init__(message, "PARALLEL_DOWNLOAD_FAILED")
+
+
+def partial_download_paths(dest_dir: Path, document_id: int) -> tuple[Path, Path]:
+    """Paths of the in-progress file and its part bitmap for a document.
+
+    Keyed by document ID rather than filename, so a restarted download
+    finds its partial file even if the destination name changed.
+
+    Args:
+        dest_dir: Directory the document is downloaded into.
+        document_id: Telegram document ID.
+
+    Returns:
+        (partial file, bitmap state file) tuple.
+    """
+    part_path = dest_dir / f".tg-{document_id}.part"
+    return part_path, part_path.with_name(part_path.name + ".json")
+
+
+class PartBitmap:
+    """Which parts of a download are complete."""
+
+    def __init__(self, total_parts: int, bits: bytearray | None = None):
+        self.total_parts = total_parts
+        self._bits = bits if bits is not None else bytearray((total_parts + 7) // 8)
+
+    def mark(self, index: int) -> None:
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def is_done(self, index: int) -> bool:
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def missing(self) -> list[int]:
+        return [i for i in range(self.total_parts) if not self.is_done(i)]
+
+    def done_count(self) -> int:
+        return self.total_parts - len(self.missing())
+
+    @classmethod
+    def load(cls, state_path: Path, key: str, size: int, part_size: int) -> PartBitmap | None:
+        """Load a persisted bitmap if it belongs to this exact download.
+
+        Returns:
+            The bitmap, or None if missing, unreadable or for other content.
+        """
+        try:
+            state = json.loads(state_path.read_text())
+            if (state["key"], state["size"], state["part_size"]) != (key, size, part_size):
+                return None
+            bits = bytearray(base64.b64decode(state["done"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        total_parts = -(-size // part_size)
+        if len(bits) != (total_parts + 7) // 8:
+            return None
+        return cls(total_parts, bits)
+
+    def save(self, state_path: Path, key: str, size: int, part_size: int) -> None:
+        """Persist the bitmap atomically."""
+        state = {
+            "key": key,
+            "size": size,
+            "part_size": part_size,
+            "done": base64.b64encode(bytes(self._bits)).decode(),
+        }
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, state_path)
+
+
+class BandwidthBudget:
+    """Token bucket shared by all parallel downloads in the process.
+
+    The rate is read from settings on every call, so changes apply to
+    downloads already running. Up to one second of budget can burst.
+    """
+
+    _instance: BandwidthBudget | None = None
+
+    def __init__(self, rate_mbps: float | None = None):
+        """Initialize the budget.
+
+        Args:
+            rate_mbps: Fixed rate in Mbit/s (default: follow settings).
+        """
+        self._rate_mbps = rate_mbps
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def get_instance(cls) -> BandwidthBudget:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def bytes_per_second(self) -> float:
+        mbps = self._rate_mbps if self._rate_mbps is not None else settings.telegram_download_bandwidth_mbps
+        return mbps * 125_000
+
+    async def consume(self, nbytes: int) -> None:
+        """Wait until nbytes may be transferred.
+
+        Callers take the bytes up front and sleep off any debt, so
+        concurrent callers are paced one after another.
+        """
+        rate = self.bytes_per_second
+        if rate <= 0:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(rate, self._tokens + (now - self._last) * rate)
+            self._last = now
+            self._tokens -= nbytes
+            delay = -self._tokens / rate if self._tokens < 0 else 0.0
+
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def download_parts(
+    fetchers: list[FetchPart],
+    size: int,
+    part_path: Path,
+    state_path: Path,
+    key: str,
+    *,
+    part_size: int = PART_SIZE,
+    budget: BandwidthBudget | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> str:
+    """Fetch a file's parts concurrently into a preallocated partial file.
+
+    Each fetcher is one connection and has at most one request in flight.
+    Resumes from the persisted bitmap when it matches key/size/part_size.
+    On failure the partial file and bitmap are kept for the next attempt.
+
+    Args:
+        fetchers: Callables returning ``limit`` bytes at ``offset``.
+        size: Total file size in bytes.
+        part_path: Partial file to write into.
+        state_path: Where the part bitmap is persisted.
+        key: Identifies the content (a changed key discards old parts).
+        part_size: Bytes per part request.
+        budget: Optional shared bandwidth limit.
+        progress_callback: Called with (bytes_done, size).
+
+    Returns:
+        Hex SHA-256 of the complete file.
+
+    Raises:
+        ParallelDownloadError: If a part can't be fetched.
+        TelegramRateLimitError: If Telegram asks to wait (flood wait).
+    """
+    total_parts = -(-size // part_size)
+    bitmap = None
+    if part_path.exists():
+        bitmap = PartBitmap.load(state_path, key, size, part_size)
+    if bitmap is None:
+        bitmap = PartBitmap(total_parts)
+        part_path.unlink(missing_ok=True)
+
+    def part_length(index: int) -> int:
+        return min(part_size, size - index * part_size)
+
+    queue = deque(bitmap.missing())
+    done_bytes = sum(part_length(i) for i in range(total_parts) if bitmap.is_done(i))
+    pending: dict[int, bytes] = {}
+    completed = asyncio.Condition()
+    last_save = time.monotonic()
+
+    if queue and done_bytes:
+        logger.info(
+            "parallel_download_resuming",
+            part_path=str(part_path),
+            parts_done=total_parts - len(queue),
+            total_parts=total_parts,
+        )
+
+    fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        os.ftruncate(fd, size)
+
+        async def hash_in_order() -> str:
+            hasher = hashlib.sha256()
+            for index in range(total_parts):
+                async with completed:
+                    await completed.wait_for(lambda index=index: bitmap.is_done(index))
+                data = pending.pop(index, None)
+                if data is None:
+                    data = await asyncio.to_thread(
+                        os.pread, fd, part_length(index), index * part_size
+                    )
+                await asyncio.to_thread(hasher.update, data)
+            return hasher.hexdigest()
+
+        async def fetch_with_retry(fetch: FetchPart, offset: int) -> bytes:
+            for attempt in range(1, PART_MAX_ATTEMPTS + 1):
+                try:
+                    return await asyncio.wait_for(
+                        fetch(offset, part_size), timeout=PART_TIMEOUT_SECONDS
+                    )
+                except (TimeoutError, ConnectionError) as e:
+                    if attempt == PART_MAX_ATTEMPTS:
+                        raise ParallelDownloadError(
+                            f"Part at offset {offset} failed after {attempt} attempts: {e!r}"
+                        ) from e
+                    await asyncio.sleep(attempt)
+            raise AssertionError("unreachable")
+
+        async def run_connection(fetch: FetchPart) -> None:
+            nonlocal done_bytes, last_save
+            while queue:
+                index = queue.popleft()
+                offset = index * part_size
+                length = part_length(index)
+                if budget:
+                    await budget.consume(length)
+
+                data = await fetch_with_retry(fetch, offset)
+                if len(data) != length:
+                    raise ParallelDownloadError(
+                        f"Part at offset {offset} returned {len(data)} bytes, expected {length}"
+                    )
+                await asyncio.to_thread(os.pwrite, fd, data, offset)
+
+                bitmap.mark(index)
+                if len(pending) < HASH_WINDOW_PARTS:
+                    pending[index] = data
+                done_bytes += length
+                async with completed:
+                    completed.notify_all()
+
+                if progress_callback:
+                    progress_callback(done_bytes, size)
+                if time.monotonic() - last_save >= STATE_SAVE_INTERVAL:
+                    last_save = time.monotonic()
+                    await asyncio.to_thread(bitmap.save, state_path, key, size, part_size)
+
+        hasher_task = asyncio.create_task(hash_in_order())
+        connections = [asyncio.create_task(run_connection(f)) for f in fetchers]
+        try:
+            await asyncio.gather(*connections)
+            digest = await hasher_task
+        except BaseException:
+            for task in (*connections, hasher_task):
+                task.cancel()
+            await asyncio.gather(*connections, hasher_task, return_exceptions=True)
+            await asyncio.to_thread(bitmap.save, state_path, key, size, part_size)
+            raise
+    finally:
+        os.close(fd)
+
+    state_path.unlink(missing_ok=True)
+    return digest
+
+
+class ParallelDownloader:
+    """Downloads a Telegram document over several connections at once."""
+
+    def __init__(
+        self,
+        client: TelegramClient,
+        connections: int | None = None,
+        budget: BandwidthBudget | None = None,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            client: Connected, authorized Telethon client.
+            connections: Senders to open (default from settings).
+            budget: Bandwidth budget (default: the shared one).
+        """
+        self.client = client
+        self.connections = connections or settings.telegram_download_connections
+        self.budget = budget or BandwidthBudget.get_instance()
+
+    async def download(
+        self,
+        document: Any,
+        dest_path: Path,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> str:
+        """Download a document to dest_path.
+
+        Args:
+            document: Telethon Document (e.g. message.document).
+            dest_path: Final destination; its directory must exist.
+            progress_callback: Called with (bytes_done, total_bytes).
+
+        Returns:
+            Hex SHA-256 of the file (also remembered for compute_file_hash).
+        """
+        from telethon import utils
+        from telethon.errors import FloodWaitError
+        from telethon.tl.functions.upload import GetFileRequest
+
+        dc_id, location = utils.get_input_location(document)
+        size = document.size
+        part_path, state_path = partial_download_paths(dest_path.parent, document.id)
+        key = f"{document.id}:{document.access_hash}"
+
+        connections = max(1, min(self.connections, -(-size // PART_SIZE)))
+        senders = await self._open_senders(dc_id, connections)
+        logger.info(
+            "parallel_download_started",
+            document_id=document.id,
+            dc_id=dc_id,
+            size=size,
+            connections=len(senders),
+        )
+
+        def make_fetcher(sender: MTProtoSender) -> FetchPart:
+            async def fetch(offset: int, limit: int) -> bytes:
+                try:
+                    result = await sender.send(
+                        GetFileRequest(location=location, offset=offset, limit=limit)
+                    )
+                except FloodWaitError as e:
+                    raise TelegramRateLimitError(e.seconds) from e
+                return result.bytes
+
+            return fetch
+
+        try:
+            digest = await download_parts(
+                [make_fetcher(s) for s in senders],
+                size,
+                part_path,
+                state_path,
+                key,
+                budget=self.budget,
+                progress_callback=progress_callback,
+            )
+        finally:
+            await asyncio.gather(
+                *(s.disconnect() for s in senders), return_exceptions=True
+            )
+
+        os.replace(part_path, dest_path)
+        remember_file_hash(dest_path, digest)
+        return digest
+
+    async def _open_senders(self, dc_id: int, count: int) -> list[MTProtoSender]:
+        """Connect senders to the document's DC.
+
+        The home DC reuses the session's auth key. For another DC the
+        authorization is exported once and its key shared by the rest.
+        """
+        from telethon.network import MTProtoSender
+        from telethon.tl.alltlobjects import LAYER
+        from telethon.tl.functions import InvokeWithLayerRequest
+        from telethon.tl.functions.auth import (
+            ExportAuthorizationRequest,
+            ImportAuthorizationRequest,
+        )
+
+        client = self.client
+        dc = await client._get_dc(dc_id)
+        auth_key = client.session.auth_key if dc_id == client.session.dc_id else None
+
+        async def open_one() -> MTProtoSender:
+            nonlocal auth_key
+            sender = MTProtoSender(auth_key, loggers=client._log)
+            await sender.connect(
+                client._connection(
+                    dc.ip_address,
+                    dc.port,
+                    dc.id,
+                    loggers=client._log,
+                    proxy=client._proxy,
+                    local_addr=client._local_addr,
+                )
+            )
+            if auth_key is None:
+                auth = await client(ExportAuthorizationRequest(dc_id))
+                client._init_request.query = ImportAuthorizationRequest(
+                    id=auth.id, bytes=auth.bytes
+                )
+                await sender.send(InvokeWithLayerRequest(LAYER, client._init_request))
+                auth_key = sender.auth_key
+            return sender
+
+        # The first sender may have to export the authorization
+        senders = [await open_one()]
+        results = await asyncio.gather(
+            *(open_one() for _ in range(count - 1)), return_exceptions=True
+        )
+        senders += [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await asyncio.gather(*(s.disconnect() for s in senders), return_exceptions=True)
+            raise errors[0]
+        return senders
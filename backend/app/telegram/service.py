@@ -26,6 +26,7 @@ from telethon.tl.types import Channel, Chat, ChatInvite, ChatInviteAlready
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.telegram.cache import TelegramCache
 from app.telegram.exceptions import (
     TelegramAccessDeniedError,
     TelegramChannelNotFoundError,
@@ -47,6 +48,25 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def media_unique_id(message) -> str | None:
+    """Get a stable identifier for a message's file.
+
+    MTProto has no Bot API file_unique_id. A document or photo keeps its
+    ID wherever it is forwarded or reposted, so that ID is used instead.
+
+    Args:
+        message: Telethon Message object.
+
+    Returns:
+        "document:<id>" or "photo:<id>", or None if the message has no file.
+    """
+    if message.document:
+        return f"document:{message.document.id}"
+    if message.photo:
+        return f"photo:{message.photo.id}"
+    return None
+
+
 class WalSqliteSession(SQLiteSession):
     """SQLite session with WAL mode and busy timeout for better concurrency.
 
@@ -410,9 +430,10 @@ class TelegramService:
                 except Exception as e:
                     logger.warning("telegram_logout_error", error=str(e))
 
-            # Clear state
+            # Clear state (cached entities belong to the old account)
             self._phone_code_hash = None
             self._pending_phone = None
+            TelegramCache.reset_instance()
 
             return {"status": "logged_out"}
 
@@ -689,6 +710,7 @@ class TelegramService:
 
         if message.media:
             has_media = True
+            unique_file_id = media_unique_id(message)
 
             if message.document:
                 doc = message.document
@@ -704,6 +726,7 @@ class TelegramService:
                     "filename": filename,
                     "size": doc.size,
                     "mime_type": doc.mime_type,
+                    "unique_file_id": unique_file_id,
                 })
 
             elif message.photo:
@@ -715,6 +738,7 @@ class TelegramService:
                     "filename": None,
                     "size": getattr(largest, "size", None),
                     "mime_type": "image/jpeg",
+                    "unique_file_id": unique_file_id,
                 })
 
             elif message.video:
@@ -724,6 +748,7 @@ class TelegramService:
                     "filename": None,
                     "size": getattr(video, "size", None),
                     "mime_type": getattr(video, "mime_type", "video/mp4"),
+                    "unique_file_id": unique_file_id,
                 })
 
             elif message.audio:
@@ -733,6 +758,7 @@ class TelegramService:
                     "filename": None,
                     "size": getattr(audio, "size", None),
                     "mime_type": getattr(audio, "mime_type", "audio/mpeg"),
+                    "unique_file_id": unique_file_id,
                 })
 
         # Get forward info
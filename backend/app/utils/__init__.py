@@ -1,13 +1,23 @@
 """Utility functions for Printarr."""
 
 from app.utils.file_hash import (
+    HashingWriter,
     compute_file_hash,
     compute_file_hash_sync,
     compute_file_hashes_batch,
+    known_file_hash,
+    remember_file_hash,
 )
+from app.utils.file_link import link_or_copy
+from app.utils.zip_stream import ZipStream
 
 __all__ = [
+    "HashingWriter",
     "compute_file_hash",
     "compute_file_hash_sync",
     "compute_file_hashes_batch",
+    "known_file_hash",
+    "link_or_copy",
+    "remember_file_hash",
+    "ZipStream",
 ]
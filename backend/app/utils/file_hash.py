@@ -1,16 +1,98 @@
 """File hashing utilities for deduplication (DEC-041).
 
 Provides stream-based SHA-256 hash computation to avoid loading entire files into memory.
+
+Downloads and uploads hash their bytes as they are written through a
+``HashingWriter`` instead of reading the finished file back. The digest is
+remembered against the file's identity (device, inode, size, mtime), so later
+``compute_file_hash`` calls on the same file - even after it was renamed or
+moved within the filesystem - return it without touching the disk. Any write
+changes size or mtime, which invalidates the entry.
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
+
+# Default chunk size for streaming hash computation. Large reads keep the
+# syscall count low; the buffer is reused for the whole file.
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Maximum number of streamed digests kept in memory
+KNOWN_HASHES_MAX_ENTRIES = 4096
+
+_FileKey = tuple[int, int, int, int]
+
+_known_hashes: OrderedDict[_FileKey, str] = OrderedDict()
+_known_hashes_lock = threading.Lock()
+
+
+def _file_key(st: os.stat_result) -> _FileKey:
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def remember_file_hash(file_path: Path, digest: str) -> None:
+    """Record the SHA-256 of a file whose bytes were hashed while writing it.
+
+    Args:
+        file_path: Path to the completed file.
+        digest: Hex SHA-256 of the file content.
+    """
+    try:
+        key = _file_key(os.stat(file_path))
+    except OSError:
+        return
+
+    with _known_hashes_lock:
+        _known_hashes[key] = digest
+        _known_hashes.move_to_end(key)
+        while len(_known_hashes) > KNOWN_HASHES_MAX_ENTRIES:
+            _known_hashes.popitem(last=False)
 
-# Default chunk size for streaming hash computation
-DEFAULT_CHUNK_SIZE = 8192  # 8KB - good balance of speed and memory
+
+def known_file_hash(file_path: Path) -> str | None:
+    """Return the remembered SHA-256 of an unchanged file, if any.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Hex SHA-256, or None if the file wasn't hashed while written or has
+        changed since.
+    """
+    try:
+        key = _file_key(os.stat(file_path))
+    except OSError:
+        return None
+
+    with _known_hashes_lock:
+        return _known_hashes.get(key)
+
+
+def _hash_file_into(hasher: Any, f: Any, chunk_size: int) -> int:
+    """Feed the rest of an open binary file into a hasher.
+
+    Reads into one reusable buffer rather than allocating a bytes object
+    per chunk.
+
+    Returns:
+        Number of bytes hashed.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = 0
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            return total
+        hasher.update(view[:n])
+        total += n
 
 
 def compute_file_hash_sync(
@@ -20,11 +102,12 @@ def compute_file_hash_sync(
     """Compute SHA-256 hash of a file synchronously (stream-based).
 
     This function streams the file in chunks to avoid loading the entire
-    file into memory, making it suitable for large 3D model files.
+    file into memory, making it suitable for large 3D model files. Files
+    written through a ``HashingWriter`` are not read again.
 
     Args:
         file_path: Path to the file to hash.
-        chunk_size: Size of chunks to read at a time (default 8KB).
+        chunk_size: Size of chunks to read at a time (default 1MB).
 
     Returns:
         64-character lowercase hex string of the SHA-256 hash.
@@ -33,10 +116,13 @@ def compute_file_hash_sync(
         FileNotFoundError: If the file doesn't exist.
         PermissionError: If the file can't be read.
     """
+    known = known_file_hash(file_path)
+    if known is not None:
+        return known
+
     sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            sha256.update(chunk)
+    with open(file_path, "rb", buffering=0) as f:
+        _hash_file_into(sha256, f, chunk_size)
     return sha256.hexdigest()
 
 
@@ -51,7 +137,7 @@ async def compute_file_hash(
 
     Args:
         file_path: Path to the file to hash.
-        chunk_size: Size of chunks to read at a time (default 8KB).
+        chunk_size: Size of chunks to read at a time (default 1MB).
 
     Returns:
         64-character lowercase hex string of the SHA-256 hash.
@@ -60,6 +146,10 @@ async def compute_file_hash(
         FileNotFoundError: If the file doesn't exist.
         PermissionError: If the file can't be read.
     """
+    known = known_file_hash(file_path)
+    if known is not None:
+        return known
+
     loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
         None,
@@ -79,7 +169,7 @@ async def compute_file_hashes_batch(
 
     Args:
         file_paths: List of paths to files to hash.
-        chunk_size: Size of chunks to read at a time (default 8KB).
+        chunk_size: Size of chunks to read at a time (default 1MB).
 
     Returns:
         Dict mapping file paths to their SHA-256 hashes.
@@ -102,3 +192,92 @@ async def compute_file_hashes_batch(
             results[item[0]] = item[1]
 
     return results
+
+
+class HashingWriter:
+    """Binary file sink that computes SHA-256 of everything written to it.
+
+    Usable anywhere a writable binary file object is expected (Telethon's
+    ``download_media``, ``shutil.copyfileobj``, streamed HTTP bodies).
+
+    With ``append=True`` an existing partial file is hashed once and new
+    bytes are appended, so resumed downloads still end with the digest of
+    the whole file.
+
+    Call ``finish()`` once the content is complete: it closes the file and
+    remembers the digest for ``compute_file_hash``. ``discard()`` closes and
+    deletes an incomplete file.
+    """
+
+    def __init__(self, file_path: Path, *, append: bool = False) -> None:
+        """Open the file for writing.
+
+        Args:
+            file_path: Destination path.
+            append: Keep and hash existing content instead of truncating.
+        """
+        self.path = Path(file_path)
+        self._hasher = hashlib.sha256()
+        self.size = 0
+
+        if append and self.path.exists():
+            self._file = open(self.path, "r+b")
+            self.size = _hash_file_into(self._hasher, self._file, DEFAULT_CHUNK_SIZE)
+        else:
+            self._file = open(self.path, "wb")
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Write bytes to the file and the hash."""
+        written = self._file.write(data)
+        self._hasher.update(data)
+        self.size += written
+        return written
+
+    def tell(self) -> int:
+        """Return the number of bytes in the file."""
+        return self.size
+
+    def flush(self) -> None:
+        """Flush buffered writes to the OS."""
+        self._file.flush()
+
+    def truncate(self) -> None:
+        """Drop everything written so far and start over."""
+        self._file.seek(0)
+        self._file.truncate()
+        self._hasher = hashlib.sha256()
+        self.size = 0
+
+    def hexdigest(self) -> str:
+        """Return the hex SHA-256 of the bytes written so far."""
+        return self._hasher.hexdigest()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        """Close the file without recording the digest."""
+        self._file.close()
+
+    def finish(self) -> str:
+        """Close the file and remember its digest.
+
+        Returns:
+            Hex SHA-256 of the complete file.
+        """
+        self._file.close()
+        digest = self._hasher.hexdigest()
+        remember_file_hash(self.path, digest)
+        return digest
+
+    def discard(self) -> None:
+        """Close and delete the (incomplete) file."""
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> HashingWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._file.close()
@@ -0,0 +1,67 @@
+"""Place a file's content at a second path without copying it if possible.
+
+Used when the bytes being staged are already on disk (for example the same
+Telegram file posted to several channels). The new path is, in order of
+preference:
+
+1. A hardlink - same inode, no extra space, works within one filesystem.
+2. A reflink (copy-on-write clone via the FICLONE ioctl) - separate inode
+   sharing the extents, on filesystems that support it (btrfs, XFS).
+3. A plain copy - always works; still cheaper than downloading again.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl request number of FICLONE (linux/fs.h)
+FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    if fcntl is None:
+        raise OSError("reflink not supported on this platform")
+
+    with open(src, "rb") as s, open(dest, "xb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dest.unlink(missing_ok=True)
+            raise
+
+
+def link_or_copy(src: Path, dest: Path) -> str:
+    """Make dest have the content of src, sharing storage where possible.
+
+    Args:
+        src: Existing file.
+        dest: Path to create. Must not exist.
+
+    Returns:
+        How the file was placed: "hardlink", "reflink" or "copy".
+
+    Raises:
+        OSError: If even copying fails.
+    """
+    try:
+        os.link(src, dest)
+        return "hardlink"
+    except OSError:
+        pass
+
+    try:
+        _reflink(src, dest)
+        return "reflink"
+    except OSError:
+        pass
+
+    shutil.copy2(src, dest)
+    return "copy"
@@ -0,0 +1,402 @@
+"""Streaming ZIP writer for design downloads.
+
+Builds a ZIP archive as a sequence of byte chunks while the member files
+are read, so a download starts immediately and memory use stays flat no
+matter how large the design is.
+
+Every entry is written with a data descriptor (general purpose flag bit 3),
+so CRC-32 is computed on the fly instead of requiring a second pass over
+the file. Entries are STORED or DEFLATED per file; formats that are
+already compressed (3MF, images, nested archives) are stored by default.
+ZIP64 records are emitted automatically for large entries, large offsets
+or more than 65535 entries.
+
+When every entry is stored, the archive size is fully determined by the
+file names and sizes, so content_length can be sent up front and byte
+ranges of the archive can be served with iter_range().
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import time
+import zlib
+from collections.abc import Generator, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Read size when streaming member files
+ZIP_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Extensions whose contents are already compressed; deflating them wastes CPU
+STORED_EXTENSIONS = frozenset(
+    {
+        # 3MF is itself a ZIP container
+        ".3mf",
+        # Archives
+        ".zip", ".rar", ".7z", ".gz", ".bz2", ".xz", ".zst",
+        # Images
+        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".heic",
+        # Video
+        ".mp4", ".mov", ".webm", ".mkv",
+    }
+)
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+# Size/offset/count limits of the classic ZIP format
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+
+_VERSION_DEFAULT = 20
+_VERSION_ZIP64 = 45
+# Bit 3: sizes and CRC follow in a data descriptor; bit 11: UTF-8 names
+_FLAGS = 0x08 | 0x800
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_DESCRIPTOR = struct.Struct("<IIII")
+_DESCRIPTOR_ZIP64 = struct.Struct("<IIQQ")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+_END_RECORD_ZIP64 = struct.Struct("<IQHHIIQQQQ")
+_END_LOCATOR_ZIP64 = struct.Struct("<IIQI")
+
+
+@dataclass
+class ZipEntry:
+    """A file queued for the archive."""
+
+    path: Path
+    arcname: str
+    size: int
+    mtime: float
+    mode: int
+    compress_type: int
+
+    @property
+    def zip64(self) -> bool:
+        """Whether this entry needs ZIP64 size fields."""
+        # Deflate can slightly expand incompressible data
+        limit = self.size if self.compress_type == ZIP_STORED else self.size * 1.05
+        return limit >= ZIP64_LIMIT
+
+
+def _dos_datetime(mtime: float) -> tuple[int, int]:
+    """Convert a timestamp to MS-DOS (time, date) fields."""
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (0 << 9) | (1 << 5) | 1
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+class ZipStream:
+    """A ZIP archive produced incrementally from files on disk.
+
+    Example:
+        zip_stream = ZipStream()
+        zip_stream.add_file(path, "Design/model.stl")
+        return StreamingResponse(zip_stream, media_type="application/zip")
+    """
+
+    def __init__(self, compress_level: int = 6):
+        """Initialize an empty archive.
+
+        Args:
+            compress_level: zlib level for deflated entries.
+        """
+        self.compress_level = compress_level
+        self.entries: list[ZipEntry] = []
+
+    def add_file(
+        self,
+        path: Path,
+        arcname: str,
+        compress_type: int | None = None,
+    ) -> ZipEntry:
+        """Queue a file for the archive.
+
+        The size is captured now; exactly that many bytes are written even
+        if the file changes before it is streamed.
+
+        Args:
+            path: File on disk.
+            arcname: Name inside the archive.
+            compress_type: ZIP_STORED or ZIP_DEFLATED. Defaults to STORED for
+                STORED_EXTENSIONS and DEFLATED otherwise.
+
+        Returns:
+            The queued entry.
+
+        Raises:
+            OSError: If the file can't be stat'ed.
+        """
+        stat = os.stat(path)
+        if compress_type is None:
+            compress_type = (
+                ZIP_STORED
+                if path.suffix.lower() in STORED_EXTENSIONS
+                else ZIP_DEFLATED
+            )
+        entry = ZipEntry(
+            path=path,
+            arcname=arcname.replace(os.sep, "/").lstrip("/"),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            mode=stat.st_mode,
+            compress_type=compress_type,
+        )
+        self.entries.append(entry)
+        return entry
+
+    @property
+    def content_length(self) -> int | None:
+        """Exact archive size, or None if any entry is compressed."""
+        if any(entry.compress_type != ZIP_STORED for entry in self.entries):
+            return None
+
+        offset = 0
+        central_size = 0
+        for entry in self.entries:
+            name_len = len(entry.arcname.encode("utf-8"))
+            zip64 = entry.zip64
+            offset_zip64 = offset >= ZIP64_LIMIT
+            offset += _LOCAL_HEADER.size + name_len + (20 if zip64 else 0)
+            offset += entry.size
+            offset += (_DESCRIPTOR_ZIP64 if zip64 else _DESCRIPTOR).size
+            extra_len = (16 if zip64 else 0) + (8 if offset_zip64 else 0)
+            central_size += _CENTRAL_HEADER.size + name_len + (
+                4 + extra_len if extra_len else 0
+            )
+
+        return offset + central_size + self._end_size(offset, central_size)
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the entries' names, sizes and mtimes."""
+        hasher = hashlib.sha256()
+        for entry in self.entries:
+            hasher.update(
+                f"{entry.arcname}:{entry.size}:{entry.mtime}:{entry.compress_type}\n".encode()
+            )
+        return f'"{hasher.hexdigest()[:32]}"'
+
+    def _end_size(self, central_offset: int, central_size: int) -> int:
+        """Size of the end-of-central-directory records."""
+        size = _END_RECORD.size
+        if self._needs_zip64_end(central_offset, central_size):
+            size += _END_RECORD_ZIP64.size + _END_LOCATOR_ZIP64.size
+        return size
+
+    def _needs_zip64_end(self, central_offset: int, central_size: int) -> bool:
+        """Whether the archive needs ZIP64 end records."""
+        return (
+            len(self.entries) >= ZIP64_COUNT_LIMIT
+            or central_offset >= ZIP64_LIMIT
+            or central_size >= ZIP64_LIMIT
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the archive in chunks.
+
+        Blocking; StreamingResponse runs sync iterators in a threadpool.
+        """
+        offset = 0
+        central: list[bytes] = []
+
+        for entry in self.entries:
+            name = entry.arcname.encode("utf-8")
+            dos_time, dos_date = _dos_datetime(entry.mtime)
+            zip64 = entry.zip64
+            version = _VERSION_ZIP64 if zip64 else _VERSION_DEFAULT
+            header_offset = offset
+
+            # Local header; CRC and sizes follow in the data descriptor
+            if zip64:
+                extra = struct.pack("<HHQQ", 0x0001, 16, 0, 0)
+                size_field = ZIP64_LIMIT
+            else:
+                extra = b""
+                size_field = 0
+            header = _LOCAL_HEADER.pack(
+                0x04034B50, version, _FLAGS, entry.compress_type,
+                dos_time, dos_date, 0, size_field, size_field,
+                len(name), len(extra),
+            ) + name + extra
+            yield header
+            offset += len(header)
+
+            crc, compressed_size = yield from self._iter_entry_data(entry)
+            offset += compressed_size
+
+            if zip64:
+                descriptor = _DESCRIPTOR_ZIP64.pack(
+                    0x08074B50, crc, compressed_size, entry.size
+                )
+            else:
+                descriptor = _DESCRIPTOR.pack(
+                    0x08074B50, crc, compressed_size, entry.size
+                )
+            yield descriptor
+            offset += len(descriptor)
+
+            central.append(
+                self._central_header(
+                    entry, name, version, dos_time, dos_date,
+                    crc, compressed_size, header_offset,
+                )
+            )
+
+        central_offset = offset
+        central_data = b"".join(central)
+        yield central_data
+        yield self._end_records(central_offset, len(central_data))
+
+    def iter_range(self, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes [start, end) of the archive.
+
+        Only meaningful when content_length is known (every entry stored),
+        since the layout is then fixed. Entries before start are still read
+        because their CRCs go into the data descriptors and the central
+        directory; nothing past end is read.
+
+        Args:
+            start: First byte offset.
+            end: Offset after the last byte.
+        """
+        offset = 0
+        chunks = iter(self)
+        try:
+            for chunk in chunks:
+                chunk_end = offset + len(chunk)
+                if chunk_end > start:
+                    yield chunk[max(start - offset, 0) : end - offset]
+                offset = chunk_end
+                if offset >= end:
+                    return
+        finally:
+            chunks.close()
+
+    def _iter_entry_data(
+        self, entry: ZipEntry
+    ) -> Generator[bytes, None, tuple[int, int]]:
+        """Yield an entry's (compressed) data.
+
+        Returns:
+            (CRC-32, compressed size) once the data is written.
+        """
+        crc = 0
+        compressed_size = 0
+        remaining = entry.size
+        compressor = (
+            zlib.compressobj(self.compress_level, zlib.DEFLATED, -15)
+            if entry.compress_type == ZIP_DEFLATED
+            else None
+        )
+
+        with open(entry.path, "rb") as f:
+            while remaining > 0:
+                chunk = f.read(min(ZIP_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"{entry.path} shrank while being archived")
+                remaining -= len(chunk)
+                crc = zlib.crc32(chunk, crc)
+                if compressor is not None:
+                    chunk = compressor.compress(chunk)
+                    if not chunk:
+                        continue
+                compressed_size += len(chunk)
+                yield chunk
+
+        if compressor is not None:
+            chunk = compressor.flush()
+            compressed_size += len(chunk)
+            yield chunk
+        return crc, compressed_size
+
+    def _central_header(
+        self,
+        entry: ZipEntry,
+        name: bytes,
+        version: int,
+        dos_time: int,
+        dos_date: int,
+        crc: int,
+        compressed_size: int,
+        header_offset: int,
+    ) -> bytes:
+        """Build the central directory record for an entry."""
+        zip64_fields: list[int] = []
+        size, csize, offset = entry.size, compressed_size, header_offset
+        if entry.zip64:
+            zip64_fields += [entry.size, compressed_size]
+            size = csize = ZIP64_LIMIT
+        if header_offset >= ZIP64_LIMIT:
+            zip64_fields.append(header_offset)
+            offset = ZIP64_LIMIT
+
+        extra = b""
+        if zip64_fields:
+            version = _VERSION_ZIP64
+            extra = struct.pack(
+                f"<HH{len(zip64_fields)}Q",
+                0x0001,
+                8 * len(zip64_fields),
+                *zip64_fields,
+            )
+
+        return _CENTRAL_HEADER.pack(
+            0x02014B50,
+            (3 << 8) | version,  # Made by: Unix
+            version,
+            _FLAGS,
+            entry.compress_type,
+            dos_time,
+            dos_date,
+            crc,
+            csize,
+            size,
+            len(name),
+            len(extra),
+            0,  # Comment length
+            0,  # Disk number
+            0,  # Internal attributes
+            (entry.mode & 0xFFFF) << 16,
+            offset,
+        ) + name + extra
+
+    def _end_records(self, central_offset: int, central_size: int) -> bytes:
+        """Build the end-of-central-directory record(s)."""
+        count = len(self.entries)
+        records = b""
+        if self._needs_zip64_end(central_offset, central_size):
+            zip64_end_offset = central_offset + central_size
+            records += _END_RECORD_ZIP64.pack(
+                0x06064B50,
+                _END_RECORD_ZIP64.size - 12,
+                (3 << 8) | _VERSION_ZIP64,
+                _VERSION_ZIP64,
+                0,
+                0,
+                count,
+                count,
+                central_size,
+                central_offset,
+            )
+            records += _END_LOCATOR_ZIP64.pack(0x07064B50, 0, zip64_end_offset, 1)
+
+        records += _END_RECORD.pack(
+            0x06054B50,
+            0,
+            0,
+            min(count, ZIP64_COUNT_LIMIT),
+            min(count, ZIP64_COUNT_LIMIT),
+            min(central_size, ZIP64_LIMIT),
+            min(central_offset, ZIP64_LIMIT),
+            0,
+        )
+        return records
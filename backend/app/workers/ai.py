@@ -2,10 +2,17 @@
 
 Processes AI_ANALYZE_DESIGN jobs to generate tags and select best previews
 using Google Gemini.
+
+The worker claims up to ai_batch_max_designs jobs at a time. Before the
+first of them is processed, the designs of all claimed jobs are analyzed
+in one batched request (AiService.prefetch_batch), so each job then only
+applies its stored result. This gets several designs through per request
+under the same RPM limit.
 """
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from app.core.config import settings
@@ -30,6 +37,11 @@ class AiWorker(BaseWorker):
 
     job_types = [JobType.AI_ANALYZE_DESIGN]
 
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        # Designs whose results a batch request has already stored
+        self._prefetched: set[str] = set()
+
     async def process(self, job: Job, payload: dict[str, Any] | None) -> dict[str, Any] | None:
         """Process an AI_ANALYZE_DESIGN job.
 
@@ -65,6 +77,8 @@ class AiWorker(BaseWorker):
             ai_service = AiService(db)
 
             try:
+                await self._prefetch_batch(ai_service, design_id, force)
+
                 result = await ai_service.analyze_design(
                     design_id=design_id,
                     force=force,
@@ -108,3 +122,40 @@ class AiWorker(BaseWorker):
                     exc_info=True,
                 )
                 raise
+
+            finally:
+                self._prefetched.discard(design_id)
+
+    async def _prefetch_batch(
+        self,
+        ai_service: AiService,
+        design_id: str,
+        force: bool,
+    ) -> None:
+        """Analyze this job's design together with the other claimed jobs'.
+
+        Args:
+            ai_service: Service bound to the job's session.
+            design_id: Design of the job being processed.
+            force: The job's force flag; only jobs with the same flag join.
+        """
+        if design_id in self._prefetched:
+            return
+
+        design_ids = [design_id]
+        for claimed in self._claimed_jobs:
+            payload = json.loads(claimed.payload_json) if claimed.payload_json else {}
+            other_id = payload.get("design_id")
+            if (
+                other_id
+                and payload.get("force", False) == force
+                and other_id not in self._prefetched
+                and other_id not in design_ids
+            ):
+                design_ids.append(other_id)
+
+        if len(design_ids) < 2:
+            return
+
+        stored = await ai_service.prefetch_batch(design_ids, force=force)
+        self._prefetched.update(stored)
@@ -8,10 +8,13 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.logging import get_logger
 from app.db.models import Job, JobStatus, JobType
 from app.db.session import async_session_maker
 from app.services.job_queue import JobQueueService
+from app.workers.concurrency import ConcurrencyScheduler, WorkerResource
 
 logger = get_logger(__name__)
 
@@ -41,8 +44,10 @@ class BaseWorker(ABC):
     - process(job): the actual job processing logic
 
     Features:
-    - Configurable poll interval
+    - Configurable poll interval, with wake-ups from the LISTEN/NOTIFY
+      dispatcher so idle workers only poll as a slow safety net
     - Graceful shutdown handling
+    - Shared-resource slots (Telegram, disk, CPU) via resources
     - Automatic retry with exponential backoff
     - Error logging and job state updates
     - Progress tracking support
@@ -51,10 +56,15 @@ class BaseWorker(ABC):
     # Subclasses must set this to the job types they handle
     job_types: list[JobType] = []
 
+    # Shared resources this worker holds a slot of while processing
+    # (capped globally by the WorkerManager's ConcurrencyScheduler)
+    resources: list[WorkerResource] = []
+
     def __init__(
         self,
         *,
         poll_interval: float = 1.0,
+        safety_poll_interval: float = 30.0,
         batch_size: int = 1,
         worker_id: str | None = None,
     ):
@@ -62,16 +72,24 @@ class BaseWorker(ABC):
 
         Args:
             poll_interval: Seconds to wait between polling for jobs.
-            batch_size: Number of jobs to claim per poll (for future use).
+            safety_poll_interval: Seconds to wait between polls while job
+                notifications are enabled (see enable_notifications).
+            batch_size: Maximum number of jobs to claim per poll. Claimed
+                jobs are processed one after another by this worker.
             worker_id: Optional identifier for this worker instance.
         """
         self.poll_interval = poll_interval
+        self.safety_poll_interval = safety_poll_interval
         self.batch_size = batch_size
         self.worker_id = worker_id or self.__class__.__name__
 
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
+        self._notifications_enabled = False
         self._current_job: Job | None = None
+        self._claimed_jobs: list[Job] = []
+        self.scheduler: ConcurrencyScheduler | None = None
         self._jobs_processed = 0
         self._jobs_failed = 0
         self._started_at: datetime | None = None
@@ -140,87 +158,193 @@ class BaseWorker(ABC):
             )
 
     async def _poll_and_process(self) -> None:
-        """Poll for a job and process it if found."""
+        """Poll for jobs and process them if found.
+
+        Takes this worker's shared-resource slots first (see resources),
+        so claimed jobs never sit waiting for a slot while counting
+        towards stale-job detection.
+        """
+        # Clear before claiming so a notification that arrives while the
+        # dequeue query runs still wakes us for the next poll.
+        self._wake_event.clear()
+
+        if not await self._acquire_resources():
+            return  # Shutdown requested while waiting for a slot
+        try:
+            found = await self._claim_and_process()
+        finally:
+            if self.scheduler is not None:
+                await self.scheduler.release(self.resources)
+
+        if not found:
+            # No job available, sleep until woken by a job notification,
+            # shutdown, or the poll interval elapses
+            try:
+                await asyncio.wait_for(
+                    self._wake_event.wait(),
+                    timeout=self.idle_poll_interval,
+                )
+            except TimeoutError:
+                pass
+            # Log periodic heartbeat (every 60 polls = ~1 minute at 1s interval)
+            self._poll_count = getattr(self, '_poll_count', 0) + 1
+            if self._poll_count % 60 == 0:
+                logger.debug(
+                    "worker_heartbeat",
+                    worker_id=self.worker_id,
+                    poll_count=self._poll_count,
+                )
+
+    async def _acquire_resources(self) -> bool:
+        """Wait for this worker's shared-resource slots.
+
+        Returns:
+            True once the slots are held, False if shutdown was requested
+            first (no slots are held in that case).
+        """
+        if self.scheduler is None or not self.resources:
+            return True
+
+        acquire = asyncio.create_task(self.scheduler.acquire(self.resources))
+        shutdown = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            await asyncio.wait({acquire, shutdown}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            acquire.cancel()
+            raise
+        finally:
+            shutdown.cancel()
+
+        if acquire.done():
+            return True
+
+        acquire.cancel()
+        try:
+            await acquire
+        except asyncio.CancelledError:
+            return False
+        # Acquired just as we cancelled
+        await self.scheduler.release(self.resources)
+        return False
+
+    async def _claim_and_process(self) -> bool:
+        """Claim jobs and process them.
+
+        Claims a single job, or up to batch_size jobs in one statement
+        when batch_size > 1, and processes the claimed jobs in order.
+        Jobs from a batch that haven't started when shutdown is requested
+        are released back to the queue.
+
+        Returns:
+            True if any job was claimed, False if the queue was empty.
+        """
         async with async_session_maker() as db:
             queue = JobQueueService(db)
 
-            # Try to claim a job
-            job = await queue.dequeue(self.job_types or None)
+            # Try to claim jobs
+            if self.batch_size > 1:
+                jobs = await queue.dequeue_many(self.job_types or None, self.batch_size)
+            else:
+                job = await queue.dequeue(self.job_types or None)
+                jobs = [job] if job is not None else []
 
-            if job is None:
-                # No job available, wait and retry
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=self.poll_interval,
-                    )
-                except TimeoutError:
-                    pass
-                # Log periodic heartbeat (every 60 polls = ~1 minute at 1s interval)
-                self._poll_count = getattr(self, '_poll_count', 0) + 1
-                if self._poll_count % 60 == 0:
-                    logger.debug(
-                        "worker_heartbeat",
-                        worker_id=self.worker_id,
-                        poll_count=self._poll_count,
-                    )
-                return
+            if not jobs:
+                return False
 
             # CRITICAL: Commit the job claim BEFORE processing to release
             # the database lock. This allows the process() method to use
             # its own session without deadlocking with this one.
             await db.commit()
 
-            # Process the job
-            self._current_job = job
-            self._last_progress_update = None  # Reset throttle for new job
-            payload = queue.get_payload(job)
-
+            self._claimed_jobs = jobs
             try:
-                logger.info(
-                    "job_processing_start",
-                    worker_id=self.worker_id,
-                    job_id=job.id,
-                    job_type=job.type.value,
-                )
+                while self._claimed_jobs and not self._shutdown_event.is_set():
+                    job = self._claimed_jobs.pop(0)
+
+                    # Batched jobs may have been cancelled or requeued while
+                    # waiting their turn
+                    if self.batch_size > 1:
+                        started = await queue.start_claimed(job)
+                        await db.commit()
+                        if not started:
+                            continue
+
+                    await self._process_job(db, queue, job)
+            finally:
+                if self._claimed_jobs:
+                    released = await queue.release(self._claimed_jobs)
+                    await db.commit()
+                    logger.info(
+                        "worker_released_claimed_jobs",
+                        worker_id=self.worker_id,
+                        count=released,
+                    )
+                self._claimed_jobs = []
 
-                result = await self.process(job, payload)
+        return True
 
-                # Mark success with optional result
-                await queue.complete(job.id, success=True, result=result)
-                self._jobs_processed += 1
+    async def _process_job(
+        self,
+        db: AsyncSession,
+        queue: JobQueueService,
+        job: Job,
+    ) -> None:
+        """Process a claimed job and record its outcome.
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(
-                    "job_processing_error",
-                    worker_id=self.worker_id,
-                    job_id=job.id,
-                    job_type=job.type.value,
-                    error=error_msg,
-                    exc_info=True,
-                )
+        Args:
+            db: Session used for the claim and completion updates.
+            queue: Job queue service bound to db.
+            job: The claimed (RUNNING) job.
+        """
+        self._current_job = job
+        self._last_progress_update = None  # Reset throttle for new job
+        payload = queue.get_payload(job)
 
-                # Mark failure (may trigger retry)
-                await queue.complete(job.id, success=False, error=error_msg)
-                self._jobs_failed += 1
+        try:
+            logger.info(
+                "job_processing_start",
+                worker_id=self.worker_id,
+                job_id=job.id,
+                job_type=job.type.value,
+            )
 
-                # If job will be retried, calculate delay
-                # Re-fetch job to check updated status
-                updated_job = await queue.get_job(job.id)
-                if updated_job and updated_job.status == JobStatus.QUEUED:
-                    delay = calculate_retry_delay(updated_job.attempts)
-                    logger.info(
-                        "job_retry_scheduled",
-                        job_id=job.id,
-                        attempt=updated_job.attempts,
-                        delay_seconds=delay,
-                    )
+            result = await self.process(job, payload)
 
-            finally:
-                self._current_job = None
-                # Commit the transaction
-                await db.commit()
+            # Mark success with optional result
+            await queue.complete(job.id, success=True, result=result)
+            self._jobs_processed += 1
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(
+                "job_processing_error",
+                worker_id=self.worker_id,
+                job_id=job.id,
+                job_type=job.type.value,
+                error=error_msg,
+                exc_info=True,
+            )
+
+            # Mark failure (may trigger retry)
+            await queue.complete(job.id, success=False, error=error_msg)
+            self._jobs_failed += 1
+
+            # If job will be retried, calculate delay
+            # Re-fetch job to check updated status
+            updated_job = await queue.get_job(job.id)
+            if updated_job and updated_job.status == JobStatus.QUEUED:
+                delay = calculate_retry_delay(updated_job.attempts)
+                logger.info(
+                    "job_retry_scheduled",
+                    job_id=job.id,
+                    attempt=updated_job.attempts,
+                    delay_seconds=delay,
+                )
+
+        finally:
+            self._current_job = None
+            # Commit the transaction
+            await db.commit()
 
     async def check_cancellation(self) -> None:
         """Check if the current job has been cancelled and raise if so.
@@ -337,6 +461,37 @@ class BaseWorker(ABC):
                 error=str(e),
             )
 
+    def wake(self) -> None:
+        """Wake the worker if it is idle so it polls for jobs immediately.
+
+        Called by the job dispatcher when a matching job is enqueued.
+        Has no effect on a worker that is busy processing a job; it will
+        poll again as soon as the current job finishes.
+        """
+        self._wake_event.set()
+
+    def enable_notifications(self, enabled: bool) -> None:
+        """Switch between notification-driven and polling dispatch.
+
+        While enabled, the worker relies on wake() for new jobs and only
+        polls every safety_poll_interval seconds (e.g. to pick up retries
+        whose backoff has expired). When disabled it polls every
+        poll_interval seconds.
+
+        Args:
+            enabled: Whether a job dispatcher is delivering notifications.
+        """
+        self._notifications_enabled = enabled
+        # Re-poll now: jobs may have been enqueued while switching modes
+        self.wake()
+
+    @property
+    def idle_poll_interval(self) -> float:
+        """Seconds to sleep between polls when the queue is empty."""
+        if self._notifications_enabled:
+            return self.safety_poll_interval
+        return self.poll_interval
+
     def request_shutdown(self) -> None:
         """Request graceful shutdown of the worker."""
         logger.info(
@@ -346,6 +501,7 @@ class BaseWorker(ABC):
         )
         self._running = False
         self._shutdown_event.set()
+        self._wake_event.set()
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -386,6 +542,8 @@ class BaseWorker(ABC):
             "is_running": self._running,
             "is_processing": self._current_job is not None,
             "current_job_id": self._current_job.id if self._current_job else None,
+            "claimed_job_count": len(self._claimed_jobs),
+            "notifications_enabled": self._notifications_enabled,
             "jobs_processed": self._jobs_processed,
             "jobs_failed": self._jobs_failed,
             "uptime_seconds": self._uptime_seconds(),
@@ -0,0 +1,127 @@
+"""Shared-resource limits for background workers.
+
+Worker pools are sized per job type, but several pools compete for the
+same scarce resources: the single Telegram client, local disk bandwidth
+and CPU for extraction/rendering. The ConcurrencyScheduler caps how many
+workers may use each resource at once, so I/O-bound pools (downloads)
+can scale out while CPU-bound stages stay bounded.
+
+Workers declare the resources they need via BaseWorker.resources and
+acquire all of them atomically before claiming a job. Limits can be
+changed at runtime (see WorkerManager.apply_setting).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from enum import StrEnum
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class WorkerResource(StrEnum):
+    """Shared resources that workers compete for."""
+
+    TELEGRAM = "TELEGRAM"  # Concurrent Telegram media transfers
+    DISK = "DISK"  # Concurrent heavy disk readers/writers
+    CPU = "CPU"  # CPU-bound extraction and render slots
+
+
+class ConcurrencyScheduler:
+    """Resizable, all-or-nothing slot allocator for shared resources.
+
+    Resources without a configured limit are unbounded.
+    """
+
+    def __init__(self, limits: dict[WorkerResource, int] | None = None):
+        """Initialize the scheduler.
+
+        Args:
+            limits: Initial slot count per resource.
+        """
+        self._limits: dict[WorkerResource, int] = dict(limits or {})
+        self._in_use: dict[WorkerResource, int] = dict.fromkeys(WorkerResource, 0)
+        self._condition = asyncio.Condition()
+
+    def _available(self, resources: Iterable[WorkerResource]) -> bool:
+        """Check if one slot of every resource is free."""
+        for resource in resources:
+            limit = self._limits.get(resource)
+            if limit is not None and self._in_use[resource] >= limit:
+                return False
+        return True
+
+    async def acquire(self, resources: Iterable[WorkerResource]) -> None:
+        """Wait until one slot of every resource is free, then take them.
+
+        Slots are taken together so workers needing several resources
+        can't deadlock holding some while waiting on others. Cancelling
+        a waiting acquire takes no slots.
+
+        Args:
+            resources: Resources to acquire.
+        """
+        resources = list(resources)
+        if not resources:
+            return
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available(resources))
+            for resource in resources:
+                self._in_use[resource] += 1
+
+    async def release(self, resources: Iterable[WorkerResource]) -> None:
+        """Return slots taken by acquire().
+
+        Args:
+            resources: Resources to release.
+        """
+        resources = list(resources)
+        if not resources:
+            return
+        async with self._condition:
+            for resource in resources:
+                self._in_use[resource] = max(0, self._in_use[resource] - 1)
+            self._condition.notify_all()
+
+    async def set_limit(self, resource: WorkerResource, limit: int) -> None:
+        """Change the slot count for a resource.
+
+        Lowering a limit never interrupts work in progress; holders keep
+        their slots and new acquires wait until usage drops below it.
+
+        Args:
+            resource: The resource to resize.
+            limit: New number of slots (minimum 1).
+        """
+        limit = max(1, limit)
+        async with self._condition:
+            old_limit = self._limits.get(resource)
+            self._limits[resource] = limit
+            self._condition.notify_all()
+
+        if old_limit != limit:
+            logger.info(
+                "resource_limit_changed",
+                resource=resource.value,
+                old_limit=old_limit,
+                new_limit=limit,
+            )
+
+    def get_limit(self, resource: WorkerResource) -> int | None:
+        """Get the slot count for a resource (None = unbounded)."""
+        return self._limits.get(resource)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get slot usage per resource."""
+        return {
+            resource.value: {
+                "limit": self._limits.get(resource),
+                "in_use": self._in_use[resource],
+            }
+            for resource in WorkerResource
+        }
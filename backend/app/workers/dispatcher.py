@@ -0,0 +1,233 @@
+"""LISTEN/NOTIFY job dispatcher for waking idle workers.
+
+JobQueueService.enqueue emits a Postgres NOTIFY on a per-job-type channel
+(see job_notify_channel). The dispatcher holds one dedicated connection
+that LISTENs on the channels of all registered workers and wakes only the
+workers whose job_types match, so idle workers don't have to poll the
+queue every second.
+
+If the database is not PostgreSQL, or the listen connection is lost,
+workers fall back to interval polling until the dispatcher reconnects.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.models import JobType
+from app.services.job_queue import JOB_NOTIFY_CHANNEL_PREFIX, job_notify_channel
+from app.workers.base import BaseWorker
+
+logger = get_logger(__name__)
+
+
+class JobDispatcher:
+    """Wakes idle workers when jobs of their type are enqueued.
+
+    Usage:
+        dispatcher = JobDispatcher()
+        dispatcher.register(worker)
+        task = asyncio.create_task(dispatcher.run())
+        ...
+        dispatcher.stop()
+    """
+
+    def __init__(
+        self,
+        *,
+        database_url: str | None = None,
+        reconnect_delay: float = 5.0,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            database_url: SQLAlchemy database URL. Defaults to settings.
+            reconnect_delay: Seconds to wait before re-establishing a
+                lost listen connection.
+        """
+        self.database_url = database_url or settings.database_url
+        self.reconnect_delay = reconnect_delay
+
+        self._workers: dict[JobType, list[BaseWorker]] = defaultdict(list)
+        self._stop_event = asyncio.Event()
+        self._listening = False
+        self._notifications_received = 0
+
+    def register(self, worker: BaseWorker) -> None:
+        """Register a worker to be woken for its job types.
+
+        Args:
+            worker: The worker instance.
+        """
+        for job_type in worker.job_types:
+            self._workers[job_type].append(worker)
+        if self._listening:
+            # Workers added while listening (pool resize) skip fast polling
+            worker.enable_notifications(True)
+
+    def unregister(self, worker: BaseWorker) -> None:
+        """Stop waking a worker (e.g. after it has been shut down).
+
+        Args:
+            worker: The worker instance.
+        """
+        for workers in self._workers.values():
+            if worker in workers:
+                workers.remove(worker)
+
+    @property
+    def is_supported(self) -> bool:
+        """Check if the configured database supports LISTEN/NOTIFY."""
+        return make_url(self.database_url).get_backend_name() == "postgresql"
+
+    @property
+    def is_listening(self) -> bool:
+        """Check if the listen connection is currently established."""
+        return self._listening
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get dispatcher statistics."""
+        return {
+            "listening": self._listening,
+            "channels": len(self._workers),
+            "notifications_received": self._notifications_received,
+        }
+
+    def dispatch(self, job_type: JobType) -> int:
+        """Wake idle workers that handle the given job type.
+
+        Busy workers are left alone; they poll again as soon as their
+        current job finishes.
+
+        Args:
+            job_type: The job type that became available.
+
+        Returns:
+            Number of workers woken.
+        """
+        woken = 0
+        for worker in self._workers.get(job_type, []):
+            if worker.is_running and not worker.is_processing:
+                worker.wake()
+                woken += 1
+        return woken
+
+    def stop(self) -> None:
+        """Request the dispatcher to stop listening."""
+        self._stop_event.set()
+
+    async def run(self) -> None:
+        """Listen for job notifications until stop() is called.
+
+        Reconnects after reconnect_delay if the connection drops. Does
+        nothing (workers keep polling) if the database is not PostgreSQL.
+        """
+        if not self.is_supported:
+            logger.info(
+                "job_dispatcher_disabled",
+                reason="database does not support LISTEN/NOTIFY",
+            )
+            return
+
+        while not self._stop_event.is_set():
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "job_dispatcher_connection_error",
+                    error=str(e),
+                    retry_in_seconds=self.reconnect_delay,
+                )
+            finally:
+                self._set_listening(False)
+
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=self.reconnect_delay,
+                )
+            except TimeoutError:
+                pass
+
+    async def _listen(self) -> None:
+        """Open the listen connection and wait until it drops or stop()."""
+        import asyncpg
+
+        url = make_url(self.database_url).set(drivername="postgresql")
+        conn = await asyncpg.connect(url.render_as_string(hide_password=False))
+        connection_lost = asyncio.Event()
+
+        try:
+            conn.add_termination_listener(lambda _conn: connection_lost.set())
+            for job_type in self._workers:
+                await conn.add_listener(job_notify_channel(job_type), self._on_notify)
+
+            self._set_listening(True)
+            logger.info(
+                "job_dispatcher_listening",
+                channels=[job_notify_channel(jt) for jt in self._workers],
+            )
+
+            stop_wait = asyncio.create_task(self._stop_event.wait())
+            lost_wait = asyncio.create_task(connection_lost.wait())
+            try:
+                await asyncio.wait(
+                    {stop_wait, lost_wait},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                stop_wait.cancel()
+                lost_wait.cancel()
+
+            if connection_lost.is_set():
+                logger.warning("job_dispatcher_connection_lost")
+        finally:
+            if not conn.is_closed():
+                await conn.close()
+
+    def _on_notify(
+        self,
+        _conn: Any,
+        _pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """asyncpg notification callback."""
+        self._notifications_received += 1
+        try:
+            job_type = JobType(payload)
+        except ValueError:
+            job_type = None
+
+        if job_type is None or not channel.startswith(JOB_NOTIFY_CHANNEL_PREFIX):
+            logger.debug(
+                "job_dispatcher_unknown_notification",
+                channel=channel,
+                payload=payload,
+            )
+            return
+        self.dispatch(job_type)
+
+    def _set_listening(self, listening: bool) -> None:
+        """Switch registered workers between notification and poll mode."""
+        if self._listening == listening:
+            return
+        self._listening = listening
+        seen: set[int] = set()
+        for workers in self._workers.values():
+            for worker in workers:
+                if id(worker) in seen:
+                    continue
+                seen.add(id(worker))
+                # Also wakes the worker so nothing enqueued while the
+                # connection was down waits for the next safety poll
+                worker.enable_notifications(listening)
@@ -15,6 +15,7 @@ from app.db.session import async_session_maker
 from app.services.download import DownloadError, DownloadService
 from app.services.duplicate import DuplicateService
 from app.workers.base import BaseWorker, NonRetryableError, RetryableError
+from app.workers.concurrency import WorkerResource
 
 logger = get_logger(__name__)
 
@@ -41,6 +42,7 @@ class DownloadWorker(BaseWorker):
     """
 
     job_types = [JobType.DOWNLOAD_DESIGN]
+    resources = [WorkerResource.TELEGRAM, WorkerResource.DISK]
 
     def __init__(
         self,
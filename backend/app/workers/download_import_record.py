@@ -41,6 +41,7 @@ from app.services.phpbb import PhpbbError, PhpbbService
 from app.services.job_queue import JobQueueService
 from app.utils import compute_file_hash
 from app.workers.base import BaseWorker, CancellationError, NonRetryableError, RetryableError
+from app.workers.concurrency import WorkerResource
 
 # Auto-merge threshold for pre-download duplicate check (DEC-041 / #216)
 AUTO_MERGE_THRESHOLD = 0.9
@@ -63,6 +64,7 @@ class DownloadImportRecordWorker(BaseWorker):
     """
 
     job_types = [JobType.DOWNLOAD_IMPORT_RECORD]
+    resources = [WorkerResource.DISK]
 
     async def process(self, job, payload: dict[str, Any] | None) -> dict[str, Any] | None:
         """Process a DOWNLOAD_IMPORT_RECORD job.
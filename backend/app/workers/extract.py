@@ -17,6 +17,7 @@ from app.services.archive import (
     PasswordProtectedError,
 )
 from app.workers.base import BaseWorker, NonRetryableError, RetryableError
+from app.workers.concurrency import WorkerResource
 
 logger = get_logger(__name__)
 
@@ -41,6 +42,7 @@ class ExtractArchiveWorker(BaseWorker):
     """
 
     job_types = [JobType.EXTRACT_ARCHIVE]
+    resources = [WorkerResource.CPU, WorkerResource.DISK]
 
     def __init__(
         self,
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import asyncio
 from io import BytesIO
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.core.logging import get_logger
 from app.db.models import Attachment, Design, Job, JobType, MediaType, PreviewAsset, TelegramMessage
@@ -20,9 +20,15 @@ from app.db.models.enums import PreviewKind, PreviewSource
 from app.db.session import async_session_maker
 from app.services.preview import PreviewService
 from app.telegram import TelegramService
+from app.telegram.cache import TelegramCache
 from app.workers.base import BaseWorker, NonRetryableError, RetryableError
+from app.workers.concurrency import WorkerResource
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from telethon.errors import FileReferenceExpiredError
+
+if TYPE_CHECKING:
+    from telethon.types import Message
 
 logger = get_logger(__name__)
 
@@ -45,6 +51,7 @@ class ImageWorker(BaseWorker):
     """
 
     job_types = [JobType.DOWNLOAD_TELEGRAM_IMAGES]
+    resources = [WorkerResource.TELEGRAM]
 
     def __init__(
         self,
@@ -160,6 +167,17 @@ class ImageWorker(BaseWorker):
         except Exception as e:
             raise RetryableError(f"Telegram not available: {e}")
 
+        # Fetch every message the photos belong to in one request
+        try:
+            await TelegramCache.get_instance().get_messages(
+                self.telegram.client,
+                int(channel_peer_id),
+                [msg_id for _, msg_id in attachments_to_download[:MAX_IMAGES_PER_JOB]],
+            )
+        except Exception as e:
+            # Left to the per-photo fetches below
+            logger.warning("image_message_prefetch_failed", design_id=design_id, error=str(e))
+
         # Download images (NO database session held during downloads)
         downloaded = []
         try:
@@ -270,11 +288,25 @@ class ImageWorker(BaseWorker):
             Image bytes if successful, None otherwise
         """
         client = self.telegram.client
+        cache = TelegramCache.get_instance()
+
+        # Get the message (usually already cached by the job's batched fetch)
+        message = await cache.get_message(client, int(channel_peer_id), message_id)
 
-        # Get the message
-        entity = await client.get_entity(int(channel_peer_id))
-        message = await client.get_messages(entity, ids=message_id)
+        try:
+            return await self._download_message_photo(message, channel_peer_id, message_id)
+        except FileReferenceExpiredError:
+            # Cached message outlived its file reference; refetch and retry once
+            message = await cache.refresh_message(client, int(channel_peer_id), message_id)
+            return await self._download_message_photo(message, channel_peer_id, message_id)
 
+    async def _download_message_photo(
+        self,
+        message: Message | None,
+        channel_peer_id: str,
+        message_id: int,
+    ) -> bytes | None:
+        """Download the photo of a fetched message into memory."""
         if not message:
             logger.warning(
                 "message_not_found",
@@ -283,6 +315,8 @@ class ImageWorker(BaseWorker):
             )
             return None
 
+        client = self.telegram.client
+
         # Download to bytes buffer
         buffer = BytesIO()
 
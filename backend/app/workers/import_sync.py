@@ -13,7 +13,6 @@ enabled folders in the source are synced.
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -47,6 +46,7 @@ from app.services.google_drive import GoogleDriveError, GoogleDriveService, Goog
 from app.services.import_profile import ImportProfileService
 from app.services.job_queue import JobQueueService
 from app.services.phpbb import PhpbbAuthError, PhpbbError, PhpbbService
+from app.utils import compute_file_hash
 from app.workers.base import BaseWorker, NonRetryableError, RetryableError
 
 # Auto-merge threshold for cross-source duplicate detection (DEC-041 / #216)
@@ -105,6 +105,8 @@ class SyncImportSourceWorker(BaseWorker):
                 - folder_id: Optional folder ID to sync just one folder
                 - auto_import: Whether to auto-import detected designs
                 - conflict_resolution: How to handle conflicts
+                - rebuild: Rescan Google Drive sources fully instead of
+                  applying changes since the last sync
 
         Returns:
             Result dict with designs_detected, designs_imported, errors.
@@ -122,6 +124,7 @@ class SyncImportSourceWorker(BaseWorker):
 
         folder_id = payload.get("folder_id")  # Optional: sync single folder
         auto_import = payload.get("auto_import", False)
+        rebuild = payload.get("rebuild", False)
         conflict_resolution_str = payload.get("conflict_resolution", "SKIP")
         try:
             conflict_resolution = ConflictResolution(conflict_resolution_str)
@@ -134,6 +137,7 @@ class SyncImportSourceWorker(BaseWorker):
             source_id=source_id,
             folder_id=folder_id,
             auto_import=auto_import,
+            rebuild=rebuild,
         )
 
         designs_detected = 0
@@ -174,12 +178,12 @@ class SyncImportSourceWorker(BaseWorker):
                 if not folders_to_sync:
                     # Backward compatibility: use deprecated source fields
                     result = await self._sync_legacy_source(
-                        db, source, auto_import, conflict_resolution
+                        db, source, auto_import, conflict_resolution, rebuild
                     )
                 else:
                     # Sync each folder
                     result = await self._sync_folders(
-                        db, source, folders_to_sync, auto_import, conflict_resolution
+                        db, source, folders_to_sync, auto_import, conflict_resolution, rebuild
                     )
 
                 designs_detected = result["detected"]
@@ -308,6 +312,7 @@ class SyncImportSourceWorker(BaseWorker):
         source: ImportSource,
         auto_import: bool,
         conflict_resolution: ConflictResolution,
+        rebuild: bool = False,
     ) -> dict[str, Any]:
         """Sync a Google Drive import source.
 
@@ -316,6 +321,7 @@ class SyncImportSourceWorker(BaseWorker):
             source: The import source.
             auto_import: Whether to auto-import detected designs.
             conflict_resolution: How to handle conflicts.
+            rebuild: Rescan the whole tree instead of applying changes.
 
         Returns:
             Dict with detected and imported counts.
@@ -336,29 +342,28 @@ class SyncImportSourceWorker(BaseWorker):
         if source.google_credentials_id:
             credentials = await gdrive_service.get_credentials(source.google_credentials_id)
 
-        # Scan Google Drive folder for designs with caching and batching
-        detected_designs = await gdrive_service.scan_for_designs(
+        # Apply Drive changes since the last sync (full scan on first sync
+        # or rebuild). Legacy sources keep their page token in the snapshot.
+        sync_result = await gdrive_service.sync_designs(
             source.google_drive_folder_id,
+            snapshot_key=f"source:{source.id}",
             credentials=credentials,
             config=config,
-            use_cache=True,
-            use_batch=True,
+            rebuild=rebuild,
         )
+        detected_designs = sync_result.designs
         detected = len(detected_designs)
 
         # Update progress: creating records
         await self.update_progress(30, 100)
 
+        existing_paths = await self._existing_source_paths(
+            db, ImportRecord.import_source_id == source.id
+        )
+
         # Create import records for detected designs
         for design in detected_designs:
-            # Check if record already exists
-            existing = await db.execute(
-                select(ImportRecord).where(
-                    ImportRecord.import_source_id == source.id,
-                    ImportRecord.source_path == design.relative_path,
-                )
-            )
-            if existing.scalar_one_or_none():
+            if design.relative_path in existing_paths:
                 continue  # Skip existing records
 
             record = ImportRecord(
@@ -374,6 +379,7 @@ class SyncImportSourceWorker(BaseWorker):
                 google_folder_id=design.folder_id,  # Store Google Drive folder ID for download
             )
             db.add(record)
+            existing_paths.add(design.relative_path)
 
         # Commit records to release locks before potentially long import operations
         await db.commit()
@@ -441,6 +447,7 @@ class SyncImportSourceWorker(BaseWorker):
                 credentials.base_url,
                 source.phpbb_forum_url,
                 cookies,
+                snapshot_key=f"source:{source.id}",
             )
             detected = len(detected_designs)
 
@@ -1062,18 +1069,15 @@ class SyncImportSourceWorker(BaseWorker):
 
     async def _compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA256 hash of a file."""
-        import asyncio
-
-        sha256 = hashlib.sha256()
+        return await compute_file_hash(file_path)
 
-        def _hash_file() -> str:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+    async def _existing_source_paths(self, db, *criteria) -> set[str]:
+        """Get the source_path of every ImportRecord matching criteria.
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _hash_file)
+        One query instead of an existence check per detected design.
+        """
+        result = await db.execute(select(ImportRecord.source_path).where(*criteria))
+        return set(result.scalars().all())
 
     # ============================================================
     # DEC-038: Folder-based sync methods
@@ -1086,6 +1090,7 @@ class SyncImportSourceWorker(BaseWorker):
         folders: list[ImportSourceFolder],
         auto_import: bool,
         conflict_resolution: ConflictResolution,
+        rebuild: bool = False,
     ) -> dict[str, Any]:
         """Sync multiple folders.
 
@@ -1095,6 +1100,7 @@ class SyncImportSourceWorker(BaseWorker):
             folders: List of folders to sync.
             auto_import: Whether to auto-import detected designs.
             conflict_resolution: How to handle conflicts.
+            rebuild: Rescan Google Drive folders fully instead of applying changes.
 
         Returns:
             Dict with total detected and imported counts.
@@ -1120,7 +1126,7 @@ class SyncImportSourceWorker(BaseWorker):
                     )
                 elif source.source_type == ImportSourceType.GOOGLE_DRIVE:
                     result = await self._sync_folder_google_drive(
-                        db, source, folder, auto_import, conflict_resolution
+                        db, source, folder, auto_import, conflict_resolution, rebuild
                     )
                 elif source.source_type == ImportSourceType.PHPBB_FORUM:
                     result = await self._sync_folder_phpbb(
@@ -1194,6 +1200,7 @@ class SyncImportSourceWorker(BaseWorker):
         source: ImportSource,
         auto_import: bool,
         conflict_resolution: ConflictResolution,
+        rebuild: bool = False,
     ) -> dict[str, Any]:
         """Sync using deprecated source-level fields (backward compatibility).
 
@@ -1202,6 +1209,7 @@ class SyncImportSourceWorker(BaseWorker):
             source: The import source.
             auto_import: Whether to auto-import detected designs.
             conflict_resolution: How to handle conflicts.
+            rebuild: Rescan Google Drive sources fully instead of applying changes.
 
         Returns:
             Dict with detected and imported counts.
@@ -1218,7 +1226,7 @@ class SyncImportSourceWorker(BaseWorker):
             )
         elif source.source_type == ImportSourceType.GOOGLE_DRIVE:
             return await self._sync_google_drive(
-                db, source, auto_import, conflict_resolution
+                db, source, auto_import, conflict_resolution, rebuild
             )
         elif source.source_type == ImportSourceType.PHPBB_FORUM:
             return await self._sync_phpbb_forum(
@@ -1310,12 +1318,13 @@ class SyncImportSourceWorker(BaseWorker):
         folder: ImportSourceFolder,
         auto_import: bool,
         conflict_resolution: ConflictResolution,
+        rebuild: bool = False,
     ) -> dict[str, Any]:
         """Sync a single Google Drive folder.
 
         Uses optimized sync strategy:
-        - First sync: Full scan with caching and batching
-        - Subsequent syncs: Incremental sync using change tokens (if available)
+        - First sync (or rebuild): Full scan with batching
+        - Subsequent syncs: Incremental sync using change tokens (OAuth only)
         - Stores sync_cursor for next incremental sync
 
         Args:
@@ -1324,6 +1333,7 @@ class SyncImportSourceWorker(BaseWorker):
             folder: The folder to sync.
             auto_import: Whether to auto-import detected designs.
             conflict_resolution: How to handle conflicts.
+            rebuild: Rescan the whole tree instead of applying changes.
 
         Returns:
             Dict with detected and imported counts.
@@ -1345,44 +1355,36 @@ class SyncImportSourceWorker(BaseWorker):
         if source.google_credentials_id:
             credentials = await gdrive_service.get_credentials(source.google_credentials_id)
 
-        # Scan Google Drive folder with caching and batching
-        # Note: Incremental sync via change tokens is available but requires
-        # tracking file state which adds complexity. For now we use the
-        # optimized full scan with caching.
-        detected_designs = await gdrive_service.scan_for_designs(
+        # Apply Drive changes since folder.sync_cursor, re-detecting only
+        # the affected subtrees. Full scan on first sync or rebuild.
+        sync_result = await gdrive_service.sync_designs(
             folder.google_folder_id,
+            snapshot_key=f"folder:{folder.id}",
             credentials=credentials,
             config=config,
-            use_cache=True,
-            use_batch=True,
+            page_token=folder.sync_cursor,
+            rebuild=rebuild,
         )
+        detected_designs = sync_result.designs
 
-        # Store/update sync cursor for future incremental sync
-        # Get a new page token so future syncs can detect changes
-        if not folder.sync_cursor:
-            try:
-                new_token = await gdrive_service.get_start_page_token(credentials)
-                folder.sync_cursor = new_token
-                logger.debug(
-                    "sync_cursor_set",
-                    folder_id=folder.id,
-                    token_preview=new_token[:20] + "..." if new_token else None,
-                )
-            except Exception as e:
-                # Non-fatal - we can still sync without change tracking
-                logger.warning("failed_to_get_page_token", error=str(e))
+        # Store the page token the next sync continues from
+        folder.sync_cursor = sync_result.page_token
+        logger.debug(
+            "sync_cursor_set",
+            folder_id=folder.id,
+            incremental=sync_result.incremental,
+            changes_applied=sync_result.changes_applied,
+            token_preview=sync_result.page_token[:20] + "..." if sync_result.page_token else None,
+        )
         detected = len(detected_designs)
 
+        existing_paths = await self._existing_source_paths(
+            db, ImportRecord.import_source_folder_id == folder.id
+        )
+
         # Create import records
         for design in detected_designs:
-            # Check if record already exists
-            existing = await db.execute(
-                select(ImportRecord).where(
-                    ImportRecord.import_source_folder_id == folder.id,
-                    ImportRecord.source_path == design.relative_path,
-                )
-            )
-            if existing.scalar_one_or_none():
+            if design.relative_path in existing_paths:
                 continue
 
             record = ImportRecord(
@@ -1399,6 +1401,7 @@ class SyncImportSourceWorker(BaseWorker):
                 google_folder_id=design.folder_id,  # Store for download
             )
             db.add(record)
+            existing_paths.add(design.relative_path)
 
         # Commit records to release locks before potentially long import operations
         await db.commit()
@@ -1461,6 +1464,7 @@ class SyncImportSourceWorker(BaseWorker):
                 credentials.base_url,
                 folder.phpbb_forum_url,
                 cookies,
+                snapshot_key=f"folder:{folder.id}",
             )
             detected = len(detected_designs)
 
@@ -0,0 +1,69 @@
+"""Worker for converting the library to content-addressed storage.
+
+Processes DEDUPE_LIBRARY jobs, which link every imported file to its blob
+in library/.blobs so identical files across designs share one copy on disk.
+New imports go straight into the store when
+PRINTARR_LIBRARY_CONTENT_ADDRESSED is enabled; this job covers files
+imported before that.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.logging import get_logger
+from app.db.models import Job
+from app.db.models.enums import JobType
+from app.services.blob_store import BlobStore
+from app.workers.base import BaseWorker
+from app.workers.concurrency import WorkerResource
+
+logger = get_logger(__name__)
+
+# DesignFiles processed per round
+DEDUPE_BATCH_SIZE = 100
+
+
+class LibraryDedupeWorker(BaseWorker):
+    """Worker that deduplicates an existing library in place."""
+
+    job_types = [JobType.DEDUPE_LIBRARY]
+    resources = [WorkerResource.DISK]
+
+    async def process(self, job: Job, payload: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Process a DEDUPE_LIBRARY job.
+
+        Args:
+            job: The job to process.
+            payload: Unused.
+
+        Returns:
+            Result dict with files processed, files linked and bytes saved.
+        """
+        store = BlobStore()
+        total = await store.count_library_files()
+
+        processed = linked = bytes_saved = 0
+        last_id: str | None = None
+        await self.update_progress(0, total, force=True)
+
+        while True:
+            batch = await store.dedupe_batch(last_id, DEDUPE_BATCH_SIZE)
+            if batch.last_id is None:
+                break
+
+            last_id = batch.last_id
+            processed += batch.files
+            linked += batch.linked
+            bytes_saved += batch.bytes_saved
+            await self.update_progress(processed, max(total, processed))
+
+        store.mark_deduped()
+        logger.info(
+            "library_dedupe_complete",
+            job_id=job.id,
+            processed=processed,
+            linked=linked,
+            bytes_saved=bytes_saved,
+        )
+        return {"processed": processed, "linked": linked, "bytes_saved": bytes_saved}
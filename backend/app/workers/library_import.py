@@ -13,6 +13,7 @@ from app.db.session import async_session_maker
 from app.services.job_queue import JobQueueService
 from app.services.library import LibraryError, LibraryImportService
 from app.workers.base import BaseWorker, NonRetryableError, RetryableError
+from app.workers.concurrency import WorkerResource
 
 logger = get_logger(__name__)
 
@@ -36,6 +37,7 @@ class ImportToLibraryWorker(BaseWorker):
     """
 
     job_types = [JobType.IMPORT_TO_LIBRARY]
+    resources = [WorkerResource.DISK]
 
     def __init__(
         self,
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Any, Type
+from typing import Any
 
 from sqlalchemy import String, and_, cast, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
@@ -15,15 +16,35 @@ from app.db.models import ImportSource, ImportSourceStatus, Job, JobStatus, JobT
 from app.db.session import async_session_maker
 from app.services.job_queue import JobQueueService
 from app.workers.base import BaseWorker
+from app.workers.concurrency import ConcurrencyScheduler, WorkerResource
+from app.workers.dispatcher import JobDispatcher
 
 logger = get_logger(__name__)
 
+# Worker pools sized from settings (SettingsService key -> worker class names).
+# Pools not listed here run a single worker.
+WORKER_POOL_SETTINGS: dict[str, tuple[str, ...]] = {
+    "max_concurrent_downloads": ("DownloadWorker",),
+    "max_concurrent_import_downloads": ("DownloadImportRecordWorker",),
+    "max_cpu_jobs": ("ExtractArchiveWorker", "RenderWorker"),
+}
+
+# Global caps on shared resources (SettingsService key -> resource)
+RESOURCE_LIMIT_SETTINGS: dict[str, WorkerResource] = {
+    "max_telegram_transfers": WorkerResource.TELEGRAM,
+    "max_disk_io_jobs": WorkerResource.DISK,
+    "max_cpu_jobs": WorkerResource.CPU,
+}
+
 
 class WorkerManager:
     """Orchestrates background workers for job processing.
 
     Manages the lifecycle of workers, including:
     - Starting workers in their own tasks
+    - Per-type worker pools, resizable at runtime
+    - Global caps on shared resources (Telegram, disk, CPU)
+    - Waking idle workers via LISTEN/NOTIFY job dispatch
     - Graceful shutdown of all workers
     - Health monitoring and statistics
     - Stale job recovery
@@ -46,35 +67,155 @@ class WorkerManager:
         self.stale_job_threshold_minutes = stale_job_threshold_minutes
 
         self._workers: list[BaseWorker] = []
-        self._worker_tasks: list[asyncio.Task] = []
+        self._worker_tasks: dict[str, asyncio.Task] = {}
+        self._pools: dict[str, list[BaseWorker]] = {}
+        self._pool_config: dict[str, tuple[type[BaseWorker], int, dict[str, Any]]] = {}
+        self._pool_next_index: dict[str, int] = {}
         self._running = False
         self._shutdown_event = asyncio.Event()
         self._maintenance_task: asyncio.Task | None = None
+        self._scheduler = ConcurrencyScheduler()
+        self._dispatcher = JobDispatcher()
+        self._dispatcher_task: asyncio.Task | None = None
         self._started_at: datetime | None = None
 
+        # SQLite doesn't handle concurrent writes well, so pools only
+        # scale out on PostgreSQL (DEC-039)
+        self.allow_concurrency = (
+            make_url(settings.database_url).get_backend_name() == "postgresql"
+        )
+
+    @property
+    def scheduler(self) -> ConcurrencyScheduler:
+        """Get the shared-resource scheduler used by all workers."""
+        return self._scheduler
+
     def register_worker(
         self,
-        worker_class: Type[BaseWorker],
+        worker_class: type[BaseWorker],
         *,
         count: int = 1,
+        batch_size: int = 1,
         **kwargs: Any,
     ) -> None:
         """Register a worker class to be managed.
 
+        Workers of the same class form a pool that can later be resized
+        with resize_pool().
+
         Args:
             worker_class: The worker class to instantiate.
             count: Number of worker instances to create.
+            batch_size: Number of jobs each worker claims per poll.
             **kwargs: Arguments to pass to worker constructor.
         """
-        for i in range(count):
-            worker_id = f"{worker_class.__name__}-{i+1}"
-            worker = worker_class(worker_id=worker_id, **kwargs)
-            self._workers.append(worker)
+        name = worker_class.__name__
+        self._pool_config[name] = (worker_class, batch_size, kwargs)
+        self._pools.setdefault(name, [])
+        self._pool_next_index.setdefault(name, 0)
+        for _ in range(self._pool_size(count)):
+            self._spawn_worker(name)
+
+    def resize_pool(self, worker_class_name: str, count: int) -> int:
+        """Grow or shrink a worker pool.
+
+        New workers start immediately if the manager is running. Surplus
+        workers are retired idle-first; a busy worker finishes its
+        current job before stopping and releases any other jobs it had
+        claimed.
+
+        Args:
+            worker_class_name: Class name of a registered worker.
+            count: Desired number of workers (minimum 1).
+
+        Returns:
+            The resulting pool size.
+        """
+        pool = self._pools.get(worker_class_name)
+        if pool is None:
+            logger.warning("worker_pool_not_found", pool=worker_class_name)
+            return 0
+
+        target = self._pool_size(count)
+        old_size = len(pool)
+
+        while len(pool) < target:
+            self._spawn_worker(worker_class_name)
+
+        if len(pool) > target:
+            # Idle workers sort first (False < True)
+            surplus = sorted(pool, key=lambda w: w.is_processing)[: len(pool) - target]
+            for worker in surplus:
+                pool.remove(worker)
+                self._workers.remove(worker)
+                self._dispatcher.unregister(worker)
+                worker.request_shutdown()
+
+        if len(pool) != old_size:
             logger.info(
-                "worker_registered",
-                worker_id=worker_id,
-                job_types=[jt.value for jt in worker.job_types],
+                "worker_pool_resized",
+                pool=worker_class_name,
+                old_size=old_size,
+                new_size=len(pool),
             )
+        return len(pool)
+
+    async def apply_setting(self, key: str, value: int) -> None:
+        """Apply a concurrency setting to the running workers.
+
+        Args:
+            key: SettingsService key (see WORKER_POOL_SETTINGS and
+                RESOURCE_LIMIT_SETTINGS).
+            value: New value for the setting.
+        """
+        resource = RESOURCE_LIMIT_SETTINGS.get(key)
+        if resource is not None:
+            await self._scheduler.set_limit(resource, value)
+
+        for worker_class_name in WORKER_POOL_SETTINGS.get(key, ()):
+            if worker_class_name in self._pools:
+                self.resize_pool(worker_class_name, value)
+
+    def _pool_size(self, count: int) -> int:
+        """Clamp a requested pool size to what the database supports."""
+        count = max(1, count)
+        return count if self.allow_concurrency else 1
+
+    def _spawn_worker(self, worker_class_name: str) -> BaseWorker:
+        """Create a worker for a pool, starting it if the manager runs."""
+        worker_class, batch_size, kwargs = self._pool_config[worker_class_name]
+        self._pool_next_index[worker_class_name] += 1
+        worker_id = f"{worker_class_name}-{self._pool_next_index[worker_class_name]}"
+
+        worker = worker_class(worker_id=worker_id, **kwargs)
+        worker.safety_poll_interval = settings.worker_safety_poll_interval
+        worker.batch_size = batch_size
+        worker.scheduler = self._scheduler
+
+        self._workers.append(worker)
+        self._pools[worker_class_name].append(worker)
+        self._dispatcher.register(worker)
+        if self._running:
+            self._start_worker(worker)
+
+        logger.info(
+            "worker_registered",
+            worker_id=worker_id,
+            job_types=[jt.value for jt in worker.job_types],
+            resources=[r.value for r in worker.resources],
+        )
+        return worker
+
+    def _start_worker(self, worker: BaseWorker) -> None:
+        """Run a worker in its own task."""
+        task = asyncio.create_task(
+            worker.run(),
+            name=f"worker-{worker.worker_id}",
+        )
+        self._worker_tasks[worker.worker_id] = task
+        task.add_done_callback(
+            lambda _t, worker_id=worker.worker_id: self._worker_tasks.pop(worker_id, None)
+        )
 
     async def start(self) -> None:
         """Start all registered workers.
@@ -95,11 +236,13 @@ class WorkerManager:
 
         # Start all workers as tasks
         for worker in self._workers:
-            task = asyncio.create_task(
-                worker.run(),
-                name=f"worker-{worker.worker_id}",
-            )
-            self._worker_tasks.append(task)
+            self._start_worker(worker)
+
+        # Start job dispatcher (LISTEN/NOTIFY wake-ups; polling is the fallback)
+        self._dispatcher_task = asyncio.create_task(
+            self._dispatcher.run(),
+            name="worker-dispatcher",
+        )
 
         # Start maintenance task (stale job recovery)
         self._maintenance_task = asyncio.create_task(
@@ -135,6 +278,15 @@ class WorkerManager:
         for worker in self._workers:
             worker.request_shutdown()
 
+        # Stop job dispatcher
+        self._dispatcher.stop()
+        if self._dispatcher_task:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+
         # Cancel maintenance task
         if self._maintenance_task:
             self._maintenance_task.cancel()
@@ -144,19 +296,20 @@ class WorkerManager:
                 pass
 
         # Wait for worker tasks to complete (with timeout)
-        if self._worker_tasks:
+        worker_tasks = list(self._worker_tasks.values())
+        if worker_tasks:
             try:
                 await asyncio.wait_for(
-                    asyncio.gather(*self._worker_tasks, return_exceptions=True),
+                    asyncio.gather(*worker_tasks, return_exceptions=True),
                     timeout=30.0,  # 30 second timeout
                 )
             except asyncio.TimeoutError:
                 logger.warning(
                     "worker_shutdown_timeout",
-                    pending_workers=len([t for t in self._worker_tasks if not t.done()]),
+                    pending_workers=len([t for t in worker_tasks if not t.done()]),
                 )
                 # Cancel remaining tasks
-                for task in self._worker_tasks:
+                for task in worker_tasks:
                     if not task.done():
                         task.cancel()
 
@@ -293,6 +446,9 @@ class WorkerManager:
                 "worker_count": len(self._workers),
                 "uptime_seconds": self._uptime_seconds(),
             },
+            "pools": {name: len(pool) for name, pool in self._pools.items()},
+            "resources": self._scheduler.stats,
+            "dispatcher": self._dispatcher.stats,
             "queue": queue_stats,
             "workers": [w.stats for w in self._workers],
         }
@@ -350,36 +506,64 @@ async def start_workers() -> None:
     from app.workers.family import FamilyWorker
     from app.workers.image import ImageWorker
     from app.workers.import_sync import SyncImportSourceWorker
+    from app.workers.library_dedupe import LibraryDedupeWorker
     from app.workers.library_import import ImportToLibraryWorker
+    from app.workers.preview_variants import PreviewVariantsWorker
     from app.workers.render import RenderWorker
 
-    # Register download workers
-    # NOTE: SQLite doesn't handle concurrent writes well, so we limit to 1 worker
-    # for SQLite databases. For PostgreSQL, we could use max_concurrent_downloads.
-    download_worker_count = 1  # Forced to 1 for SQLite compatibility
-    manager.register_worker(DownloadWorker, count=download_worker_count)
+    # Size pools and shared-resource caps from settings (DB overrides env)
+    concurrency = await _load_concurrency_settings()
+    for key, resource in RESOURCE_LIMIT_SETTINGS.items():
+        await manager.scheduler.set_limit(resource, concurrency[key])
+
+    # Register download workers (I/O-bound, scale out up to the Telegram
+    # and disk caps). Bulk downloads queue thousands of jobs at once, so
+    # they are claimed in batches.
+    manager.register_worker(
+        DownloadWorker,
+        count=concurrency["max_concurrent_downloads"],
+        batch_size=settings.job_claim_batch_size,
+    )
 
     # Register image workers (v0.7: preview image downloads)
-    manager.register_worker(ImageWorker, count=1)
+    manager.register_worker(
+        ImageWorker,
+        count=1,
+        batch_size=settings.job_claim_batch_size,
+    )
 
-    # Register extract workers (single worker is sufficient for CPU-bound extraction)
-    manager.register_worker(ExtractArchiveWorker, count=1)
+    # Register extract workers (CPU-bound, bounded by the CPU cap)
+    manager.register_worker(ExtractArchiveWorker, count=concurrency["max_cpu_jobs"])
 
     # Register import workers (single worker to avoid race conditions)
     manager.register_worker(ImportToLibraryWorker, count=1)
 
-    # Register render workers (CPU-bound, single worker is sufficient)
-    manager.register_worker(RenderWorker, count=1)
+    # Register library dedupe worker (one job walks the whole library)
+    manager.register_worker(LibraryDedupeWorker, count=1)
+
+    # Register render workers (CPU-bound, bounded by the CPU cap)
+    manager.register_worker(RenderWorker, count=concurrency["max_cpu_jobs"])
+
+    # Register preview variant backfill worker (one job covers all previews)
+    manager.register_worker(PreviewVariantsWorker, count=1)
 
     # Register import sync workers (v0.8: async import source syncing)
     manager.register_worker(SyncImportSourceWorker, count=1)
 
     # Register per-design download workers (DEC-040)
-    manager.register_worker(DownloadImportRecordWorker, count=1)
+    manager.register_worker(
+        DownloadImportRecordWorker,
+        count=concurrency["max_concurrent_import_downloads"],
+    )
 
     # Register AI analysis workers (v1.0 - DEC-043)
     # Only useful if AI is enabled, but worker handles this gracefully
-    manager.register_worker(AiWorker, count=1)
+    # Claims several jobs at once so they can share a batched request
+    manager.register_worker(
+        AiWorker,
+        count=1,
+        batch_size=settings.ai_batch_max_designs,
+    )
 
     # Register family overlap detection workers (v1.0 - DEC-044)
     # Runs post-download to find design variants via shared file hashes
@@ -389,6 +573,32 @@ async def start_workers() -> None:
     await manager.start()
 
 
+async def _load_concurrency_settings() -> dict[str, int]:
+    """Read worker pool sizes and resource caps via SettingsService."""
+    from app.services.settings import WORKER_CONCURRENCY_SETTINGS, SettingsService
+
+    async with async_session_maker() as db:
+        settings_service = SettingsService(db)
+        return {
+            key: await settings_service.get(key)
+            for key in WORKER_CONCURRENCY_SETTINGS
+        }
+
+
+async def apply_concurrency_setting(key: str, value: int) -> None:
+    """Apply a changed concurrency setting to the running worker manager.
+
+    Called by SettingsService when a setting in WORKER_CONCURRENCY_SETTINGS
+    changes. Does nothing if workers aren't running.
+
+    Args:
+        key: The setting key.
+        value: The new value.
+    """
+    if _manager is not None and _manager.is_running:
+        await _manager.apply_setting(key, value)
+
+
 async def stop_workers() -> None:
     """Stop the global worker manager.
 
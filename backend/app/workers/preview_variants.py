@@ -0,0 +1,64 @@
+"""Worker for backfilling resized preview variants.
+
+Processes GENERATE_PREVIEW_VARIANTS jobs, which generate the WebP/AVIF
+derivatives for previews saved before variants existed. New previews get
+their variants when saved, so one job works through the whole backlog.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.logging import get_logger
+from app.db.models import Job
+from app.db.models.enums import JobType
+from app.db.session import async_session_maker
+from app.services.preview import PreviewService
+from app.workers.base import BaseWorker
+from app.workers.concurrency import WorkerResource
+
+logger = get_logger(__name__)
+
+# Previews processed (and committed) per round
+VARIANT_BACKFILL_BATCH_SIZE = 50
+
+
+class PreviewVariantsWorker(BaseWorker):
+    """Worker that generates missing preview variants."""
+
+    job_types = [JobType.GENERATE_PREVIEW_VARIANTS]
+    resources = [WorkerResource.CPU]
+
+    async def process(self, job: Job, payload: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Process a GENERATE_PREVIEW_VARIANTS job.
+
+        Args:
+            job: The job to process.
+            payload: Unused.
+
+        Returns:
+            Result dict with the number of previews processed.
+        """
+        async with async_session_maker() as db:
+            total = await PreviewService(db).count_missing_variants()
+
+        processed = 0
+        await self.update_progress(0, total, force=True)
+
+        while True:
+            async with async_session_maker() as db:
+                count = await PreviewService(db).generate_missing_variants(
+                    limit=VARIANT_BACKFILL_BATCH_SIZE
+                )
+                await db.commit()
+
+            if count == 0:
+                break
+
+            processed += count
+            # Previews saved meanwhile already have variants, so the total
+            # can only shrink; keep it from dropping below what's done
+            await self.update_progress(processed, max(total, processed))
+
+        logger.info("preview_variant_backfill_complete", job_id=job.id, processed=processed)
+        return {"processed": processed}
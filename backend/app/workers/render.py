@@ -21,6 +21,7 @@ from app.db.models.enums import FileKind, JobType, PreviewKind, PreviewSource
 from app.db.session import async_session_maker
 from app.services.preview import PreviewService
 from app.workers.base import BaseWorker
+from app.workers.concurrency import WorkerResource
 from sqlalchemy import select
 
 logger = get_logger(__name__)
@@ -47,6 +48,7 @@ class RenderWorker(BaseWorker):
     """
 
     job_types = [JobType.GENERATE_RENDER]
+    resources = [WorkerResource.CPU]
 
     async def process(self, job: Job, payload: dict[str, Any] | None) -> dict[str, Any] | None:
         """Process a GENERATE_RENDER job.
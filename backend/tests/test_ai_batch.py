@@ -0,0 +1,93 @@
+"""Tests for batched AI analysis (DEC-043).
+
+Tests cover:
+- Parsing per-design results from a batch response
+- Token estimates used to size batches
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from app.services.ai import GEMINI_IMAGE_TILE_TOKENS, AiService
+
+
+def design(title: str = "Dragon Bust"):
+    return SimpleNamespace(
+        canonical_title=title,
+        canonical_designer="Someone",
+        sources=[],
+    )
+
+
+def preview(width: int | None, height: int | None):
+    return SimpleNamespace(width=width, height=height)
+
+
+class TestParseBatchResponse:
+    """Tests for AiService._parse_batch_response."""
+
+    def test_results_keyed_by_design(self):
+        response = json.dumps({
+            "designs": [
+                {"design": 1, "tags": ["Griffin", "bust"], "best_preview_index": 0},
+                {"design": 0, "tags": ["dragon"], "best_preview_index": 2},
+            ]
+        })
+
+        results = AiService()._parse_batch_response(response, 2)
+
+        assert results[0].tags == ["dragon"]
+        assert results[0].best_preview_index == 2
+        assert results[1].tags == ["griffin", "bust"]
+
+    def test_code_fence_and_bare_list(self):
+        response = '```json\n[{"design": 0, "tags": ["dragon"]}]\n```'
+
+        results = AiService()._parse_batch_response(response, 1)
+
+        assert results[0].tags == ["dragon"]
+        assert results[0].best_preview_index is None
+
+    def test_invalid_entries_skipped(self):
+        response = json.dumps({
+            "designs": [
+                {"design": 5, "tags": ["out of range"]},
+                {"tags": ["no index"]},
+                "garbage",
+                {"design": 0, "tags": ["first"]},
+                {"design": 0, "tags": ["duplicate"]},
+            ]
+        })
+
+        results = AiService()._parse_batch_response(response, 2)
+
+        assert list(results) == [0]
+        assert results[0].tags == ["first"]
+
+    def test_unparseable_response(self):
+        assert AiService()._parse_batch_response("not json", 2) == {}
+
+
+class TestEstimateTokens:
+    """Tests for AiService._estimate_tokens."""
+
+    def test_small_image_is_one_tile(self, monkeypatch):
+        monkeypatch.setattr("app.services.ai.settings.ai_image_max_edge", 1024)
+        service = AiService()
+
+        small = service._estimate_tokens(design(), [preview(300, 200)])
+        large = service._estimate_tokens(design(), [preview(4000, 3000)])
+
+        # 4000x3000 is downscaled to 1024x768: two tiles
+        assert large - small == GEMINI_IMAGE_TILE_TOKENS
+
+    def test_unknown_size_assumes_max_edge(self, monkeypatch):
+        monkeypatch.setattr("app.services.ai.settings.ai_image_max_edge", 1024)
+        service = AiService()
+
+        unknown = service._estimate_tokens(design(), [preview(None, None)])
+        known = service._estimate_tokens(design(), [preview(1024, 1024)])
+
+        assert unknown == known
@@ -0,0 +1,60 @@
+"""Tests for the AI analysis result cache (DEC-043).
+
+Tests cover:
+- Cache key stability and sensitivity
+- Store/load round trip
+"""
+
+from __future__ import annotations
+
+from app.services.ai_cache import AiResultCache
+
+CONTEXT = {
+    "title": "Dragon Bust",
+    "designer": "Someone",
+    "channel": "Minis",
+    "caption": "A dragon bust",
+}
+
+
+def make_key(**overrides) -> str:
+    args = {
+        "prompt_version": 1,
+        "context": CONTEXT,
+        "image_hashes": ["a" * 64, "b" * 64],
+        "image_sources": ["TELEGRAM", "ARCHIVE"],
+    }
+    args.update(overrides)
+    return AiResultCache.key_for(**args)
+
+
+class TestKey:
+    """Tests for AiResultCache.key_for."""
+
+    def test_cosmetic_metadata_changes_share_key(self):
+        context = {**CONTEXT, "title": "  dragon   BUST "}
+        assert make_key(context=context) == make_key()
+
+    def test_metadata_change_changes_key(self):
+        context = {**CONTEXT, "caption": "A griffin bust"}
+        assert make_key(context=context) != make_key()
+
+    def test_preview_content_and_order_matter(self):
+        assert make_key(image_hashes=["c" * 64, "b" * 64]) != make_key()
+        assert make_key(image_hashes=["b" * 64, "a" * 64]) != make_key()
+
+    def test_prompt_version_changes_key(self):
+        assert make_key(prompt_version=2) != make_key()
+
+
+class TestStore:
+    """Tests for AiResultCache.get/put."""
+
+    def test_round_trip(self):
+        key = make_key()
+        AiResultCache.put(key, {"tags": ["dragon", "bust"], "best_preview_index": 1})
+
+        assert AiResultCache.get(key) == {"tags": ["dragon", "bust"], "best_preview_index": 1}
+
+    def test_miss(self):
+        assert AiResultCache.get(make_key(prompt_version=99)) is None
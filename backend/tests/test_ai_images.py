@@ -0,0 +1,117 @@
+"""Tests for preview preparation for AI analysis (DEC-043).
+
+Tests cover:
+- Downscaling and JPEG re-encoding
+- Transparency flattening
+- Content-hash cache reuse
+- Mapping prepared images back to their previews
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.services.ai import AiService
+from app.services.ai_images import AI_IMAGE_MIME_TYPE, PreparedImage, prepare_image
+
+
+def write_image(path: Path, size: tuple[int, int], mode: str = "RGB", fmt: str = "PNG") -> Path:
+    color = (200, 50, 50, 0) if mode == "RGBA" else (200, 50, 50)
+    Image.new(mode, size, color).save(path, fmt)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "ai_images"
+
+
+class TestPrepareImage:
+    """Tests for prepare_image."""
+
+    def test_downscales_to_max_edge(self, tmp_path, cache_dir):
+        source = write_image(tmp_path / "big.png", (4000, 2000))
+
+        prepared = prepare_image(str(source), str(cache_dir), 1024, 80)
+
+        assert prepared.mime_type == AI_IMAGE_MIME_TYPE
+        assert not prepared.cache_hit
+        assert prepared.original_size == source.stat().st_size
+        with Image.open(BytesIO(prepared.data)) as img:
+            assert img.format == "JPEG"
+            assert img.size == (1024, 512)
+
+    def test_small_image_not_upscaled(self, tmp_path, cache_dir):
+        source = write_image(tmp_path / "small.jpg", (300, 200), fmt="JPEG")
+
+        prepared = prepare_image(str(source), str(cache_dir), 1024, 80)
+
+        with Image.open(BytesIO(prepared.data)) as img:
+            assert img.size == (300, 200)
+
+    def test_transparency_flattened_to_white(self, tmp_path, cache_dir):
+        source = write_image(tmp_path / "alpha.png", (64, 64), mode="RGBA")
+
+        prepared = prepare_image(str(source), str(cache_dir), 1024, 95)
+
+        with Image.open(BytesIO(prepared.data)) as img:
+            assert img.mode == "RGB"
+            r, g, b = img.getpixel((32, 32))
+            assert min(r, g, b) > 240
+
+    def test_result_cached_by_content(self, tmp_path, cache_dir):
+        first = write_image(tmp_path / "a.png", (2000, 2000))
+        second = tmp_path / "b.png"
+        second.write_bytes(first.read_bytes())
+
+        prepared = prepare_image(str(first), str(cache_dir), 512, 80)
+        reused = prepare_image(str(second), str(cache_dir), 512, 80)
+
+        assert reused.cache_hit
+        assert reused.data == prepared.data
+
+    def test_cache_keyed_by_parameters(self, tmp_path, cache_dir):
+        source = write_image(tmp_path / "a.png", (2000, 2000))
+
+        prepare_image(str(source), str(cache_dir), 512, 80)
+        resized = prepare_image(str(source), str(cache_dir), 256, 80)
+
+        assert not resized.cache_hit
+        with Image.open(BytesIO(resized.data)) as img:
+            assert img.size == (256, 256)
+
+    def test_unreadable_image_raises(self, tmp_path, cache_dir):
+        source = tmp_path / "broken.png"
+        source.write_bytes(b"not an image")
+
+        with pytest.raises(OSError):
+            prepare_image(str(source), str(cache_dir), 512, 80)
+
+
+class TestReadPreviewImages:
+    """Tests for AiService._read_preview_images."""
+
+    @pytest.mark.asyncio
+    async def test_reports_preview_index_of_each_image(self, tmp_path):
+        previews = [MagicMock(name=f"preview{i}") for i in range(3)]
+        paths = {p: tmp_path / f"{i}.png" for i, p in enumerate(previews)}
+        prepared = [
+            PreparedImage(b"a", AI_IMAGE_MIME_TYPE, 1, False),
+            None,  # Failed to prepare
+            PreparedImage(b"c", AI_IMAGE_MIME_TYPE, 1, False),
+        ]
+        service = AiService(MagicMock())
+
+        with (
+            patch.object(service, "_existing_preview_paths", return_value=paths),
+            patch("app.services.ai.prepare_ai_images", AsyncMock(return_value=prepared)),
+        ):
+            images, indices = await service._read_preview_images(previews)
+
+        assert images == [(b"a", AI_IMAGE_MIME_TYPE), (b"c", AI_IMAGE_MIME_TYPE)]
+        assert indices == [0, 2]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import tarfile
 import zipfile
 from contextlib import asynccontextmanager
@@ -9,6 +11,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.db.base import Base
@@ -434,6 +437,49 @@ class TestPrepareFileInfo:
         assert file_info.relative_path == "models/part.stl"
 
 
+class TestExtractDesignArchives:
+    """Tests for extract_design_archives."""
+
+    @pytest.mark.asyncio
+    async def test_records_hashes_for_all_files(
+        self, db_session, sample_design, temp_staging, mock_session_maker
+    ):
+        """Test files from top-level and nested archives get correct hashes."""
+        inner = io.BytesIO()
+        with zipfile.ZipFile(inner, "w") as zf:
+            zf.writestr("nested/part.stl", b"nested part")
+
+        with zipfile.ZipFile(temp_staging / "design.zip", "w") as zf:
+            for i in range(20):
+                zf.writestr(f"parts/part{i}.stl", f"part {i}".encode())
+            zf.writestr("inner.zip", inner.getvalue())
+        await db_session.commit()
+
+        extractor = ArchiveExtractor(db_session)
+        with patch("app.services.archive.async_session_maker", mock_session_maker):
+            with patch("app.services.archive.settings") as mock_settings:
+                mock_settings.staging_path = temp_staging.parent
+                result = await extractor.extract_design_archives(sample_design.id)
+
+        assert result["files_created"] == 22
+        assert result["nested_archives"] == 1
+        assert not (temp_staging / "design.zip").exists()
+        assert not (temp_staging / "inner.zip").exists()
+
+        async with mock_session_maker() as db:
+            files = (
+                await db.execute(
+                    select(DesignFile).where(DesignFile.design_id == sample_design.id)
+                )
+            ).scalars().all()
+            design = await db.get(Design, sample_design.id)
+
+        hashes = {f.relative_path: f.sha256 for f in files}
+        assert hashes["parts/part7.stl"] == hashlib.sha256(b"part 7").hexdigest()
+        assert hashes["nested/part.stl"] == hashlib.sha256(b"nested part").hexdigest()
+        assert design.status == DesignStatus.EXTRACTED
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================
@@ -0,0 +1,193 @@
+"""Tests for BackfillService - streaming channel backfill."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.models import BackfillMode, Channel, TelegramMessage
+from app.services import backfill as backfill_module
+from app.services.backfill import BackfillService
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def db_engine():
+    """Create an in-memory test database engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Create a test database session."""
+    async_session = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session() as session:
+        yield session
+
+
+@pytest.fixture
+async def sample_channel(db_session):
+    """Create a sample channel for testing."""
+    channel = Channel(
+        title="Test Channel",
+        telegram_peer_id="12345",
+        is_enabled=True,
+        backfill_mode=BackfillMode.ALL_HISTORY,
+    )
+    db_session.add(channel)
+    await db_session.commit()
+    return channel
+
+
+class FakeTelegram:
+    """Stand-in for TelegramService that yields synthetic messages."""
+
+    def __init__(self, count: int, fail_after: int | None = None):
+        self.count = count
+        self.fail_after = fail_after
+        self.yielded = 0
+        self.client = SimpleNamespace(iter_messages=self._iter_messages)
+
+    async def _iter_messages(self, peer_id, **kwargs):
+        for msg_id in range(kwargs.get("min_id", 0) + 1, self.count + 1):
+            if self.fail_after is not None and self.yielded >= self.fail_after:
+                raise ConnectionError("telegram went away")
+            self.yielded += 1
+            yield SimpleNamespace(id=msg_id)
+            await asyncio.sleep(0)
+
+    async def _parse_message(self, message) -> dict:
+        return {
+            "id": message.id,
+            "date": "2024-01-15T10:30:00Z",
+            "text": f"Message {message.id}",
+            "has_media": False,
+            "attachments": [],
+        }
+
+
+def make_service(db_session, telegram: FakeTelegram) -> BackfillService:
+    """Create a BackfillService wired to a fake Telegram client."""
+    with patch(
+        "app.services.backfill.TelegramService.get_instance",
+        return_value=telegram,
+    ):
+        service = BackfillService(db_session)
+    service._fetch_unfetched_metadata = AsyncMock(
+        return_value={"fetched": 0, "failed": 0}
+    )
+    return service
+
+
+async def count_messages(db_session) -> int:
+    """Count ingested TelegramMessage rows."""
+    result = await db_session.execute(select(func.count(TelegramMessage.id)))
+    return result.scalar_one()
+
+
+# =============================================================================
+# Pipeline Tests
+# =============================================================================
+
+
+class TestStreamingBackfill:
+    """Tests for the producer/consumer backfill pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_ingests_all_messages(self, db_session, sample_channel):
+        """Test that every fetched message is ingested and checkpointed."""
+        service = make_service(db_session, FakeTelegram(count=25))
+
+        result = await service.backfill_channel(sample_channel)
+
+        assert result["messages_processed"] == 25
+        assert result["last_message_id"] == 25
+        assert await count_messages(db_session) == 25
+
+        await db_session.refresh(sample_channel)
+        assert sample_channel.last_backfill_checkpoint == 25
+        assert sample_channel.last_ingested_message_id == 25
+
+    @pytest.mark.asyncio
+    async def test_fetch_is_bounded_by_queue(self, db_session, sample_channel):
+        """Test that the producer never runs far ahead of ingestion."""
+        telegram = FakeTelegram(count=50)
+        service = make_service(db_session, telegram)
+
+        max_lead = 0
+        original_ingest = service.ingest.ingest_batch
+
+        async def tracking_ingest(channel, messages):
+            nonlocal max_lead
+            max_lead = max(max_lead, telegram.yielded - messages[-1]["id"])
+            return await original_ingest(channel, messages)
+
+        service.ingest.ingest_batch = tracking_ingest
+
+        with patch.object(backfill_module, "BACKFILL_QUEUE_SIZE", 5):
+            result = await service.backfill_channel(sample_channel)
+
+        assert result["messages_processed"] == 50
+        # Queue size plus the message held by the blocked producer
+        assert max_lead <= 6
+
+    @pytest.mark.asyncio
+    async def test_commits_checkpoints_in_batches(self, db_session, sample_channel):
+        """Test that checkpoints are committed while the backfill runs."""
+        service = make_service(db_session, FakeTelegram(count=30))
+
+        checkpoints = []
+        original_update = service._update_checkpoint
+
+        async def tracking_update(channel_id, message_id):
+            checkpoints.append(message_id)
+            await original_update(channel_id, message_id)
+
+        service._update_checkpoint = tracking_update
+
+        with patch.object(backfill_module, "BACKFILL_BATCH_SIZE", 10):
+            await service.backfill_channel(sample_channel)
+
+        # Intermediate checkpoints before the final one
+        assert len(checkpoints) > 1
+        assert checkpoints == sorted(checkpoints)
+        assert checkpoints[-1] == 30
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_saves_checkpoint(self, db_session, sample_channel):
+        """Test that a Telegram error keeps ingested progress for resuming."""
+        service = make_service(db_session, FakeTelegram(count=30, fail_after=12))
+
+        with pytest.raises(ConnectionError):
+            await service.backfill_channel(sample_channel)
+
+        assert await count_messages(db_session) == 12
+        await db_session.refresh(sample_channel)
+        assert sample_channel.last_backfill_checkpoint == 12
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, db_session, sample_channel):
+        """Test that a resumed backfill only fetches newer messages."""
+        sample_channel.last_backfill_checkpoint = 20
+        await db_session.commit()
+        service = make_service(db_session, FakeTelegram(count=30))
+
+        result = await service.backfill_channel(sample_channel)
+
+        assert result["messages_processed"] == 10
+        assert result["last_message_id"] == 30
@@ -0,0 +1,210 @@
+"""Tests for BlobStore - content-addressed library storage.
+
+Tests cover:
+- Storing files once and linking them into the library
+- Converting existing library copies into links
+- Releasing blobs once no DesignFile refers to them
+- Deduplicating a library through the DesignFile table
+"""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.models import Design, DesignFile, DesignStatus, FileKind
+from app.services.blob_store import BlobStore
+
+CONTENT = b"solid body"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+async def db_engine():
+    """Create an in-memory test database engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Create a test database session."""
+    async_session = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        yield session
+
+
+@pytest.fixture
+def mock_session_maker(db_engine):
+    """Create a mock session maker that uses the test database."""
+    test_session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def mock_maker():
+        async with test_session_maker() as session:
+            yield session
+
+    return mock_maker
+
+
+@pytest.fixture
+def library(tmp_path):
+    library = tmp_path / "library"
+    library.mkdir()
+    return library
+
+
+@pytest.fixture
+def store(library):
+    return BlobStore(library / ".blobs")
+
+
+async def add_design_file(
+    db_session,
+    relative_path: str,
+    sha256: str | None = SHA256,
+    status: DesignStatus = DesignStatus.ORGANIZED,
+) -> DesignFile:
+    design = Design(canonical_title="Variant", canonical_designer="Maker", status=status)
+    db_session.add(design)
+    await db_session.flush()
+    design_file = DesignFile(
+        design_id=design.id,
+        relative_path=relative_path,
+        filename=relative_path.rsplit("/", 1)[-1],
+        ext=".stl",
+        sha256=sha256,
+        file_kind=FileKind.MODEL,
+    )
+    db_session.add(design_file)
+    await db_session.flush()
+    return design_file
+
+
+class TestPlace:
+    """Tests for BlobStore.place."""
+
+    def test_identical_files_share_one_blob(self, tmp_path, library, store):
+        for name in ("a", "b"):
+            source = tmp_path / f"{name}.stl"
+            source.write_bytes(CONTENT)
+            method = store.place(source, library / name / "body.stl", SHA256)
+            assert method == "hardlink"
+            assert not source.exists()
+
+        blob = store.blob_path(SHA256)
+        assert blob.read_bytes() == CONTENT
+        assert blob.stat().st_nlink == 3
+        assert (library / "a" / "body.stl").stat().st_ino == (library / "b" / "body.stl").stat().st_ino
+
+    def test_keeps_source_when_existing_blob_differs(self, tmp_path, library, store):
+        blob = store.blob_path(SHA256)
+        blob.parent.mkdir(parents=True)
+        blob.write_bytes(b"something else entirely")
+        source = tmp_path / "body.stl"
+        source.write_bytes(CONTENT)
+
+        with pytest.raises(ValueError):
+            store.place(source, library / "a" / "body.stl", SHA256)
+
+        assert source.read_bytes() == CONTENT
+
+
+class TestAdopt:
+    """Tests for BlobStore.adopt."""
+
+    def test_first_copy_becomes_blob_and_later_copies_link(self, library, store):
+        first = library / "a" / "body.stl"
+        second = library / "b" / "body.stl"
+        for path in (first, second):
+            path.parent.mkdir()
+            path.write_bytes(CONTENT)
+
+        assert store.adopt(first, SHA256) == 0
+        assert store.adopt(second, SHA256) == len(CONTENT)
+        assert store.adopt(second, SHA256) == 0
+
+        assert first.stat().st_ino == second.stat().st_ino == store.blob_path(SHA256).stat().st_ino
+        assert second.read_bytes() == CONTENT
+
+
+class TestRelease:
+    """Tests for BlobStore.release and delete_design_files."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_blob_while_referenced(self, tmp_path, library, store, db_session):
+        first = await add_design_file(db_session, "a/body.stl")
+        await add_design_file(db_session, "b/body.stl")
+        source = tmp_path / "body.stl"
+        source.write_bytes(CONTENT)
+        store.place(source, library / "a" / "body.stl", SHA256)
+
+        await store.delete_design_files(db_session, first.design_id)
+
+        assert store.blob_path(SHA256).exists()
+
+    @pytest.mark.asyncio
+    async def test_deletes_unreferenced_blob_and_shards(self, tmp_path, library, store, db_session):
+        design_file = await add_design_file(db_session, "a/body.stl")
+        source = tmp_path / "body.stl"
+        source.write_bytes(CONTENT)
+        store.place(source, library / "a" / "body.stl", SHA256)
+
+        await store.delete_design_files(db_session, design_file.design_id)
+
+        assert not store.blob_path(SHA256).exists()
+        assert not (store.root / SHA256[:2]).exists()
+        # The library name keeps its content
+        assert (library / "a" / "body.stl").read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_ignores_references_outside_library(self, tmp_path, library, store, db_session):
+        design_file = await add_design_file(db_session, "a/body.stl")
+        await add_design_file(db_session, "staged/body.stl", status=DesignStatus.EXTRACTED)
+        source = tmp_path / "body.stl"
+        source.write_bytes(CONTENT)
+        store.place(source, library / "a" / "body.stl", SHA256)
+
+        await store.delete_design_files(db_session, design_file.design_id)
+
+        assert not store.blob_path(SHA256).exists()
+
+
+class TestDedupeBatch:
+    """Tests for BlobStore.dedupe_batch."""
+
+    @pytest.mark.asyncio
+    async def test_links_duplicates_and_fixes_hashes(
+        self, library, store, db_session, mock_session_maker
+    ):
+        for name in ("a", "b"):
+            path = library / name / "body.stl"
+            path.parent.mkdir()
+            path.write_bytes(CONTENT)
+        await add_design_file(db_session, "a/body.stl")
+        missing_hash = await add_design_file(db_session, "b/body.stl", sha256=None)
+        await db_session.commit()
+
+        with (
+            patch("app.services.blob_store.async_session_maker", mock_session_maker),
+            patch("app.services.blob_store.settings") as mock_settings,
+        ):
+            mock_settings.library_path = library
+            total = await store.count_library_files()
+            batch = await store.dedupe_batch(None, limit=10)
+            done = await store.dedupe_batch(batch.last_id, limit=10)
+
+        assert total == 2
+        assert (batch.files, batch.linked, batch.bytes_saved) == (2, 1, len(CONTENT))
+        assert done.last_id is None
+        assert (library / "a" / "body.stl").stat().st_ino == (library / "b" / "body.stl").stat().st_ino
+        await db_session.refresh(missing_hash)
+        assert missing_hash.sha256 == SHA256
@@ -13,9 +13,11 @@ Tests cover:
 from __future__ import annotations
 
 import hashlib
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
@@ -39,6 +41,7 @@ from app.services.bulk_import import (
     BulkImportService,
     DetectedDesign,
 )
+from app.services.folder_scan import FolderScanCache, scan_folder_stats
 from app.services.import_profile import ImportProfileService
 
 
@@ -207,56 +210,180 @@ class TestScanFolder:
 class TestMetadataCalculation:
     """Tests for folder size, mtime, and hash calculation."""
 
-    @pytest.mark.asyncio
-    async def test_calculate_folder_size(self, service: BulkImportService):
+    def test_calculate_folder_size(self):
         """Test folder size calculation."""
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "file1.txt").write_text("A" * 100)  # 100 bytes
             (root / "file2.txt").write_text("B" * 50)   # 50 bytes
 
-            size = service._calculate_folder_size(root)
-            assert size == 150
+            assert scan_folder_stats(root).total_size == 150
 
-    @pytest.mark.asyncio
-    async def test_calculate_folder_mtime(self, service: BulkImportService):
+    def test_calculate_folder_mtime(self):
         """Test folder mtime returns most recent time."""
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "file.txt").write_text("content")
 
-            mtime = service._get_folder_mtime(root)
+            mtime = scan_folder_stats(root).mtime
             assert mtime is not None
             assert isinstance(mtime, datetime)
 
-    @pytest.mark.asyncio
-    async def test_calculate_folder_hash_deterministic(self, service: BulkImportService):
+    def test_calculate_folder_hash_deterministic(self):
         """Test folder hash is deterministic for same content."""
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             (root / "file.txt").write_text("content")
 
-            hash1 = service._calculate_folder_hash(root)
-            hash2 = service._calculate_folder_hash(root)
+            hash1 = scan_folder_stats(root).file_hash
+            hash2 = scan_folder_stats(root).file_hash
 
             assert hash1 == hash2
 
-    @pytest.mark.asyncio
-    async def test_calculate_folder_hash_changes_with_content(self, service: BulkImportService):
+    def test_calculate_folder_hash_changes_with_content(self):
         """Test folder hash changes when content changes."""
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
             file_path = root / "file.txt"
 
             file_path.write_text("content1")
-            hash1 = service._calculate_folder_hash(root)
+            hash1 = scan_folder_stats(root).file_hash
 
             file_path.write_text("content2 longer")
-            hash2 = service._calculate_folder_hash(root)
+            hash2 = scan_folder_stats(root).file_hash
 
             assert hash1 != hash2
 
 
+class TestSinglePassScan:
+    """Tests for the single-pass folder walk and incremental scan cache."""
+
+    @pytest.mark.asyncio
+    async def test_hash_matches_per_file_walk(self):
+        """Test the single-pass fingerprint matches hashing every file path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "Parts" / "Arms").mkdir(parents=True)
+            (root / "model.stl").write_text("A" * 10)
+            (root / "Parts" / "arm.stl").write_text("B" * 20)
+            (root / "Parts" / "Arms" / "left.stl").write_text("C" * 30)
+            (root / "Parts-extra.stl").write_text("D" * 40)
+
+            hasher = hashlib.sha256()
+            for file_path in sorted(root.rglob("*")):
+                if file_path.is_file():
+                    rel = file_path.relative_to(root)
+                    hasher.update(f"{rel}:{file_path.stat().st_size}".encode())
+
+            stats = scan_folder_stats(root)
+
+            assert stats.file_hash == hasher.hexdigest()[:32]
+            assert stats.total_size == 100
+            assert stats.directories["."].subdirs == ["Parts"]
+
+    @pytest.mark.asyncio
+    async def test_first_scan_lists_each_directory_once(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test detection and stats share a single scandir pass."""
+        with patch("os.scandir", wraps=os.scandir) as listed:
+            designs = await service.scan_folder(sample_source)
+
+        paths = [str(call.args[0]) for call in listed.call_args_list]
+        assert designs
+        assert len(paths) == len(set(paths))
+
+    @pytest.mark.asyncio
+    async def test_rescan_reuses_unchanged_designs(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test a second scan reuses cached stats for every design."""
+        first = await service.scan_folder(sample_source)
+
+        with patch(
+            "app.services.bulk_import.scan_folder_stats", wraps=scan_folder_stats
+        ) as walk:
+            second = await service.scan_folder(sample_source)
+
+        walk.assert_not_called()
+        assert {d.relative_path: d.file_hash for d in second} == {
+            d.relative_path: d.file_hash for d in first
+        }
+        assert {d.relative_path: d.title for d in second} == {
+            d.relative_path: d.title for d in first
+        }
+
+    @pytest.mark.asyncio
+    async def test_added_files_and_folders_are_rescanned(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test new files and design folders invalidate the cache."""
+        first = {d.relative_path: d for d in await service.scan_folder(sample_source)}
+
+        (temp_design_folder / "Dragon" / "wing.stl").write_text("STL content for wing")
+        new_design = temp_design_folder / "Castle"
+        new_design.mkdir()
+        (new_design / "castle.stl").write_text("STL content for castle")
+
+        second = {d.relative_path: d for d in await service.scan_folder(sample_source)}
+
+        assert set(second) == {"Dragon", "Knight", "Castle"}
+        assert second["Dragon"].file_hash != first["Dragon"].file_hash
+        assert second["Dragon"].total_size > first["Dragon"].total_size
+        assert second["Knight"].file_hash == first["Knight"].file_hash
+
+    @pytest.mark.asyncio
+    async def test_removed_design_is_dropped(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test designs deleted since the last scan are not reported."""
+        await service.scan_folder(sample_source)
+
+        for file_path in (temp_design_folder / "Knight").iterdir():
+            file_path.unlink()
+        (temp_design_folder / "Knight").rmdir()
+
+        designs = await service.scan_folder(sample_source)
+
+        assert [d.relative_path for d in designs] == ["Dragon"]
+
+    @pytest.mark.asyncio
+    async def test_config_change_discards_cache(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test a different profile config starts from an empty cache."""
+        await service.scan_folder(sample_source)
+        config = await service._profile_service.get_profile_config(
+            sample_source.import_profile_id
+        )
+
+        assert FolderScanCache.load(temp_design_folder, config).is_unchanged(
+            temp_design_folder, "."
+        )
+
+        changed = config.model_copy(deep=True)
+        changed.detection.min_model_files = config.detection.min_model_files + 1
+        assert not FolderScanCache.load(temp_design_folder, changed).is_unchanged(
+            temp_design_folder, "."
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_recompute(
+        self, service: BulkImportService, sample_source, temp_design_folder
+    ):
+        """Test invalidated designs are recomputed on the next scan."""
+        await service.scan_folder(sample_source)
+        config = await service._profile_service.get_profile_config(
+            sample_source.import_profile_id
+        )
+
+        FolderScanCache.invalidate(temp_design_folder, ["Dragon"])
+        cache = FolderScanCache.load(temp_design_folder, config)
+
+        assert not cache.is_unchanged(temp_design_folder / "Dragon", "Dragon")
+        assert cache.is_unchanged(temp_design_folder / "Knight", "Knight")
+
+
 # =============================================================================
 # Import Record Management Tests
 # =============================================================================
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from telethon.errors import FileReferenceExpiredError
 
 from app.db.base import Base
 from app.db.models import (
@@ -20,7 +22,12 @@ from app.db.models import (
     JobType,
     TelegramMessage,
 )
-from app.services.download import ARCHIVE_EXTENSIONS, DownloadError, DownloadService
+from app.services.download import (
+    ARCHIVE_EXTENSIONS,
+    AttachmentDownloadInfo,
+    DownloadError,
+    DownloadService,
+)
 
 
 # =============================================================================
@@ -402,6 +409,206 @@ class TestDownloadDesign:
         assert "no attachments" in str(exc_info.value).lower()
 
 
+class TestDownloadAttachment:
+    """Tests for _download_attachment."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_expired_file_reference(self, tmp_path, mock_session_maker):
+        """Test an expired file reference refetches the message and retries."""
+        service = DownloadService()
+        stale, fresh = MagicMock(), MagicMock()
+        att_info = AttachmentDownloadInfo(
+            id="att-1",
+            filename="model.stl",
+            ext=".stl",
+            message_id="msg-1",
+            channel_peer_id="-100123",
+            telegram_message_id=42,
+        )
+
+        async def download_media(message, file_path, progress_callback=None):
+            if message is stale:
+                raise FileReferenceExpiredError(request=None)
+            file_path.write_bytes(b"solid")
+            return str(file_path)
+
+        with (
+            patch("app.services.download.async_session_maker", mock_session_maker),
+            patch.object(service, "_fetch_telegram_message", AsyncMock(return_value=stale)),
+            patch.object(service, "_refresh_telegram_message", AsyncMock(return_value=fresh)) as refresh,
+            patch.object(service, "_download_media", side_effect=download_media),
+        ):
+            result = await service._download_attachment(att_info, tmp_path)
+
+        refresh.assert_awaited_once_with("-100123", 42)
+        assert result["path"] == str(tmp_path / "model.stl")
+        assert result["size"] == len(b"solid")
+        assert not service._claimed_paths
+
+    @pytest.mark.asyncio
+    async def test_links_file_already_downloaded_from_another_channel(
+        self, tmp_path, db_session, sample_attachment, mock_session_maker
+    ):
+        """Test a known unique file ID is linked from disk, not downloaded."""
+        existing = tmp_path / "other" / "model.stl"
+        existing.parent.mkdir()
+        existing.write_bytes(b"solid")
+        sample_attachment.telegram_unique_file_id = "AgADuniq"
+        sample_attachment.download_status = AttachmentDownloadStatus.DOWNLOADED
+        sample_attachment.download_path = str(existing)
+        sample_attachment.size_bytes = 5
+        sample_attachment.sha256 = hashlib.sha256(b"solid").hexdigest()
+        await db_session.commit()
+
+        service = DownloadService()
+        att_info = AttachmentDownloadInfo(
+            id="att-new",
+            filename="repost.stl",
+            ext=".stl",
+            message_id="msg-2",
+            channel_peer_id="-100456",
+            telegram_message_id=7,
+            telegram_unique_file_id="AgADuniq",
+            size_bytes=5,
+        )
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        with (
+            patch("app.services.download.async_session_maker", mock_session_maker),
+            patch.object(service, "_fetch_telegram_message", AsyncMock()) as fetch,
+        ):
+            result = await service._download_attachment(att_info, staging)
+
+        fetch.assert_not_awaited()
+        assert result["sha256"] == sample_attachment.sha256
+        assert (staging / "repost.stl").stat().st_ino == existing.stat().st_ino
+
+    @pytest.mark.asyncio
+    async def test_changed_copy_is_downloaded_again(
+        self, tmp_path, db_session, sample_attachment, mock_session_maker
+    ):
+        """Test a copy that no longer matches its recorded digest is not reused."""
+        existing = tmp_path / "model.stl"
+        existing.write_bytes(b"edited")
+        sample_attachment.telegram_unique_file_id = "AgADuniq"
+        sample_attachment.download_status = AttachmentDownloadStatus.DOWNLOADED
+        sample_attachment.download_path = str(existing)
+        sample_attachment.size_bytes = None
+        sample_attachment.sha256 = hashlib.sha256(b"solid").hexdigest()
+        await db_session.commit()
+
+        service = DownloadService()
+        att_info = AttachmentDownloadInfo(
+            id="att-new",
+            filename="model.stl",
+            ext=".stl",
+            message_id="msg-2",
+            channel_peer_id="-100456",
+            telegram_message_id=7,
+            telegram_unique_file_id="AgADuniq",
+            size_bytes=5,
+        )
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        async def download_media(message, file_path, progress_callback=None):
+            file_path.write_bytes(b"solid")
+            return str(file_path)
+
+        with (
+            patch("app.services.download.async_session_maker", mock_session_maker),
+            patch.object(service, "_fetch_telegram_message", AsyncMock(return_value=MagicMock())),
+            patch.object(service, "_download_media", side_effect=download_media) as download,
+        ):
+            result = await service._download_attachment(att_info, staging)
+
+        download.assert_called_once()
+        assert result["sha256"] == hashlib.sha256(b"solid").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_same_name_and_size_is_not_reused(
+        self, tmp_path, db_session, sample_attachment, mock_session_maker
+    ):
+        """Test a different file with the same name and size is downloaded."""
+        existing = tmp_path / "model.stl"
+        existing.write_bytes(b"other")
+        sample_attachment.telegram_unique_file_id = "document:1"
+        sample_attachment.download_status = AttachmentDownloadStatus.DOWNLOADED
+        sample_attachment.download_path = str(existing)
+        sample_attachment.size_bytes = 5
+        sample_attachment.sha256 = hashlib.sha256(b"other").hexdigest()
+        await db_session.commit()
+
+        service = DownloadService()
+        att_info = AttachmentDownloadInfo(
+            id="att-new",
+            filename="model.stl",
+            ext=".stl",
+            message_id="msg-2",
+            channel_peer_id="-100456",
+            telegram_message_id=7,
+            telegram_unique_file_id="document:2",
+            size_bytes=5,
+        )
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        async def download_media(message, file_path, progress_callback=None):
+            file_path.write_bytes(b"solid")
+            return str(file_path)
+
+        with (
+            patch("app.services.download.async_session_maker", mock_session_maker),
+            patch.object(service, "_fetch_telegram_message", AsyncMock(return_value=MagicMock())),
+            patch.object(service, "_download_media", side_effect=download_media) as download,
+        ):
+            result = await service._download_attachment(att_info, staging)
+
+        download.assert_called_once()
+        assert result["sha256"] == hashlib.sha256(b"solid").hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_looks_up_missing_file_id_from_message(
+        self, tmp_path, db_session, sample_attachment, mock_session_maker
+    ):
+        """Test an attachment ingested without a file ID gets it from its message."""
+        existing = tmp_path / "other" / "model.stl"
+        existing.parent.mkdir()
+        existing.write_bytes(b"solid")
+        sample_attachment.telegram_unique_file_id = "document:99"
+        sample_attachment.download_status = AttachmentDownloadStatus.DOWNLOADED
+        sample_attachment.download_path = str(existing)
+        sample_attachment.size_bytes = 5
+        sample_attachment.sha256 = hashlib.sha256(b"solid").hexdigest()
+        await db_session.commit()
+
+        service = DownloadService()
+        att_info = AttachmentDownloadInfo(
+            id="att-new",
+            filename="repost.stl",
+            ext=".stl",
+            message_id="msg-2",
+            channel_peer_id="-100456",
+            telegram_message_id=7,
+        )
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        message = MagicMock()
+        message.document.id = 99
+
+        with (
+            patch("app.services.download.async_session_maker", mock_session_maker),
+            patch.object(service, "_fetch_telegram_message", AsyncMock(return_value=message)),
+            patch.object(service, "_download_media") as download,
+        ):
+            result = await service._download_attachment(att_info, staging)
+
+        download.assert_not_called()
+        assert att_info.telegram_unique_file_id == "document:99"
+        assert result["sha256"] == sample_attachment.sha256
+
+
 # =============================================================================
 # DownloadWorker Tests
 # =============================================================================
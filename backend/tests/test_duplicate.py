@@ -0,0 +1,242 @@
+"""Tests for DuplicateService fuzzy matching and the design match index."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from rapidfuzz import fuzz
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.models import Design, DesignStatus
+from app.services import duplicate_index
+from app.services.duplicate import TITLE_SIMILARITY_THRESHOLD, DuplicateService
+from app.services.duplicate_index import DesignMatchIndex, _length_bounds
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def db_engine():
+    """Create an in-memory test database engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Create a test database session."""
+    async_session = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Give each test its own index singleton."""
+    monkeypatch.setattr(duplicate_index, "_index", None)
+
+
+def make_design(title: str, designer: str = "Unknown", **kwargs) -> Design:
+    """Create an unsaved Design."""
+    return Design(canonical_title=title, canonical_designer=designer, **kwargs)
+
+
+# =============================================================================
+# Index Tests
+# =============================================================================
+
+
+class TestLengthBounds:
+    """Tests for the lossless length filter."""
+
+    def test_bounds_never_exclude_a_match(self):
+        """Test that no pair reaching the threshold falls outside the bounds."""
+        rng = random.Random(42)
+        alphabet = "abcde "
+        for _ in range(3000):
+            a = "".join(rng.choices(alphabet, k=rng.randint(1, 30)))
+            b = "".join(rng.choices(alphabet, k=rng.randint(1, 30)))
+            if fuzz.ratio(a, b) >= TITLE_SIMILARITY_THRESHOLD:
+                low, high = _length_bounds(len(a), TITLE_SIMILARITY_THRESHOLD)
+                assert low <= len(b) <= high
+
+
+class TestDesignMatchIndex:
+    """Tests for DesignMatchIndex lookups."""
+
+    def test_title_candidates_match_brute_force(self):
+        """Test that title lookups return exactly the fuzzy matches."""
+        index = DesignMatchIndex()
+        rng = random.Random(7)
+        words = ["dragon", "bust", "castle", "robot", "kit", "v2", "mini", "tower"]
+        titles = {
+            f"d{i}": " ".join(rng.choices(words, k=rng.randint(1, 4)))
+            for i in range(300)
+        }
+        for design_id, title in titles.items():
+            index.upsert(design_id, title.title(), "Unknown")
+
+        for query in ["Dragon Bust", "castle tower", "Robot Kit v2", "mini"]:
+            expected = {
+                design_id
+                for design_id, title in titles.items()
+                if fuzz.ratio(query.lower(), title) >= TITLE_SIMILARITY_THRESHOLD
+            }
+            found = index.find_title_candidates(query, TITLE_SIMILARITY_THRESHOLD)
+            assert set(found) == expected
+
+    def test_title_designer_candidates_use_designer_buckets(self):
+        """Test that both title and designer must be similar."""
+        index = DesignMatchIndex()
+        index.upsert("a", "Dragon Bust", "Mini Studio")
+        index.upsert("b", "Dragon Bust", "Mini Studios")
+        index.upsert("c", "Dragon Bust", "Other Maker")
+        index.upsert("d", "Castle", "Mini Studio")
+
+        found = index.find_title_designer_candidates(
+            "dragon bust", "MINI STUDIO", TITLE_SIMILARITY_THRESHOLD
+        )
+
+        assert sorted(found) == ["a", "b"]
+
+    def test_upsert_moves_and_deleted_removes(self):
+        """Test that renames move a design and deletions drop it."""
+        index = DesignMatchIndex()
+        index.upsert("a", "Dragon Bust", "Unknown")
+        index.upsert("a", "Castle Tower", "Unknown")
+
+        assert index.find_title_candidates("Dragon Bust", 80) == []
+        assert index.find_title_candidates("Castle Tower", 80) == ["a"]
+
+        index.upsert("a", "Castle Tower", "Unknown", DesignStatus.DELETED)
+        assert index.find_title_candidates("Castle Tower", 80) == []
+        assert index.stats["designs"] == 0
+
+
+class TestIndexSessionSync:
+    """Tests that the index follows ORM writes."""
+
+    @pytest.mark.asyncio
+    async def test_flushed_designs_are_indexed(self, db_session):
+        """Test that designs added after the build are found without a rebuild."""
+        index = duplicate_index.get_design_match_index()
+        await index.ensure_loaded(db_session)
+
+        design = make_design("Dragon Bust")
+        db_session.add(design)
+        await db_session.flush()
+
+        await index.ensure_loaded(db_session)
+        assert index.stats["rebuilds"] == 1
+        assert index.find_title_candidates("Dragon Bust", 80) == [design.id]
+
+        design.canonical_title = "Castle Tower"
+        await db_session.flush()
+        assert index.find_title_candidates("Castle Tower", 80) == [design.id]
+
+        await db_session.delete(design)
+        await db_session.flush()
+        assert index.find_title_candidates("Castle Tower", 80) == []
+
+    @pytest.mark.asyncio
+    async def test_rollback_marks_stale(self, db_session):
+        """Test that rolled back design changes trigger a rebuild."""
+        index = duplicate_index.get_design_match_index()
+        await index.ensure_loaded(db_session)
+
+        db_session.add(make_design("Dragon Bust"))
+        await db_session.flush()
+        await db_session.rollback()
+
+        assert index.stats["stale"] is True
+        await index.ensure_loaded(db_session)
+        assert index.find_title_candidates("Dragon Bust", 80) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_marks_stale(self, db_session):
+        """Test that bulk UPDATEs on designs trigger a rebuild."""
+        design = make_design("Dragon Bust")
+        db_session.add(design)
+        await db_session.commit()
+
+        index = duplicate_index.get_design_match_index()
+        await index.ensure_loaded(db_session)
+
+        await db_session.execute(
+            update(Design)
+            .where(Design.id == design.id)
+            .values(canonical_title="Castle Tower")
+        )
+
+        assert index.stats["stale"] is True
+        await index.ensure_loaded(db_session)
+        assert index.find_title_candidates("Castle Tower", 80) == [design.id]
+
+
+# =============================================================================
+# DuplicateService Matching Tests
+# =============================================================================
+
+
+class TestTitleDesignerMatching:
+    """Tests for DuplicateService fuzzy title/designer matching."""
+
+    @pytest.mark.asyncio
+    async def test_find_title_designer_matches(self, db_session):
+        """Test that similar title and designer are matched."""
+        design = make_design("Dragon Bust v2", "Mini Studio")
+        similar = make_design("Dragon Bust v3", "Mini Studios")
+        other_designer = make_design("Dragon Bust v2", "Someone Else")
+        deleted = make_design(
+            "Dragon Bust v2", "Mini Studio", status=DesignStatus.DELETED
+        )
+        db_session.add_all([design, similar, other_designer, deleted])
+        await db_session.commit()
+
+        service = DuplicateService(db_session)
+        matches = await service._find_title_designer_matches(design)
+
+        assert matches == [similar.id]
+
+    @pytest.mark.asyncio
+    async def test_check_pre_download_fuzzy_title(self, db_session):
+        """Test that pre-download checks find fuzzy title matches."""
+        existing = make_design("Articulated Dragon", "Mini Studio")
+        db_session.add(existing)
+        await db_session.commit()
+
+        service = DuplicateService(db_session)
+        match, match_type, confidence = await service.check_pre_download(
+            title="Articulated Dragons",
+            designer="Mini Studio",
+            files=[],
+        )
+
+        assert match is not None
+        assert match.id == existing.id
+        assert confidence == 0.7
+
+    @pytest.mark.asyncio
+    async def test_check_pre_download_no_match(self, db_session):
+        """Test that unrelated titles are not matched."""
+        db_session.add(make_design("Articulated Dragon", "Mini Studio"))
+        await db_session.commit()
+
+        service = DuplicateService(db_session)
+        match, _, _ = await service.check_pre_download(
+            title="Castle Tower",
+            designer="Mini Studio",
+            files=[],
+        )
+
+        assert match is None
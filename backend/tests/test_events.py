@@ -0,0 +1,169 @@
+"""Tests for the SSE event broadcaster (#217).
+
+Tests cover:
+- Event IDs and SSE formatting
+- Progress coalescing in slow client queues
+- Bounded client queues and resync on overflow
+- Last-Event-ID replay
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.events import (
+    SSE_REPLAY_BUFFER_SIZE,
+    Event,
+    EventBroadcaster,
+    EventSubscription,
+    EventType,
+)
+
+
+@pytest.fixture
+def broadcaster():
+    """Fresh broadcaster, bypassing the singleton."""
+    EventBroadcaster._instance = None
+    instance = EventBroadcaster()
+    yield instance
+    EventBroadcaster._instance = None
+
+
+def drain(queue: EventSubscription) -> list[Event]:
+    events = []
+    while True:
+        try:
+            events.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return events
+
+
+class TestBroadcast:
+    """Tests for event delivery."""
+
+    @pytest.mark.asyncio
+    async def test_events_get_increasing_ids(self, broadcaster):
+        async with broadcaster.subscribe() as queue:
+            await broadcaster.broadcast_queue_updated()
+            await broadcaster.broadcast_job_started("job-1", "DOWNLOAD_DESIGN")
+
+            first, second = drain(queue)
+            assert first.id.endswith(":1")
+            assert second.id.endswith(":2")
+            assert first.to_sse().startswith(f"id: {first.id}\ndata: ")
+
+    @pytest.mark.asyncio
+    async def test_pending_progress_is_coalesced(self, broadcaster):
+        async with broadcaster.subscribe() as queue:
+            await broadcaster.broadcast_job_progress("job-1", 10)
+            await broadcaster.broadcast_job_progress("job-2", 5)
+            await broadcaster.broadcast_job_progress("job-1", 20)
+            await broadcaster.broadcast_job_progress("job-1", 30)
+
+            events = drain(queue)
+            assert [(e.payload["job_id"], e.payload["progress"]) for e in events] == [
+                ("job-1", 30),
+                ("job-2", 5),
+            ]
+            assert broadcaster.get_stats()["events_coalesced"] == 2
+
+            # Delivered progress isn't coalesced with later updates
+            await broadcaster.broadcast_job_progress("job-1", 40)
+            assert [e.payload["progress"] for e in drain(queue)] == [40]
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_and_requests_resync(self, broadcaster):
+        async with broadcaster.subscribe() as queue:
+            queue._maxsize = 3
+            for i in range(5):
+                await broadcaster.broadcast_design_created(f"design-{i}", f"Design {i}")
+
+            events = drain(queue)
+            assert events[0].type == EventType.RESYNC
+            assert [e.payload["design_id"] for e in events[1:]] == [
+                "design-2",
+                "design-3",
+                "design-4",
+            ]
+            assert broadcaster.get_stats()["events_dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_event(self, broadcaster):
+        async with broadcaster.subscribe() as queue:
+            waiter = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            await broadcaster.broadcast_queue_updated()
+            event = await asyncio.wait_for(waiter, timeout=1)
+            assert event.type == EventType.QUEUE_UPDATED
+
+
+class TestReplay:
+    """Tests for Last-Event-ID replay."""
+
+    @pytest.mark.asyncio
+    async def test_replays_missed_events(self, broadcaster):
+        async with broadcaster.subscribe() as queue:
+            await broadcaster.broadcast_job_created("job-1", "DOWNLOAD_DESIGN")
+            last_seen = drain(queue)[-1].id
+
+        await broadcaster.broadcast_job_started("job-1", "DOWNLOAD_DESIGN")
+        await broadcaster.broadcast_job_progress("job-1", 10)
+        await broadcaster.broadcast_job_progress("job-1", 50)
+        await broadcaster.broadcast_job_created("job-2", "DOWNLOAD_DESIGN")
+
+        async with broadcaster.subscribe(last_seen) as queue:
+            events = drain(queue)
+
+        # State events in order, plus only the latest progress
+        assert [e.type for e in events] == [
+            EventType.JOB_STARTED,
+            EventType.JOB_PROGRESS,
+            EventType.JOB_CREATED,
+        ]
+        assert events[1].payload["progress"] == 50
+        assert broadcaster.get_stats()["events_replayed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_job_progress_not_replayed(self, broadcaster):
+        await broadcaster.broadcast_queue_updated()
+        last_seen = broadcaster.get_stats()["last_event_id"]
+
+        await broadcaster.broadcast_job_progress("job-1", 90)
+        await broadcaster.broadcast_job_completed("job-1", "DOWNLOAD_DESIGN")
+
+        async with broadcaster.subscribe(last_seen) as queue:
+            assert [e.type for e in drain(queue)] == [EventType.JOB_COMPLETED]
+
+    @pytest.mark.asyncio
+    async def test_resync_when_history_evicted(self, broadcaster):
+        await broadcaster.broadcast_queue_updated()
+        last_seen = broadcaster.get_stats()["last_event_id"]
+
+        for _ in range(SSE_REPLAY_BUFFER_SIZE + 1):
+            await broadcaster.broadcast_queue_updated()
+
+        async with broadcaster.subscribe(last_seen) as queue:
+            events = drain(queue)
+
+        assert [e.type for e in events] == [EventType.RESYNC]
+        assert broadcaster.get_stats()["resyncs"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("last_event_id", ["1:1", "garbage"])
+    async def test_resync_for_unknown_id(self, broadcaster, last_event_id):
+        await broadcaster.broadcast_queue_updated()
+
+        async with broadcaster.subscribe(last_event_id) as queue:
+            assert [e.type for e in drain(queue)] == [EventType.RESYNC]
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_client_gets_nothing(self, broadcaster):
+        await broadcaster.broadcast_queue_updated()
+        last_seen = broadcaster.get_stats()["last_event_id"]
+
+        async with broadcaster.subscribe(last_seen) as queue:
+            assert drain(queue) == []
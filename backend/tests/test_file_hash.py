@@ -0,0 +1,144 @@
+"""Tests for file hashing utilities.
+
+Tests cover:
+- Streamed hashing with reusable read buffers
+- HashingWriter digests, including resumed (appended) files
+- Reuse of streamed digests by compute_file_hash
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+import pytest
+
+from app.utils import (
+    HashingWriter,
+    compute_file_hash,
+    compute_file_hash_sync,
+    known_file_hash,
+)
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestComputeFileHash:
+    """Tests for compute_file_hash_sync and compute_file_hash."""
+
+    def test_matches_hashlib_across_chunk_boundaries(self, tmp_path):
+        data = os.urandom(10_000)
+        path = tmp_path / "model.stl"
+        path.write_bytes(data)
+
+        assert compute_file_hash_sync(path, chunk_size=4096) == sha256(data)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.stl"
+        path.write_bytes(b"")
+
+        assert compute_file_hash_sync(path) == sha256(b"")
+
+    @pytest.mark.asyncio
+    async def test_async_matches_sync(self, tmp_path):
+        path = tmp_path / "model.stl"
+        path.write_bytes(b"solid test\n" * 100)
+
+        assert await compute_file_hash(path) == compute_file_hash_sync(path)
+
+
+class TestHashingWriter:
+    """Tests for HashingWriter."""
+
+    def test_digest_matches_written_content(self, tmp_path):
+        path = tmp_path / "model.stl"
+
+        writer = HashingWriter(path)
+        writer.write(b"solid ")
+        writer.write(memoryview(b"test\n"))
+        digest = writer.finish()
+
+        assert path.read_bytes() == b"solid test\n"
+        assert digest == sha256(b"solid test\n")
+        assert writer.tell() == len(b"solid test\n")
+
+    def test_append_hashes_existing_prefix(self, tmp_path):
+        path = tmp_path / "model.stl.part"
+        path.write_bytes(b"first half, ")
+
+        writer = HashingWriter(path, append=True)
+        assert writer.size == len(b"first half, ")
+        writer.write(b"second half")
+        digest = writer.finish()
+
+        assert path.read_bytes() == b"first half, second half"
+        assert digest == sha256(b"first half, second half")
+
+    def test_truncate_starts_over(self, tmp_path):
+        path = tmp_path / "model.stl.part"
+        path.write_bytes(b"stale")
+
+        writer = HashingWriter(path, append=True)
+        writer.truncate()
+        writer.write(b"fresh")
+        digest = writer.finish()
+
+        assert path.read_bytes() == b"fresh"
+        assert digest == sha256(b"fresh")
+
+    def test_discard_removes_file(self, tmp_path):
+        path = tmp_path / "model.stl"
+
+        writer = HashingWriter(path)
+        writer.write(b"partial")
+        writer.discard()
+
+        assert not path.exists()
+        assert writer.closed
+
+
+class TestKnownHashes:
+    """Tests for reusing digests computed while writing."""
+
+    def test_finished_file_is_not_reread(self, tmp_path, monkeypatch):
+        path = tmp_path / "model.stl"
+        writer = HashingWriter(path)
+        writer.write(b"streamed")
+        writer.finish()
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("file was re-read")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        assert compute_file_hash_sync(path) == sha256(b"streamed")
+
+    def test_digest_survives_rename(self, tmp_path):
+        path = tmp_path / "model.stl.part"
+        writer = HashingWriter(path)
+        writer.write(b"streamed")
+        writer.finish()
+
+        final = tmp_path / "model.stl"
+        os.replace(path, final)
+
+        assert known_file_hash(final) == sha256(b"streamed")
+
+    def test_modified_file_is_hashed_again(self, tmp_path):
+        path = tmp_path / "model.stl"
+        writer = HashingWriter(path)
+        writer.write(b"streamed")
+        writer.finish()
+
+        path.write_bytes(b"rewritten content")
+
+        assert known_file_hash(path) is None
+        assert compute_file_hash_sync(path) == sha256(b"rewritten content")
+
+    def test_closed_without_finish_is_not_remembered(self, tmp_path):
+        path = tmp_path / "model.stl"
+        with HashingWriter(path) as writer:
+            writer.write(b"incomplete")
+
+        assert known_file_hash(path) is None
@@ -0,0 +1,257 @@
+"""Tests for LibraryFileResponse - conditional and Range file downloads."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.file_response import (
+    LibraryFileResponse,
+    RangeNotSatisfiable,
+    parse_range_header,
+)
+from app.db import get_db
+from app.db.base import Base
+from app.db.models import Design, DesignFile
+from app.main import app
+
+SHA256 = "ab" * 32
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def file_path(tmp_path) -> Path:
+    """Create a file to serve."""
+    path = tmp_path / "model.stl"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+async def file_client(file_path):
+    """Create a client for a minimal app serving one file."""
+    file_app = FastAPI()
+
+    @file_app.get("/file")
+    async def serve_file() -> LibraryFileResponse:
+        return LibraryFileResponse(
+            file_path, sha256=SHA256, size_bytes=len(CONTENT), filename="model.stl"
+        )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=file_app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+# =============================================================================
+# Range Parsing Tests
+# =============================================================================
+
+
+class TestParseRangeHeader:
+    """Tests for parse_range_header."""
+
+    def test_single_and_suffix_ranges(self):
+        """Test closed, open-ended and suffix ranges."""
+        assert parse_range_header("bytes=0-99", 1000) == [(0, 100)]
+        assert parse_range_header("bytes=900-", 1000) == [(900, 1000)]
+        assert parse_range_header("bytes=-100", 1000) == [(900, 1000)]
+        assert parse_range_header("bytes=990-2000", 1000) == [(990, 1000)]
+
+    def test_overlapping_ranges_are_merged(self):
+        """Test that overlapping ranges are coalesced and sorted."""
+        assert parse_range_header("bytes=500-599,0-99,50-149", 1000) == [
+            (0, 150),
+            (500, 600),
+        ]
+
+    def test_malformed_headers_are_ignored(self):
+        """Test that malformed or non-byte ranges return None."""
+        assert parse_range_header("items=0-1", 1000) is None
+        assert parse_range_header("bytes=abc", 1000) is None
+        assert parse_range_header("bytes=5-1", 1000) is None
+
+    def test_unsatisfiable(self):
+        """Test that ranges beyond the file raise RangeNotSatisfiable."""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=1000-1100", 1000)
+
+
+# =============================================================================
+# Response Tests
+# =============================================================================
+
+
+class TestLibraryFileResponse:
+    """Tests for conditional and ranged responses."""
+
+    @pytest.mark.asyncio
+    async def test_full_response_headers(self, file_client):
+        """Test that a plain GET returns the file with validators."""
+        response = await file_client.get("/file")
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["etag"] == f'"{SHA256}"'
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == str(len(CONTENT))
+        assert "model.stl" in response.headers["content-disposition"]
+
+    @pytest.mark.asyncio
+    async def test_single_range(self, file_client):
+        """Test that a single range returns 206 with Content-Range."""
+        response = await file_client.get("/file", headers={"Range": "bytes=100-199"})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+
+    @pytest.mark.asyncio
+    async def test_multiple_ranges(self, file_client):
+        """Test that several ranges return multipart/byteranges."""
+        response = await file_client.get(
+            "/file", headers={"Range": "bytes=0-9,-10"}
+        )
+
+        assert response.status_code == 206
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        assert int(response.headers["content-length"]) == len(response.content)
+
+        boundary = content_type.split("boundary=")[1].encode()
+        parts = response.content.split(b"--" + boundary)
+        assert len(parts) == 4  # preamble, two parts, closing
+        assert parts[1].endswith(b"\r\n\r\n" + CONTENT[:10] + b"\r\n")
+        assert f"bytes 10230-10239/{len(CONTENT)}".encode() in parts[2]
+        assert parts[2].endswith(CONTENT[-10:] + b"\r\n")
+
+    @pytest.mark.asyncio
+    async def test_unsatisfiable_range(self, file_client):
+        """Test that a range past the end returns 416."""
+        response = await file_client.get("/file", headers={"Range": "bytes=99999-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, file_client):
+        """Test that a matching ETag returns 304 without a body."""
+        response = await file_client.get(
+            "/file", headers={"If-None-Match": f'W/"{SHA256}"'}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == f'"{SHA256}"'
+
+    @pytest.mark.asyncio
+    async def test_if_modified_since_returns_304(self, file_client):
+        """Test that an unchanged Last-Modified returns 304."""
+        first = await file_client.get("/file")
+        response = await file_client.get(
+            "/file", headers={"If-Modified-Since": first.headers["last-modified"]}
+        )
+
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_if_range_mismatch_sends_full_file(self, file_client):
+        """Test that a stale If-Range validator returns the whole file."""
+        response = await file_client.get(
+            "/file", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+
+        response = await file_client.get(
+            "/file", headers={"Range": "bytes=0-9", "If-Range": f'"{SHA256}"'}
+        )
+        assert response.status_code == 206
+
+    @pytest.mark.asyncio
+    async def test_if_match_mismatch_returns_412(self, file_client):
+        """Test that a failed If-Match returns 412."""
+        response = await file_client.get("/file", headers={"If-Match": '"other"'})
+
+        assert response.status_code == 412
+
+    @pytest.mark.asyncio
+    async def test_stale_hash_falls_back_to_stat_etag(self, file_client, file_path):
+        """Test that the hash isn't used once the file size changed."""
+        file_path.write_bytes(CONTENT + b"more")
+
+        response = await file_client.get("/file")
+
+        assert response.headers["etag"] != f'"{SHA256}"'
+        assert response.content == CONTENT + b"more"
+
+
+# =============================================================================
+# Route Tests
+# =============================================================================
+
+
+class TestDownloadSingleFile:
+    """Tests for GET /api/v1/designs/{id}/files/{file_id}/download."""
+
+    @pytest.mark.asyncio
+    async def test_resume_download(self, tmp_path, file_path):
+        """Test that the library download honours Range and the hash ETag."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async_session = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async with async_session() as session:
+            design = Design(canonical_title="Dragon", canonical_designer="Tester")
+            session.add(design)
+            await session.flush()
+            design_file = DesignFile(
+                design_id=design.id,
+                relative_path=file_path.name,
+                filename=file_path.name,
+                ext=".stl",
+                size_bytes=os.path.getsize(file_path),
+                sha256=SHA256,
+            )
+            session.add(design_file)
+            await session.commit()
+
+        async def override_get_db():
+            async with async_session() as session:
+                yield session
+
+        previous_overrides = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                with patch("app.api.routes.designs.settings") as mock_settings:
+                    mock_settings.library_path = tmp_path
+                    response = await client.get(
+                        f"/api/v1/designs/{design.id}/files/{design_file.id}/download",
+                        headers={"Range": "bytes=5000-", "If-Range": f'"{SHA256}"'},
+                    )
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(previous_overrides)
+            await engine.dispose()
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[5000:]
+        assert response.headers["etag"] == f'"{SHA256}"'
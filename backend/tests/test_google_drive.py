@@ -12,17 +12,21 @@ Note: Most tests mock the Google API to avoid requiring real credentials.
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.db.base import Base
 from app.db.models import GoogleCredentials
+from app.services.drive_sync import DriveTreeSnapshot
 from app.services.google_drive import (
     DRIVE_FILE_REGEX,
     DRIVE_FOLDER_REGEX,
+    ChangeInfo,
     FileInfo,
     FolderInfo,
     GoogleAccessDeniedError,
@@ -30,7 +34,15 @@ from app.services.google_drive import (
     GoogleDriveError,
     GoogleDriveService,
     GoogleNotFoundError,
+    IncrementalSyncResult,
 )
+from app.services.google_drive_client import (
+    DRIVE_API_BASE,
+    DriveClient,
+    DriveDownloadError,
+    partial_download_path,
+)
+from app.utils import known_file_hash
 
 
 # =============================================================================
@@ -78,6 +90,32 @@ async def sample_credentials(db_session):
     return creds
 
 
+def make_drive_client(handler) -> DriveClient:
+    """DriveClient whose HTTP calls are answered by handler(request)."""
+    http = httpx.AsyncClient(
+        base_url=DRIVE_API_BASE, transport=httpx.MockTransport(handler)
+    )
+    return DriveClient(http, api_key="test-key")
+
+
+def json_routes(routes: dict[str, dict]):
+    """Handler returning JSON bodies keyed by request path."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/drive/v3")
+        return httpx.Response(200, json=routes[path])
+
+    return handler
+
+
+def error_response(status: int, reason: str = "notFound") -> httpx.Response:
+    """A Drive API error body."""
+    return httpx.Response(
+        status,
+        json={"error": {"code": status, "message": reason, "errors": [{"reason": reason}]}},
+    )
+
+
 # =============================================================================
 # URL Parsing Tests
 # =============================================================================
@@ -259,15 +297,11 @@ class TestGetFolderInfo:
             "files": [{"id": "file1"}, {"id": "file2"}],
         }
 
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-
-            # Mock files().get()
-            mock_service.files.return_value.get.return_value.execute.return_value = mock_file_response
-            # Mock files().list()
-            mock_service.files.return_value.list.return_value.execute.return_value = mock_list_response
-
+        client = make_drive_client(json_routes({
+            "/files/folder123": mock_file_response,
+            "/files": mock_list_response,
+        }))
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
             result = await service.get_folder_info("folder123")
 
             assert result.id == "folder123"
@@ -284,11 +318,8 @@ class TestGetFolderInfo:
             "mimeType": "application/pdf",  # Not a folder
         }
 
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-            mock_service.files.return_value.get.return_value.execute.return_value = mock_file_response
-
+        client = make_drive_client(json_routes({"/files/file123": mock_file_response}))
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
             with pytest.raises(GoogleDriveError, match="is not a folder"):
                 await service.get_folder_info("file123")
 
@@ -320,11 +351,8 @@ class TestListFolder:
             "nextPageToken": None,
         }
 
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-            mock_service.files.return_value.list.return_value.execute.return_value = mock_response
-
+        client = make_drive_client(json_routes({"/files": mock_response}))
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
             files, next_token = await service.list_folder("folder123")
 
             assert len(files) == 2
@@ -342,11 +370,8 @@ class TestListFolder:
             "nextPageToken": "next_page_123",
         }
 
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-            mock_service.files.return_value.list.return_value.execute.return_value = mock_response
-
+        client = make_drive_client(json_routes({"/files": mock_response}))
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
             files, next_token = await service.list_folder("folder123")
 
             assert len(files) == 1
@@ -428,38 +453,422 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_handle_404_error(self, service: GoogleDriveService):
         """Test 404 error converts to GoogleNotFoundError."""
-        from googleapiclient.errors import HttpError
-
-        mock_response = MagicMock()
-        mock_response.status = 404
-
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-            mock_service.files.return_value.get.return_value.execute.side_effect = HttpError(
-                mock_response, b"Not Found"
-            )
+        client = make_drive_client(lambda request: error_response(404, "notFound"))
 
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
             with pytest.raises(GoogleNotFoundError):
                 await service.get_folder_info("nonexistent")
 
     @pytest.mark.asyncio
     async def test_handle_403_error(self, service: GoogleDriveService):
         """Test 403 error converts to GoogleAccessDeniedError."""
-        from googleapiclient.errors import HttpError
+        client = make_drive_client(lambda request: error_response(403, "forbidden"))
+
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
+            with pytest.raises(GoogleAccessDeniedError):
+                await service.get_folder_info("private_folder")
+
+
+    @pytest.mark.asyncio
+    async def test_403_rate_limit_is_retried(self, service: GoogleDriveService):
+        """Test 403 rateLimitExceeded is retried instead of treated as access denied."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return error_response(403, "userRateLimitExceeded")
+            return httpx.Response(200, json={"files": []})
+
+        client = make_drive_client(handler)
+        with (
+            patch.object(service, "_get_drive_client", AsyncMock(return_value=client)),
+            patch("app.services.google_drive.asyncio.sleep", AsyncMock()),
+        ):
+            files, _ = await service.list_folder("folder123")
+
+        assert files == []
+        assert calls == 2
+
+
+# =============================================================================
+# Streamed Download Tests
+# =============================================================================
 
-        mock_response = MagicMock()
-        mock_response.status = 403
 
-        with patch.object(service, "_get_drive_service") as mock_get_service:
-            mock_service = MagicMock()
-            mock_get_service.return_value = mock_service
-            mock_service.files.return_value.get.return_value.execute.side_effect = HttpError(
-                mock_response, b"Access Denied"
+def media_handler(content: bytes, fail_after: int | None = None, honor_range: bool = True):
+    """Serve content for alt=media, dropping the first transfer after fail_after bytes."""
+    requests: list[httpx.Request] = []
+
+    class DroppingStream(httpx.AsyncByteStream):
+        def __init__(self, data: bytes, limit: int):
+            self.data = data
+            self.limit = limit
+
+        async def __aiter__(self):
+            yield self.data[: self.limit]
+            raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        range_header = request.headers.get("Range")
+        if range_header and honor_range:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(content):
+                return httpx.Response(416)
+            return httpx.Response(
+                206,
+                content=content[start:],
+                headers={"Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"},
             )
+        if fail_after is not None and len(requests) == 1:
+            return httpx.Response(200, stream=DroppingStream(content, fail_after))
+        return httpx.Response(200, content=content)
 
-            with pytest.raises(GoogleAccessDeniedError):
-                await service.get_folder_info("private_folder")
+    handler.requests = requests
+    return handler
+
+
+class TestDownloadMedia:
+    """Tests for DriveClient.download_media."""
+
+    @pytest.mark.asyncio
+    async def test_streams_to_destination(self, tmp_path):
+        """Test the body is written to dest and no partial file is left."""
+        content = b"solid\n" * 1000
+        client = make_drive_client(media_handler(content))
+        dest = tmp_path / "model.stl"
+
+        size = await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert size == len(content)
+        assert dest.read_bytes() == content
+        assert not partial_download_path(dest, "v1").exists()
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_dropped_connection(self, tmp_path):
+        """Test a dropped transfer resumes with a Range request."""
+        content = bytes(range(256)) * 64
+        handler = media_handler(content, fail_after=1000)
+        client = make_drive_client(handler)
+        dest = tmp_path / "model.stl"
+
+        with patch("app.services.google_drive_client.asyncio.sleep", AsyncMock()):
+            await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert dest.read_bytes() == content
+        assert handler.requests[1].headers["Range"] == "bytes=1000-"
+
+    @pytest.mark.asyncio
+    async def test_resumes_existing_partial_file(self, tmp_path):
+        """Test a partial file from an earlier attempt is continued."""
+        content = b"0123456789" * 100
+        dest = tmp_path / "model.stl"
+        partial_download_path(dest, "v1").write_bytes(content[:300])
+        handler = media_handler(content)
+        client = make_drive_client(handler)
+
+        await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert dest.read_bytes() == content
+        assert handler.requests[0].headers["Range"] == "bytes=300-"
+
+    @pytest.mark.asyncio
+    async def test_resumed_download_digest_covers_whole_file(self, tmp_path):
+        """Test the hash computed while streaming includes the resumed prefix."""
+        content = b"0123456789" * 100
+        dest = tmp_path / "model.stl"
+        partial_download_path(dest, "v1").write_bytes(content[:300])
+        client = make_drive_client(media_handler(content))
+
+        await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert known_file_hash(dest) == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_stale_partial_from_other_version_is_discarded(self, tmp_path):
+        """Test partial data from an older revision is never resumed."""
+        content = b"new content" * 50
+        dest = tmp_path / "model.stl"
+        stale = partial_download_path(dest, "v0")
+        stale.write_bytes(b"old")
+        handler = media_handler(content)
+        client = make_drive_client(handler)
+
+        await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert dest.read_bytes() == content
+        assert not stale.exists()
+        assert "Range" not in handler.requests[0].headers
+
+    @pytest.mark.asyncio
+    async def test_range_ignored_restarts_from_zero(self, tmp_path):
+        """Test a 200 reply to a Range request overwrites the partial file."""
+        content = b"abcdef" * 100
+        dest = tmp_path / "model.stl"
+        partial_download_path(dest, "v1").write_bytes(b"garbage")
+        client = make_drive_client(media_handler(content, honor_range=False))
+
+        await client.download_media("f1", dest, expected_size=len(content), version="v1")
+
+        assert dest.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_size_mismatch_raises(self, tmp_path):
+        """Test a short body is reported instead of saved."""
+        client = make_drive_client(media_handler(b"short"))
+        dest = tmp_path / "model.stl"
+
+        with pytest.raises(DriveDownloadError):
+            await client.download_media("f1", dest, expected_size=100, version="v1")
+
+        assert not dest.exists()
+        assert not partial_download_path(dest, "v1").exists()
+
+    @pytest.mark.asyncio
+    async def test_service_download_file(self, service: GoogleDriveService, tmp_path):
+        """Test GoogleDriveService.download_file uses metadata size and version."""
+        content = b"x" * 2048
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("alt") == "media":
+                return httpx.Response(200, content=content)
+            return httpx.Response(200, json={
+                "name": "model.stl",
+                "size": str(len(content)),
+                "mimeType": "application/sla",
+                "modifiedTime": "2024-01-02T00:00:00.000Z",
+            })
+
+        client = make_drive_client(handler)
+        dest = tmp_path / "sub" / "model.stl"
+        with patch.object(service, "_get_drive_client", AsyncMock(return_value=client)):
+            result = await service.download_file("f1", dest)
+
+        assert result == dest
+        assert dest.read_bytes() == content
+
+
+# =============================================================================
+# Incremental Sync Tests
+# =============================================================================
+
+FOLDER = "application/vnd.google-apps.folder"
+
+
+def drive_folder(id: str, name: str, parent: str) -> FileInfo:
+    return FileInfo(id=id, name=name, mime_type=FOLDER, parent_id=parent, is_folder=True)
+
+
+def drive_file(id: str, name: str, parent: str, size: int = 100) -> FileInfo:
+    return FileInfo(id=id, name=name, mime_type="application/sla", size=size, parent_id=parent)
+
+
+def changed(info: FileInfo) -> ChangeInfo:
+    return ChangeInfo(file_id=info.id, file_name=info.name, mime_type=info.mime_type, file_info=info)
+
+
+def removed(file_id: str) -> ChangeInfo:
+    return ChangeInfo(file_id=file_id, removed=True)
+
+
+@pytest.fixture
+def drive_tree() -> list[FileInfo]:
+    """root/Dragon (design), root/Knight (design), root/Misc/notes.txt."""
+    return [
+        drive_folder("dragon", "Dragon", "root"),
+        drive_file("dragon-stl", "dragon.stl", "dragon"),
+        drive_folder("knight", "Knight", "root"),
+        drive_file("knight-stl", "knight.stl", "knight"),
+        drive_folder("misc", "Misc", "root"),
+        drive_file("notes", "notes.txt", "misc"),
+    ]
+
+
+class TestDriveTreeSnapshot:
+    """Tests for applying Changes API results to a stored tree."""
+
+    def make_snapshot(self, files: list[FileInfo]) -> DriveTreeSnapshot:
+        from app.schemas.import_profile import ImportProfileConfig
+
+        return DriveTreeSnapshot.from_listing(
+            "test", "root", ImportProfileConfig(), files, "token-1"
+        )
+
+    def test_changes_outside_tree_are_ignored(self, drive_tree):
+        """Test changes elsewhere in the Drive don't touch the snapshot."""
+        snapshot = self.make_snapshot(drive_tree)
+
+        changes = snapshot.apply_changes([
+            changed(drive_file("other", "other.stl", "somewhere-else")),
+            removed("unknown"),
+        ])
+
+        assert changes.dirty == set()
+        assert "other" not in snapshot.entries
+
+    def test_file_change_marks_ancestors_only(self, drive_tree):
+        """Test a new file dirties its folder and the root, not siblings."""
+        snapshot = self.make_snapshot(drive_tree)
+
+        changes = snapshot.apply_changes([changed(drive_file("new", "wing.stl", "dragon"))])
+
+        assert changes.dirty == {"dragon", "root"}
+        assert snapshot.entries["new"]["p"] == "dragon"
+
+    def test_folder_removal_drops_subtree(self, drive_tree):
+        """Test removing a folder removes everything below it."""
+        snapshot = self.make_snapshot(drive_tree)
+
+        changes = snapshot.apply_changes([removed("knight")])
+
+        assert "knight" not in snapshot.entries
+        assert "knight-stl" not in snapshot.entries
+        assert changes.dirty == {"root"}
+
+    def test_moved_out_folder_is_removed(self, drive_tree):
+        """Test a folder moved outside the root leaves the tree."""
+        snapshot = self.make_snapshot(drive_tree)
+
+        snapshot.apply_changes([changed(drive_folder("knight", "Knight", "elsewhere"))])
+
+        assert "knight" not in snapshot.entries
+        assert "knight-stl" not in snapshot.entries
+
+    def test_renamed_folder_dirties_subtree(self, drive_tree):
+        """Test a rename re-evaluates the folder and its subfolders."""
+        files = drive_tree + [drive_folder("wings", "Wings", "dragon")]
+        snapshot = self.make_snapshot(files)
+
+        changes = snapshot.apply_changes([changed(drive_folder("dragon", "Red Dragon", "root"))])
+
+        assert {"dragon", "wings", "root"} <= changes.dirty
+        assert "knight" not in changes.dirty
+
+    def test_child_before_parent_folder(self, drive_tree):
+        """Test a file is placed even if its new folder's change comes later."""
+        snapshot = self.make_snapshot(drive_tree)
+
+        changes = snapshot.apply_changes([
+            changed(drive_file("orc-stl", "orc.stl", "orc")),
+            changed(drive_folder("orc", "Orc", "root")),
+        ])
+
+        assert snapshot.entries["orc-stl"]["p"] == "orc"
+        assert "orc" in changes.folders_to_list
+
+    def test_roundtrip_through_disk(self, drive_tree):
+        """Test a saved snapshot loads back with its token and entries."""
+        from app.schemas.import_profile import ImportProfileConfig
+
+        snapshot = self.make_snapshot(drive_tree)
+        snapshot.save()
+
+        loaded = DriveTreeSnapshot.load("test", "root", ImportProfileConfig())
+        assert loaded is not None
+        assert loaded.page_token == "token-1"
+        assert loaded.entries == snapshot.entries
+        assert DriveTreeSnapshot.load("test", "other-root", ImportProfileConfig()) is None
+
+
+class TestSyncDesigns:
+    """Tests for GoogleDriveService.sync_designs."""
+
+    @pytest.mark.asyncio
+    async def test_full_then_incremental(
+        self, service: GoogleDriveService, sample_credentials, drive_tree
+    ):
+        """Test the second sync lists changes only and keeps unchanged designs."""
+        listing = AsyncMock(return_value=drive_tree)
+        changes_page = IncrementalSyncResult(
+            new_page_token="token-2",
+            changes=[
+                changed(drive_folder("orc", "Orc", "root")),
+                changed(drive_file("orc-stl", "orc.stl", "orc")),
+            ],
+        )
+
+        async def list_recursive(folder_id, credentials=None, max_depth=10, use_cache=True):
+            if folder_id == "orc":
+                return [drive_file("orc-stl", "orc.stl", "orc")]
+            return drive_tree
+
+        with (
+            patch.object(service, "get_start_page_token", AsyncMock(return_value="token-1")),
+            patch.object(service, "list_folder_recursive_cached", listing),
+        ):
+            first = await service.sync_designs(
+                "root", "folder:test-sync", credentials=sample_credentials
+            )
+
+        assert first.incremental is False
+        assert first.page_token == "token-1"
+        assert {d.relative_path for d in first.designs} == {"Dragon", "Knight"}
+
+        with (
+            patch.object(service, "list_changes", AsyncMock(return_value=changes_page)) as list_changes,
+            patch.object(service, "list_folder_recursive_cached", side_effect=list_recursive) as listed,
+            patch.object(
+                service, "_is_design_folder_virtual", wraps=service._is_design_folder_virtual
+            ) as detect,
+        ):
+            second = await service.sync_designs(
+                "root", "folder:test-sync", credentials=sample_credentials, page_token="token-1"
+            )
+
+        list_changes.assert_awaited_once()
+        # Only the folder that entered the tree was listed
+        assert [c.args[0] for c in listed.call_args_list] == ["orc"]
+        # Dragon and Knight were reused, not re-detected
+        assert {c.args[0].id for c in detect.call_args_list} == {"root", "orc"}
+        assert second.incremental is True
+        assert second.page_token == "token-2"
+        assert {d.relative_path for d in second.designs} == {"Dragon", "Knight", "Orc"}
+
+    @pytest.mark.asyncio
+    async def test_token_mismatch_forces_full_scan(
+        self, service: GoogleDriveService, sample_credentials, drive_tree
+    ):
+        """Test a stored tree from another token is not trusted."""
+        with (
+            patch.object(service, "get_start_page_token", AsyncMock(return_value="token-1")),
+            patch.object(service, "list_folder_recursive_cached", AsyncMock(return_value=drive_tree)),
+        ):
+            await service.sync_designs("root", "folder:test-mismatch", credentials=sample_credentials)
+
+        with (
+            patch.object(service, "get_start_page_token", AsyncMock(return_value="token-9")),
+            patch.object(service, "list_changes", AsyncMock()) as list_changes,
+            patch.object(service, "list_folder_recursive_cached", AsyncMock(return_value=drive_tree)),
+        ):
+            result = await service.sync_designs(
+                "root", "folder:test-mismatch", credentials=sample_credentials, page_token="stale"
+            )
+
+        list_changes.assert_not_awaited()
+        assert result.incremental is False
+        assert result.page_token == "token-9"
+
+    @pytest.mark.asyncio
+    async def test_rebuild_skips_changes(
+        self, service: GoogleDriveService, sample_credentials, drive_tree
+    ):
+        """Test rebuild always does a full listing."""
+        with (
+            patch.object(service, "get_start_page_token", AsyncMock(return_value="token-1")),
+            patch.object(service, "list_folder_recursive_cached", AsyncMock(return_value=drive_tree)),
+        ):
+            await service.sync_designs("root", "folder:test-rebuild", credentials=sample_credentials)
+
+            with patch.object(service, "list_changes", AsyncMock()) as list_changes:
+                result = await service.sync_designs(
+                    "root", "folder:test-rebuild", credentials=sample_credentials,
+                    page_token="token-1", rebuild=True,
+                )
+
+        list_changes.assert_not_awaited()
+        assert result.incremental is False
 
 
 # =============================================================================
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -226,6 +228,7 @@ class TestIngestMessageAttachments:
                     "filename": "model.stl",
                     "mime_type": "application/octet-stream",
                     "size": 1024000,
+                    "unique_file_id": "document:5",
                 }
             ],
         }
@@ -244,6 +247,7 @@ class TestIngestMessageAttachments:
         assert attachments[0].ext == ".stl"
         assert attachments[0].media_type == MediaType.DOCUMENT
         assert attachments[0].is_candidate_design_file is True
+        assert attachments[0].telegram_unique_file_id == "document:5"
 
     @pytest.mark.asyncio
     async def test_creates_photo_attachment(self, db_session, sample_channel):
@@ -941,3 +945,119 @@ class TestSplitArchiveIngestion:
         )
         sources = result.scalars().all()
         assert len(sources) == 2
+
+
+# =============================================================================
+# Batch Ingestion Tests
+# =============================================================================
+
+
+class TestIngestBatch:
+    """Tests for ingest_batch set-based ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_results_match_input_order(self, db_session, sample_channel):
+        """Test that results line up with the input messages."""
+        service = IngestService(db_session)
+
+        messages = [
+            {"id": 801, "date": "2024-01-15T10:00:00Z", "text": "Hello", "attachments": []},
+            {"text": "No id"},
+            {
+                "id": 802,
+                "date": "2024-01-15T10:05:00Z",
+                "text": "Dragon Bust",
+                "has_media": True,
+                "attachments": [{"type": "DOCUMENT", "filename": "dragon.stl"}],
+            },
+        ]
+
+        results = await service.ingest_batch(sample_channel, messages)
+
+        assert len(results) == 3
+        assert results[0][0].telegram_message_id == 801
+        assert results[0][1] is False
+        assert results[1] == (None, False)
+        assert results[2][0].telegram_message_id == 802
+        assert results[2][1] is True
+
+        result = await db_session.execute(select(Design))
+        design = result.scalar_one()
+        assert design.canonical_title == "Dragon Bust"
+        assert design.primary_file_types == "STL"
+
+    @pytest.mark.asyncio
+    async def test_skips_known_and_repeated_messages(self, db_session, sample_channel):
+        """Test that existing and in-batch duplicate messages aren't re-inserted."""
+        service = IngestService(db_session)
+        first = {"id": 810, "date": "2024-01-15T10:00:00Z", "text": "First"}
+        existing, _ = await service.ingest_message(sample_channel, first)
+
+        second = {"id": 811, "date": "2024-01-15T10:01:00Z", "text": "Second"}
+        results = await service.ingest_batch(sample_channel, [first, second, second])
+
+        assert results[0] == (existing, False)
+        assert results[1][0] is not None
+        assert results[2] == (results[1][0], False)
+
+        result = await db_session.execute(select(TelegramMessage))
+        assert len(result.scalars().all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_merges_split_archive_parts_in_batch(self, db_session, sample_channel):
+        """Test that split archive parts in the same batch share one design."""
+        service = IngestService(db_session)
+
+        messages = [
+            {
+                "id": 820 + part,
+                "date": f"2024-01-15T10:3{part}:00Z",
+                "text": f"Castle Part {part}",
+                "has_media": True,
+                "attachments": [
+                    {"type": "DOCUMENT", "filename": f"Castle.part{part}.rar"}
+                ],
+            }
+            for part in (1, 2, 3)
+        ]
+
+        results = await service.ingest_batch(sample_channel, messages)
+
+        assert all(created for _, created in results)
+        result = await db_session.execute(select(Design))
+        design = result.scalar_one()
+        assert design.detected_parts == 3
+
+    @pytest.mark.asyncio
+    async def test_queues_images_from_nearby_photo_in_batch(
+        self, db_session, sample_channel
+    ):
+        """Test that a preview photo earlier in the batch is picked up."""
+        from app.db.models import Job, JobType
+
+        service = IngestService(db_session)
+
+        messages = [
+            {
+                "id": 830,
+                "date": "2024-01-15T10:00:00Z",
+                "text": "Preview",
+                "has_media": True,
+                "attachments": [{"type": "PHOTO"}],
+            },
+            {
+                "id": 831,
+                "date": "2024-01-15T10:10:00Z",
+                "text": "Robot Kit",
+                "has_media": True,
+                "attachments": [{"type": "DOCUMENT", "filename": "robot.zip"}],
+            },
+        ]
+
+        await service.ingest_batch(sample_channel, messages)
+
+        result = await db_session.execute(
+            select(Job).where(Job.type == JobType.DOWNLOAD_TELEGRAM_IMAGES)
+        )
+        job = result.scalar_one()
+        assert json.loads(job.payload_json)["message_ids"] == [830]
@@ -250,6 +250,128 @@ class TestDequeue:
         assert result is None
 
 
+# =============================================================================
+# Batch Dequeue Tests
+# =============================================================================
+
+
+class TestDequeueMany:
+    """Tests for dequeue_many, start_claimed and release."""
+
+    @pytest.mark.asyncio
+    async def test_dequeue_many_claims_up_to_n(self, db_session):
+        """Test that dequeue_many claims at most n jobs."""
+        service = JobQueueService(db_session)
+        for _ in range(5):
+            await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        await db_session.flush()
+
+        jobs = await service.dequeue_many([JobType.DOWNLOAD_DESIGN], 3)
+
+        assert len(jobs) == 3
+        assert all(j.status == JobStatus.RUNNING for j in jobs)
+        assert all(j.attempts == 1 for j in jobs)
+
+        stats = await service.get_queue_stats()
+        assert stats["by_status"]["QUEUED"] == 2
+        assert stats["by_status"]["RUNNING"] == 3
+
+    @pytest.mark.asyncio
+    async def test_dequeue_many_orders_by_priority(self, db_session):
+        """Test that claimed jobs are ordered by priority."""
+        service = JobQueueService(db_session)
+        await service.enqueue(JobType.DOWNLOAD_DESIGN, priority=1)
+        high = await service.enqueue(JobType.DOWNLOAD_DESIGN, priority=10)
+        medium = await service.enqueue(JobType.DOWNLOAD_DESIGN, priority=5)
+        await db_session.flush()
+
+        jobs = await service.dequeue_many(n=2)
+
+        assert [j.id for j in jobs] == [high.id, medium.id]
+
+    @pytest.mark.asyncio
+    async def test_dequeue_many_filters_by_job_type(self, db_session):
+        """Test that dequeue_many only claims the requested types."""
+        service = JobQueueService(db_session)
+        await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        backfill = await service.enqueue(JobType.BACKFILL_CHANNEL)
+        await db_session.flush()
+
+        jobs = await service.dequeue_many([JobType.BACKFILL_CHANNEL], 5)
+
+        assert [j.id for j in jobs] == [backfill.id]
+
+    @pytest.mark.asyncio
+    async def test_dequeue_many_skips_jobs_waiting_for_retry(self, db_session):
+        """Test that jobs with next_retry_at in the future are not claimed."""
+        service = JobQueueService(db_session)
+        job = await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        job.next_retry_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        await db_session.flush()
+
+        jobs = await service.dequeue_many(n=5)
+
+        assert jobs == []
+
+    @pytest.mark.asyncio
+    async def test_start_claimed_rejects_cancelled_job(self, db_session):
+        """Test that a job cancelled while waiting in a batch is skipped."""
+        service = JobQueueService(db_session)
+        await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        await db_session.flush()
+        (job,) = await service.dequeue_many(n=1)
+
+        await service.cancel(job.id)
+
+        assert await service.start_claimed(job) is False
+
+    @pytest.mark.asyncio
+    async def test_start_claimed_accepts_running_job(self, db_session):
+        """Test that a claimed job can be started."""
+        service = JobQueueService(db_session)
+        await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        await db_session.flush()
+        (job,) = await service.dequeue_many(n=1)
+
+        assert await service.start_claimed(job) is True
+
+    @pytest.mark.asyncio
+    async def test_start_claimed_rejects_job_reclaimed_by_another_worker(self, db_session):
+        """Test that a job requeued as stale and claimed again is skipped."""
+        service = JobQueueService(db_session)
+        await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        await db_session.flush()
+        (job,) = await service.dequeue_many(n=1)
+        # The first worker's copy, as loaded in its own session
+        db_session.expunge(job)
+
+        await service.release([job])
+        (reclaimed,) = await service.dequeue_many(n=1)
+
+        assert reclaimed.claim_token != job.claim_token
+        assert await service.start_claimed(job) is False
+        assert await service.release([job]) == 0
+
+    @pytest.mark.asyncio
+    async def test_release_returns_jobs_to_queue(self, db_session):
+        """Test that released jobs are QUEUED again without a used attempt."""
+        service = JobQueueService(db_session)
+        for _ in range(2):
+            await service.enqueue(JobType.DOWNLOAD_DESIGN)
+        await db_session.flush()
+        jobs = await service.dequeue_many(n=2)
+
+        released = await service.release(jobs)
+
+        assert released == 2
+        for job in jobs:
+            refreshed = await service.get_job(job.id)
+            await db_session.refresh(refreshed)
+            assert refreshed.status == JobStatus.QUEUED
+            assert refreshed.attempts == 0
+            assert refreshed.started_at is None
+
+
 # =============================================================================
 # Complete Tests
 # =============================================================================
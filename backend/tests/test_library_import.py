@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import patch
@@ -21,6 +22,7 @@ from app.db.models import (
     ModelKind,
     TelegramMessage,
 )
+from app.services.blob_store import BlobStore
 from app.services.library import (
     DEFAULT_TEMPLATE,
     INVALID_CHARS,
@@ -346,6 +348,7 @@ class TestImportDesign:
             mock_settings.staging_path = temp_dirs["staging_root"]
             mock_settings.library_path = temp_dirs["library"]
             mock_settings.library_template_global = "{designer}/{title}"
+            mock_settings.library_content_addressed = False
 
             with patch("app.services.library.async_session_maker", mock_session_maker):
                 service = LibraryImportService(db_session)
@@ -382,6 +385,7 @@ class TestImportDesign:
             mock_settings.staging_path = temp_dirs["staging_root"]
             mock_settings.library_path = temp_dirs["library"]
             mock_settings.library_template_global = "{designer}/{title}"
+            mock_settings.library_content_addressed = False
 
             with patch("app.services.library.async_session_maker", mock_session_maker):
                 service = LibraryImportService(db_session)
@@ -390,6 +394,98 @@ class TestImportDesign:
                 await db_session.refresh(design_with_source)
                 assert design_with_source.status == DesignStatus.ORGANIZED
 
+    @pytest.mark.asyncio
+    async def test_content_addressed_import_links_blob(
+        self, db_session, design_with_source, temp_dirs, mock_session_maker
+    ):
+        """Test content-addressed mode stores the file once and links it."""
+        test_file = temp_dirs["staging"] / "model.stl"
+        test_file.write_bytes(b"STL content")
+        sha256 = hashlib.sha256(b"STL content").hexdigest()
+
+        design_file = DesignFile(
+            design_id=design_with_source.id,
+            relative_path="model.stl",
+            filename="model.stl",
+            ext=".stl",
+            size_bytes=11,
+            file_kind=FileKind.MODEL,
+            model_kind=ModelKind.STL,
+            is_from_archive=True,
+        )
+        db_session.add(design_file)
+        await db_session.commit()
+
+        blob_store = BlobStore(temp_dirs["library"] / ".blobs")
+        with (
+            patch("app.services.library.settings") as mock_settings,
+            patch("app.services.library.BlobStore", return_value=blob_store),
+            patch("app.services.library.async_session_maker", mock_session_maker),
+        ):
+            mock_settings.staging_path = temp_dirs["staging_root"]
+            mock_settings.library_path = temp_dirs["library"]
+            mock_settings.library_template_global = "{designer}/{title}"
+            mock_settings.library_content_addressed = True
+
+            service = LibraryImportService(db_session)
+            await service.import_design(design_with_source.id)
+
+        await db_session.refresh(design_file)
+        imported = temp_dirs["library"] / design_file.relative_path
+        blob = blob_store.blob_path(sha256)
+        assert design_file.sha256 == sha256
+        assert imported.read_bytes() == b"STL content"
+        assert imported.stat().st_ino == blob.stat().st_ino
+        assert not test_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_content_addressed_import_ignores_stale_hash(
+        self, db_session, design_with_source, temp_dirs, mock_session_maker
+    ):
+        """Test a wrong recorded hash never swaps the file for another blob."""
+        test_file = temp_dirs["staging"] / "model.stl"
+        test_file.write_bytes(b"STL content")
+        sha256 = hashlib.sha256(b"STL content").hexdigest()
+        stale = hashlib.sha256(b"Old content").hexdigest()
+
+        blob_store = BlobStore(temp_dirs["library"] / ".blobs")
+        stale_blob = blob_store.blob_path(stale)
+        stale_blob.parent.mkdir(parents=True)
+        stale_blob.write_bytes(b"Old content")
+
+        design_file = DesignFile(
+            design_id=design_with_source.id,
+            relative_path="model.stl",
+            filename="model.stl",
+            ext=".stl",
+            size_bytes=11,
+            sha256=stale,
+            file_kind=FileKind.MODEL,
+            model_kind=ModelKind.STL,
+            is_from_archive=True,
+        )
+        db_session.add(design_file)
+        await db_session.commit()
+
+        with (
+            patch("app.services.library.settings") as mock_settings,
+            patch("app.services.library.BlobStore", return_value=blob_store),
+            patch("app.services.library.async_session_maker", mock_session_maker),
+        ):
+            mock_settings.staging_path = temp_dirs["staging_root"]
+            mock_settings.library_path = temp_dirs["library"]
+            mock_settings.library_template_global = "{designer}/{title}"
+            mock_settings.library_content_addressed = True
+
+            service = LibraryImportService(db_session)
+            await service.import_design(design_with_source.id)
+
+        await db_session.refresh(design_file)
+        imported = temp_dirs["library"] / design_file.relative_path
+        assert design_file.sha256 == sha256
+        assert imported.read_bytes() == b"STL content"
+        assert imported.stat().st_ino == blob_store.blob_path(sha256).stat().st_ino
+
 
 # =============================================================================
 # ImportToLibraryWorker Tests
@@ -0,0 +1,226 @@
+"""Tests for parallel Telegram document downloads.
+
+Tests cover:
+- Fetching parts over several connections into one file
+- Hashing in file order when parts complete out of order
+- Resuming from a persisted part bitmap
+- The shared bandwidth budget
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from telethon.tl.types import Document
+
+from app.telegram.parallel_download import (
+    PART_SIZE,
+    BandwidthBudget,
+    ParallelDownloader,
+    ParallelDownloadError,
+    PartBitmap,
+    download_parts,
+    partial_download_paths,
+)
+
+PART = 4096
+
+
+def make_fetcher(content: bytes, calls: list[int] | None = None, delays: dict[int, float] | None = None):
+    async def fetch(offset: int, limit: int) -> bytes:
+        if calls is not None:
+            calls.append(offset)
+        if delays and offset in delays:
+            await asyncio.sleep(delays[offset])
+        return content[offset:offset + limit]
+
+    return fetch
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return partial_download_paths(tmp_path, 12345)
+
+
+class TestDownloadParts:
+    """Tests for download_parts."""
+
+    @pytest.mark.asyncio
+    async def test_assembles_file_from_parallel_parts(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 10 + 123)
+        fetchers = [make_fetcher(content) for _ in range(4)]
+
+        digest = await download_parts(
+            fetchers, len(content), part_path, state_path, "doc", part_size=PART
+        )
+
+        assert part_path.read_bytes() == content
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert not state_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_hash_is_in_file_order_when_parts_finish_out_of_order(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 6)
+        # The first part finishes last
+        fetchers = [make_fetcher(content, delays={0: 0.05}) for _ in range(3)]
+
+        digest = await download_parts(
+            fetchers, len(content), part_path, state_path, "doc", part_size=PART
+        )
+
+        assert digest == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_reports_progress(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 3)
+        progress: list[tuple[int, int]] = []
+
+        await download_parts(
+            [make_fetcher(content)],
+            len(content),
+            part_path,
+            state_path,
+            "doc",
+            part_size=PART,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert progress[-1] == (len(content), len(content))
+
+    @pytest.mark.asyncio
+    async def test_resumes_missing_parts_only(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 4)
+        part_path.write_bytes(content[:PART] + bytes(PART) + content[2 * PART:3 * PART])
+        bitmap = PartBitmap(4)
+        bitmap.mark(0)
+        bitmap.mark(2)
+        bitmap.save(state_path, "doc", len(content), PART)
+        calls: list[int] = []
+
+        digest = await download_parts(
+            [make_fetcher(content, calls)], len(content), part_path, state_path, "doc", part_size=PART
+        )
+
+        assert sorted(calls) == [PART, 3 * PART]
+        assert part_path.read_bytes() == content
+        assert digest == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_state_for_other_content_is_discarded(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 2)
+        part_path.write_bytes(b"x" * PART * 2)
+        bitmap = PartBitmap(2)
+        bitmap.mark(0)
+        bitmap.save(state_path, "other-doc", len(content), PART)
+        calls: list[int] = []
+
+        await download_parts(
+            [make_fetcher(content, calls)], len(content), part_path, state_path, "doc", part_size=PART
+        )
+
+        assert sorted(calls) == [0, PART]
+        assert part_path.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_progress_for_next_attempt(self, paths):
+        part_path, state_path = paths
+        content = os.urandom(PART * 4)
+
+        async def failing(offset: int, limit: int) -> bytes:
+            if offset == 2 * PART:
+                raise ValueError("boom")
+            return content[offset:offset + limit]
+
+        with pytest.raises(ValueError):
+            await download_parts(
+                [failing], len(content), part_path, state_path, "doc", part_size=PART
+            )
+
+        bitmap = PartBitmap.load(state_path, "doc", len(content), PART)
+        assert bitmap is not None
+        assert bitmap.missing() == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_short_part_is_an_error(self, paths):
+        part_path, state_path = paths
+
+        async def short(offset: int, limit: int) -> bytes:
+            return b"tiny"
+
+        with pytest.raises(ParallelDownloadError):
+            await download_parts([short], PART * 2, part_path, state_path, "doc", part_size=PART)
+
+
+class FakeSender:
+    """Stands in for an MTProtoSender answering upload.getFile."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.disconnect = AsyncMock()
+
+    async def send(self, request):
+        return SimpleNamespace(bytes=self.content[request.offset:request.offset + request.limit])
+
+
+class TestParallelDownloader:
+    """Tests for ParallelDownloader.download."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_document_and_closes_senders(self, tmp_path):
+        content = os.urandom(PART_SIZE * 2 + 10)
+        document = Document(
+            id=777,
+            access_hash=1,
+            file_reference=b"ref",
+            date=None,
+            mime_type="application/zip",
+            size=len(content),
+            dc_id=2,
+            attributes=[],
+        )
+        senders = [FakeSender(content) for _ in range(3)]
+        downloader = ParallelDownloader(client=object(), connections=3, budget=BandwidthBudget(0))
+        dest = tmp_path / "design.zip"
+
+        with patch.object(downloader, "_open_senders", AsyncMock(return_value=senders)):
+            digest = await downloader.download(document, dest)
+
+        assert dest.read_bytes() == content
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert not partial_download_paths(tmp_path, 777)[0].exists()
+        for sender in senders:
+            sender.disconnect.assert_awaited_once()
+
+
+class TestBandwidthBudget:
+    """Tests for BandwidthBudget."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_does_not_wait(self):
+        budget = BandwidthBudget(rate_mbps=0)
+
+        start = time.monotonic()
+        await budget.consume(10**9)
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_paces_to_rate(self):
+        # 8 Mbit/s = 1,000,000 bytes/s
+        budget = BandwidthBudget(rate_mbps=8)
+
+        start = time.monotonic()
+        await asyncio.gather(*(budget.consume(100_000) for _ in range(3)))
+
+        assert time.monotonic() - start >= 0.25
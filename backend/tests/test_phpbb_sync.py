@@ -0,0 +1,167 @@
+"""Tests for incremental phpBB forum scans.
+
+Tests cover:
+- Persisting index page validators and topic markers
+- Skipping topics whose last post is unchanged
+- Per-host request pacing
+- Pooled client lifetime
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.phpbb import AttachmentInfo, PhpbbService, TopicInfo
+from app.services.phpbb_http import (
+    HostTokenBucket,
+    close_phpbb_http_clients,
+    phpbb_http_client,
+)
+from app.services.phpbb_sync import PhpbbForumSnapshot
+
+FORUM_URL = "https://forum.example.com/viewforum.php?f=7"
+PAGE_URL = "https://forum.example.com/viewforum.php?f=7&start=25"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    with patch("app.services.phpbb_sync.settings") as mock_settings:
+        mock_settings.cache_path = tmp_path
+        yield tmp_path
+
+
+def make_topic(topic_id: int, marker: str) -> TopicInfo:
+    return TopicInfo(
+        topic_id=topic_id,
+        forum_id=7,
+        title=f"[STL] Model {topic_id}",
+        last_post_marker=marker,
+        url=f"viewtopic.php?f=7&t={topic_id}",
+    )
+
+
+class TestPhpbbForumSnapshot:
+    """Tests for PhpbbForumSnapshot."""
+
+    def test_round_trip(self, cache_path):
+        snapshot = PhpbbForumSnapshot.load("folder:1", FORUM_URL)
+        snapshot.store_page(PAGE_URL, '"abc"', None, [{"topic_id": 1}], None)
+        snapshot.store_topic(1, "p10:3", None)
+        snapshot.save()
+
+        loaded = PhpbbForumSnapshot.load("folder:1", FORUM_URL)
+
+        assert loaded.validators(PAGE_URL) == {"If-None-Match": '"abc"'}
+        assert loaded.cached_page(PAGE_URL)["topics"] == [{"topic_id": 1}]
+        assert loaded.unchanged_topic(1, "p10:3") == {"marker": "p10:3", "design": None}
+        assert loaded.unchanged_topic(1, "p11:4") is None
+
+    def test_pages_without_validators_are_not_kept(self, cache_path):
+        snapshot = PhpbbForumSnapshot("folder:1", FORUM_URL)
+        snapshot.store_page(PAGE_URL, None, None, [], None)
+
+        assert snapshot.cached_page(PAGE_URL) is None
+        assert snapshot.validators(PAGE_URL) == {}
+
+    def test_discards_other_forum_and_expired_state(self, cache_path):
+        snapshot = PhpbbForumSnapshot("folder:1", FORUM_URL)
+        snapshot.store_topic(1, "p10:3", None)
+        snapshot.save()
+
+        assert PhpbbForumSnapshot.load("folder:1", FORUM_URL + "0").topics == {}
+
+        snapshot.created_at = time.time() - 30 * 24 * 60 * 60
+        snapshot.save()
+        assert PhpbbForumSnapshot.load("folder:1", FORUM_URL).topics == {}
+
+
+class TestIncrementalScan:
+    """Tests for PhpbbService.scan_forum_for_designs with stored state."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_changed_topics(self, cache_path):
+        service = PhpbbService(MagicMock())
+        attachment = AttachmentInfo(
+            file_id=5,
+            filename="model.zip",
+            size_bytes=100,
+            download_url="https://forum.example.com/download/file.php?id=5",
+        )
+        get_content = AsyncMock(return_value=([attachment], []))
+
+        first = [make_topic(1, "p10:0"), make_topic(2, "p20:0")]
+        second = [make_topic(1, "p10:0"), make_topic(2, "p25:1")]
+
+        with (
+            patch.object(service, "list_all_topics", AsyncMock(side_effect=[first, second])),
+            patch.object(service, "get_topic_content", get_content),
+        ):
+            await service.scan_forum_for_designs(
+                "https://forum.example.com", FORUM_URL, {}, snapshot_key="folder:1"
+            )
+            designs = await service.scan_forum_for_designs(
+                "https://forum.example.com", FORUM_URL, {}, snapshot_key="folder:1"
+            )
+
+        assert get_content.await_count == 3
+        assert [d.topic_id for d in designs] == [1, 2]
+        assert designs[0].attachments == [attachment]
+
+
+class TestHostTokenBucket:
+    """Tests for HostTokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_paces(self):
+        bucket = HostTokenBucket(delay=0.05, burst=2)
+
+        started = time.monotonic()
+        for _ in range(2):
+            await bucket.acquire()
+        burst_elapsed = time.monotonic() - started
+        await bucket.acquire()
+        total_elapsed = time.monotonic() - started
+
+        assert burst_elapsed < 0.04
+        assert total_elapsed >= 0.04
+
+    def test_follows_delay_setting(self):
+        bucket = HostTokenBucket()
+
+        with patch("app.services.phpbb_http.settings") as mock_settings:
+            mock_settings.phpbb_request_delay = 0.5
+            assert bucket.delay == 0.5
+            mock_settings.phpbb_request_delay = 2.0
+            assert bucket.delay == 2.0
+
+
+class TestPhpbbHttpClient:
+    """Tests for phpbb_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_evicted_client_closed_once_returned(self):
+        url = "https://forum.example.com/"
+        try:
+            with patch("app.services.phpbb_http.MAX_POOLED_CLIENTS", 1):
+                async with phpbb_http_client(url, {"sid": "a"}) as first:
+                    async with phpbb_http_client(url, {"sid": "b"}):
+                        pass
+                    assert not first.is_closed
+                assert first.is_closed
+        finally:
+            await close_phpbb_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_same_session_shares_client(self):
+        url = "https://forum.example.com/"
+        try:
+            async with phpbb_http_client(url, {"sid": "a"}) as first:
+                pass
+            async with phpbb_http_client(url + "viewforum.php?f=7", {"sid": "a"}) as second:
+                assert second is first
+                assert not second.is_closed
+        finally:
+            await close_phpbb_http_clients()
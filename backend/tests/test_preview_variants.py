@@ -0,0 +1,143 @@
+"""Tests for resized preview variants.
+
+Tests cover:
+- WebP derivative generation per width
+- Skipping widths at or above the original width
+- Variant selection by width and Accept header
+- Skipping variants when the worker pool breaks
+"""
+
+from __future__ import annotations
+
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.services.preview_variants import (
+    PREVIEW_VARIANT_WIDTHS,
+    create_preview_variants,
+    generate_variants,
+    select_variant,
+    variant_path,
+)
+
+BROWSER_ACCEPT = "image/avif,image/webp,image/apng,image/*,*/*;q=0.8"
+
+
+def write_image(path: Path, size: tuple[int, int], mode: str = "RGB") -> Path:
+    color = (200, 50, 50, 128) if mode == "RGBA" else (200, 50, 50)
+    Image.new(mode, size, color).save(path, "PNG")
+    return path
+
+
+class TestGenerateVariants:
+    """Tests for generate_variants."""
+
+    def test_generates_each_width(self, tmp_path):
+        source = write_image(tmp_path / "big.png", (1600, 800))
+
+        written = generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert sorted(v["width"] for v in written) == [200, 400, 800]
+        for variant in written:
+            assert variant["format"] == "webp"
+            assert variant["height"] == variant["width"] // 2
+            with Image.open(variant["path"]) as img:
+                assert img.format == "WEBP"
+                assert img.size == (variant["width"], variant["height"])
+
+    def test_skips_widths_not_smaller_than_original(self, tmp_path):
+        source = write_image(tmp_path / "medium.png", (400, 300))
+
+        written = generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert [v["width"] for v in written] == [200]
+        assert not variant_path(source, 400, "webp").exists()
+
+    def test_small_image_has_no_variants(self, tmp_path):
+        source = write_image(tmp_path / "tiny.png", (150, 150))
+
+        assert generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80) == []
+
+    def test_keeps_transparency(self, tmp_path):
+        source = write_image(tmp_path / "alpha.png", (500, 500), mode="RGBA")
+
+        written = generate_variants(str(source), (200,), ["webp"], 80)
+
+        with Image.open(written[0]["path"]) as img:
+            assert img.mode == "RGBA"
+
+
+class TestSelectVariant:
+    """Tests for select_variant."""
+
+    def test_no_width_serves_original(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert select_variant(source, None, BROWSER_ACCEPT) == (source, None)
+
+    def test_picks_smallest_variant_covering_width(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        path, media_type = select_variant(source, 250, BROWSER_ACCEPT)
+
+        assert path == variant_path(source, 400, "webp")
+        assert media_type == "image/webp"
+
+    def test_prefers_avif_when_present_and_accepted(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        generate_variants(str(source), (200,), ["webp"], 80)
+        avif = variant_path(source, 200, "avif")
+        avif.write_bytes(b"stand-in")
+
+        assert select_variant(source, 200, BROWSER_ACCEPT) == (avif, "image/avif")
+        assert select_variant(source, 200, "image/webp,*/*") == (
+            variant_path(source, 200, "webp"),
+            "image/webp",
+        )
+
+    def test_client_without_webp_gets_original(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert select_variant(source, 200, "image/png,image/*;q=0.8") == (source, None)
+        assert select_variant(source, 200, "image/webp;q=0") == (source, None)
+
+    def test_wider_than_variants_serves_original(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert select_variant(source, 1200, BROWSER_ACCEPT) == (source, None)
+
+    def test_missing_variant_serves_original(self, tmp_path):
+        # 500px original: no 800px variant, so w=600 gets the original
+        source = write_image(tmp_path / "p.png", (500, 500))
+        generate_variants(str(source), PREVIEW_VARIANT_WIDTHS, ["webp"], 80)
+
+        assert select_variant(source, 600, BROWSER_ACCEPT) == (source, None)
+
+
+class TestCreatePreviewVariants:
+    """Tests for create_preview_variants."""
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_skips_variants(self, tmp_path):
+        source = write_image(tmp_path / "p.png", (1600, 800))
+        executor = MagicMock()
+        executor.submit.side_effect = BrokenProcessPool("worker died")
+
+        with (
+            patch("app.services.preview_variants._get_executor", return_value=executor),
+            patch("app.services.preview_variants.shutdown_preview_variant_executor") as shutdown,
+            patch("app.services.preview_variants.generate_variants") as generate,
+        ):
+            written = await create_preview_variants(source, tmp_path)
+
+        assert written == []
+        shutdown.assert_called_once()
+        generate.assert_not_called()
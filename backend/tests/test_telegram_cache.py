@@ -0,0 +1,122 @@
+"""Tests for TelegramCache - shared entity and message cache.
+
+Tests cover:
+- Entities resolved once per channel
+- Batched message fetches and reuse of fresh messages
+- Concurrent callers sharing one fetch
+- Message expiry and refresh
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.telegram import cache as cache_module
+from app.telegram.cache import TelegramCache
+
+
+def make_client() -> MagicMock:
+    client = MagicMock()
+    client.get_input_entity = AsyncMock(return_value=SimpleNamespace(channel_id=1))
+
+    async def get_messages(entity, ids):
+        await asyncio.sleep(0)
+        return [SimpleNamespace(id=i) if i < 1000 else None for i in ids]
+
+    client.get_messages = AsyncMock(side_effect=get_messages)
+    return client
+
+
+@pytest.fixture
+def cache():
+    with patch("app.telegram.rate_limiter.TelegramRateLimiter.acquire", AsyncMock()):
+        yield TelegramCache()
+
+
+class TestTelegramCache:
+    """Tests for TelegramCache."""
+
+    @pytest.mark.asyncio
+    async def test_batches_message_ids_into_one_request(self, cache):
+        client = make_client()
+
+        messages = await cache.get_messages(client, -100123, [5, 6, 7])
+
+        assert [m.id for m in messages.values()] == [5, 6, 7]
+        client.get_messages.assert_awaited_once()
+        assert client.get_messages.await_args.kwargs["ids"] == [5, 6, 7]
+
+    @pytest.mark.asyncio
+    async def test_reuses_fresh_messages_and_entities(self, cache):
+        client = make_client()
+        await cache.get_messages(client, -100123, [5, 6])
+
+        message = await cache.get_message(client, -100123, 6)
+        await cache.get_messages(client, -100123, [7])
+
+        assert message.id == 6
+        assert client.get_messages.await_count == 2
+        assert client.get_messages.await_args.kwargs["ids"] == [7]
+        client.get_input_entity.assert_awaited_once_with(-100123)
+
+    @pytest.mark.asyncio
+    async def test_missing_message_is_none(self, cache):
+        client = make_client()
+
+        assert await cache.get_message(client, -100123, 5000) is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_a_fetch(self, cache):
+        client = make_client()
+
+        first, second = await asyncio.gather(
+            cache.get_message(client, -100123, 5),
+            cache.get_message(client, -100123, 5),
+        )
+
+        assert first is second
+        client.get_messages.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_splits_large_batches(self, cache):
+        client = make_client()
+
+        messages = await cache.get_messages(client, -100123, list(range(1, 251)))
+
+        assert len(messages) == 250
+        assert client.get_messages.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_messages_are_refetched(self, cache, monkeypatch):
+        client = make_client()
+        await cache.get_message(client, -100123, 5)
+
+        monkeypatch.setattr(cache_module, "MESSAGE_TTL_SECONDS", 0)
+        await cache.get_message(client, -100123, 5)
+
+        assert client.get_messages.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_refetches(self, cache):
+        client = make_client()
+        before = await cache.get_message(client, -100123, 5)
+
+        after = await cache.refresh_message(client, -100123, 5)
+
+        assert after is not before
+        assert client.get_messages.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self, cache):
+        client = make_client()
+        client.get_messages.side_effect = [ConnectionError("down"), [SimpleNamespace(id=5)]]
+
+        with pytest.raises(ConnectionError):
+            await cache.get_message(client, -100123, 5)
+        message = await cache.get_message(client, -100123, 5)
+
+        assert message.id == 5
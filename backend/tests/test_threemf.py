@@ -0,0 +1,146 @@
+"""Tests for streaming 3MF analysis.
+
+Tests cover:
+- Color and material detection
+- Early stop and mesh skipping
+- Plate, thumbnail and metadata extraction
+- Damaged files
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+from app.services.multicolor import MulticolorDetector
+from app.services.threemf import analyze_3mf
+
+CORE_NS = "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"
+
+
+def model_xml(resources: str, mesh_vertices: int = 3, metadata: str = "") -> str:
+    vertices = "".join(
+        f'<vertex x="{i}" y="{i}" z="{i}"/>' for i in range(mesh_vertices)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<model unit="millimeter" xmlns="{CORE_NS}">
+{metadata}
+<resources>
+{resources}
+<object id="10" type="model">
+<mesh><vertices>{vertices}</vertices>
+<triangles><triangle v1="0" v2="1" v3="2"/></triangles></mesh>
+</object>
+</resources>
+<build><item objectid="10"/></build>
+</model>"""
+
+
+def write_3mf(path: Path, model: str | bytes, extra: dict[str, bytes] | None = None) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("3D/3dmodel.model", model)
+        for name, data in (extra or {}).items():
+            zf.writestr(name, data)
+    return path
+
+
+class TestAnalyze3mf:
+    """Tests for analyze_3mf."""
+
+    def test_multiple_base_materials_detected(self, tmp_path):
+        path = write_3mf(tmp_path / "multi.3mf", model_xml(
+            '<basematerials id="1">'
+            '<base name="Red" displaycolor="#FF0000"/>'
+            '<base name="Blue" displaycolor="#0000FF"/>'
+            '</basematerials>'
+        ))
+
+        analysis = analyze_3mf(path, stop_when_multicolor=False)
+
+        assert analysis.is_multicolor
+        assert analysis.colors == ["#0000FF", "#FF0000"]
+        assert analysis.fully_parsed
+
+    def test_single_color(self, tmp_path):
+        path = write_3mf(tmp_path / "single.3mf", model_xml(
+            '<basematerials id="1"><base name="Red" displaycolor="#FF0000"/></basematerials>'
+        ))
+
+        analysis = analyze_3mf(path)
+
+        assert not analysis.is_multicolor
+        assert analysis.colors == ["#FF0000"]
+        assert analysis.fully_parsed
+
+    def test_stops_once_multicolor(self, tmp_path):
+        # Broken XML after the materials: only reachable without early stop
+        model = model_xml(
+            '<basematerials id="1">'
+            '<base displaycolor="#FF0000"/><base displaycolor="#00FF00"/>'
+            '</basematerials>'
+        ).replace("<build>", "<build><<<")
+        path = write_3mf(tmp_path / "early.3mf", model)
+
+        analysis = analyze_3mf(path)
+
+        assert analysis.is_multicolor
+        assert not analysis.fully_parsed
+        assert analysis.error is None
+
+    def test_mesh_contents_ignored(self, tmp_path):
+        # Elements named like materials inside a mesh are not materials
+        model = model_xml("", mesh_vertices=5000).replace(
+            "<vertices>",
+            '<vertices><color color="#FF0000"/><color color="#00FF00"/>',
+        )
+        path = write_3mf(tmp_path / "mesh.3mf", model)
+
+        analysis = analyze_3mf(path)
+
+        assert analysis.colors == []
+        assert not analysis.is_multicolor
+
+    def test_plates_thumbnails_and_metadata(self, tmp_path):
+        path = write_3mf(
+            tmp_path / "plates.3mf",
+            model_xml("", metadata='<metadata name="Title">Dragon</metadata>'),
+            extra={
+                "Metadata/plate_1.png": b"png1",
+                "Metadata/plate_2.png": b"png2",
+                "Metadata/plate_2.json": b"{}",
+                "Metadata/thumbnail.png": b"thumb",
+            },
+        )
+
+        analysis = analyze_3mf(path, read_thumbnail=True)
+
+        assert analysis.plates == [1, 2]
+        assert "Metadata/plate_1.png" in analysis.thumbnails
+        assert analysis.thumbnail_name == "Metadata/thumbnail.png"
+        assert analysis.thumbnail_data == b"thumb"
+        assert analysis.metadata == {"Title": "Dragon"}
+
+    def test_not_a_zip(self, tmp_path):
+        path = tmp_path / "broken.3mf"
+        path.write_bytes(b"not a zip")
+
+        analysis = analyze_3mf(path)
+
+        assert analysis.error is not None
+        assert not analysis.is_multicolor
+
+
+class TestDetectFrom3mf:
+    """Tests for MulticolorDetector.detect_from_3mf."""
+
+    def test_returns_details(self, tmp_path):
+        path = write_3mf(tmp_path / "multi.3mf", model_xml(
+            '<basematerials id="1"><base displaycolor="#FF0000"/></basematerials>'
+            '<basematerials id="2"><base displaycolor="#FF0000"/></basematerials>'
+        ))
+
+        is_multicolor, details = MulticolorDetector().detect_from_3mf(path)
+
+        assert is_multicolor
+        assert details["color_count"] == 1
+        assert details["materials"] == ["basematerials_1", "basematerials_2"]
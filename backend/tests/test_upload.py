@@ -598,3 +598,165 @@ class TestValidation:
                         filename=f"file{ext}",
                         file_content=b"malicious",
                     )
+
+
+# =============================================================================
+# Streaming and Resumable Upload Tests
+# =============================================================================
+
+
+@pytest.fixture
+def limited_service(service: UploadService) -> UploadService:
+    """UploadService with a 1MB size limit."""
+    service._get_max_size = AsyncMock(return_value=(1, 1024 * 1024))
+    return service
+
+
+class TestStreamingUpload:
+    """Tests for chunked writing in create_upload."""
+
+    @pytest.mark.asyncio
+    async def test_records_sha256(self, limited_service: UploadService, staging_dir):
+        """The SHA-256 is computed while the file is written."""
+        import hashlib
+
+        content = b"solid test\n" * 50000
+
+        result = await limited_service.create_upload(filename="model.stl", file_content=content)
+
+        assert result.size == len(content)
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+        assert (staging_dir / result.upload_id / "model.stl").read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_streamed_content_over_limit_rejected(
+        self, limited_service: UploadService, staging_dir
+    ):
+        """The limit is enforced while data arrives and the upload is removed."""
+        received = []
+
+        async def chunks():
+            for _ in range(4):
+                received.append(1)
+                yield b"X" * (512 * 1024)
+
+        with pytest.raises(UploadValidationError, match="exceeds maximum"):
+            await limited_service.create_upload(filename="large.stl", file_content=chunks())
+
+        # Stopped at the first chunk past the limit
+        assert len(received) == 3
+        assert list(staging_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_announced_size_over_limit_rejected(
+        self, limited_service: UploadService, staging_dir
+    ):
+        """An oversized upload is rejected before anything is written."""
+        with pytest.raises(UploadValidationError, match="exceeds maximum"):
+            await limited_service.create_upload(
+                filename="large.stl",
+                file_content=b"",
+                size=2 * 1024 * 1024,
+            )
+
+        assert list(staging_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_filename_cannot_escape_staging(self, limited_service: UploadService, staging_dir):
+        """Directory components in the filename are dropped."""
+        result = await limited_service.create_upload(
+            filename="../../model.stl",
+            file_content=b"solid test",
+        )
+
+        assert result.filename == "model.stl"
+        assert (staging_dir / result.upload_id / "model.stl").exists()
+
+
+class TestResumableUpload:
+    """Tests for resumable upload sessions."""
+
+    @pytest.mark.asyncio
+    async def test_upload_in_chunks(self, limited_service: UploadService):
+        """Chunks appended at the right offsets complete the upload."""
+        import hashlib
+
+        content = b"0123456789" * 1000
+        session = await limited_service.create_upload_session("model.3mf", len(content))
+        assert session.status == UploadStatus.UPLOADING
+        assert session.offset == 0
+
+        first = await limited_service.append_upload_chunk(session.upload_id, 0, content[:4000])
+        assert first.offset == 4000
+        assert first.status == UploadStatus.UPLOADING
+
+        done = await limited_service.append_upload_chunk(session.upload_id, 4000, content[4000:])
+        assert done.offset == len(content)
+        assert done.status == UploadStatus.PENDING
+        assert done.sha256 == hashlib.sha256(content).hexdigest()
+
+        info = await limited_service.get_upload(session.upload_id)
+        assert info.status == UploadStatus.PENDING
+        assert info.sha256 == done.sha256
+
+    @pytest.mark.asyncio
+    async def test_wrong_offset_rejected(self, limited_service: UploadService):
+        """A chunk must start at the current offset."""
+        from app.services.upload import UploadOffsetError
+
+        session = await limited_service.create_upload_session("model.stl", 100)
+        await limited_service.append_upload_chunk(session.upload_id, 0, b"X" * 40)
+
+        with pytest.raises(UploadOffsetError) as exc_info:
+            await limited_service.append_upload_chunk(session.upload_id, 20, b"X" * 10)
+
+        assert exc_info.value.offset == 40
+
+    @pytest.mark.asyncio
+    async def test_interrupted_chunk_keeps_received_data(self, limited_service: UploadService):
+        """Data before a dropped connection counts; the client resumes after it."""
+        import hashlib
+
+        import app.services.upload as upload_module
+
+        content = b"A" * 3000 + b"B" * 3000
+        session = await limited_service.create_upload_session("model.stl", len(content))
+
+        async def dropped():
+            yield content[:3000]
+            raise ConnectionResetError("client went away")
+
+        with pytest.raises(ConnectionResetError):
+            await limited_service.append_upload_chunk(session.upload_id, 0, dropped())
+
+        state = await limited_service.get_upload_session(session.upload_id)
+        assert state.offset == 3000
+
+        # Simulate a restart: the running hash is rebuilt from disk
+        upload_module._session_hashes.clear()
+
+        done = await limited_service.append_upload_chunk(session.upload_id, 3000, content[3000:])
+        assert done.status == UploadStatus.PENDING
+        assert done.sha256 == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_data_past_declared_size_rejected(self, limited_service: UploadService):
+        """A session never grows beyond the size it was created with."""
+        session = await limited_service.create_upload_session("model.stl", 10)
+
+        with pytest.raises(UploadValidationError, match="declared upload size"):
+            await limited_service.append_upload_chunk(session.upload_id, 0, b"X" * 11)
+
+    @pytest.mark.asyncio
+    async def test_session_over_limit_rejected(self, limited_service: UploadService):
+        """The size limit applies when the session is created."""
+        with pytest.raises(UploadValidationError, match="exceeds maximum"):
+            await limited_service.create_upload_session("model.stl", 2 * 1024 * 1024)
+
+    @pytest.mark.asyncio
+    async def test_incomplete_upload_cannot_be_processed(self, limited_service: UploadService):
+        """Processing waits until all bytes have arrived."""
+        session = await limited_service.create_upload_session("model.stl", 100)
+
+        with pytest.raises(UploadProcessingError, match="still receiving data"):
+            await limited_service.process_upload(session.upload_id)
@@ -0,0 +1,484 @@
+"""Tests for BaseWorker, JobDispatcher, ConcurrencyScheduler and WorkerManager."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.models import Job, JobStatus, JobType
+from app.services.job_queue import JobQueueService, job_notify_channel
+from app.workers.base import BaseWorker
+from app.workers.concurrency import ConcurrencyScheduler, WorkerResource
+from app.workers.dispatcher import JobDispatcher
+from app.workers.manager import WorkerManager
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def db_engine():
+    """Create an in-memory test database engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def mock_session_maker(db_engine):
+    """Create a mock session maker that uses the test database."""
+    test_session_maker = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    @asynccontextmanager
+    async def mock_maker():
+        async with test_session_maker() as session:
+            yield session
+
+    return mock_maker
+
+
+class RecordingWorker(BaseWorker):
+    """Worker that records the jobs it processes."""
+
+    job_types = [JobType.DOWNLOAD_DESIGN]
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.processed: list[str] = []
+        self.processed_event = asyncio.Event()
+
+    async def process(
+        self, job: Job, payload: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        self.processed.append(job.id)
+        self.processed_event.set()
+        return None
+
+
+class ExtractWorker(RecordingWorker):
+    """Worker for a different job type."""
+
+    job_types = [JobType.EXTRACT_ARCHIVE]
+
+
+class CpuWorker(RecordingWorker):
+    """Worker that needs a CPU slot."""
+
+    resources = [WorkerResource.CPU]
+
+
+# Stand-ins named like the real workers so pool settings apply to them
+ExtractWorkerPool = type("ExtractArchiveWorker", (ExtractWorker,), {})
+DownloadWorkerPool = type("DownloadWorker", (RecordingWorker,), {})
+
+
+# =============================================================================
+# Notification Channel Tests
+# =============================================================================
+
+
+class TestJobNotifyChannel:
+    """Tests for per-job-type NOTIFY channels."""
+
+    def test_channel_per_job_type(self):
+        """Test each job type gets its own channel."""
+        channels = {job_notify_channel(jt) for jt in JobType}
+
+        assert len(channels) == len(JobType)
+
+    def test_channel_name_format(self):
+        """Test channel names are lowercase identifiers."""
+        assert job_notify_channel(JobType.DOWNLOAD_DESIGN) == "printarr_jobs_download_design"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_skips_notify_on_sqlite(self, mock_session_maker):
+        """Test enqueue works on databases without LISTEN/NOTIFY."""
+        async with mock_session_maker() as db:
+            job = await JobQueueService(db).enqueue(JobType.DOWNLOAD_DESIGN)
+            await db.commit()
+
+        assert job.status == JobStatus.QUEUED
+
+
+# =============================================================================
+# BaseWorker Wake Tests
+# =============================================================================
+
+
+class TestWorkerWake:
+    """Tests for notification-driven worker wake-ups."""
+
+    def test_idle_poll_interval_defaults_to_poll_interval(self):
+        """Test workers poll at poll_interval without notifications."""
+        worker = RecordingWorker(poll_interval=1.0, safety_poll_interval=30.0)
+
+        assert worker.idle_poll_interval == 1.0
+
+    def test_idle_poll_interval_with_notifications(self):
+        """Test workers fall back to the slow safety poll when notified."""
+        worker = RecordingWorker(poll_interval=1.0, safety_poll_interval=30.0)
+
+        worker.enable_notifications(True)
+
+        assert worker.idle_poll_interval == 30.0
+
+    @pytest.mark.asyncio
+    async def test_wake_starts_job_before_safety_poll(self, mock_session_maker):
+        """Test a woken worker claims a new job without waiting to poll."""
+        worker = RecordingWorker(safety_poll_interval=60.0)
+        worker.enable_notifications(True)
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            task = asyncio.create_task(worker.run())
+            # Let the worker find an empty queue and go idle
+            await asyncio.sleep(0.1)
+
+            async with mock_session_maker() as db:
+                job = await JobQueueService(db).enqueue(JobType.DOWNLOAD_DESIGN)
+                await db.commit()
+            worker.wake()
+
+            await asyncio.wait_for(worker.processed_event.wait(), timeout=5)
+            worker.request_shutdown()
+            await asyncio.wait_for(task, timeout=5)
+
+        assert worker.processed == [job.id]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_interrupts_idle_wait(self, mock_session_maker):
+        """Test request_shutdown ends the idle wait immediately."""
+        worker = RecordingWorker(poll_interval=60.0)
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            task = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.1)
+            worker.request_shutdown()
+            await asyncio.wait_for(task, timeout=5)
+
+        assert task.done()
+
+
+# =============================================================================
+# Batch Claiming Tests
+# =============================================================================
+
+
+class TestWorkerBatchClaiming:
+    """Tests for BaseWorker batch_size handling."""
+
+    @pytest.mark.asyncio
+    async def test_batch_processes_all_claimed_jobs(self, mock_session_maker):
+        """Test a batch worker processes every job it claims in order."""
+        worker = RecordingWorker(batch_size=3)
+        async with mock_session_maker() as db:
+            queue = JobQueueService(db)
+            ids = [(await queue.enqueue(JobType.DOWNLOAD_DESIGN)).id for _ in range(3)]
+            await db.commit()
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            await worker._poll_and_process()
+
+        assert worker.processed == ids
+        async with mock_session_maker() as db:
+            stats = await JobQueueService(db).get_queue_stats()
+        assert stats["by_status"] == {"SUCCESS": 3}
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_unstarted_jobs(self, mock_session_maker):
+        """Test claimed jobs not yet started go back to the queue on shutdown."""
+
+        class StopAfterFirstWorker(RecordingWorker):
+            async def process(self, job, payload):
+                await super().process(job, payload)
+                self.request_shutdown()
+                return None
+
+        worker = StopAfterFirstWorker(batch_size=3)
+        async with mock_session_maker() as db:
+            queue = JobQueueService(db)
+            for _ in range(3):
+                await queue.enqueue(JobType.DOWNLOAD_DESIGN)
+            await db.commit()
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            await worker._poll_and_process()
+
+        assert len(worker.processed) == 1
+        async with mock_session_maker() as db:
+            stats = await JobQueueService(db).get_queue_stats()
+        assert stats["by_status"] == {"SUCCESS": 1, "QUEUED": 2}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_job_is_skipped(self, mock_session_maker):
+        """Test a job cancelled while waiting in the batch isn't processed."""
+
+        class CancelNextWorker(RecordingWorker):
+            async def process(self, job, payload):
+                await super().process(job, payload)
+                async with mock_session_maker() as db:
+                    await JobQueueService(db).cancel(self._claimed_jobs[0].id)
+                    await db.commit()
+                return None
+
+        worker = CancelNextWorker(batch_size=2)
+        async with mock_session_maker() as db:
+            queue = JobQueueService(db)
+            first = await queue.enqueue(JobType.DOWNLOAD_DESIGN)
+            await queue.enqueue(JobType.DOWNLOAD_DESIGN)
+            await db.commit()
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            await worker._poll_and_process()
+
+        assert worker.processed == [first.id]
+
+
+# =============================================================================
+# JobDispatcher Tests
+# =============================================================================
+
+
+class TestJobDispatcher:
+    """Tests for JobDispatcher routing."""
+
+    def test_dispatch_wakes_only_matching_workers(self):
+        """Test only workers handling the job type are woken."""
+        dispatcher = JobDispatcher(database_url="postgresql+asyncpg://u:p@localhost/db")
+        download = RecordingWorker()
+        extract = ExtractWorker()
+        for worker in (download, extract):
+            worker._running = True
+            dispatcher.register(worker)
+
+        woken = dispatcher.dispatch(JobType.DOWNLOAD_DESIGN)
+
+        assert woken == 1
+        assert download._wake_event.is_set()
+        assert not extract._wake_event.is_set()
+
+    def test_dispatch_skips_busy_workers(self):
+        """Test workers processing a job are not woken."""
+        dispatcher = JobDispatcher(database_url="postgresql+asyncpg://u:p@localhost/db")
+        worker = RecordingWorker()
+        worker._running = True
+        worker._current_job = Job(type=JobType.DOWNLOAD_DESIGN)
+        dispatcher.register(worker)
+
+        assert dispatcher.dispatch(JobType.DOWNLOAD_DESIGN) == 0
+
+    def test_notification_routes_by_payload(self):
+        """Test asyncpg notifications are routed to workers."""
+        dispatcher = JobDispatcher(database_url="postgresql+asyncpg://u:p@localhost/db")
+        worker = ExtractWorker()
+        worker._running = True
+        dispatcher.register(worker)
+
+        dispatcher._on_notify(
+            None, 1, job_notify_channel(JobType.EXTRACT_ARCHIVE), "EXTRACT_ARCHIVE"
+        )
+
+        assert worker._wake_event.is_set()
+
+    def test_unknown_notification_ignored(self):
+        """Test unknown payloads don't raise."""
+        dispatcher = JobDispatcher(database_url="postgresql+asyncpg://u:p@localhost/db")
+
+        dispatcher._on_notify(None, 1, "other_channel", "NOT_A_JOB_TYPE")
+
+        assert dispatcher.stats["notifications_received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_is_noop_without_postgres(self):
+        """Test the dispatcher leaves workers polling on SQLite."""
+        dispatcher = JobDispatcher(database_url="sqlite+aiosqlite:///:memory:")
+        worker = RecordingWorker(poll_interval=1.0)
+        dispatcher.register(worker)
+
+        await asyncio.wait_for(dispatcher.run(), timeout=1)
+
+        assert not dispatcher.is_supported
+        assert not dispatcher.is_listening
+        assert worker.idle_poll_interval == 1.0
+
+
+# =============================================================================
+# ConcurrencyScheduler Tests
+# =============================================================================
+
+
+class TestConcurrencyScheduler:
+    """Tests for shared-resource slot limits."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_blocks_at_limit(self):
+        """Test acquire waits when a resource is at its limit."""
+        scheduler = ConcurrencyScheduler({WorkerResource.CPU: 1})
+        await scheduler.acquire([WorkerResource.CPU])
+
+        waiter = asyncio.create_task(scheduler.acquire([WorkerResource.CPU]))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await scheduler.release([WorkerResource.CPU])
+        await asyncio.wait_for(waiter, timeout=1)
+        assert scheduler.stats["CPU"]["in_use"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unlimited_resource_never_blocks(self):
+        """Test resources without a limit are unbounded."""
+        scheduler = ConcurrencyScheduler()
+
+        for _ in range(10):
+            await asyncio.wait_for(scheduler.acquire([WorkerResource.DISK]), timeout=1)
+
+        assert scheduler.stats["DISK"]["in_use"] == 10
+
+    @pytest.mark.asyncio
+    async def test_multi_resource_acquire_is_all_or_nothing(self):
+        """Test no slots are taken while any requested resource is full."""
+        scheduler = ConcurrencyScheduler({WorkerResource.CPU: 1, WorkerResource.DISK: 2})
+        await scheduler.acquire([WorkerResource.CPU])
+
+        waiter = asyncio.create_task(
+            scheduler.acquire([WorkerResource.CPU, WorkerResource.DISK])
+        )
+        await asyncio.sleep(0.05)
+
+        assert not waiter.done()
+        assert scheduler.stats["DISK"]["in_use"] == 0
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_wakes_waiters(self):
+        """Test set_limit lets waiting workers proceed immediately."""
+        scheduler = ConcurrencyScheduler({WorkerResource.TELEGRAM: 1})
+        await scheduler.acquire([WorkerResource.TELEGRAM])
+        waiter = asyncio.create_task(scheduler.acquire([WorkerResource.TELEGRAM]))
+        await asyncio.sleep(0.05)
+
+        await scheduler.set_limit(WorkerResource.TELEGRAM, 2)
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert scheduler.get_limit(WorkerResource.TELEGRAM) == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_holds_no_slot_when_idle(self, mock_session_maker):
+        """Test a worker releases its slots after an empty poll."""
+        scheduler = ConcurrencyScheduler({WorkerResource.CPU: 1})
+        worker = CpuWorker(poll_interval=0.01)
+        worker.scheduler = scheduler
+
+        with patch("app.workers.base.async_session_maker", mock_session_maker):
+            await worker._poll_and_process()
+
+        assert scheduler.stats["CPU"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_while_waiting_for_slot(self):
+        """Test a worker waiting for a slot stops cleanly on shutdown."""
+        scheduler = ConcurrencyScheduler({WorkerResource.CPU: 1})
+        await scheduler.acquire([WorkerResource.CPU])
+        worker = CpuWorker()
+        worker.scheduler = scheduler
+
+        task = asyncio.create_task(worker._acquire_resources())
+        await asyncio.sleep(0.05)
+        worker.request_shutdown()
+
+        assert await asyncio.wait_for(task, timeout=1) is False
+        assert scheduler.stats["CPU"]["in_use"] == 1
+
+
+# =============================================================================
+# WorkerManager Pool Tests
+# =============================================================================
+
+
+class TestWorkerManagerPools:
+    """Tests for per-type worker pools."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a manager that allows concurrent pools."""
+        manager = WorkerManager()
+        manager.allow_concurrency = True
+        return manager
+
+    def test_register_creates_pool(self, manager):
+        """Test register_worker creates count workers sharing the scheduler."""
+        manager.register_worker(RecordingWorker, count=3, batch_size=2)
+
+        pool = manager._pools["RecordingWorker"]
+        assert len(pool) == 3
+        assert [w.worker_id for w in pool] == [
+            "RecordingWorker-1",
+            "RecordingWorker-2",
+            "RecordingWorker-3",
+        ]
+        assert all(w.scheduler is manager.scheduler for w in pool)
+        assert all(w.batch_size == 2 for w in pool)
+
+    def test_sqlite_pools_stay_single(self):
+        """Test pools are not scaled out without PostgreSQL."""
+        manager = WorkerManager()
+        manager.allow_concurrency = False
+
+        manager.register_worker(RecordingWorker, count=4)
+
+        assert manager.worker_count == 1
+
+    def test_resize_grows_pool(self, manager):
+        """Test resize_pool adds workers with fresh IDs."""
+        manager.register_worker(RecordingWorker, count=1)
+
+        assert manager.resize_pool("RecordingWorker", 3) == 3
+        assert manager._pools["RecordingWorker"][-1].worker_id == "RecordingWorker-3"
+
+    def test_resize_retires_idle_workers_first(self, manager):
+        """Test shrinking a pool stops idle workers before busy ones."""
+        manager.register_worker(RecordingWorker, count=3)
+        busy = manager._pools["RecordingWorker"][0]
+        busy._current_job = Job(type=JobType.DOWNLOAD_DESIGN)
+
+        manager.resize_pool("RecordingWorker", 1)
+
+        assert manager._pools["RecordingWorker"] == [busy]
+        assert manager.worker_count == 1
+
+    @pytest.mark.asyncio
+    async def test_apply_setting_resizes_pools_and_caps(self, manager):
+        """Test concurrency settings resize pools and resource caps."""
+        manager.register_worker(ExtractWorkerPool, count=1)
+
+        await manager.apply_setting("max_cpu_jobs", 3)
+
+        assert len(manager._pools["ExtractArchiveWorker"]) == 3
+        assert manager.scheduler.get_limit(WorkerResource.CPU) == 3
+
+    @pytest.mark.asyncio
+    async def test_settings_service_applies_to_running_manager(self, db_engine, manager):
+        """Test SettingsService.set pushes concurrency changes live."""
+        from app.services.settings import SettingsService
+
+        manager.register_worker(DownloadWorkerPool, count=1)
+        manager._running = True
+        session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+        with patch("app.workers.manager._manager", manager), \
+                patch.object(manager, "_start_worker"):
+            async with session_maker() as db:
+                await SettingsService(db).set("max_concurrent_downloads", 4)
+        SettingsService.clear_cache()
+
+        assert len(manager._pools["DownloadWorker"]) == 4
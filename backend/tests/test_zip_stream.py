@@ -0,0 +1,265 @@
+"""Tests for the streaming ZIP writer and design ZIP downloads."""
+
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db import get_db
+from app.db.base import Base
+from app.db.models import Design, DesignFile
+from app.main import app
+from app.utils import zip_stream as zip_stream_module
+from app.utils.zip_stream import ZIP_DEFLATED, ZIP_STORED, ZipStream
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def db_engine():
+    """Create an in-memory test database engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(db_engine):
+    """Create a test client with overridden database dependency."""
+    async_session = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with async_session() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def design_dir(tmp_path) -> Path:
+    """Create a design folder with mixed file types."""
+    folder = tmp_path / "Dragon"
+    (folder / "parts").mkdir(parents=True)
+    (folder / "dragon.stl").write_bytes(b"solid dragon\n" * 5000)
+    (folder / "dragon.3mf").write_bytes(os.urandom(50_000))
+    (folder / "parts" / "wing ü.stl").write_bytes(b"solid wing\n" * 100)
+    (folder / "empty.txt").write_bytes(b"")
+    return folder
+
+
+def build(zip_stream: ZipStream) -> bytes:
+    """Consume a ZipStream into bytes."""
+    return b"".join(zip_stream)
+
+
+# =============================================================================
+# ZipStream Tests
+# =============================================================================
+
+
+class TestZipStream:
+    """Tests for ZipStream archive output."""
+
+    def test_archive_round_trips(self, design_dir):
+        """Test that every file reads back intact."""
+        zip_stream = ZipStream()
+        names = []
+        for path in sorted(design_dir.rglob("*")):
+            if path.is_file():
+                name = str(path.relative_to(design_dir.parent))
+                zip_stream.add_file(path, name)
+                names.append((name, path))
+
+        archive = zipfile.ZipFile(io.BytesIO(build(zip_stream)))
+
+        assert archive.testzip() is None
+        for name, path in names:
+            assert archive.read(name) == path.read_bytes()
+
+    def test_compressed_formats_are_stored(self, design_dir):
+        """Test that 3MF is stored and STL is deflated by default."""
+        zip_stream = ZipStream()
+        zip_stream.add_file(design_dir / "dragon.stl", "dragon.stl")
+        zip_stream.add_file(design_dir / "dragon.3mf", "dragon.3mf")
+
+        archive = zipfile.ZipFile(io.BytesIO(build(zip_stream)))
+
+        assert archive.getinfo("dragon.stl").compress_type == ZIP_DEFLATED
+        assert archive.getinfo("dragon.3mf").compress_type == ZIP_STORED
+        assert zip_stream.content_length is None
+
+    def test_content_length_when_all_stored(self, design_dir):
+        """Test that content_length matches the output when nothing is deflated."""
+        zip_stream = ZipStream()
+        for path in design_dir.rglob("*"):
+            if path.is_file():
+                zip_stream.add_file(path, path.name, ZIP_STORED)
+
+        assert zip_stream.content_length == len(build(zip_stream))
+
+    def test_zip64_end_records(self, design_dir):
+        """Test that ZIP64 end records are emitted past the entry count limit."""
+        zip_stream = ZipStream()
+        with patch.object(zip_stream_module, "ZIP64_COUNT_LIMIT", 3):
+            for i in range(4):
+                zip_stream.add_file(design_dir / "empty.txt", f"f{i}.txt", ZIP_STORED)
+            data = build(zip_stream)
+            assert zip_stream.content_length == len(data)
+
+        assert b"PK\x06\x06" in data
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        assert len(archive.namelist()) == 4
+
+    def test_iter_range_matches_slice(self, design_dir):
+        """Test that iter_range yields exactly the requested archive bytes."""
+        zip_stream = ZipStream()
+        for path in sorted(design_dir.rglob("*")):
+            if path.is_file():
+                zip_stream.add_file(path, path.name, ZIP_STORED)
+        data = build(zip_stream)
+
+        for start, end in [(0, len(data)), (5, 40), (len(data) - 22, len(data))]:
+            assert b"".join(zip_stream.iter_range(start, end)) == data[start:end]
+
+    def test_writes_captured_size(self, design_dir):
+        """Test that a file growing after add_file doesn't corrupt the archive."""
+        path = design_dir / "dragon.3mf"
+        zip_stream = ZipStream()
+        zip_stream.add_file(path, "dragon.3mf")
+        original = path.read_bytes()
+        path.write_bytes(original + b"appended")
+
+        data = build(zip_stream)
+
+        assert len(data) == zip_stream.content_length
+        assert zipfile.ZipFile(io.BytesIO(data)).read("dragon.3mf") == original
+
+
+# =============================================================================
+# Download Route Tests
+# =============================================================================
+
+
+class TestDownloadDesignFiles:
+    """Tests for GET /api/v1/designs/{id}/download."""
+
+    @pytest.mark.asyncio
+    async def test_download_streams_zip(self, client, db_engine, design_dir):
+        """Test that the design ZIP contains all library files."""
+        async_session = async_sessionmaker(db_engine, expire_on_commit=False)
+        async with async_session() as session:
+            design = Design(canonical_title="Dragon", canonical_designer="Tester")
+            session.add(design)
+            await session.flush()
+            for rel in ["Dragon/dragon.stl", "Dragon/dragon.3mf", "Dragon/missing.stl"]:
+                session.add(
+                    DesignFile(
+                        design_id=design.id,
+                        relative_path=rel,
+                        filename=Path(rel).name,
+                        ext=Path(rel).suffix,
+                    )
+                )
+            await session.commit()
+
+        with patch("app.api.routes.designs.settings") as mock_settings:
+            mock_settings.library_path = design_dir.parent
+            response = await client.get(f"/api/v1/designs/{design.id}/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert sorted(archive.namelist()) == ["Dragon/dragon.3mf", "Dragon/dragon.stl"]
+
+    @pytest.mark.asyncio
+    async def test_stored_download_has_content_length(
+        self, client, db_engine, design_dir
+    ):
+        """Test that an all-stored archive is sent with Content-Length."""
+        async_session = async_sessionmaker(db_engine, expire_on_commit=False)
+        async with async_session() as session:
+            design = Design(canonical_title="Dragon", canonical_designer="Tester")
+            session.add(design)
+            await session.flush()
+            session.add(
+                DesignFile(
+                    design_id=design.id,
+                    relative_path="Dragon/dragon.3mf",
+                    filename="dragon.3mf",
+                    ext=".3mf",
+                )
+            )
+            await session.commit()
+
+        with patch("app.api.routes.designs.settings") as mock_settings:
+            mock_settings.library_path = design_dir.parent
+            response = await client.get(f"/api/v1/designs/{design.id}/download")
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    @pytest.mark.asyncio
+    async def test_stored_download_resumes_with_range(
+        self, client, db_engine, design_dir
+    ):
+        """Test that a Range request on an all-stored archive returns 206."""
+        async_session = async_sessionmaker(db_engine, expire_on_commit=False)
+        async with async_session() as session:
+            design = Design(canonical_title="Dragon", canonical_designer="Tester")
+            session.add(design)
+            await session.flush()
+            session.add(
+                DesignFile(
+                    design_id=design.id,
+                    relative_path="Dragon/dragon.3mf",
+                    filename="dragon.3mf",
+                    ext=".3mf",
+                )
+            )
+            await session.commit()
+
+        url = f"/api/v1/designs/{design.id}/download"
+        with patch("app.api.routes.designs.settings") as mock_settings:
+            mock_settings.library_path = design_dir.parent
+            full = await client.get(url)
+            partial = await client.get(
+                url,
+                headers={"Range": "bytes=10-", "If-Range": full.headers["etag"]},
+            )
+            stale = await client.get(
+                url, headers={"Range": "bytes=10-", "If-Range": '"other"'}
+            )
+
+        assert full.headers["accept-ranges"] == "bytes"
+        assert partial.status_code == 206
+        assert partial.content == full.content[10:]
+        assert partial.headers["content-range"] == (
+            f"bytes 10-{len(full.content) - 1}/{len(full.content)}"
+        )
+        assert stale.status_code == 200
+        assert stale.content == full.content
@@ -55,7 +55,7 @@ export function DesignCard({ design, isSelected, onToggleSelect, selectionMode,
   }
 
   const hasPreview = design.primary_preview && !imageError
-  const previewUrl = design.primary_preview ? getPreviewUrl(design.primary_preview.file_path) : null
+  const previewUrl = design.primary_preview ? getPreviewUrl(design.primary_preview.file_path, 400) : null
 
   return (
     <Link
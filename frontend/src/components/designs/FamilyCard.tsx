@@ -128,7 +128,7 @@ export function FamilyCard({
   const familyStatus = getFamilyStatus(designs)
   const preview = getBestPreview(designs)
   const hasPreview = preview && !imageError
-  const previewUrl = preview ? getPreviewUrl(preview.file_path) : null
+  const previewUrl = preview ? getPreviewUrl(preview.file_path, 400) : null
 
   // Check if any designs in family are selected
   const selectedInFamily = designs.filter(d => selectedIds?.has(d.id)).length
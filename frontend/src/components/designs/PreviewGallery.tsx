@@ -109,7 +109,7 @@ export function PreviewGallery({
           onClick={() => openLightbox(0)}
         >
           <img
-            src={getPreviewUrl(primaryPreview.file_path)}
+            src={getPreviewUrl(primaryPreview.file_path, 800)}
             alt={primaryPreview.original_filename || 'Primary preview'}
             className="w-full h-full object-contain"
             onError={() => handleImageError(primaryPreview.id)}
@@ -172,7 +172,7 @@ export function PreviewGallery({
                   className="w-20 h-20 rounded-lg overflow-hidden bg-bg-tertiary border-2 border-transparent hover:border-accent-primary transition-colors focus:outline-none focus:ring-2 focus:ring-accent-primary"
                 >
                   <img
-                    src={getPreviewUrl(preview.file_path)}
+                    src={getPreviewUrl(preview.file_path, 200)}
                     alt={preview.original_filename || `Preview ${index + 2}`}
                     className="w-full h-full object-cover"
                     onError={() => handleImageError(preview.id)}
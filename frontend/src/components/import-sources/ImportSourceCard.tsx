@@ -32,12 +32,12 @@ export function ImportSourceCard({
   const syncFolder = useSyncFolder()
   const updateFolder = useUpdateFolder()
 
-  const handleSync = async () => {
+  const handleSync = async (rebuild = false) => {
     setSyncResult(null)
     try {
       const result = await triggerSync.mutateAsync({
         id: source.id,
-        request: { auto_import: true },
+        request: { auto_import: true, rebuild },
       })
       setSyncResult({
         type: 'success',
@@ -229,7 +229,7 @@ export function ImportSourceCard({
 
             {/* Sync Now button */}
             <button
-              onClick={handleSync}
+              onClick={() => handleSync()}
               disabled={triggerSync.isPending || source.source_type === 'UPLOAD'}
               className="p-2 text-text-secondary hover:text-accent-primary hover:bg-bg-tertiary rounded transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
               aria-label="Sync now"
@@ -242,6 +242,19 @@ export function ImportSourceCard({
               )}
             </button>
 
+            {/* Rebuild button - full Google Drive rescan instead of changes only */}
+            {source.source_type === 'GOOGLE_DRIVE' && (
+              <button
+                onClick={() => handleSync(true)}
+                disabled={triggerSync.isPending}
+                className="p-2 text-text-secondary hover:text-accent-warning hover:bg-bg-tertiary rounded transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+                aria-label="Rebuild"
+                title="Rebuild: rescan every folder instead of only changes since the last sync"
+              >
+                <RebuildIcon className="w-5 h-5" />
+              </button>
+            )}
+
             {/* View History button */}
             <button
               onClick={() => onViewHistory(source.id)}
@@ -521,6 +534,19 @@ function RefreshIcon({ className }: { className?: string }) {
   )
 }
 
+function RebuildIcon({ className }: { className?: string }) {
+  return (
+    <svg className={className} fill="none" stroke="currentColor" viewBox="0 0 24 24">
+      <path
+        strokeLinecap="round"
+        strokeLinejoin="round"
+        strokeWidth={2}
+        d="M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z"
+      />
+    </svg>
+  )
+}
+
 function HistoryIcon({ className }: { className?: string }) {
   return (
     <svg className={className} fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -81,8 +81,10 @@ export function useAutoSelectPrimary() {
 }
 
 /**
- * Helper to get the full URL for a preview file
+ * Helper to get the full URL for a preview file.
+ * Pass the display width (in CSS pixels, doubled for high-DPI screens) to
+ * get a resized WebP/AVIF variant instead of the original.
  */
-export function getPreviewUrl(filePath: string): string {
-  return previewsApi.getFileUrl(filePath)
+export function getPreviewUrl(filePath: string, width?: number): string {
+  return previewsApi.getFileUrl(filePath, width)
 }
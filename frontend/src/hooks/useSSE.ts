@@ -46,6 +46,8 @@ export function useSSE(options: UseSSEOptions = {}) {
   const retryDelayRef = useRef(INITIAL_RETRY_DELAY)
   const retryTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
   const isUnmountedRef = useRef(false)
+  // Last event ID seen, so a reconnect replays what was missed
+  const lastEventIdRef = useRef<string | null>(null)
 
   // Handle job progress event
   const handleJobProgress = useCallback(
@@ -214,6 +216,15 @@ export function useSSE(options: UseSSEOptions = {}) {
     queryClient.invalidateQueries({ queryKey: ['queueStats'] })
   }, [queryClient])
 
+  // Handle resync event: events were missed and can't be replayed
+  const handleResync = useCallback(() => {
+    queryClient.invalidateQueries({ queryKey: ['queue'] })
+    queryClient.invalidateQueries({ queryKey: ['queueStats'] })
+    queryClient.invalidateQueries({ queryKey: ['activity'] })
+    queryClient.invalidateQueries({ queryKey: ['designs'] })
+    queryClient.invalidateQueries({ queryKey: ['stats'] })
+  }, [queryClient])
+
   // Process incoming event
   const handleEvent = useCallback(
     (event: SSEEvent) => {
@@ -257,6 +268,9 @@ export function useSSE(options: UseSSEOptions = {}) {
           queryClient.invalidateQueries({ queryKey: ['stats'] })
           queryClient.invalidateQueries({ queryKey: ['designs'] })
           break
+        case 'resync':
+          handleResync()
+          break
         case 'heartbeat':
           // Just keep connection alive, no action needed
           break
@@ -273,6 +287,7 @@ export function useSSE(options: UseSSEOptions = {}) {
       handleDesignStatusChanged,
       handleDesignCreated,
       handleQueueUpdated,
+      handleResync,
     ]
   )
 
@@ -285,7 +300,11 @@ export function useSSE(options: UseSSEOptions = {}) {
 
     setStatus('connecting')
 
-    const eventSource = new EventSource(SSE_URL)
+    // A new EventSource doesn't send Last-Event-ID, so pass it explicitly
+    const url = lastEventIdRef.current
+      ? `${SSE_URL}?last_event_id=${encodeURIComponent(lastEventIdRef.current)}`
+      : SSE_URL
+    const eventSource = new EventSource(url)
     eventSourceRef.current = eventSource
 
     eventSource.onopen = () => {
@@ -296,6 +315,9 @@ export function useSSE(options: UseSSEOptions = {}) {
 
     eventSource.onmessage = (event) => {
       if (isUnmountedRef.current) return
+      if (event.lastEventId) {
+        lastEventIdRef.current = event.lastEventId
+      }
       try {
         const data = JSON.parse(event.data) as SSEEvent
         handleEvent(data)
@@ -44,6 +44,7 @@ import type {
 } from '@/types/design'
 import type {
   UploadResponse,
+  UploadSessionResponse,
   BatchUploadResponse,
   UploadStatusResponse,
   ProcessUploadRequest,
@@ -407,8 +408,9 @@ export const previewsApi = {
   autoSelectPrimary: (designId: string) =>
     api.post(`/previews/design/${designId}/auto-select-primary`).then((r) => r.data),
 
-  // Get the URL for a preview file
-  getFileUrl: (filePath: string) => `/api/v1/previews/files/${filePath}`,
+  // Get the URL for a preview file, optionally a resized variant for a display width
+  getFileUrl: (filePath: string, width?: number) =>
+    `/api/v1/previews/files/${filePath}${width ? `?w=${width}` : ''}`,
 }
 
 // =============================================================================
@@ -590,9 +592,83 @@ export const googleOAuthApi = {
 // Upload API (v0.8) - #179
 // =============================================================================
 
+// Files above this size are sent as resumable chunked uploads
+const RESUMABLE_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+const RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+const RESUMABLE_MAX_RETRIES = 5
+
+// Send a file in chunks, resuming from the server's offset after a failure
+async function uploadFileResumable(
+  file: File,
+  onProgress?: (progress: number) => void
+): Promise<UploadResponse> {
+  let session = await api
+    .post<UploadSessionResponse>('/upload/sessions', {
+      filename: file.name,
+      size: file.size,
+      content_type: file.type || undefined,
+    })
+    .then((r) => r.data)
+
+  let retries = 0
+  while (session.status === 'UPLOADING') {
+    const offset = session.offset
+    try {
+      session = await api
+        .patch<UploadSessionResponse>(
+          `/upload/sessions/${session.upload_id}`,
+          file.slice(offset, offset + RESUMABLE_CHUNK_SIZE),
+          {
+            headers: {
+              'Content-Type': 'application/offset+octet-stream',
+              'Upload-Offset': String(offset),
+            },
+            onUploadProgress: (e) => {
+              if (onProgress && file.size) {
+                onProgress(Math.round(((offset + e.loaded) / file.size) * 100))
+              }
+            },
+          }
+        )
+        .then((r) => r.data)
+      retries = 0
+    } catch (error) {
+      const status = axios.isAxiosError(error) ? error.response?.status : undefined
+      // Client errors other than an offset mismatch won't go away on retry
+      if ((status && status >= 400 && status < 500 && status !== 409) || ++retries > RESUMABLE_MAX_RETRIES) {
+        throw error
+      }
+      await new Promise((resolve) => setTimeout(resolve, 1000 * 2 ** (retries - 1)))
+      // Continue from whatever the server received before the failure
+      const head = await api.head(`/upload/sessions/${session.upload_id}`).catch(() => null)
+      if (head) {
+        session = { ...session, offset: Number(head.headers['upload-offset']) }
+        if (session.offset >= session.size) {
+          // The last chunk arrived but its response was lost
+          const current = await api.get<UploadStatusResponse>(`/upload/${session.upload_id}/status`)
+          session = { ...session, status: current.data.status }
+        }
+      }
+    }
+  }
+
+  return {
+    upload_id: session.upload_id,
+    filename: session.filename,
+    size: session.size,
+    status: session.status,
+    sha256: session.sha256,
+  }
+}
+
 export const uploadApi = {
-  // Upload a single file (returns upload_id for tracking)
+  // Upload a single file (returns upload_id for tracking).
+  // Large files use resumable chunked uploads so flaky links don't restart them.
   uploadFile: (file: File, onProgress?: (progress: number) => void): Promise<UploadResponse> => {
+    if (file.size > RESUMABLE_UPLOAD_THRESHOLD) {
+      return uploadFileResumable(file, onProgress)
+    }
+
     const formData = new FormData()
     formData.append('file', file)
 
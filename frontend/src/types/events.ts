@@ -18,6 +18,7 @@ export type EventType =
   // System events
   | 'heartbeat'
   | 'sync_status'
+  | 'resync'
 
 // Event payloads
 export interface JobCreatedPayload {
@@ -86,6 +87,10 @@ export interface HeartbeatPayload {
   client_count?: number
 }
 
+export interface ResyncPayload {
+  reason: 'client_lagging' | 'history_unavailable'
+}
+
 export interface SyncStatusPayload {
   channel_id: string | null
   channel_title: string | null
@@ -265,6 +265,8 @@ export interface ImportSourceListParams {
 export interface SyncTriggerRequest {
   conflict_resolution?: ConflictResolution
   auto_import?: boolean
+  // Google Drive: rescan the whole tree instead of applying changes
+  rebuild?: boolean
 }
 
 export interface SyncTriggerResponse {
@@ -1,7 +1,7 @@
 // Upload API types (#179)
 // Must match backend/app/schemas/upload.py
 
-export type UploadStatusType = 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED' | 'EXPIRED'
+export type UploadStatusType = 'UPLOADING' | 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED' | 'EXPIRED'
 
 // Response from POST /api/v1/upload/files
 export interface UploadResponse {
@@ -9,6 +9,17 @@ export interface UploadResponse {
   filename: string
   size: number
   status: UploadStatusType
+  sha256: string | null
+}
+
+// Response from POST/PATCH /api/v1/upload/sessions (resumable uploads)
+export interface UploadSessionResponse {
+  upload_id: string
+  filename: string
+  offset: number
+  size: number
+  status: UploadStatusType
+  sha256: string | null
 }
 
 // Response from POST /api/v1/upload/files/batch
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Ingest Throughput Benchmark
+
+Compares per-message ingestion (IngestService.ingest_message) against
+batched ingestion (IngestService.ingest_batch) on the same synthetic
+channel history. Reports for each mode:
+
+- Messages per second
+- SQL statements issued per message
+
+The synthetic history mixes text-only posts, preview photo posts and
+design posts (STL/3MF/ZIP, including split RAR archives), roughly like
+a typical design channel.
+
+Usage:
+    python scripts/benchmark_ingest.py [options]
+
+Options:
+    --messages      Number of synthetic messages per mode (default: 2000)
+    --batch-size    Messages per transaction (default: 100)
+
+Requirements:
+    - PostgreSQL; set PRINTARR_DATABASE_URL to a local scratch database
+    - The benchmark creates two temporary channels and deletes them (and
+      their designs and jobs) when it finishes
+    - Run from project root directory
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import delete, event, select
+
+from app.db.models import Channel, Design, DesignSource, Job
+from app.db.session import async_session_maker, engine
+from app.services.ingest import IngestService
+
+
+class StatementCounter:
+    """Counts SQL statements executed through the shared engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+
+def make_messages(count: int) -> list[dict]:
+    """Build a synthetic, oldest-first channel history."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    messages = []
+    for i in range(1, count + 1):
+        date = (start + timedelta(minutes=7 * i)).isoformat()
+        kind = i % 5
+        if kind == 0:
+            attachments = [{"type": "PHOTO", "size": 150_000}]
+            text = f"Preview for model {i // 5}"
+        elif kind == 1:
+            attachments = [
+                {"type": "DOCUMENT", "filename": f"Dragon_{i}_Body.stl", "size": 4_000_000},
+                {"type": "DOCUMENT", "filename": f"Dragon_{i}_Base.3mf", "size": 900_000},
+            ]
+            text = f"Dragon Bust {i}\n#dragon #fantasy\nhttps://example.com/{i}"
+        elif kind == 2:
+            attachments = [
+                {"type": "DOCUMENT", "filename": f"Castle_{i // 10}.part{i % 3 + 1}.rar"}
+            ]
+            text = ""
+        elif kind == 3:
+            attachments = [{"type": "DOCUMENT", "filename": f"Robot_{i}.zip", "size": 20_000_000}]
+            text = f"Robot Kit {i} (Multicolor)"
+        else:
+            attachments = []
+            text = f"Update #{i}: new release this weekend, stay tuned!"
+
+        messages.append(
+            {
+                "id": i,
+                "date": date,
+                "text": text,
+                "has_media": bool(attachments),
+                "attachments": attachments,
+                "sender": {"name": "Benchmark Designer"},
+            }
+        )
+    return messages
+
+
+async def create_channel(label: str) -> Channel:
+    """Create a scratch channel for one benchmark run."""
+    async with async_session_maker() as db:
+        channel = Channel(
+            title=f"Ingest benchmark ({label})",
+            telegram_peer_id=f"bench-{uuid.uuid4()}",
+            is_enabled=False,
+        )
+        db.add(channel)
+        await db.commit()
+        return channel
+
+
+async def run_mode(
+    args: argparse.Namespace,
+    batched: bool,
+    messages: list[dict],
+    counter: StatementCounter,
+) -> dict:
+    """Ingest the synthetic history in one mode and time it."""
+    channel = await create_channel("batch" if batched else "per-message")
+    start_count = counter.count
+    started = time.perf_counter()
+
+    async with async_session_maker() as db:
+        ingest = IngestService(db)
+        for offset in range(0, len(messages), args.batch_size):
+            chunk = messages[offset : offset + args.batch_size]
+            if batched:
+                await ingest.ingest_batch(channel, chunk)
+            else:
+                for message_data in chunk:
+                    await ingest.ingest_message(channel, message_data)
+            await db.commit()
+
+    elapsed = time.perf_counter() - started
+    statements = counter.count - start_count
+
+    return {
+        "channel_id": channel.id,
+        "messages_per_second": len(messages) / elapsed,
+        "statements_per_message": statements / len(messages),
+        "seconds": elapsed,
+    }
+
+
+async def cleanup(channel_ids: list[str]) -> None:
+    """Delete benchmark channels and everything they produced."""
+    async with async_session_maker() as db:
+        design_ids = select(DesignSource.design_id).where(
+            DesignSource.channel_id.in_(channel_ids)
+        )
+        await db.execute(delete(Job).where(Job.design_id.in_(design_ids)))
+        await db.execute(delete(Design).where(Design.id.in_(design_ids)))
+        await db.execute(delete(Channel).where(Channel.id.in_(channel_ids)))
+        await db.commit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark message ingestion")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        print("This benchmark expects PostgreSQL (set PRINTARR_DATABASE_URL)")
+        sys.exit(1)
+
+    messages = make_messages(args.messages)
+    counter = StatementCounter()
+    results = {}
+    try:
+        for mode, batched in (("per-message", False), ("batch", True)):
+            print(f"Running {mode} ...")
+            results[mode] = await run_mode(args, batched, messages, counter)
+    finally:
+        await cleanup([r["channel_id"] for r in results.values()])
+        await engine.dispose()
+
+    print()
+    print(f"{'mode':<14}{'msgs/s':>12}{'stmts/msg':>12}{'seconds':>10}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<14}{r['messages_per_second']:>12.1f}"
+            f"{r['statements_per_message']:>12.2f}{r['seconds']:>10.1f}"
+        )
+    if len(results) == 2:
+        speedup = results["batch"]["messages_per_second"] / results["per-message"]["messages_per_second"]
+        print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Job Dispatch Benchmark
+
+Compares interval polling against LISTEN/NOTIFY job dispatch for the
+background workers. Reports two numbers for each mode:
+
+- Idle query rate: SQL statements per second issued while the queue is empty
+- Enqueue-to-start latency: time from committing a job to process() starting
+
+Usage:
+    python scripts/benchmark_job_dispatch.py [options]
+
+Options:
+    --workers           Number of idle workers to run (default: 9, one per worker class)
+    --idle-seconds      Length of the idle measurement window (default: 30)
+    --samples           Number of latency samples per mode (default: 20)
+    --poll-interval     Poll interval for polling mode (default: 1.0)
+
+Requirements:
+    - PostgreSQL (LISTEN/NOTIFY is Postgres-only); set PRINTARR_DATABASE_URL
+    - Use a scratch database: the benchmark creates and deletes jobs
+    - Run from project root directory
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import delete, event
+
+from app.db.models import Job, JobType
+from app.db.session import async_session_maker, engine
+from app.services.job_queue import JobQueueService
+from app.workers.base import BaseWorker
+from app.workers.dispatcher import JobDispatcher
+
+# Job type used for latency probes; no production worker handles it
+PROBE_JOB_TYPE = JobType.DEDUPE_RECONCILE
+
+# Job types of the idle workers, mirroring start_workers()
+IDLE_JOB_TYPES = [
+    JobType.DOWNLOAD_DESIGN,
+    JobType.DOWNLOAD_TELEGRAM_IMAGES,
+    JobType.EXTRACT_ARCHIVE,
+    JobType.IMPORT_TO_LIBRARY,
+    JobType.GENERATE_RENDER,
+    JobType.SYNC_IMPORT_SOURCE,
+    JobType.DOWNLOAD_IMPORT_RECORD,
+    JobType.AI_ANALYZE_DESIGN,
+    JobType.DETECT_FAMILY_OVERLAP,
+]
+
+
+class StatementCounter:
+    """Counts SQL statements executed through the shared engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+
+class IdleWorker(BaseWorker):
+    """Worker that never finds work (scratch database)."""
+
+    async def process(self, job: Job, payload: dict[str, Any] | None) -> None:
+        return None
+
+
+class ProbeWorker(BaseWorker):
+    """Worker that records when each probe job starts."""
+
+    job_types = [PROBE_JOB_TYPE]
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.started: dict[str, float] = {}
+        self.started_event = asyncio.Event()
+
+    async def process(self, job: Job, payload: dict[str, Any] | None) -> None:
+        self.started[job.id] = time.perf_counter()
+        self.started_event.set()
+        return None
+
+
+async def run_mode(args: argparse.Namespace, use_notify: bool, counter: StatementCounter) -> dict:
+    """Run idle and latency measurements for one dispatch mode."""
+    workers: list[BaseWorker] = []
+    for i in range(args.workers):
+        worker_cls = type(
+            f"IdleWorker{i}",
+            (IdleWorker,),
+            {"job_types": [IDLE_JOB_TYPES[i % len(IDLE_JOB_TYPES)]]},
+        )
+        workers.append(worker_cls(poll_interval=args.poll_interval))
+    probe = ProbeWorker(poll_interval=args.poll_interval)
+    workers.append(probe)
+
+    dispatcher = JobDispatcher()
+    for worker in workers:
+        dispatcher.register(worker)
+
+    tasks = [asyncio.create_task(w.run()) for w in workers]
+    dispatcher_task = None
+    if use_notify:
+        dispatcher_task = asyncio.create_task(dispatcher.run())
+        # Wait for the listen connection
+        for _ in range(100):
+            if dispatcher.is_listening:
+                break
+            await asyncio.sleep(0.05)
+        if not dispatcher.is_listening:
+            raise RuntimeError("Dispatcher failed to connect; is this PostgreSQL?")
+
+    # Let workers settle into their idle loop
+    await asyncio.sleep(2)
+
+    # Idle query rate
+    start_count = counter.count
+    await asyncio.sleep(args.idle_seconds)
+    idle_rate = (counter.count - start_count) / args.idle_seconds
+
+    # Enqueue-to-start latency
+    latencies: list[float] = []
+    for _ in range(args.samples):
+        probe.started_event.clear()
+        async with async_session_maker() as db:
+            job = await JobQueueService(db).enqueue(PROBE_JOB_TYPE)
+            job_id = job.id
+            await db.commit()
+        committed_at = time.perf_counter()
+        await asyncio.wait_for(probe.started_event.wait(), timeout=args.poll_interval * 10 + 60)
+        latencies.append((probe.started[job_id] - committed_at) * 1000)
+        # Spread samples across the poll cycle
+        await asyncio.sleep(args.poll_interval * 0.37)
+
+    for worker in workers:
+        worker.request_shutdown()
+    dispatcher.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if dispatcher_task:
+        await dispatcher_task
+
+    return {
+        "idle_queries_per_second": idle_rate,
+        "latency_ms_p50": statistics.median(latencies),
+        "latency_ms_max": max(latencies),
+    }
+
+
+async def cleanup_probe_jobs() -> None:
+    """Delete jobs created by the benchmark."""
+    async with async_session_maker() as db:
+        await db.execute(delete(Job).where(Job.type == PROBE_JOB_TYPE))
+        await db.commit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark job dispatch modes")
+    parser.add_argument("--workers", type=int, default=len(IDLE_JOB_TYPES))
+    parser.add_argument("--idle-seconds", type=float, default=30.0)
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    counter = StatementCounter()
+    results = {}
+    try:
+        for mode, use_notify in (("polling", False), ("listen/notify", True)):
+            print(f"Running {mode} ...")
+            results[mode] = await run_mode(args, use_notify, counter)
+    finally:
+        await cleanup_probe_jobs()
+        await engine.dispose()
+
+    print()
+    print(f"{'mode':<16}{'idle queries/s':>16}{'p50 latency ms':>18}{'max latency ms':>18}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<16}{r['idle_queries_per_second']:>16.2f}"
+            f"{r['latency_ms_p50']:>18.1f}{r['latency_ms_max']:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())